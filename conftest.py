@@ -0,0 +1,6 @@
+"""
+Shared pytest setup
+Import GitPython before the demo scripts put studio/ on sys.path, where studio/git would shadow it
+"""
+
+import git  # noqa: F401
@@ -4,43 +4,47 @@ CLI interface for gitflow-studio
 Provides comprehensive Git workflow management through command line
 """
 
+import time
+
+# Cold-start clock: everything from here to command dispatch counts as startup
+_STARTUP_CLOCK = time.perf_counter()
+
 import asyncio
 import argparse
+import atexit
 import sys
 import os
+import signal
 from pathlib import Path
 from typing import Optional, List
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
-from rich.text import Text
-from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.align import Align
-from rich.layout import Layout
-from rich.live import Live
-from rich.columns import Columns
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.syntax import Syntax
-from rich.tree import Tree
-from rich.rule import Rule
+from rich.prompt import Prompt, Confirm
 from datetime import datetime
+from contextlib import ExitStack
 import subprocess
 
+# Heavy dependencies (GitHub client, keyring, psutil, aiosqlite, ...) are only
+# imported when the service that needs them is first used; see _register_services
 from studio.git.git_operations import GitOperations
-from studio.core.app_context import AppContext
-from studio.core.plugin_loader import PluginLoader
-from studio.github.auth import GitHubAuth
-from studio.github.repos import GitHubRepos
-from studio.core.aliases import AliasManager
-from studio.core.themes import ThemeManager
-from studio.utils.export_manager import ExportManager
-from studio.utils.advanced_search import AdvancedSearch
-from studio.utils.performance_monitor import PerformanceMonitor
+from studio.core.services import ServiceContainer, LazyService, import_attr
+from studio.commands import COMMAND_MODULES, command_names, command_help, load_command, load_plugin_commands
 
 console = Console()
 
+# Startup time above which --verbose prints a warning
+STARTUP_BUDGET = 0.25
+
+# Commands that run the background resource sampler while they execute
+LONG_RUNNING_COMMANDS = {'analytics', 'export', 'search', 'github'}
+DEFAULT_SAMPLE_INTERVAL = 0.5
+
+# Commits prefetched for `log` in interactive mode (its default count)
+PREFETCH_COMMITS = 10
+
 # ASCII Art Banner
 BANNER = """
 [bold cyan]
@@ -56,27 +60,69 @@ BANNER = """
 """
 
 class GitFlowStudioCLI:
+    app_context = LazyService()
+    github_auth = LazyService()
+    github_repos = LazyService()
+    alias_manager = LazyService()
+    theme_manager = LazyService()
+    export_manager = LazyService()
+    advanced_search = LazyService()
+    performance_monitor = LazyService()
+    
     def __init__(self):
-        self.app_context = AppContext()
         self.git_ops = None
         self.current_repo = None
-        self.github_auth = GitHubAuth()
-        self.github_repos = GitHubRepos(self.github_auth)
-        
-        # Initialize production-ready features
-        self.alias_manager = AliasManager()
-        self.theme_manager = ThemeManager()
-        self.export_manager = ExportManager()
-        self.advanced_search = AdvancedSearch()
-        self.performance_monitor = PerformanceMonitor()
-        
+        self._initialized = False
+        
+        # Interactive session state (see interactive_mode)
+        self._interactive = False
+        self._command_task = None
+        self._prefetch_tasks = set()
+        
+        # Services are constructed on first access
+        self.services = ServiceContainer()
+        self._register_services()
+        
+        # Per-command tracemalloc profiling (--memprofile)
+        self.memprofile = False
+        self.memprofile_top = 10
+        
+        # Background resource sampling for long-running commands (--sample-interval)
+        self.sample_interval = DEFAULT_SAMPLE_INTERVAL
+        
+    def _register_services(self):
+        """Register factories for services that are expensive to import or build"""
+        self.services.register('app_context', lambda: import_attr('studio.core.app_context', 'AppContext')())
+        self.services.register('github_auth', lambda: import_attr('studio.github.auth', 'GitHubAuth')())
+        self.services.register('github_repos', lambda: import_attr('studio.github.repos', 'GitHubRepos')(self.github_auth))
+        self.services.register('alias_manager', lambda: import_attr('studio.core.aliases', 'AliasManager')())
+        self.services.register('theme_manager', lambda: import_attr('studio.core.themes', 'ThemeManager')())
+        self.services.register('export_manager', lambda: import_attr('studio.utils.export_manager', 'ExportManager')())
+        self.services.register('advanced_search', lambda: import_attr('studio.utils.advanced_search', 'AdvancedSearch')())
+        self.services.register('performance_monitor', lambda: import_attr('studio.utils.performance_monitor', 'PerformanceMonitor')())
+    
+    def record_startup_time(self, startup_time: float, verbose: bool = False):
+        """Record how long the CLI took to get from import to command dispatch"""
+        if self.services.is_loaded('performance_monitor'):
+            self.performance_monitor.record_startup_time(startup_time, STARTUP_BUDGET)
+        else:
+            # Appends one line; building a PerformanceMonitor here would load and rewrite the metrics file
+            from studio.utils.startup_times import append_startup_time
+            append_startup_time(startup_time, STARTUP_BUDGET)
+        if verbose and startup_time > STARTUP_BUDGET:
+            console.print(f"[yellow]⚠️ Startup took {startup_time*1000:.0f} ms "
+                          f"(budget {STARTUP_BUDGET*1000:.0f} ms)[/]")
+    
     def show_banner(self):
         """Display the ASCII art banner"""
         console.print(BANNER)
         console.print(f"[dim]Version 1.0.3 • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/dim]\n")
         
     async def initialize(self):
-        """Initialize with progress indicator"""
+        """Initialize with progress indicator (only the first call does any work)"""
+        if self._initialized:
+            return
+        self._initialized = True
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -140,289 +186,379 @@ class GitFlowStudioCLI:
         console.print(table)
         return repos
         
-    async def interactive_mode(self):
-        """Run in interactive mode"""
+    async def close(self):
+        """Release network and database connections held by services"""
+        if self.services.is_loaded('app_context'):
+            await self.app_context.close()
+        if self.services.is_loaded('github_auth'):
+            await self.github_auth.client.close()
+        if self.services.is_loaded('github_repos'):
+            self.github_repos.mirror.close()
+            self.github_repos.notification_store.close()
+        
+    async def interactive_mode(self, repo_path: Optional[str] = None):
+        """Run in interactive mode, optionally opening repo_path first"""
         console.print(Panel("[bold blue]Welcome to GitFlow Studio Interactive Mode![/]\n[dim]Type 'help' for available commands or 'exit' to quit.[/]", 
                           title="[green]Interactive Mode", border_style="green"))
         
-        while True:
-            try:
-                command = Prompt.ask("\n[bold cyan]gitflow-studio>[/]")
+        # The whole session runs on this loop: repositories stay open, their
+        # read-only results are cached, and prefetches run while the prompt waits
+        loop = asyncio.get_running_loop()
+        GitOperations.share_instances()
+        self._interactive = True
+        if repo_path:
+            self.set_repository(repo_path)
+        try:
+            loop.add_signal_handler(signal.SIGINT, self._interrupt_interactive)
+        except (NotImplementedError, RuntimeError):
+            pass  # Ctrl+C raises KeyboardInterrupt instead (e.g. on Windows)
+        
+        try:
+            while True:
+                try:
+                    # Read in a worker thread so background tasks keep running
+                    command = await loop.run_in_executor(None, Prompt.ask, "\n[bold cyan]gitflow-studio>[/]")
+                except EOFError:
+                    command = 'exit'
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Use 'exit' to quit or 'help' for commands.[/]")
+                    continue
                 
                 if command.lower() in ['exit', 'quit', 'q']:
                     console.print("[yellow]Goodbye! 👋[/]")
                     break
-                elif command.lower() in ['help', 'h', '?']:
-                    self.show_interactive_help()
-                elif command.lower() == 'discover':
-                    repos = self.show_repository_discovery()
-                    if repos:
-                        choice = Prompt.ask("\n[bold]Select repository number to open[/]", default="1")
-                        try:
-                            repo_index = int(choice) - 1
-                            if 0 <= repo_index < len(repos):
-                                self.set_repository(repos[repo_index])
-                            else:
-                                console.print("[red]Invalid repository number![/]")
-                        except ValueError:
-                            console.print("[red]Please enter a valid number![/]")
-                elif command.lower() == 'status':
-                    asyncio.run(self.status())
-                elif command.lower() == 'log':
-                    count = Prompt.ask("Number of commits", default="10")
-                    asyncio.run(self.log(int(count)))
-                elif command.lower() == 'branches':
-                    asyncio.run(self.branches())
-                elif command.lower() == 'stash list':
-                    asyncio.run(self.stash_list())
-                elif command.lower().startswith('commit '):
-                    message = command[7:]
-                    add_all = Confirm.ask("Add all changes before commit?")
-                    asyncio.run(self.commit(message, add_all))
                 
-                # Production-ready features
-                elif command.lower().startswith('alias '):
-                    self.handle_alias_command(command[6:])
-                elif command.lower().startswith('theme '):
-                    self.handle_theme_command(command[6:])
-                elif command.lower().startswith('export '):
-                    self.handle_export_command(command[7:])
-                elif command.lower().startswith('search '):
-                    self.handle_search_command(command[7:])
-                elif command.lower().startswith('performance '):
-                    self.handle_performance_command(command[12:])
-                elif command.lower().startswith('checkout '):
-                    ref = command[9:]
-                    asyncio.run(self.checkout(ref))
-                elif command.lower().startswith('branch create '):
-                    name = command[14:]
-                    start_point = Prompt.ask("Start point (optional)", default="") or None
-                    asyncio.run(self.create_branch(name, start_point))
-                elif command.lower().startswith('branch delete '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
-                    else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        name = parts[2] if len(parts) > 2 else Prompt.ask("Branch name to delete")
-                        force = Confirm.ask("Force delete (even if not merged)?", default=False)
-                        result = asyncio.run(self.git_ops.delete_branch(name, force))
-                        print(result)
-                elif command.lower().startswith('branch delete-remote '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
-                    else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        name = parts[2] if len(parts) > 2 else Prompt.ask("Remote branch name to delete")
-                        remote = Prompt.ask("Remote name", default="origin")
-                        result = asyncio.run(self.git_ops.delete_remote_branch(name, remote))
-                        print(result)
-                elif command.lower().startswith('branch rename '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
-                    else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        if len(parts) >= 4:
-                            old_name = parts[2]
-                            new_name = parts[3]
+                self._command_task = asyncio.ensure_future(self.run_interactive_command(command))
+                try:
+                    await self._command_task
+                except asyncio.CancelledError:
+                    console.print("\n[yellow]Command interrupted.[/]")
+                finally:
+                    self._command_task = None
+        finally:
+            try:
+                loop.remove_signal_handler(signal.SIGINT)
+            except (NotImplementedError, RuntimeError):
+                pass
+            for task in list(self._prefetch_tasks):
+                task.cancel()
+            self._interactive = False
+    
+    def _interrupt_interactive(self):
+        """Ctrl+C: cancel the running command, or remind how to quit at the prompt"""
+        if self._command_task is not None and not self._command_task.done():
+            self._command_task.cancel()
+        else:
+            console.print("\n[yellow]Use 'exit' to quit or 'help' for commands.[/]")
+    
+    def prefetch_repository(self):
+        """Warm the cache of the current repository in the background
+        
+        Only used in interactive mode, where results stay cached on the shared
+        GitOperations until HEAD, the index or a ref changes. Status depends on
+        the working tree, so it is never cached and not prefetched.
+        """
+        if not self._interactive or self.git_ops is None or self.git_ops.cache is None:
+            return
+        for coro in (self.git_ops.branches(), self.git_ops.list_tags(),
+                     self.git_ops.log(max_count=PREFETCH_COMMITS)):
+            task = asyncio.ensure_future(coro)
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_done)
+    
+    def _prefetch_done(self, task):
+        self._prefetch_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()  # failures resurface when the command itself runs
+    
+    async def run_interactive_command(self, command: str):
+        """Run one interactive mode command"""
+        profiling = ExitStack()
+        profile = None
+        try:
+            command_name = command.split()[0].lower() if command.strip() else ""
+            if self.memprofile and command_name:
+                profile = profiling.enter_context(
+                    self.performance_monitor.memory_profile(command_name, self.memprofile_top)
+                )
+            if self.sample_interval > 0 and command_name in LONG_RUNNING_COMMANDS:
+                profiling.enter_context(self.performance_monitor.sampling(self.sample_interval))
+            
+            if command.lower() in ['help', 'h', '?']:
+                self.show_interactive_help()
+            elif command.lower() == 'discover':
+                repos = self.show_repository_discovery()
+                if repos:
+                    choice = Prompt.ask("\n[bold]Select repository number to open[/]", default="1")
+                    try:
+                        repo_index = int(choice) - 1
+                        if 0 <= repo_index < len(repos):
+                            self.set_repository(repos[repo_index])
                         else:
-                            old_name = Prompt.ask("Current branch name")
-                            new_name = Prompt.ask("New branch name")
-                        result = asyncio.run(self.git_ops.rename_branch(old_name, new_name))
-                        print(result)
-                elif command.lower() == 'stash':
-                    message = Prompt.ask("Stash message (optional)", default="")
-                    message = message if message else None
-                    asyncio.run(self.stash(message))
-                elif command.lower() == 'stash pop':
-                    asyncio.run(self.stash_pop())
-                elif command.lower() == 'push':
-                    asyncio.run(self.push())
-                elif command.lower() == 'pull':
-                    asyncio.run(self.pull())
-                elif command.lower() == 'gitflow init':
-                    asyncio.run(self.gitflow_init())
-                elif command.lower().startswith('gitflow feature start '):
-                    name = command[23:]
-                    asyncio.run(self.gitflow_feature_start(name))
-                elif command.lower().startswith('gitflow feature finish '):
-                    name = command[24:]
-                    asyncio.run(self.gitflow_feature_finish(name))
-                elif command.lower().startswith('gitflow release start '):
-                    version = command[23:]
-                    asyncio.run(self.gitflow_release_start(version))
-                elif command.lower().startswith('gitflow release finish '):
-                    version = command[24:]
-                    asyncio.run(self.gitflow_release_finish(version))
-                elif command.lower() == 'repo info':
-                    self.show_repository_info()
-                elif command.lower() == 'github login':
-                    asyncio.run(self.github_login())
-                elif command.lower() == 'github logout':
-                    self.github_logout()
-                elif command.lower() == 'github repos':
-                    await self.github_list_repos()
-                elif command.lower().startswith('github clone '):
-                    repo_name = command[13:]
-                    await self.github_clone_repo(repo_name)
-                elif command.lower().startswith('github search '):
-                    query = command[14:]
-                    await self.github_search_repos(query)
-                elif command.lower() == 'clear':
-                    console.clear()
-                    self.show_banner()
-                elif command.lower().startswith('github issues '):
-                    self.github_issues_mode(command)
-                elif command.lower().startswith('github prs '):
-                    self.github_prs_mode(command)
-                elif command.lower().startswith('github notifications '):
-                    self.github_notifications_mode(command)
-                elif command.lower().startswith('github releases '):
-                    self.github_releases_mode(command)
-                elif command.lower() == 'github stats':
-                    self.github_stats_mode(command)
-                elif command.lower().startswith('github branches '):
-                    self.github_branches_mode(command)
-                elif command.lower().startswith('tag list'):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
-                    else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        result = asyncio.run(self.git_ops.list_tags())
-                        print(result)
-                elif command.lower().startswith('tag create '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
-                    else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name")
-                        annotated = Confirm.ask("Annotated tag?", default=False)
-                        message = Prompt.ask("Tag message (optional)", default="") if annotated else None
-                        commit = Prompt.ask("Commit hash (optional)", default="") or None
-                        result = asyncio.run(self.git_ops.create_tag(name, message=message, annotated=annotated, commit=commit))
-                        print(result)
-                elif command.lower().startswith('tag delete '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
+                            console.print("[red]Invalid repository number![/]")
+                    except ValueError:
+                        console.print("[red]Please enter a valid number![/]")
+            elif command.lower() == 'status':
+                await self.status()
+            elif command.lower() == 'log':
+                count = Prompt.ask("Number of commits", default=str(PREFETCH_COMMITS))
+                await self.log(int(count))
+            elif command.lower() == 'branches':
+                await self.branches()
+            elif command.lower() == 'stash list':
+                await self.stash_list()
+            elif command.lower().startswith('commit '):
+                message = command[7:]
+                add_all = Confirm.ask("Add all changes before commit?")
+                await self.commit(message, add_all)
+            
+            # Production-ready features
+            elif command.lower().startswith('alias '):
+                self.handle_alias_command(command[6:])
+            elif command.lower().startswith('theme '):
+                self.handle_theme_command(command[6:])
+            elif command.lower().startswith('export '):
+                await self.handle_export_command(command[7:])
+            elif command.lower().startswith('search '):
+                self.handle_search_command(command[7:])
+            elif command.lower().startswith('performance '):
+                self.handle_performance_command(command[12:])
+            elif command.lower().startswith('checkout '):
+                ref = command[9:]
+                await self.checkout(ref)
+            elif command.lower().startswith('branch create '):
+                name = command[14:]
+                start_point = Prompt.ask("Start point (optional)", default="") or None
+                await self.create_branch(name, start_point)
+            elif command.lower().startswith('branch delete '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    name = parts[2] if len(parts) > 2 else Prompt.ask("Branch name to delete")
+                    force = Confirm.ask("Force delete (even if not merged)?", default=False)
+                    result = await self.git_ops.delete_branch(name, force)
+                    print(result)
+            elif command.lower().startswith('branch delete-remote '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    name = parts[2] if len(parts) > 2 else Prompt.ask("Remote branch name to delete")
+                    remote = Prompt.ask("Remote name", default="origin")
+                    result = await self.git_ops.delete_remote_branch(name, remote)
+                    print(result)
+            elif command.lower().startswith('branch rename '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    if len(parts) >= 4:
+                        old_name = parts[2]
+                        new_name = parts[3]
                     else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name to delete")
-                        result = asyncio.run(self.git_ops.delete_tag(name))
-                        print(result)
-                elif command.lower().startswith('tag show '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
+                        old_name = Prompt.ask("Current branch name")
+                        new_name = Prompt.ask("New branch name")
+                    result = await self.git_ops.rename_branch(old_name, new_name)
+                    print(result)
+            elif command.lower() == 'stash':
+                message = Prompt.ask("Stash message (optional)", default="")
+                message = message if message else None
+                await self.stash(message)
+            elif command.lower() == 'stash pop':
+                await self.stash_pop()
+            elif command.lower() == 'push':
+                await self.push()
+            elif command.lower() == 'pull':
+                await self.pull()
+            elif command.lower() == 'gitflow init':
+                await self.gitflow_init()
+            elif command.lower().startswith('gitflow feature start '):
+                name = command[23:]
+                await self.gitflow_feature_start(name)
+            elif command.lower().startswith('gitflow feature finish '):
+                name = command[24:]
+                await self.gitflow_feature_finish(name)
+            elif command.lower().startswith('gitflow release start '):
+                version = command[23:]
+                await self.gitflow_release_start(version)
+            elif command.lower().startswith('gitflow release finish '):
+                version = command[24:]
+                await self.gitflow_release_finish(version)
+            elif command.lower() == 'repo info':
+                self.show_repository_info()
+            elif command.lower() == 'github login':
+                await self.github_login()
+            elif command.lower() == 'github logout':
+                self.github_logout()
+            elif command.lower() == 'github repos':
+                await self.github_list_repos()
+            elif command.lower().startswith('github clone '):
+                repo_name = command[13:]
+                await self.github_clone_repo(repo_name)
+            elif command.lower().startswith('github search '):
+                query = command[14:]
+                await self.github_search_repos(query)
+            elif command.lower() == 'clear':
+                console.clear()
+                self.show_banner()
+            elif command.lower().startswith('github issues '):
+                await self.github_issues_mode(command)
+            elif command.lower().startswith('github prs '):
+                await self.github_prs_mode(command)
+            elif command.lower().startswith('github notifications '):
+                await self.github_notifications_mode(command)
+            elif command.lower().startswith('github releases '):
+                await self.github_releases_mode(command)
+            elif command.lower() == 'github stats':
+                await self.github_stats_mode(command)
+            elif command.lower().startswith('github branches '):
+                await self.github_branches_mode(command)
+            elif command.lower().startswith('tag list'):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    result = await self.git_ops.list_tags()
+                    print(result)
+            elif command.lower().startswith('tag create '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name")
+                    annotated = Confirm.ask("Annotated tag?", default=False)
+                    message = Prompt.ask("Tag message (optional)", default="") if annotated else None
+                    commit = Prompt.ask("Commit hash (optional)", default="") or None
+                    result = await self.git_ops.create_tag(name, message=message, annotated=annotated, commit=commit)
+                    print(result)
+            elif command.lower().startswith('tag delete '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name to delete")
+                    result = await self.git_ops.delete_tag(name)
+                    print(result)
+            elif command.lower().startswith('tag show '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name to show")
+                    result = await self.git_ops.show_tag_details(name)
+                    print(result)
+            elif command.lower().startswith('cherry-pick '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    if len(parts) > 1:
+                        commit = parts[1]
                     else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        name = parts[2] if len(parts) > 2 else Prompt.ask("Tag name to show")
-                        result = asyncio.run(self.git_ops.show_tag_details(name))
-                        print(result)
-                elif command.lower().startswith('cherry-pick '):
-                    repo = self.current_repo
-                    if not repo:
-                        console.print("[red]No repository selected![/]")
+                        commit = Prompt.ask("Commit hash to cherry-pick")
+                    no_commit = Confirm.ask("No auto-commit?", default=False)
+                    cmd = ['cherry-pick']
+                    if no_commit:
+                        cmd.append('--no-commit')
+                    cmd.append(commit)
+                    result = await self.git_ops._run_git_command(*cmd)
+                    print(result)
+            elif command.lower().startswith('revert '):
+                repo = self.current_repo
+                if not repo:
+                    console.print("[red]No repository selected![/]")
+                else:
+                    if not self.git_ops:
+                        self.git_ops = GitOperations.open(repo)
+                    parts = command.split()
+                    if len(parts) > 1:
+                        commit = parts[1]
                     else:
-                        if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        if len(parts) > 1:
-                            commit = parts[1]
-                        else:
-                            commit = Prompt.ask("Commit hash to cherry-pick")
-                        no_commit = Confirm.ask("No auto-commit?", default=False)
-                        cmd = ['cherry-pick']
-                        if no_commit:
-                            cmd.append('--no-commit')
-                        cmd.append(commit)
-                        result = asyncio.run(self.git_ops._run_git_command(*cmd))
-                        print(result)
-                elif command.lower().startswith('revert '):
+                        commit = Prompt.ask("Commit hash to revert")
+                    no_commit = Confirm.ask("No auto-commit?", default=False)
+                    cmd = ['revert']
+                    if no_commit:
+                        cmd.append('--no-commit')
+                    cmd.append(commit)
+                    result = await self.git_ops._run_git_command(*cmd)
+                    print(result)
+            elif command.lower().startswith('rebase-interactive '):
+                base = command[18:]
+                await self.rebase_interactive(base)
+            elif command.lower().startswith('squash '):
+                num = int(command[7:])
+                message = Prompt.ask("Commit message for the squashed commit", default="")
+                await self.squash(num, message)
+            elif command.lower().startswith('analytics '):
+                parts = command.split()
+                if len(parts) >= 2:
+                    subcommand = parts[1]
                     repo = self.current_repo
                     if not repo:
                         console.print("[red]No repository selected![/]")
                     else:
                         if not self.git_ops:
-                            self.git_ops = GitOperations(repo)
-                        parts = command.split()
-                        if len(parts) > 1:
-                            commit = parts[1]
+                            self.git_ops = GitOperations.open(repo)
+                        if subcommand == 'stats':
+                            result = await self.git_ops.get_repository_stats()
+                            self.display_repository_stats(result)
+                        elif subcommand == 'activity':
+                            days = int(parts[2]) if len(parts) > 2 else 30
+                            result = await self.git_ops.get_commit_activity(days)
+                            self.display_commit_activity(result, days)
+                        elif subcommand == 'files':
+                            days = int(parts[2]) if len(parts) > 2 else 30
+                            result = await self.git_ops.get_file_changes(days)
+                            self.display_file_changes(result, days)
+                        elif subcommand == 'branches':
+                            result = await self.git_ops.get_branch_activity()
+                            self.display_branch_activity(result)
+                        elif subcommand == 'contributors':
+                            result = await self.git_ops.get_contributor_stats()
+                            self.display_contributor_stats(result)
+                        elif subcommand == 'health':
+                            result = await self.git_ops.get_repository_health()
+                            self.display_repository_health(result)
                         else:
-                            commit = Prompt.ask("Commit hash to revert")
-                        no_commit = Confirm.ask("No auto-commit?", default=False)
-                        cmd = ['revert']
-                        if no_commit:
-                            cmd.append('--no-commit')
-                        cmd.append(commit)
-                        result = asyncio.run(self.git_ops._run_git_command(*cmd))
-                        print(result)
-                elif command.lower().startswith('rebase-interactive '):
-                    base = command[18:]
-                    asyncio.run(self.rebase_interactive(base))
-                elif command.lower().startswith('squash '):
-                    num = int(command[7:])
-                    message = Prompt.ask("Commit message for the squashed commit", default="")
-                    asyncio.run(self.squash(num, message))
-                elif command.lower().startswith('analytics '):
-                    parts = command.split()
-                    if len(parts) >= 2:
-                        subcommand = parts[1]
-                        repo = self.current_repo
-                        if not repo:
-                            console.print("[red]No repository selected![/]")
-                        else:
-                            if not self.git_ops:
-                                self.git_ops = GitOperations(repo)
-                            if subcommand == 'stats':
-                                result = asyncio.run(self.git_ops.get_repository_stats())
-                                asyncio.run(self.display_repository_stats(result))
-                            elif subcommand == 'activity':
-                                days = int(parts[2]) if len(parts) > 2 else 30
-                                result = asyncio.run(self.git_ops.get_commit_activity(days))
-                                asyncio.run(self.display_commit_activity(result, days))
-                            elif subcommand == 'files':
-                                days = int(parts[2]) if len(parts) > 2 else 30
-                                result = asyncio.run(self.git_ops.get_file_changes(days))
-                                asyncio.run(self.display_file_changes(result, days))
-                            elif subcommand == 'branches':
-                                result = asyncio.run(self.git_ops.get_branch_activity())
-                                asyncio.run(self.display_branch_activity(result))
-                            elif subcommand == 'contributors':
-                                result = asyncio.run(self.git_ops.get_contributor_stats())
-                                asyncio.run(self.display_contributor_stats(result))
-                            elif subcommand == 'health':
-                                result = asyncio.run(self.git_ops.get_repository_health())
-                                asyncio.run(self.display_repository_health(result))
-                            else:
-                                console.print("[red]Unknown analytics command. Use: stats, activity, files, branches, contributors, health[/]")
-                    else:
-                        console.print("[red]Analytics command requires a subcommand. Use: stats, activity, files, branches, contributors, health[/]")
+                            console.print("[red]Unknown analytics command. Use: stats, activity, files, branches, contributors, health[/]")
                 else:
-                    console.print(f"[red]Unknown command: {command}[/]")
-                    console.print("[dim]Type 'help' for available commands.[/]")
-                    
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Use 'exit' to quit or 'help' for commands.[/]")
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/]")
+                    console.print("[red]Analytics command requires a subcommand. Use: stats, activity, files, branches, contributors, health[/]")
+            else:
+                console.print(f"[red]Unknown command: {command}[/]")
+                console.print("[dim]Type 'help' for available commands.[/]")
+                
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Use 'exit' to quit or 'help' for commands.[/]")
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/]")
+        finally:
+            profiling.close()
+            if profile:
+                self.performance_monitor.display_memory_profile(profile)
                 
     def show_interactive_help(self):
         """Show help for interactive mode"""
@@ -564,7 +700,7 @@ class GitFlowStudioCLI:
             
         try:
             self.current_repo = repo_path
-            self.git_ops = GitOperations(repo_path)
+            self.git_ops = GitOperations.open(repo_path)
             
             # Create a nice panel for repository info
             repo_info = f"""
@@ -575,6 +711,7 @@ class GitFlowStudioCLI:
 [bright_blue]Status:[/] [green]Ready[/]
             """
             console.print(Panel(repo_info, title="[green]Repository Info", border_style="green"))
+            self.prefetch_repository()
             return True
         except Exception as e:
             console.print(Panel(f"[bold red]❌ Failed to set repository:[/] {e}", 
@@ -1089,15 +1226,11 @@ class GitFlowStudioCLI:
                               title="[red]Error", border_style="red"))
             return
         
-        success = await self.github_repos.clone_repository(repo_name)
-        if success:
+        repo_path = await self.github_repos.clone_repository(repo_name)
+        if repo_path:
             # Ask if user wants to set this as current repository
             if Confirm.ask("Set this as current repository?"):
-                user_info = self.github_auth.get_user_info()
-                if user_info:
-                    repo_path = Path.home() / "git" / user_info['login'] / repo_name
-                    if repo_path.exists():
-                        self.set_repository(str(repo_path))
+                self.set_repository(str(repo_path))
     
     async def github_search_repos(self, query: str):
         """Search GitHub repositories"""
@@ -1109,7 +1242,7 @@ class GitFlowStudioCLI:
         repos = await self.github_repos.search_repositories(query)
         self.github_repos.display_repositories(repos)
 
-    def github_issues_mode(self, command: str):
+    async def github_issues_mode(self, command: str):
         """Handle GitHub issues commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1125,13 +1258,13 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'list':
-            self.github_issues_list_mode(args)
+            await self.github_issues_list_mode(args)
         elif command == 'create':
-            self.github_issues_create_mode(args)
+            await self.github_issues_create_mode(args)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
-    def github_issues_list_mode(self, args: List[str]):
+    async def github_issues_list_mode(self, args: List[str]):
         """Handle 'github issues list' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github issues list <repo>'[/]", 
@@ -1139,9 +1272,9 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        asyncio.run(self.github_repos.list_issues(repo, 'open', 20))
+        await self.github_repos.list_issues(repo, 'open', 20)
 
-    def github_issues_create_mode(self, args: List[str]):
+    async def github_issues_create_mode(self, args: List[str]):
         """Handle 'github issues create' command"""
         if len(args) < 2:
             console.print(Panel("[bold red]❌ Repository and title are required. Use 'github issues create <repo> <title>'[/]", 
@@ -1150,9 +1283,9 @@ class GitFlowStudioCLI:
         
         repo, title = args[0], args[1]
         body = args[2] if len(args) > 2 else ""
-        asyncio.run(self.github_repos.create_issue(repo, title, body))
+        await self.github_repos.create_issue(repo, title, body)
 
-    def github_prs_mode(self, command: str):
+    async def github_prs_mode(self, command: str):
         """Handle GitHub PRs commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1168,23 +1301,23 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'list':
-            self.github_prs_list_mode(args)
+            await self.github_prs_list_mode(args)
         elif command == 'create':
-            self.github_prs_create_mode(args)
+            await self.github_prs_create_mode(args)
         elif command == 'comment':
-            self.github_prs_comment_mode(args)
+            await self.github_prs_comment_mode(args)
         elif command == 'close':
-            self.github_prs_close_mode(args)
+            await self.github_prs_close_mode(args)
         elif command == 'merge':
-            self.github_prs_merge_mode(args)
+            await self.github_prs_merge_mode(args)
         elif command == 'assign':
-            self.github_prs_assign_mode(args)
+            await self.github_prs_assign_mode(args)
         elif command == 'label':
-            self.github_prs_label_mode(args)
+            await self.github_prs_label_mode(args)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
-    def github_prs_list_mode(self, args: List[str]):
+    async def github_prs_list_mode(self, args: List[str]):
         """Handle 'github prs list' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github prs list <repo>'[/]", 
@@ -1192,9 +1325,9 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        asyncio.run(self.github_repos.list_pull_requests(repo, 'open', 20))
+        await self.github_repos.list_pull_requests(repo, 'open', 20)
 
-    def github_prs_create_mode(self, args: List[str]):
+    async def github_prs_create_mode(self, args: List[str]):
         """Handle 'github prs create' command"""
         if len(args) < 2:
             console.print(Panel("[bold red]❌ Repository and title are required. Use 'github prs create <repo> <title>'[/]", 
@@ -1203,9 +1336,9 @@ class GitFlowStudioCLI:
         
         repo, title = args[0], args[1]
         body = args[2] if len(args) > 2 else ""
-        asyncio.run(self.github_repos.create_pull_request(repo, title, body))
+        await self.github_repos.create_pull_request(repo, title, body)
 
-    def github_prs_comment_mode(self, args: List[str]):
+    async def github_prs_comment_mode(self, args: List[str]):
         """Handle 'github prs comment' command"""
         if len(args) < 2:
             console.print(Panel("[bold red]❌ Repository and PR number are required. Use 'github prs comment <repo> <pr>'[/]", 
@@ -1214,9 +1347,9 @@ class GitFlowStudioCLI:
         
         repo, pr = args[0], args[1]
         body = args[2] if len(args) > 2 else ""
-        asyncio.run(self.github_repos.comment_pull_request(repo, int(pr), body))
+        await self.github_repos.comment_pull_request(repo, int(pr), body)
 
-    def github_prs_close_mode(self, args: List[str]):
+    async def github_prs_close_mode(self, args: List[str]):
         """Handle 'github prs close' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github prs close <repo>'[/]", 
@@ -1224,9 +1357,9 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        asyncio.run(self.github_repos.close_pull_request(repo, int(args[0])))
+        await self.github_repos.close_pull_request(repo, int(args[0]))
 
-    def github_prs_merge_mode(self, args: List[str]):
+    async def github_prs_merge_mode(self, args: List[str]):
         """Handle 'github prs merge' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github prs merge <repo>'[/]", 
@@ -1234,9 +1367,9 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        asyncio.run(self.github_repos.merge_pull_request(repo, int(args[0]), args[1] if len(args) > 1 else 'merge'))
+        await self.github_repos.merge_pull_request(repo, int(args[0]), args[1] if len(args) > 1 else 'merge')
 
-    def github_prs_assign_mode(self, args: List[str]):
+    async def github_prs_assign_mode(self, args: List[str]):
         """Handle 'github prs assign' command"""
         if len(args) < 2:
             console.print(Panel("[bold red]❌ Repository and user are required. Use 'github prs assign <repo> <user>'[/]", 
@@ -1244,10 +1377,10 @@ class GitFlowStudioCLI:
             return
         
         repo, user = args[0], args[1]
-        result = asyncio.run(self.github_repos.assign_pull_request(repo, int(args[0]), args[1]))
+        result = await self.github_repos.assign_pull_request(repo, int(args[0]), args[1])
         print(result)
 
-    def github_prs_label_mode(self, args: List[str]):
+    async def github_prs_label_mode(self, args: List[str]):
         """Handle 'github prs label' command"""
         if len(args) < 2:
             console.print(Panel("[bold red]❌ Repository and label are required. Use 'github prs label <repo> <label>'[/]", 
@@ -1255,10 +1388,10 @@ class GitFlowStudioCLI:
             return
         
         repo, label = args[0], args[1]
-        result = asyncio.run(self.github_repos.label_pull_request(repo, int(args[0]), args[1]))
+        result = await self.github_repos.label_pull_request(repo, int(args[0]), args[1])
         print(result)
 
-    def github_notifications_mode(self, command: str):
+    async def github_notifications_mode(self, command: str):
         """Handle GitHub notifications commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1274,15 +1407,15 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'list':
-            result = self.github_notifications_list_mode(args)
+            result = await self.github_notifications_list_mode(args)
             print(result)
         elif command == 'mark-read':
-            result = self.github_notifications_mark_read_mode(args)
+            result = await self.github_notifications_mark_read_mode(args)
             print(result)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
-    def github_notifications_list_mode(self, args: List[str]):
+    async def github_notifications_list_mode(self, args: List[str]):
         """Handle 'github notifications list' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github notifications list <repo>'[/]", 
@@ -1290,10 +1423,10 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        result = asyncio.run(self.github_repos.list_notifications(all=args[0] == 'all'))
+        result = await self.github_repos.list_notifications(all=args[0] == 'all')
         print(result)
 
-    def github_notifications_mark_read_mode(self, args: List[str]):
+    async def github_notifications_mark_read_mode(self, args: List[str]):
         """Handle 'github notifications mark-read' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github notifications mark-read <repo>'[/]", 
@@ -1301,10 +1434,10 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        result = asyncio.run(self.github_repos.mark_notifications_as_read(thread_id=args[0] or '', mark_all=args[0] == 'all'))
+        result = await self.github_repos.mark_notifications_as_read(thread_id=args[0] or '', mark_all=args[0] == 'all')
         print(result)
 
-    def github_releases_mode(self, command: str):
+    async def github_releases_mode(self, command: str):
         """Handle GitHub releases commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1320,9 +1453,9 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'list':
-            self.github_releases_list_mode(args)
+            await self.github_releases_list_mode(args)
         elif command == 'create':
-            self.github_releases_create_mode(args)
+            await self.github_releases_create_mode(args)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
@@ -1339,7 +1472,7 @@ class GitFlowStudioCLI:
             args.prerelease
         )
 
-    def github_stats_mode(self, command: str):
+    async def github_stats_mode(self, command: str):
         """Handle GitHub stats commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1355,11 +1488,11 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'list':
-            self.github_stats_list_mode(args)
+            await self.github_stats_list_mode(args)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
-    def github_stats_list_mode(self, args: List[str]):
+    async def github_stats_list_mode(self, args: List[str]):
         """Handle 'github stats list' command"""
         if len(args) < 1:
             console.print(Panel("[bold red]❌ Repository is required. Use 'github stats list <repo>'[/]", 
@@ -1367,9 +1500,9 @@ class GitFlowStudioCLI:
             return
         
         repo = args[0]
-        asyncio.run(self.github_repos.list_stats(repo))
+        await self.github_repos.list_stats(repo)
 
-    def github_branches_mode(self, command: str):
+    async def github_branches_mode(self, command: str):
         """Handle GitHub branches commands"""
         if not self.current_repo:
             console.print(Panel("[bold red]❌ No repository selected. Use --repo <path> to set repository.[/]", 
@@ -1385,7 +1518,7 @@ class GitFlowStudioCLI:
         args = command_parts[2:] if len(command_parts) > 2 else []
         
         if command == 'graph':
-            self.github_branches_graph_mode(args)
+            await self.github_branches_graph_mode(args)
         else:
             console.print(f"[red]Unknown command: {command}[/]")
 
@@ -1423,7 +1556,7 @@ class GitFlowStudioCLI:
             return
             
         if not self.git_ops:
-            self.git_ops = GitOperations(self.current_repo)
+            self.git_ops = GitOperations.open(self.current_repo)
             
         with Progress(
             SpinnerColumn(),
@@ -1785,7 +1918,7 @@ class GitFlowStudioCLI:
         else:
             console.print("[red]Invalid theme command. Use: list, set, preview, create, delete, export, import, stats[/]")
     
-    def handle_export_command(self, args: str):
+    async def handle_export_command(self, args: str):
         """Handle export commands"""
         parts = args.split()
         if not parts:
@@ -1800,26 +1933,17 @@ class GitFlowStudioCLI:
                 return
             
             format = "json"
-            if "--format=csv" in parts:
-                format = "csv"
-            
-            # Collect all analytics data
-            analytics_data = {}
-            
-            # Repository stats
-            try:
-                if self.git_ops:
-                    # Note: This would need to be called in an async context
-                    # For now, we'll skip this and let users export manually
-                    pass
-            except:
-                pass
-            
-            # Export all analytics
-            exported_files = self.export_manager.export_all_analytics(analytics_data, format)
-            
-            if exported_files:
-                console.print(f"[green]✅ Exported {len(exported_files)} analytics files[/]")
+            archive = None
+            for part in parts:
+                if part.startswith("--format="):
+                    format = part[9:]
+                elif part.startswith("--archive="):
+                    archive = part[10:]
+            
+            if not self.git_ops:
+                self.git_ops = GitOperations.open(self.current_repo)
+            # Datasets are computed concurrently and each is written as soon as it is ready
+            await self.export_manager.export_analytics(self.git_ops, format, archive=archive)
         
         elif command == "list":
             self.export_manager.show_exports()
@@ -2039,11 +2163,8 @@ class GitFlowStudioCLI:
         else:
             console.print("[red]Invalid performance command. Use: summary, operation, system, memory, cpu, export, cleanup, reset[/]")
 
-def main():
-    """Main CLI entry point"""
-    cli = GitFlowStudioCLI()
-    cli.show_banner()
-    
+def create_parser():
+    """Create the top-level parser with the global options and the command subparsers action"""
     parser = argparse.ArgumentParser(
         description="[bold cyan]GitFlow Studio CLI[/] - [yellow]Comprehensive Git workflow management[/]",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2064,274 +2185,102 @@ def main():
     parser.add_argument('--discover', action='store_true', help='Discover Git repositories in current directory')
     parser.add_argument('--github-login', action='store_true', help='Login to GitHub')
     parser.add_argument('--github-logout', action='store_true', help='Logout from GitHub')
+    parser.add_argument('--memprofile', action='store_true', help='Profile memory allocations of each command with tracemalloc')
+    parser.add_argument('--memprofile-top', type=int, default=10, help='Number of allocation sites to report with --memprofile (default: 10)')
+    parser.add_argument('--sample-interval', type=float, default=DEFAULT_SAMPLE_INTERVAL,
+                        help=f'Seconds between background memory/CPU samples during long-running commands, 0 to disable (default: {DEFAULT_SAMPLE_INTERVAL})')
+    parser.add_argument('--no-daemon', action='store_true', help='Run locally even if a gitflow-studio daemon is running')
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    return parser, subparsers
+
+def find_command(parser: argparse.ArgumentParser, argv: List[str]) -> Optional[str]:
+    """Return the command word of argv, skipping global options and their values"""
+    takes_value = {
+        option for action in parser._actions
+        if action.option_strings and action.nargs != 0
+        for option in action.option_strings
+    }
     
-    # Status command
-    subparsers.add_parser('status', help='Show repository status')
-    
-    # Log command
-    log_parser = subparsers.add_parser('log', help='Show commit log')
-    log_parser.add_argument('--max-count', type=int, default=20, help='Maximum number of commits')
-    
-    # Branch commands
-    branch_parser = subparsers.add_parser('branch', help='Branch operations')
-    branch_subparsers = branch_parser.add_subparsers(dest='branch_command')
-    
-    branch_subparsers.add_parser('list', help='List all branches')
-    
-    create_branch_parser = branch_subparsers.add_parser('create', help='Create a new branch')
-    create_branch_parser.add_argument('name', help='Branch name')
-    create_branch_parser.add_argument('--start-point', help='Start point (branch/commit)')
-    
-    delete_branch_parser = branch_subparsers.add_parser('delete', help='Delete a local branch')
-    delete_branch_parser.add_argument('name', help='Branch name to delete')
-    delete_branch_parser.add_argument('--force', action='store_true', help='Force delete (even if not merged)')
-    
-    delete_remote_branch_parser = branch_subparsers.add_parser('delete-remote', help='Delete a remote branch')
-    delete_remote_branch_parser.add_argument('name', help='Branch name to delete')
-    delete_remote_branch_parser.add_argument('--remote', default='origin', help='Remote name (default: origin)')
-    
-    rename_branch_parser = branch_subparsers.add_parser('rename', help='Rename a branch')
-    rename_branch_parser.add_argument('old_name', help='Current branch name')
-    rename_branch_parser.add_argument('new_name', help='New branch name')
+    index = 0
+    while index < len(argv):
+        token = argv[index]
+        if token == '--':
+            return argv[index + 1] if index + 1 < len(argv) else None
+        if not token.startswith('-'):
+            return token
+        if token in takes_value:
+            index += 1
+        index += 1
+    return None
+
+def prepare_command(cli: GitFlowStudioCLI, argv: List[str]):
+    """Build the parser for argv, configuring only the invoked command
     
-    checkout_parser = branch_subparsers.add_parser('checkout', help='Checkout a branch')
-    checkout_parser.add_argument('ref', help='Branch or commit to checkout')
+    Returns (parser, command, command_parsers); command is None when argv has
+    no (known) command.
+    """
+    parser, subparsers = create_parser()
     
-    merge_parser = branch_subparsers.add_parser('merge', help='Merge a branch')
-    merge_parser.add_argument('branch', help='Branch to merge')
+    # Only the invoked command's module is imported and its arguments built;
+    # every other command gets a stub subparser described by the command index
+    command_name = find_command(parser, argv)
+    wants_help = not argv or '-h' in argv or '--help' in argv
+    if command_name not in COMMAND_MODULES and (command_name or wants_help):
+        load_plugin_commands(cli.app_context.plugin_loader)
     
-    rebase_parser = branch_subparsers.add_parser('rebase', help='Rebase current branch')
-    rebase_parser.add_argument('branch', help='Branch to rebase onto')
+    command_parsers = {name: subparsers.add_parser(name, help=command_help(name)) for name in command_names()}
+    command = None
+    if command_name in command_parsers:
+        command = load_command(command_name)
+        command.configure(command_parsers[command_name])
     
-    # Cherry-pick command
-    cherry_pick_parser = subparsers.add_parser('cherry-pick', help='Cherry-pick a commit')
-    cherry_pick_group = cherry_pick_parser.add_mutually_exclusive_group(required=True)
-    cherry_pick_group.add_argument('commit', nargs='?', help='Commit hash to cherry-pick')
-    cherry_pick_group.add_argument('--continue', action='store_true', help='Continue cherry-pick after resolving conflicts')
-    cherry_pick_group.add_argument('--abort', action='store_true', help='Abort cherry-pick operation')
-    cherry_pick_parser.add_argument('--no-commit', action='store_true', help='Do not automatically commit')
-    
-    # Revert command
-    revert_parser = subparsers.add_parser('revert', help='Revert a commit')
-    revert_group = revert_parser.add_mutually_exclusive_group(required=True)
-    revert_group.add_argument('commit', nargs='?', help='Commit hash to revert')
-    revert_group.add_argument('--continue', action='store_true', help='Continue revert after resolving conflicts')
-    revert_group.add_argument('--abort', action='store_true', help='Abort revert operation')
-    revert_parser.add_argument('--no-commit', action='store_true', help='Do not automatically commit')
-    
-    # Stash commands
-    stash_parser = subparsers.add_parser('stash', help='Stash operations')
-    stash_subparsers = stash_parser.add_subparsers(dest='stash_command')
+    return parser, command, command_parsers
+
+async def run_command(cli: GitFlowStudioCLI, args, command, command_parser):
+    """Run a parsed command; shared by main() and the daemon"""
+    # Only require --repo for commands that need a local repo
+    requires_repo = getattr(command, 'REQUIRES_REPO', False)
+    if requires_repo and not args.repo:
+        console.print(Panel("[bold red]❌ Repository path is required. Use --repo <path>[/]", 
+                          title="[red]Error", border_style="red"))
+        return
     
-    stash_list_parser = stash_subparsers.add_parser('list', help='List stashes')
-    stash_list_parser.add_argument('--repo', required=True, help='Local repository path')
+    if not getattr(command, 'PLAIN_OUTPUT', False):
+        await cli.initialize()
 
-    stash_create_parser = stash_subparsers.add_parser('create', help='Create a new stash')
-    stash_create_parser.add_argument('--repo', required=True, help='Local repository path')
-    stash_create_parser.add_argument('--message', help='Stash message')
+    # Only set repository for commands that require it
+    if requires_repo:
+        if not cli.set_repository(args.repo):
+            return
 
-    stash_pop_parser = stash_subparsers.add_parser('pop', help='Pop a stash')
-    stash_pop_parser.add_argument('--repo', required=True, help='Local repository path')
-    stash_pop_parser.add_argument('--stash', help='Stash reference (e.g., stash@{0})')
+    await command.run(cli, args, command_parser)
 
-    stash_drop_parser = stash_subparsers.add_parser('drop', help='Drop a stash')
-    stash_drop_parser.add_argument('--repo', required=True, help='Local repository path')
-    stash_drop_parser.add_argument('--stash', help='Stash reference (e.g., stash@{0})')
-    
-    # Commit command
-    commit_parser = subparsers.add_parser('commit', help='Create a commit')
-    commit_parser.add_argument('message', help='Commit message')
-    commit_parser.add_argument('--add-all', action='store_true', help='Add all changes before commit')
-    
-    # Push/Pull commands
-    push_parser = subparsers.add_parser('push', help='Push changes')
-    push_parser.add_argument('--remote', help='Remote name')
-    push_parser.add_argument('--branch', help='Branch name')
-    
-    pull_parser = subparsers.add_parser('pull', help='Pull changes')
-    pull_parser.add_argument('--remote', help='Remote name')
-    pull_parser.add_argument('--branch', help='Branch name')
-    
-    # Git Flow commands
-    gitflow_parser = subparsers.add_parser('gitflow', help='Git Flow operations')
-    gitflow_subparsers = gitflow_parser.add_subparsers(dest='gitflow_command')
-    
-    gitflow_subparsers.add_parser('init', help='Initialize Git Flow')
-    
-    feature_start_parser = gitflow_subparsers.add_parser('feature-start', help='Start a feature branch')
-    feature_start_parser.add_argument('name', help='Feature name')
-    
-    feature_finish_parser = gitflow_subparsers.add_parser('feature-finish', help='Finish a feature branch')
-    feature_finish_parser.add_argument('name', help='Feature name')
-    
-    release_start_parser = gitflow_subparsers.add_parser('release-start', help='Start a release branch')
-    release_start_parser.add_argument('version', help='Release version')
-    
-    release_finish_parser = gitflow_subparsers.add_parser('release-finish', help='Finish a release branch')
-    release_finish_parser.add_argument('version', help='Release version')
-    
-    # GitHub commands
-    github_parser = subparsers.add_parser('github', help='GitHub operations')
-    github_subparsers = github_parser.add_subparsers(dest='github_command')
-    
-    github_subparsers.add_parser('login', help='Login to GitHub')
-    github_subparsers.add_parser('logout', help='Logout from GitHub')
-    github_subparsers.add_parser('repos', help='List GitHub repositories')
+def main():
+    """Main CLI entry point"""
+    cli = GitFlowStudioCLI()
+    argv = sys.argv[1:]
+    parser, command, command_parsers = prepare_command(cli, argv)
     
-    github_clone_parser = github_subparsers.add_parser('clone', help='Clone a GitHub repository')
-    github_clone_parser.add_argument('name', help='Repository name')
-    github_clone_parser.add_argument('--path', help='Target path for cloning')
+    if not getattr(command, 'PLAIN_OUTPUT', False):
+        cli.show_banner()
     
-    github_search_parser = github_subparsers.add_parser('search', help='Search GitHub repositories')
-    github_search_parser.add_argument('query', help='Search query')
-    github_search_parser.add_argument('--limit', type=int, default=20, help='Maximum number of results')
+    args = parser.parse_args(argv)
+    cli.memprofile = args.memprofile
+    cli.memprofile_top = args.memprofile_top
+    cli.sample_interval = args.sample_interval
     
-    # GitHub PRs commands
-    github_prs_parser = github_subparsers.add_parser('prs', help='Manage GitHub pull requests')
-    github_prs_subparsers = github_prs_parser.add_subparsers(dest='prs_command')
-    
-    github_prs_list_parser = github_prs_subparsers.add_parser('list', help='List pull requests for a repository')
-    github_prs_list_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_list_parser.add_argument('--state', choices=['open', 'closed', 'all'], default='open', help='PR state')
-    github_prs_list_parser.add_argument('--label', help='Filter by label')
-    github_prs_list_parser.add_argument('--assignee', help='Filter by assignee')
-    github_prs_list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of PRs to list')
-
-    github_prs_create_parser = github_prs_subparsers.add_parser('create', help='Create a new pull request')
-    github_prs_create_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_create_parser.add_argument('--title', required=True, help='Title of the PR')
-    github_prs_create_parser.add_argument('--head', required=True, help='Name of the branch where changes are implemented')
-    github_prs_create_parser.add_argument('--base', required=True, help='Name of the branch you want the changes pulled into')
-    github_prs_create_parser.add_argument('--body', help='Body/description of the PR')
-
-    github_prs_comment_parser = github_prs_subparsers.add_parser('comment', help='Comment on a pull request')
-    github_prs_comment_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_comment_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
-    github_prs_comment_parser.add_argument('--body', required=True, help='Comment body')
-
-    github_prs_close_parser = github_prs_subparsers.add_parser('close', help='Close a pull request')
-    github_prs_close_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_close_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
-
-    github_prs_merge_parser = github_prs_subparsers.add_parser('merge', help='Merge a pull request')
-    github_prs_merge_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_merge_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
-    github_prs_merge_parser.add_argument('--method', choices=['merge', 'squash', 'rebase'], default='merge', help='Merge method')
-
-    github_prs_assign_parser = github_prs_subparsers.add_parser('assign', help='Assign a user to a pull request')
-    github_prs_assign_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_assign_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
-    github_prs_assign_parser.add_argument('--user', required=True, help='Username to assign')
-
-    github_prs_label_parser = github_prs_subparsers.add_parser('label', help='Add a label to a pull request')
-    github_prs_label_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_prs_label_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
-    github_prs_label_parser.add_argument('--label', required=True, help='Label to add')
-
-    # GitHub notifications commands
-    github_notifications_parser = github_subparsers.add_parser('notifications', help='Manage GitHub notifications')
-    github_notifications_subparsers = github_notifications_parser.add_subparsers(dest='notifications_command')
-
-    github_notifications_list_parser = github_notifications_subparsers.add_parser('list', help='List notifications')
-    github_notifications_list_parser.add_argument('--all', action='store_true', help='List all notifications (not just unread)')
-
-    github_notifications_mark_read_parser = github_notifications_subparsers.add_parser('mark-read', help='Mark notifications as read')
-    github_notifications_mark_read_parser.add_argument('--id', help='Notification thread ID to mark as read')
-    github_notifications_mark_read_parser.add_argument('--all', action='store_true', help='Mark all notifications as read')
-
-    # GitHub releases commands
-    github_releases_parser = github_subparsers.add_parser('releases', help='Manage GitHub releases')
-    github_releases_subparsers = github_releases_parser.add_subparsers(dest='releases_command')
-
-    github_releases_list_parser = github_releases_subparsers.add_parser('list', help='List releases for a repository')
-    github_releases_list_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_releases_list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of releases to list')
-
-    github_releases_create_parser = github_releases_subparsers.add_parser('create', help='Create a new release')
-    github_releases_create_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-    github_releases_create_parser.add_argument('--tag', required=True, help='Tag name for the release')
-    github_releases_create_parser.add_argument('--title', required=True, help='Release title')
-    github_releases_create_parser.add_argument('--body', help='Release description/body')
-    github_releases_create_parser.add_argument('--draft', action='store_true', help='Create as draft release')
-    github_releases_create_parser.add_argument('--prerelease', action='store_true', help='Mark as prerelease')
-
-    github_stats_parser = github_subparsers.add_parser('stats', help='Show repository stats')
-    github_stats_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-
-    # GitHub branches commands
-    github_branches_parser = github_subparsers.add_parser('branches', help='Branch operations')
-    github_branches_subparsers = github_branches_parser.add_subparsers(dest='branches_command')
-
-    github_branches_graph_parser = github_branches_subparsers.add_parser('graph', help='Show branch graph')
-    github_branches_graph_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
-
-    # Tag commands
-    tag_parser = subparsers.add_parser('tag', help='Tag operations')
-    tag_subparsers = tag_parser.add_subparsers(dest='tag_command')
-
-    tag_list_parser = tag_subparsers.add_parser('list', help='List all tags')
-    tag_list_parser.add_argument('--repo', required=True, help='Local repository path')
-
-    tag_create_parser = tag_subparsers.add_parser('create', help='Create a new tag')
-    tag_create_parser.add_argument('--repo', required=True, help='Local repository path')
-    tag_create_parser.add_argument('name', help='Tag name')
-    tag_create_parser.add_argument('--message', help='Tag message (for annotated tag)')
-    tag_create_parser.add_argument('--annotated', action='store_true', help='Create an annotated tag')
-    tag_create_parser.add_argument('--commit', help='Commit hash to tag (default: HEAD)')
-
-    tag_delete_parser = tag_subparsers.add_parser('delete', help='Delete a tag')
-    tag_delete_parser.add_argument('--repo', required=True, help='Local repository path')
-    tag_delete_parser.add_argument('name', help='Tag name to delete')
-
-    tag_show_parser = tag_subparsers.add_parser('show', help='Show tag details')
-    tag_show_parser.add_argument('--repo', required=True, help='Local repository path')
-    tag_show_parser.add_argument('name', help='Tag name to show')
-
-    # Interactive rebase command
-    rebase_interactive_parser = subparsers.add_parser('rebase-interactive', help='Interactive rebase onto a base branch or commit')
-    rebase_interactive_parser.add_argument('base', help='Base branch or commit to rebase onto')
-
-    # Squash command
-    squash_parser = subparsers.add_parser('squash', help='Squash last N commits into one')
-    squash_parser.add_argument('num', type=int, help='Number of commits to squash (from HEAD)')
-    squash_parser.add_argument('--message', help='Commit message for the squashed commit')
-
-    # Log for a specific file
-    log_file_parser = subparsers.add_parser('log-file', help='Show commit log for a specific file')
-    log_file_parser.add_argument('file', help='File path')
-    log_file_parser.add_argument('--max-count', type=int, default=20, help='Maximum number of commits')
-
-    # Show commit details
-    show_commit_parser = subparsers.add_parser('show-commit', help='Show full details for a specific commit')
-    show_commit_parser.add_argument('hash', help='Commit hash')
-
-    # Repository Analytics commands
-    analytics_parser = subparsers.add_parser('analytics', help='Repository analytics and statistics')
-    analytics_subparsers = analytics_parser.add_subparsers(dest='analytics_command')
-
-    analytics_stats_parser = analytics_subparsers.add_parser('stats', help='Show comprehensive repository statistics')
-
-    analytics_activity_parser = analytics_subparsers.add_parser('activity', help='Show commit activity over time')
-    analytics_activity_parser.add_argument('--days', type=int, default=30, help='Number of days to analyze')
-
-    analytics_files_parser = analytics_subparsers.add_parser('files', help='Show file change statistics')
-    analytics_files_parser.add_argument('--days', type=int, default=30, help='Number of days to analyze')
-
-    analytics_branches_parser = analytics_subparsers.add_parser('branches', help='Show branch activity and health')
-
-    analytics_contributors_parser = analytics_subparsers.add_parser('contributors', help='Show contributor statistics')
-
-    analytics_health_parser = analytics_subparsers.add_parser('health', help='Show repository health indicators')
-
-    args = parser.parse_args()
+    # Startup ends at dispatch; it is appended to the startup log at exit
+    atexit.register(cli.record_startup_time, time.perf_counter() - _STARTUP_CLOCK, args.verbose)
     
     # Handle special modes
     if args.interactive:
         async def run_interactive():
             await cli.initialize()
-            await cli.interactive_mode()
+            try:
+                await cli.interactive_mode(args.repo)
+            finally:
+                await cli.close()
         asyncio.run(run_interactive())
         return
         
@@ -2342,7 +2291,10 @@ def main():
     if args.github_login:
         async def run_github_login():
             await cli.initialize()
-            await cli.github_login()
+            try:
+                await cli.github_login()
+            finally:
+                await cli.close()
         asyncio.run(run_github_login())
         return
         
@@ -2353,233 +2305,46 @@ def main():
     if not args.command:
         parser.print_help()
         return
-
-    # Only require --repo for commands that need a local repo
-    commands_require_repo = [
-        'status', 'log', 'branch', 'commit', 'push', 'pull', 'gitflow', 'cherry-pick', 'revert', 'analytics'
-    ]
-    if args.command in commands_require_repo and not args.repo:
-        console.print(Panel("[bold red]❌ Repository path is required. Use --repo <path>[/]", 
-                          title="[red]Error", border_style="red"))
-        return
+    
+    # Read-only commands are served by a running daemon when there is one
+    if getattr(command, 'DAEMON_SAFE', False) and not (args.no_daemon or cli.memprofile):
+        from studio.core.daemon import forward_to_daemon
+        status = forward_to_daemon(argv)
+        if status is not None:
+            if status:
+                sys.exit(status)
+            return
         
     async def run():
-        await cli.initialize()
-
-        # Only set repository for commands that require it
-        if args.command in commands_require_repo:
-            if not cli.set_repository(args.repo):
-                return
-
-        # Execute commands
-        if args.command == 'status':
-            await cli.status()
-        elif args.command == 'log':
-            await cli.log(args.max_count)
-        elif args.command == 'branch':
-            if args.branch_command == 'list':
-                await cli.branches()
-            elif args.branch_command == 'create':
-                await cli.create_branch(args.name, args.start_point)
-            elif args.branch_command == 'delete':
-                git_ops = GitOperations(args.repo)
-                result = await git_ops.delete_branch(args.name, args.force)
-                print(result)
-            elif args.branch_command == 'delete-remote':
-                git_ops = GitOperations(args.repo)
-                result = await git_ops.delete_remote_branch(args.name, args.remote)
-                print(result)
-            elif args.branch_command == 'rename':
-                git_ops = GitOperations(args.repo)
-                result = await git_ops.rename_branch(args.old_name, args.new_name)
-                print(result)
-            elif args.branch_command == 'checkout':
-                await cli.checkout(args.ref)
-            elif args.branch_command == 'merge':
-                await cli.merge(args.branch)
-            elif args.branch_command == 'rebase':
-                await cli.rebase(args.branch)
-        elif args.command == 'stash':
-            git_ops = GitOperations(args.repo)
-            if args.stash_command == 'list':
-                result = await git_ops.stash_list()
-                print(result)
-            elif args.stash_command == 'create':
-                result = await git_ops.stash(args.message)
-                print(result)
-            elif args.stash_command == 'pop':
-                result = await git_ops.stash_pop(args.stash or 'stash@{0}')
-                print(result)
-            elif args.stash_command == 'drop':
-                result = await git_ops.drop_stash(args.stash or 'stash@{0}')
-                print(result)
-            else:
-                parser.print_help()
-                return
-        elif args.command == 'tag':
-            git_ops = GitOperations(args.repo)
-            if args.tag_command == 'list':
-                result = await git_ops.list_tags()
-                print(result)
-            elif args.tag_command == 'create':
-                result = await git_ops.create_tag(args.name, message=args.message, annotated=args.annotated, commit=args.commit)
-                print(result)
-            elif args.tag_command == 'delete':
-                result = await git_ops.delete_tag(args.name)
-                print(result)
-            elif args.tag_command == 'show':
-                result = await git_ops.show_tag_details(args.name)
-                print(result)
-            else:
-                parser.print_help()
-                return
-        elif args.command == 'commit':
-            await cli.commit(args.message, args.add_all)
-        elif args.command == 'push':
-            await cli.push(args.remote, args.branch)
-        elif args.command == 'pull':
-            await cli.pull(args.remote, args.branch)
-        elif args.command == 'gitflow':
-            if args.gitflow_command == 'init':
-                await cli.gitflow_init()
-            elif args.gitflow_command == 'feature-start':
-                await cli.gitflow_feature_start(args.name)
-            elif args.gitflow_command == 'feature-finish':
-                await cli.gitflow_feature_finish(args.name)
-            elif args.gitflow_command == 'release-start':
-                await cli.gitflow_release_start(args.version)
-            elif args.gitflow_command == 'release-finish':
-                await cli.gitflow_release_finish(args.version)
-        elif args.command == 'cherry-pick':
-            git_ops = GitOperations(args.repo)
-            if args.abort:
-                result = await git_ops._run_git_command('cherry-pick', '--abort')
-                print(result)
-            elif getattr(args, 'continue', False):
-                result = await git_ops._run_git_command('cherry-pick', '--continue')
-                print(result)
-            elif args.commit:
-                cmd = ['cherry-pick']
-                if args.no_commit:
-                    cmd.append('--no-commit')
-                cmd.append(args.commit)
-                result = await git_ops._run_git_command(*cmd)
-                print(result)
-        elif args.command == 'revert':
-            git_ops = GitOperations(args.repo)
-            if args.abort:
-                result = await git_ops._run_git_command('revert', '--abort')
-                print(result)
-            elif getattr(args, 'continue', False):
-                result = await git_ops._run_git_command('revert', '--continue')
-                print(result)
-            elif args.commit:
-                cmd = ['revert']
-                if args.no_commit:
-                    cmd.append('--no-commit')
-                cmd.append(args.commit)
-                result = await git_ops._run_git_command(*cmd)
-                print(result)
-        elif args.command == 'github':
-            if args.github_command == 'login':
-                await cli.github_login()
-            elif args.github_command == 'logout':
-                cli.github_logout()
-            elif args.github_command == 'repos':
-                await cli.github_list_repos()
-            elif args.github_command == 'clone':
-                success = await cli.github_repos.clone_repository(args.name)
-                if success and Confirm.ask("Set this as current repository?"):
-                    if args.path:
-                        cli.set_repository(args.path)
-                    else:
-                        user_info = cli.github_auth.get_user_info()
-                        if user_info:
-                            repo_path = Path.home() / "git" / user_info['login'] / args.name
-                            if repo_path.exists():
-                                cli.set_repository(str(repo_path))
-            elif args.github_command == 'search':
-                repos = await cli.github_repos.search_repositories(args.query, args.limit)
-                cli.github_repos.display_repositories(repos)
-            elif hasattr(args, 'prs_command') and args.prs_command:
-                if args.prs_command == 'list':
-                    kwargs = {}
-                    if args.label is not None:
-                        kwargs['label'] = args.label
-                    if args.assignee is not None:
-                        kwargs['assignee'] = args.assignee
-                    await cli.github_repos.list_pull_requests(args.repo, args.state, args.limit, **kwargs)
-                elif args.prs_command == 'create':
-                    await cli.github_repos.create_pull_request(args.repo, args.title, args.head, args.base, args.body or "")
-                elif args.prs_command == 'comment':
-                    await cli.github_repos.comment_pull_request(args.repo, int(args.pr), args.body)
-                elif args.prs_command == 'close':
-                    await cli.github_repos.close_pull_request(args.repo, int(args.pr))
-                elif args.prs_command == 'merge':
-                    await cli.github_repos.merge_pull_request(args.repo, int(args.pr), args.method)
-                elif args.prs_command == 'assign':
-                    await cli.github_repos.assign_pull_request(args.repo, int(args.pr), args.user)
-                elif args.prs_command == 'label':
-                    await cli.github_repos.label_pull_request(args.repo, int(args.pr), args.label)
-            elif hasattr(args, 'notifications_command') and args.notifications_command:
-                if args.notifications_command == 'list':
-                    await cli.github_notifications_list_mode(args)
-                elif args.notifications_command == 'mark-read':
-                    await cli.github_notifications_mark_read_mode(args)
-            elif hasattr(args, 'releases_command') and args.releases_command:
-                if args.releases_command == 'list':
-                    await cli.github_releases_list_mode(args)
-                elif args.releases_command == 'create':
-                    await cli.github_releases_create_mode(args)
-            elif getattr(args, 'github_command', None) == 'stats':
-                await cli.github_stats_mode(args.repo)
-            elif hasattr(args, 'branches_command') and args.branches_command:
-                if args.branches_command == 'graph':
-                    await cli.github_branches_graph_mode(args)
-        elif args.command == 'rebase-interactive':
-            await cli.rebase_interactive(args.base)
-        elif args.command == 'squash':
-            await cli.squash(args.num, args.message)
-        elif args.command == 'log-file':
-            git_ops = GitOperations(args.repo)
-            result = await git_ops.file_log(args.file, args.max_count)
-            print(result if result else '[No log output]')
-        elif args.command == 'show-commit':
-            git_ops = GitOperations(args.repo)
-            result = await git_ops.show_commit(args.hash)
-            print(result if result else '[No commit details output]')
-        elif args.command == 'analytics':
-            if not args.repo:
-                console.print(Panel("[bold red]❌ Repository path is required. Use --repo <path>[/]", 
-                                  title="[red]Error", border_style="red"))
-                return
-            git_ops = GitOperations(args.repo)
-            if args.analytics_command == 'stats':
-                result = await git_ops.get_repository_stats()
-                cli.display_repository_stats(result)
-            elif args.analytics_command == 'activity':
-                result = await git_ops.get_commit_activity(args.days)
-                cli.display_commit_activity(result, args.days)
-            elif args.analytics_command == 'files':
-                result = await git_ops.get_file_changes(args.days)
-                cli.display_file_changes(result, args.days)
-            elif args.analytics_command == 'branches':
-                result = await git_ops.get_branch_activity()
-                cli.display_branch_activity(result)
-            elif args.analytics_command == 'contributors':
-                result = await git_ops.get_contributor_stats()
-                cli.display_contributor_stats(result)
-            elif args.analytics_command == 'health':
-                result = await git_ops.get_repository_health()
-                cli.display_repository_health(result)
-            else:
-                parser.print_help()
-                return
-        else:
-            parser.print_help()
-            return
+        try:
+            await run_command(cli, args, command, command_parsers[args.command])
+        finally:
+            await cli.close()
+    
+    sample = cli.sample_interval > 0 and args.command in LONG_RUNNING_COMMANDS
     
-    asyncio.run(run())
+    if cli.memprofile or sample:
+        # Operation name is the command path, e.g. "analytics health"
+        operation_name = " ".join(
+            value for key, value in vars(args).items()
+            if (key == 'command' or key.endswith('_command')) and isinstance(value, str)
+        )
+        
+        async def run_instrumented():
+            profile = None
+            with ExitStack() as instrumentation:
+                if sample:
+                    instrumentation.enter_context(cli.performance_monitor.sampling(cli.sample_interval))
+                if cli.memprofile:
+                    profile = instrumentation.enter_context(
+                        cli.performance_monitor.memory_profile(operation_name, cli.memprofile_top)
+                    )
+                await run()
+            if profile is not None:
+                cli.performance_monitor.display_memory_profile(profile)
+        asyncio.run(run_instrumented())
+    else:
+        asyncio.run(run())
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Command registry for the GitFlow Studio CLI
+Each command lives in its own module, which is only imported when the command runs
+"""
+
+import argparse
+import importlib
+from pathlib import Path
+from typing import Dict, List, Any
+
+# Built-in commands in the order --help lists them. A command module defines
+# HELP, REQUIRES_REPO, configure(parser) and async run(cli, args, parser).
+COMMAND_MODULES = {
+    'status': 'studio.commands.status',
+    'log': 'studio.commands.log',
+    'branch': 'studio.commands.branch',
+    'cherry-pick': 'studio.commands.cherry_pick',
+    'revert': 'studio.commands.revert',
+    'stash': 'studio.commands.stash',
+    'commit': 'studio.commands.commit',
+    'push': 'studio.commands.push',
+    'pull': 'studio.commands.pull',
+    'gitflow': 'studio.commands.gitflow',
+    'github': 'studio.commands.github',
+    'tag': 'studio.commands.tag',
+    'rebase-interactive': 'studio.commands.rebase_interactive',
+    'squash': 'studio.commands.squash',
+    'log-file': 'studio.commands.log_file',
+    'show-commit': 'studio.commands.show_commit',
+    'analytics': 'studio.commands.analytics',
+    'export': 'studio.commands.export',
+    'daemon': 'studio.commands.daemon',
+    'completion': 'studio.commands.completion',
+}
+
+_plugin_commands: Dict[str, Any] = {}
+
+
+def register_command(name: str, command: Any):
+    """Register a plugin command (any object with HELP, configure() and run())"""
+    if name in COMMAND_MODULES:
+        raise ValueError(f"Command '{name}' is already a built-in command")
+    _plugin_commands[name] = command
+
+
+def load_plugin_commands(plugin_loader):
+    """Collect commands from plugins that define ``register_commands(register)``"""
+    plugin_loader.discover_plugins()
+    for plugin in plugin_loader.plugins:
+        if not hasattr(plugin, 'register_commands'):
+            continue
+        try:
+            plugin.register_commands(register_command)
+        except Exception as e:
+            print(f"Failed to register commands of plugin {plugin.__name__}: {e}")
+
+
+def command_names() -> List[str]:
+    """Names of all built-in and plugin commands"""
+    return list(COMMAND_MODULES) + list(_plugin_commands)
+
+
+def command_help(name: str) -> str:
+    """One-line help of a command, without importing built-in command modules"""
+    if name in _plugin_commands:
+        return getattr(_plugin_commands[name], 'HELP', '')
+    from .index import COMMAND_INDEX
+    return COMMAND_INDEX[name]['help']
+
+
+def load_command(name: str) -> Any:
+    """Import (or look up) the implementation of a command"""
+    if name in _plugin_commands:
+        return _plugin_commands[name]
+    return importlib.import_module(COMMAND_MODULES[name])
+
+
+def describe_parser(parser: argparse.ArgumentParser) -> Dict[str, Any]:
+    """Long options and nested subcommands of a parser, for --help and completion"""
+    description: Dict[str, Any] = {"options": [], "subcommands": {}}
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            helps = {choice.dest: choice.help for choice in action._choices_actions}
+            for name, subparser in action.choices.items():
+                description["subcommands"][name] = {"help": helps.get(name) or "", **describe_parser(subparser)}
+        elif action.option_strings and not isinstance(action, argparse._HelpAction):
+            description["options"].extend(opt for opt in action.option_strings if opt.startswith('--'))
+    return description
+
+
+def build_index() -> Dict[str, Any]:
+    """Build the command index by importing and configuring every built-in command"""
+    index = {}
+    for name in COMMAND_MODULES:
+        command = load_command(name)
+        parser = argparse.ArgumentParser(prog=name, add_help=False)
+        command.configure(parser)
+        index[name] = {
+            "help": command.HELP,
+            "requires_repo": command.REQUIRES_REPO,
+            **describe_parser(parser)
+        }
+    return index
+
+
+def build_global_options() -> Dict[str, List[str]]:
+    """Global options of the top-level parser, split by whether they take a value"""
+    from studio.cli import create_parser
+    parser, _ = create_parser()
+    options: Dict[str, List[str]] = {"flags": [], "values": []}
+    for action in parser._actions:
+        if action.option_strings and not isinstance(action, argparse._HelpAction):
+            key = "flags" if action.nargs == 0 else "values"
+            options[key].extend(opt for opt in action.option_strings if opt.startswith('--'))
+    return options
+
+
+INDEX_TEMPLATE = '''"""
+Precomputed command index for GitFlow Studio
+Generated by `python -m studio.commands.index`; do not edit by hand
+"""
+
+GLOBAL_OPTIONS = {global_options}
+
+COMMAND_INDEX = {command_index}
+
+
+if __name__ == "__main__":
+    from studio.commands import write_index
+    write_index()
+'''
+
+
+def write_index(path: Path = None):
+    """Regenerate studio/commands/index.py from the command modules"""
+    import pprint
+    path = path or Path(__file__).parent / "index.py"
+    path.write_text(INDEX_TEMPLATE.format(
+        global_options=pprint.pformat(build_global_options(), sort_dicts=False),
+        command_index=pprint.pformat(build_index(), sort_dicts=False)
+    ), encoding='utf-8')
@@ -0,0 +1,51 @@
+"""
+`analytics` command - repository analytics and statistics
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Repository analytics and statistics'
+REQUIRES_REPO = True
+DAEMON_SAFE = True
+
+
+def configure(parser):
+    analytics_subparsers = parser.add_subparsers(dest='analytics_command')
+
+    analytics_subparsers.add_parser('stats', help='Show comprehensive repository statistics')
+
+    analytics_activity_parser = analytics_subparsers.add_parser('activity', help='Show commit activity over time')
+    analytics_activity_parser.add_argument('--days', type=int, default=30, help='Number of days to analyze')
+
+    analytics_files_parser = analytics_subparsers.add_parser('files', help='Show file change statistics')
+    analytics_files_parser.add_argument('--days', type=int, default=30, help='Number of days to analyze')
+
+    analytics_subparsers.add_parser('branches', help='Show branch activity and health')
+
+    analytics_subparsers.add_parser('contributors', help='Show contributor statistics')
+
+    analytics_subparsers.add_parser('health', help='Show repository health indicators')
+
+
+async def run(cli, args, parser):
+    git_ops = GitOperations.open(args.repo)
+    if args.analytics_command == 'stats':
+        result = await git_ops.get_repository_stats()
+        cli.display_repository_stats(result)
+    elif args.analytics_command == 'activity':
+        result = await git_ops.get_commit_activity(args.days)
+        cli.display_commit_activity(result, args.days)
+    elif args.analytics_command == 'files':
+        result = await git_ops.get_file_changes(args.days)
+        cli.display_file_changes(result, args.days)
+    elif args.analytics_command == 'branches':
+        result = await git_ops.get_branch_activity()
+        cli.display_branch_activity(result)
+    elif args.analytics_command == 'contributors':
+        result = await git_ops.get_contributor_stats()
+        cli.display_contributor_stats(result)
+    elif args.analytics_command == 'health':
+        result = await git_ops.get_repository_health()
+        cli.display_repository_health(result)
+    else:
+        parser.print_help()
@@ -0,0 +1,64 @@
+"""
+`branch` command - local branch operations
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Branch operations'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    branch_subparsers = parser.add_subparsers(dest='branch_command')
+    
+    branch_subparsers.add_parser('list', help='List all branches')
+    
+    create_branch_parser = branch_subparsers.add_parser('create', help='Create a new branch')
+    create_branch_parser.add_argument('name', help='Branch name')
+    create_branch_parser.add_argument('--start-point', help='Start point (branch/commit)')
+    
+    delete_branch_parser = branch_subparsers.add_parser('delete', help='Delete a local branch')
+    delete_branch_parser.add_argument('name', help='Branch name to delete')
+    delete_branch_parser.add_argument('--force', action='store_true', help='Force delete (even if not merged)')
+    
+    delete_remote_branch_parser = branch_subparsers.add_parser('delete-remote', help='Delete a remote branch')
+    delete_remote_branch_parser.add_argument('name', help='Branch name to delete')
+    delete_remote_branch_parser.add_argument('--remote', default='origin', help='Remote name (default: origin)')
+    
+    rename_branch_parser = branch_subparsers.add_parser('rename', help='Rename a branch')
+    rename_branch_parser.add_argument('old_name', help='Current branch name')
+    rename_branch_parser.add_argument('new_name', help='New branch name')
+    
+    checkout_parser = branch_subparsers.add_parser('checkout', help='Checkout a branch')
+    checkout_parser.add_argument('ref', help='Branch or commit to checkout')
+    
+    merge_parser = branch_subparsers.add_parser('merge', help='Merge a branch')
+    merge_parser.add_argument('branch', help='Branch to merge')
+    
+    rebase_parser = branch_subparsers.add_parser('rebase', help='Rebase current branch')
+    rebase_parser.add_argument('branch', help='Branch to rebase onto')
+
+
+async def run(cli, args, parser):
+    if args.branch_command == 'list':
+        await cli.branches()
+    elif args.branch_command == 'create':
+        await cli.create_branch(args.name, args.start_point)
+    elif args.branch_command == 'delete':
+        git_ops = GitOperations.open(args.repo)
+        result = await git_ops.delete_branch(args.name, args.force)
+        print(result)
+    elif args.branch_command == 'delete-remote':
+        git_ops = GitOperations.open(args.repo)
+        result = await git_ops.delete_remote_branch(args.name, args.remote)
+        print(result)
+    elif args.branch_command == 'rename':
+        git_ops = GitOperations.open(args.repo)
+        result = await git_ops.rename_branch(args.old_name, args.new_name)
+        print(result)
+    elif args.branch_command == 'checkout':
+        await cli.checkout(args.ref)
+    elif args.branch_command == 'merge':
+        await cli.merge(args.branch)
+    elif args.branch_command == 'rebase':
+        await cli.rebase(args.branch)
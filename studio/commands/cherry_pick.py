@@ -0,0 +1,33 @@
+"""
+`cherry-pick` command - apply an existing commit
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Cherry-pick a commit'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    cherry_pick_group = parser.add_mutually_exclusive_group(required=True)
+    cherry_pick_group.add_argument('commit', nargs='?', help='Commit hash to cherry-pick')
+    cherry_pick_group.add_argument('--continue', action='store_true', help='Continue cherry-pick after resolving conflicts')
+    cherry_pick_group.add_argument('--abort', action='store_true', help='Abort cherry-pick operation')
+    parser.add_argument('--no-commit', action='store_true', help='Do not automatically commit')
+
+
+async def run(cli, args, parser):
+    git_ops = GitOperations.open(args.repo)
+    if args.abort:
+        result = await git_ops._run_git_command('cherry-pick', '--abort')
+        print(result)
+    elif getattr(args, 'continue', False):
+        result = await git_ops._run_git_command('cherry-pick', '--continue')
+        print(result)
+    elif args.commit:
+        cmd = ['cherry-pick']
+        if args.no_commit:
+            cmd.append('--no-commit')
+        cmd.append(args.commit)
+        result = await git_ops._run_git_command(*cmd)
+        print(result)
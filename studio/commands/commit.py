@@ -0,0 +1,15 @@
+"""
+`commit` command - create a commit
+"""
+
+HELP = 'Create a commit'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    parser.add_argument('message', help='Commit message')
+    parser.add_argument('--add-all', action='store_true', help='Add all changes before commit')
+
+
+async def run(cli, args, parser):
+    await cli.commit(args.message, args.add_all)
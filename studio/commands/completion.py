@@ -0,0 +1,61 @@
+"""
+`completion` command - print a shell completion script
+"""
+
+from typing import Dict, Any, List
+
+HELP = 'Print a shell completion script (bash or zsh)'
+REQUIRES_REPO = False
+# Machine-readable output: no banner and no plugin start-up messages
+PLAIN_OUTPUT = True
+
+SCRIPT_TEMPLATE = '''_gitflow_studio() {{
+    local cur="${{COMP_WORDS[COMP_CWORD]}}" path="" word i opts
+    for ((i=1; i<COMP_CWORD; i++)); do
+        word="${{COMP_WORDS[i]}}"
+        case "$word" in
+            {value_options}) ((i++)) ;;
+            -*) ;;
+            *) path="$path/$word" ;;
+        esac
+    done
+    case "$path" in
+{cases}
+        *) opts="" ;;
+    esac
+    COMPREPLY=($(compgen -W "$opts" -- "$cur"))
+}}
+complete -F _gitflow_studio gitflow-studio
+'''
+
+
+def configure(parser):
+    parser.add_argument('shell', choices=['bash', 'zsh'], help='Shell to generate the script for')
+
+
+def _cases(path: str, entry: Dict[str, Any], cases: List[str]):
+    words = list(entry["subcommands"]) + entry["options"] + ["--help"]
+    cases.append(f'        "{path}") opts="{" ".join(words)}" ;;')
+    for name, subcommand in entry["subcommands"].items():
+        _cases(f"{path}/{name}", subcommand, cases)
+
+
+def completion_script(shell: str) -> str:
+    """Build the completion script from the precomputed command index"""
+    from .index import COMMAND_INDEX, GLOBAL_OPTIONS
+
+    root = {
+        "subcommands": COMMAND_INDEX,
+        "options": GLOBAL_OPTIONS["flags"] + GLOBAL_OPTIONS["values"]
+    }
+    cases: List[str] = []
+    _cases("", root, cases)
+
+    script = SCRIPT_TEMPLATE.format(value_options="|".join(GLOBAL_OPTIONS["values"]), cases="\n".join(cases))
+    if shell == 'zsh':
+        script = "autoload -U +X bashcompinit && bashcompinit\n" + script
+    return script
+
+
+async def run(cli, args, parser):
+    print(completion_script(args.shell), end='')
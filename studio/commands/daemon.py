@@ -0,0 +1,79 @@
+"""
+`daemon` command - manage the background daemon that serves read-only commands
+"""
+
+import subprocess
+import sys
+import time
+
+HELP = 'Manage the background daemon (warm repository caches for read-only commands)'
+REQUIRES_REPO = False
+
+# How long `daemon start` waits for the daemon to accept connections
+START_TIMEOUT = 10.0
+
+
+def configure(parser):
+    daemon_subparsers = parser.add_subparsers(dest='daemon_command')
+
+    daemon_subparsers.add_parser('start', help='Start the daemon in the background')
+    daemon_subparsers.add_parser('stop', help='Stop the daemon')
+    daemon_subparsers.add_parser('status', help='Show daemon uptime and cache statistics')
+    daemon_subparsers.add_parser('run', help='Run the daemon in the foreground')
+
+
+def start_daemon(socket_path) -> bool:
+    """Spawn a detached daemon and wait until it answers"""
+    from studio.core.daemon import send_request
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(socket_path.with_suffix('.log'), 'a') as log:
+        subprocess.Popen([sys.executable, '-m', 'studio.core.daemon'], stdin=subprocess.DEVNULL,
+                         stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        if send_request({"action": "ping"}, socket_path) is not None:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+async def run(cli, args, parser):
+    from rich.panel import Panel
+    from rich.table import Table
+    from studio.cli import console
+    from studio.core.daemon import StudioDaemon, daemon_socket_path, send_request
+
+    socket_path = daemon_socket_path()
+    if args.daemon_command == 'start':
+        if send_request({"action": "ping"}, socket_path) is not None:
+            console.print(Panel("[yellow]Daemon is already running[/]", title="[yellow]Daemon", border_style="yellow"))
+        elif start_daemon(socket_path):
+            console.print(Panel(f"[bold green]✅ Daemon started[/] on {socket_path}", title="[green]Daemon", border_style="green"))
+        else:
+            console.print(Panel(f"[bold red]❌ Daemon did not start; see {socket_path.with_suffix('.log')}[/]",
+                                title="[red]Error", border_style="red"))
+    elif args.daemon_command == 'stop':
+        if send_request({"action": "stop"}, socket_path) is None:
+            console.print(Panel("[yellow]Daemon is not running[/]", title="[yellow]Daemon", border_style="yellow"))
+        else:
+            console.print(Panel("[bold green]✅ Daemon stopped[/]", title="[green]Daemon", border_style="green"))
+    elif args.daemon_command == 'status':
+        status = send_request({"action": "status"}, socket_path)
+        if status is None:
+            console.print(Panel("[yellow]Daemon is not running[/]", title="[yellow]Daemon", border_style="yellow"))
+            return
+        console.print(f"[bold]PID:[/] {status['pid']}  [bold]Uptime:[/] {status['uptime']:.0f}s  "
+                      f"[bold]Requests:[/] {status['requests']}")
+        table = Table(title="Open Repositories")
+        table.add_column("Repository", style="cyan")
+        table.add_column("Cached Results", justify="right")
+        table.add_column("Hits", justify="right", style="green")
+        table.add_column("Misses", justify="right", style="yellow")
+        for path, stats in status['repositories'].items():
+            table.add_row(path, str(stats['entries']), str(stats['hits']), str(stats['misses']))
+        console.print(table)
+    elif args.daemon_command == 'run':
+        await StudioDaemon(socket_path).serve()
+    else:
+        parser.print_help()
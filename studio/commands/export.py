@@ -0,0 +1,56 @@
+"""
+`export` command - stream repository history to JSON Lines, CSV, Parquet or Arrow files, and export analytics
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Export commit history, file changes and analytics'
+REQUIRES_REPO = True
+
+# Subcommand -> history dataset
+DATASETS = {'commits': 'commits', 'files': 'file_changes'}
+# Same as studio.utils.export_manager.ANALYTICS_DATASETS, which is only imported when the command runs
+ANALYTICS_DATASETS = ('stats', 'activity', 'files', 'branches', 'contributors', 'health')
+
+
+def configure(parser):
+    export_subparsers = parser.add_subparsers(dest='export_command')
+
+    for name, help_text in (('commits', 'Export every commit (hash, parents, author, dates, subject)'),
+                            ('files', 'Export one row per file changed by each commit, with line counts')):
+        export_parser = export_subparsers.add_parser(name, help=help_text)
+        export_parser.add_argument('--format', choices=['jsonl', 'csv', 'parquet', 'arrow'], default='jsonl',
+                                   help='Output format (parquet and arrow need pyarrow)')
+        export_parser.add_argument('--compress', choices=['gzip', 'zstd'],
+                                   help='Compress while writing (the Parquet/Arrow codec for those formats)')
+        export_parser.add_argument('--rev', default='HEAD', help="Revision or range to export (e.g. 'v1.0..HEAD')")
+        export_parser.add_argument('--since', help="Only commits after this date (e.g. '2024-01-01')")
+        export_parser.add_argument('--output-dir', help='Directory for the export (default: ./exports)')
+        export_parser.add_argument('--incremental', action='store_true',
+                                   help='Only export what is new since the last incremental export (appends a partition)')
+
+    analytics_parser = export_subparsers.add_parser('analytics', help='Compute and export all analytics datasets concurrently')
+    analytics_parser.add_argument('--format', choices=['json', 'csv', 'parquet', 'arrow'], default='json',
+                                  help='Output format (parquet and arrow need pyarrow)')
+    analytics_parser.add_argument('--archive', choices=['zip', 'tar', 'tar.gz'],
+                                  help='Write one archive with every dataset and a manifest.json')
+    analytics_parser.add_argument('--days', type=int, default=30, help='Days of commit and file activity')
+    analytics_parser.add_argument('--datasets', nargs='+', choices=list(ANALYTICS_DATASETS),
+                                  help='Datasets to export (default: all)')
+    analytics_parser.add_argument('--output-dir', help='Directory for the export (default: ./exports)')
+
+
+async def run(cli, args, parser):
+    if args.export_command not in DATASETS and args.export_command != 'analytics':
+        parser.print_help()
+        return
+    from studio.utils.export_manager import ExportManager
+
+    export_manager = ExportManager(args.output_dir) if args.output_dir else cli.export_manager
+    if args.export_command == 'analytics':
+        await export_manager.export_analytics(GitOperations.open(args.repo), args.format, args.datasets,
+                                              args.days, args.archive)
+        return
+    export = export_manager.export_incremental if args.incremental else export_manager.export_history
+    await export(GitOperations.open(args.repo), DATASETS[args.export_command],
+                 args.format, args.compress, args.rev, args.since)
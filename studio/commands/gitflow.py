@@ -0,0 +1,37 @@
+"""
+`gitflow` command - Git Flow branching model operations
+"""
+
+HELP = 'Git Flow operations'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    gitflow_subparsers = parser.add_subparsers(dest='gitflow_command')
+    
+    gitflow_subparsers.add_parser('init', help='Initialize Git Flow')
+    
+    feature_start_parser = gitflow_subparsers.add_parser('feature-start', help='Start a feature branch')
+    feature_start_parser.add_argument('name', help='Feature name')
+    
+    feature_finish_parser = gitflow_subparsers.add_parser('feature-finish', help='Finish a feature branch')
+    feature_finish_parser.add_argument('name', help='Feature name')
+    
+    release_start_parser = gitflow_subparsers.add_parser('release-start', help='Start a release branch')
+    release_start_parser.add_argument('version', help='Release version')
+    
+    release_finish_parser = gitflow_subparsers.add_parser('release-finish', help='Finish a release branch')
+    release_finish_parser.add_argument('version', help='Release version')
+
+
+async def run(cli, args, parser):
+    if args.gitflow_command == 'init':
+        await cli.gitflow_init()
+    elif args.gitflow_command == 'feature-start':
+        await cli.gitflow_feature_start(args.name)
+    elif args.gitflow_command == 'feature-finish':
+        await cli.gitflow_feature_finish(args.name)
+    elif args.gitflow_command == 'release-start':
+        await cli.gitflow_release_start(args.version)
+    elif args.gitflow_command == 'release-finish':
+        await cli.gitflow_release_finish(args.version)
@@ -0,0 +1,345 @@
+"""
+`github` command - GitHub repositories, pull requests, notifications and releases
+"""
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Confirm
+
+from studio.github.bulk import parse_target, VALUE_REQUIRED
+from studio.github.clone import CloneOptions
+from studio.github.client import GitHubAPIError
+from studio.github.portfolio import REPORT_FIELDS
+from studio.github.records import RepoRecord
+
+HELP = 'GitHub operations'
+REQUIRES_REPO = False
+
+console = Console()
+
+
+def configure(parser):
+    github_subparsers = parser.add_subparsers(dest='github_command')
+    
+    github_subparsers.add_parser('login', help='Login to GitHub')
+    github_subparsers.add_parser('logout', help='Logout from GitHub')
+    github_subparsers.add_parser('repos', help='List GitHub repositories')
+    
+    github_clone_parser = github_subparsers.add_parser('clone', help='Clone a GitHub repository')
+    github_clone_parser.add_argument('name', help='Repository name')
+    github_clone_parser.add_argument('--path', help='Target path for cloning')
+    _add_clone_arguments(github_clone_parser)
+
+    github_bulk_clone_parser = github_subparsers.add_parser('bulk-clone', help='Clone many repositories in parallel')
+    github_bulk_clone_parser.add_argument('names', nargs='*', help='Repositories (owner/name, or name for your own)')
+    github_bulk_clone_parser.add_argument('--org', help='Clone every repository of this organization')
+    github_bulk_clone_parser.add_argument('--dest', help='Directory to clone into as <owner>/<name> (default: ~/git)')
+    github_bulk_clone_parser.add_argument('--jobs', type=int, default=4, help='Clones running at the same time')
+    _add_clone_arguments(github_bulk_clone_parser)
+    
+    github_search_parser = github_subparsers.add_parser('search', help='Search GitHub repositories')
+    github_search_parser.add_argument('query', help='Search query')
+    github_search_parser.add_argument('--limit', type=int, default=20, help='Maximum number of results')
+    
+    # GitHub issues commands
+    github_issues_parser = github_subparsers.add_parser('issues', help='Manage GitHub issues')
+    github_issues_subparsers = github_issues_parser.add_subparsers(dest='issues_command')
+
+    github_issues_list_parser = github_issues_subparsers.add_parser('list', help='List issues for a repository')
+    github_issues_list_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_issues_list_parser.add_argument('--state', choices=['open', 'closed', 'all'], default='open', help='Issue state')
+    github_issues_list_parser.add_argument('--label', help='Filter by label')
+    github_issues_list_parser.add_argument('--assignee', help='Filter by assignee')
+    github_issues_list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of issues to list')
+    _add_mirror_arguments(github_issues_list_parser)
+
+    # GitHub PRs commands
+    github_prs_parser = github_subparsers.add_parser('prs', help='Manage GitHub pull requests')
+    github_prs_subparsers = github_prs_parser.add_subparsers(dest='prs_command')
+    
+    github_prs_list_parser = github_prs_subparsers.add_parser('list', help='List pull requests for a repository')
+    github_prs_list_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_list_parser.add_argument('--state', choices=['open', 'closed', 'all'], default='open', help='PR state')
+    github_prs_list_parser.add_argument('--label', help='Filter by label')
+    github_prs_list_parser.add_argument('--assignee', help='Filter by assignee')
+    github_prs_list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of PRs to list')
+    _add_mirror_arguments(github_prs_list_parser)
+
+    github_prs_create_parser = github_prs_subparsers.add_parser('create', help='Create a new pull request')
+    github_prs_create_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_create_parser.add_argument('--title', required=True, help='Title of the PR')
+    github_prs_create_parser.add_argument('--head', required=True, help='Name of the branch where changes are implemented')
+    github_prs_create_parser.add_argument('--base', required=True, help='Name of the branch you want the changes pulled into')
+    github_prs_create_parser.add_argument('--body', help='Body/description of the PR')
+
+    github_prs_comment_parser = github_prs_subparsers.add_parser('comment', help='Comment on a pull request')
+    github_prs_comment_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_comment_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
+    github_prs_comment_parser.add_argument('--body', required=True, help='Comment body')
+
+    github_prs_close_parser = github_prs_subparsers.add_parser('close', help='Close a pull request')
+    github_prs_close_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_close_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
+
+    github_prs_merge_parser = github_prs_subparsers.add_parser('merge', help='Merge a pull request')
+    github_prs_merge_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_merge_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
+    github_prs_merge_parser.add_argument('--method', choices=['merge', 'squash', 'rebase'], default='merge', help='Merge method')
+
+    github_prs_assign_parser = github_prs_subparsers.add_parser('assign', help='Assign a user to a pull request')
+    github_prs_assign_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_assign_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
+    github_prs_assign_parser.add_argument('--user', required=True, help='Username to assign')
+
+    github_prs_label_parser = github_prs_subparsers.add_parser('label', help='Add a label to a pull request')
+    github_prs_label_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_prs_label_parser.add_argument('--pr', required=True, type=int, help='Pull request number')
+    github_prs_label_parser.add_argument('--label', required=True, help='Label to add')
+
+    # GitHub notifications commands
+    github_notifications_parser = github_subparsers.add_parser('notifications', help='Manage GitHub notifications')
+    github_notifications_subparsers = github_notifications_parser.add_subparsers(dest='notifications_command')
+
+    github_notifications_list_parser = github_notifications_subparsers.add_parser('list', help='List notifications')
+    github_notifications_list_parser.add_argument('--all', action='store_true', help='List all notifications (not just unread)')
+
+    github_notifications_watch_parser = github_notifications_subparsers.add_parser('watch', help='Show new notifications as they arrive')
+    github_notifications_watch_parser.add_argument('--all', action='store_true', help='Include read notifications')
+    github_notifications_watch_parser.add_argument('--interval', type=float, default=0,
+                                                   help="Minimum seconds between polls (GitHub's X-Poll-Interval is always honored)")
+
+    github_notifications_mark_read_parser = github_notifications_subparsers.add_parser('mark-read', help='Mark notifications as read')
+    github_notifications_mark_read_parser.add_argument('--id', help='Notification thread ID to mark as read')
+    github_notifications_mark_read_parser.add_argument('--all', action='store_true', help='Mark all notifications as read')
+
+    # GitHub webhook commands
+    github_webhooks_parser = github_subparsers.add_parser('webhooks', help='Keep mirrored repositories current from webhook deliveries')
+    github_webhooks_subparsers = github_webhooks_parser.add_subparsers(dest='webhooks_command')
+
+    github_webhooks_serve_parser = github_webhooks_subparsers.add_parser('serve', help='Receive webhook deliveries on a local port')
+    github_webhooks_serve_parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    github_webhooks_serve_parser.add_argument('--port', type=int, default=8787, help='Port to listen on')
+    github_webhooks_serve_parser.add_argument('--secret', help='Webhook secret (default: $GITFLOW_STUDIO_WEBHOOK_SECRET)')
+    github_webhooks_serve_parser.add_argument('--insecure', action='store_true',
+                                              help='Accept unsigned deliveries when no secret is set')
+
+    github_webhooks_replay_parser = github_webhooks_subparsers.add_parser('replay', help='Apply recorded webhook deliveries')
+    github_webhooks_replay_parser.add_argument('files', nargs='+', help='JSON or JSON-lines files of {"event", "payload"} deliveries')
+
+    # GitHub releases commands
+    github_releases_parser = github_subparsers.add_parser('releases', help='Manage GitHub releases')
+    github_releases_subparsers = github_releases_parser.add_subparsers(dest='releases_command')
+
+    github_releases_list_parser = github_releases_subparsers.add_parser('list', help='List releases for a repository')
+    github_releases_list_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_releases_list_parser.add_argument('--limit', type=int, default=20, help='Maximum number of releases to list')
+
+    github_releases_create_parser = github_releases_subparsers.add_parser('create', help='Create a new release')
+    github_releases_create_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+    github_releases_create_parser.add_argument('--tag', required=True, help='Tag name for the release')
+    github_releases_create_parser.add_argument('--title', required=True, help='Release title')
+    github_releases_create_parser.add_argument('--body', help='Release description/body')
+    github_releases_create_parser.add_argument('--draft', action='store_true', help='Create as draft release')
+    github_releases_create_parser.add_argument('--prerelease', action='store_true', help='Mark as prerelease')
+
+    github_bulk_parser = github_subparsers.add_parser('bulk', help='Apply one operation to many issues or pull requests')
+    github_bulk_parser.add_argument('operation', nargs='?', choices=['comment', 'close', 'assign', 'label', 'merge'],
+                                    help='Operation to apply')
+    github_bulk_parser.add_argument('items', nargs='*', help='Issue/PR numbers (with --repo) or owner/repo#number')
+    github_bulk_parser.add_argument('--repo', action='append', help='Repository in the form owner/repo (repeatable)')
+    github_bulk_parser.add_argument('--value', help='Comment body, user, label or merge method')
+    github_bulk_parser.add_argument('--from-mirror', action='store_true',
+                                    help='Select items of --repo from the local mirror using the filters below')
+    github_bulk_parser.add_argument('--kind', choices=['issue', 'pr'], default='issue', help='Item kind for --from-mirror')
+    github_bulk_parser.add_argument('--state', choices=['open', 'closed', 'all'], default='open', help='State for --from-mirror')
+    github_bulk_parser.add_argument('--label', help='Label for --from-mirror')
+    github_bulk_parser.add_argument('--assignee', help='Assignee for --from-mirror')
+    github_bulk_parser.add_argument('--search', help='Full-text query for --from-mirror')
+    github_bulk_parser.add_argument('--concurrency', type=int, default=8, help='Items processed at the same time')
+    github_bulk_parser.add_argument('--resume', metavar='JOB', help='Resume a bulk job, skipping items that succeeded')
+
+    github_sync_parser = github_subparsers.add_parser('sync', help='Mirror issues and pull requests locally')
+    github_sync_parser.add_argument('--repo', help='Repository in the form owner/repo (default: every mirrored repository)')
+
+    github_stats_parser = github_subparsers.add_parser('stats', help='Show repository stats')
+    github_stats_parser.add_argument('--repo', action='append', help='Repository in the form owner/repo (repeatable)')
+    github_stats_parser.add_argument('--org', help='Report on every repository of this organization')
+    github_stats_parser.add_argument('--sort', choices=list(REPORT_FIELDS), default='stars',
+                                     help='Report column to sort by (several repositories)')
+    github_stats_parser.add_argument('--output', help='Also save the report as .json or .csv')
+    github_stats_parser.add_argument('--jobs', type=int, default=16, help='Stats requests in flight at the same time')
+
+    # GitHub branches commands
+    github_branches_parser = github_subparsers.add_parser('branches', help='Branch operations')
+    github_branches_subparsers = github_branches_parser.add_subparsers(dest='branches_command')
+
+    github_branches_graph_parser = github_branches_subparsers.add_parser('graph', help='Show branch graph')
+    github_branches_graph_parser.add_argument('--repo', required=True, help='Repository in the form owner/repo')
+
+
+def _add_clone_arguments(parser):
+    parser.add_argument('--filter', help="Partial clone filter, e.g. 'blob:none'")
+    parser.add_argument('--depth', type=int, help='Shallow clone with this many commits')
+    parser.add_argument('--sparse', nargs='+', metavar='DIR', help='Sparse checkout of only these directories (cone mode)')
+    parser.add_argument('--reference', help='Borrow objects from this local repository')
+
+
+def _clone_options(args):
+    return CloneOptions(args.filter, args.depth, tuple(args.sparse or ()), args.reference)
+
+
+def _add_mirror_arguments(parser):
+    parser.add_argument('--offline', action='store_true', help="List from the local mirror (see 'github sync')")
+    parser.add_argument('--search', help='Full-text search of titles, bodies and comments (uses the mirror)')
+    parser.add_argument('--sort', choices=['created', 'updated', 'number'], help='Sort order (uses the mirror)')
+
+
+def _use_mirror(args):
+    return args.offline or args.search is not None or args.sort is not None
+
+
+async def _list(cli, args, kind):
+    if _use_mirror(args):
+        cli.github_repos.list_mirrored(args.repo, kind, args.state, args.limit, args.label, args.assignee,
+                                       args.search, args.sort or 'created')
+        return
+    kwargs = {}
+    if args.label is not None:
+        kwargs['label'] = args.label
+    if args.assignee is not None:
+        kwargs['assignee'] = args.assignee
+    if kind == 'pr':
+        await cli.github_repos.list_pull_requests(args.repo, args.state, args.limit, **kwargs)
+    else:
+        await cli.github_repos.list_issues(args.repo, args.state, args.limit, **kwargs)
+
+
+def _bulk_targets(cli, args, parser):
+    targets = []
+    try:
+        for item in args.items:
+            targets.extend(parse_target(item, args.repo))
+    except ValueError as e:
+        parser.error(str(e))
+    if args.from_mirror:
+        if not args.repo:
+            parser.error("--from-mirror needs --repo")
+        for repo in args.repo:
+            items = cli.github_repos.mirror.query(repo, args.kind, args.state, args.label, args.assignee,
+                                                  args.search, limit=None)
+            targets.extend((repo, item['number']) for item in items)
+    # Keep the first occurrence of each item
+    return list(dict.fromkeys(targets))
+
+
+async def _org_repositories(cli, org):
+    try:
+        repos = await cli.github_repos.client.paginate(f"/orgs/{org}/repos", {'type': 'all'}, project=RepoRecord.page)
+    except GitHubAPIError as e:
+        console.print(Panel(f"[bold red]❌ Failed to list repositories of {org}: {e.status}[/]", 
+                          title="[red]Error", border_style="red"))
+        return None
+    return [repo['full_name'] for repo in repos]
+
+
+def _needs_network(args):
+    if getattr(args, 'github_command', None) in (None, 'login', 'logout'):
+        return False
+    return not (hasattr(args, 'offline') and _use_mirror(args))
+
+
+async def run(cli, args, parser):
+    if _needs_network(args):
+        # Cheap after the first call: the result is kept for an hour
+        await cli.github_auth.verify_token()
+    if args.github_command == 'login':
+        await cli.github_login()
+    elif args.github_command == 'logout':
+        cli.github_logout()
+    elif args.github_command == 'repos':
+        await cli.github_list_repos()
+    elif args.github_command == 'clone':
+        repo_path = await cli.github_repos.clone_repository(args.name, args.path, _clone_options(args))
+        if repo_path and Confirm.ask("Set this as current repository?"):
+            cli.set_repository(str(repo_path))
+    elif args.github_command == 'search':
+        repos = await cli.github_repos.search_repositories(args.query, args.limit)
+        cli.github_repos.display_repositories(repos)
+    elif getattr(args, 'github_command', None) == 'bulk-clone':
+        names = list(args.names)
+        if args.org:
+            org_names = await _org_repositories(cli, args.org)
+            if org_names is None:
+                return
+            names.extend(org_names)
+        if not names:
+            parser.error("give repository names or --org")
+        await cli.github_repos.clone_repositories(list(dict.fromkeys(names)), args.dest, _clone_options(args), args.jobs)
+    elif getattr(args, 'github_command', None) == 'bulk':
+        if args.resume:
+            await cli.github_repos.bulk_operation(None, [], concurrency=args.concurrency, job_id=args.resume)
+            return
+        if not args.operation:
+            parser.error("an operation is required unless --resume is given")
+        if args.operation in VALUE_REQUIRED and not args.value:
+            parser.error(f"'{args.operation}' needs --value")
+        targets = _bulk_targets(cli, args, parser)
+        if not targets:
+            parser.error("no issues or pull requests selected")
+        await cli.github_repos.bulk_operation(args.operation, targets, args.value, args.concurrency)
+    elif getattr(args, 'github_command', None) == 'sync':
+        repos = [args.repo] if args.repo else cli.github_repos.mirror.repositories()
+        if not repos:
+            parser.error("no repositories mirrored yet; pass --repo owner/repo")
+        for repo in repos:
+            await cli.github_repos.sync_issues(repo)
+    elif hasattr(args, 'issues_command') and args.issues_command:
+        if args.issues_command == 'list':
+            await _list(cli, args, 'issue')
+    elif hasattr(args, 'prs_command') and args.prs_command:
+        if args.prs_command == 'list':
+            await _list(cli, args, 'pr')
+        elif args.prs_command == 'create':
+            await cli.github_repos.create_pull_request(args.repo, args.title, args.head, args.base, args.body or "")
+        elif args.prs_command == 'comment':
+            await cli.github_repos.comment_pull_request(args.repo, int(args.pr), args.body)
+        elif args.prs_command == 'close':
+            await cli.github_repos.close_pull_request(args.repo, int(args.pr))
+        elif args.prs_command == 'merge':
+            await cli.github_repos.merge_pull_request(args.repo, int(args.pr), args.method)
+        elif args.prs_command == 'assign':
+            await cli.github_repos.assign_pull_request(args.repo, int(args.pr), args.user)
+        elif args.prs_command == 'label':
+            await cli.github_repos.label_pull_request(args.repo, int(args.pr), args.label)
+    elif hasattr(args, 'notifications_command') and args.notifications_command:
+        if args.notifications_command == 'list':
+            await cli.github_notifications_list_mode(args)
+        elif args.notifications_command == 'watch':
+            await cli.github_repos.watch_notifications(args.all, args.interval)
+        elif args.notifications_command == 'mark-read':
+            await cli.github_notifications_mark_read_mode(args)
+    elif getattr(args, 'webhooks_command', None) == 'serve':
+        await cli.github_repos.serve_webhooks(args.host, args.port, args.secret, insecure=args.insecure)
+    elif getattr(args, 'webhooks_command', None) == 'replay':
+        cli.github_repos.replay_webhooks(args.files)
+    elif hasattr(args, 'releases_command') and args.releases_command:
+        if args.releases_command == 'list':
+            await cli.github_releases_list_mode(args)
+        elif args.releases_command == 'create':
+            await cli.github_releases_create_mode(args)
+    elif getattr(args, 'github_command', None) == 'stats':
+        names = list(args.repo or [])
+        if args.org:
+            org_names = await _org_repositories(cli, args.org)
+            if org_names is None:
+                return
+            names.extend(org_names)
+        if not names:
+            parser.error("give --repo or --org")
+        if len(names) == 1 and not args.org and not args.output:
+            await cli.github_repos.list_stats(names[0])
+        else:
+            await cli.github_repos.stats_report(list(dict.fromkeys(names)), args.sort, args.output, args.jobs)
+    elif hasattr(args, 'branches_command') and args.branches_command:
+        if args.branches_command == 'graph':
+            await cli.github_branches_graph_mode(args)
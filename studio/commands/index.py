@@ -0,0 +1,433 @@
+"""
+Precomputed command index for GitFlow Studio
+Generated by `python -m studio.commands.index`; do not edit by hand
+"""
+
+GLOBAL_OPTIONS = {'flags': ['--verbose',
+           '--interactive',
+           '--discover',
+           '--github-login',
+           '--github-logout',
+           '--memprofile',
+           '--no-daemon'],
+ 'values': ['--repo', '--memprofile-top', '--sample-interval']}
+
+COMMAND_INDEX = {'status': {'help': 'Show repository status',
+            'requires_repo': True,
+            'options': [],
+            'subcommands': {}},
+ 'log': {'help': 'Show commit log',
+         'requires_repo': True,
+         'options': ['--max-count'],
+         'subcommands': {}},
+ 'branch': {'help': 'Branch operations',
+            'requires_repo': True,
+            'options': [],
+            'subcommands': {'list': {'help': 'List all branches',
+                                     'options': [],
+                                     'subcommands': {}},
+                            'create': {'help': 'Create a new branch',
+                                       'options': ['--start-point'],
+                                       'subcommands': {}},
+                            'delete': {'help': 'Delete a local branch',
+                                       'options': ['--force'],
+                                       'subcommands': {}},
+                            'delete-remote': {'help': 'Delete a remote branch',
+                                              'options': ['--remote'],
+                                              'subcommands': {}},
+                            'rename': {'help': 'Rename a branch',
+                                       'options': [],
+                                       'subcommands': {}},
+                            'checkout': {'help': 'Checkout a branch',
+                                         'options': [],
+                                         'subcommands': {}},
+                            'merge': {'help': 'Merge a branch',
+                                      'options': [],
+                                      'subcommands': {}},
+                            'rebase': {'help': 'Rebase current branch',
+                                       'options': [],
+                                       'subcommands': {}}}},
+ 'cherry-pick': {'help': 'Cherry-pick a commit',
+                 'requires_repo': True,
+                 'options': ['--continue', '--abort', '--no-commit'],
+                 'subcommands': {}},
+ 'revert': {'help': 'Revert a commit',
+            'requires_repo': True,
+            'options': ['--continue', '--abort', '--no-commit'],
+            'subcommands': {}},
+ 'stash': {'help': 'Stash operations',
+           'requires_repo': False,
+           'options': [],
+           'subcommands': {'list': {'help': 'List stashes',
+                                    'options': ['--repo'],
+                                    'subcommands': {}},
+                           'create': {'help': 'Create a new stash',
+                                      'options': ['--repo', '--message'],
+                                      'subcommands': {}},
+                           'pop': {'help': 'Pop a stash',
+                                   'options': ['--repo', '--stash'],
+                                   'subcommands': {}},
+                           'drop': {'help': 'Drop a stash',
+                                    'options': ['--repo', '--stash'],
+                                    'subcommands': {}}}},
+ 'commit': {'help': 'Create a commit',
+            'requires_repo': True,
+            'options': ['--add-all'],
+            'subcommands': {}},
+ 'push': {'help': 'Push changes',
+          'requires_repo': True,
+          'options': ['--remote', '--branch'],
+          'subcommands': {}},
+ 'pull': {'help': 'Pull changes',
+          'requires_repo': True,
+          'options': ['--remote', '--branch'],
+          'subcommands': {}},
+ 'gitflow': {'help': 'Git Flow operations',
+             'requires_repo': True,
+             'options': [],
+             'subcommands': {'init': {'help': 'Initialize Git Flow',
+                                      'options': [],
+                                      'subcommands': {}},
+                             'feature-start': {'help': 'Start a feature branch',
+                                               'options': [],
+                                               'subcommands': {}},
+                             'feature-finish': {'help': 'Finish a feature '
+                                                        'branch',
+                                                'options': [],
+                                                'subcommands': {}},
+                             'release-start': {'help': 'Start a release branch',
+                                               'options': [],
+                                               'subcommands': {}},
+                             'release-finish': {'help': 'Finish a release '
+                                                        'branch',
+                                                'options': [],
+                                                'subcommands': {}}}},
+ 'github': {'help': 'GitHub operations',
+            'requires_repo': False,
+            'options': [],
+            'subcommands': {'login': {'help': 'Login to GitHub',
+                                      'options': [],
+                                      'subcommands': {}},
+                            'logout': {'help': 'Logout from GitHub',
+                                       'options': [],
+                                       'subcommands': {}},
+                            'repos': {'help': 'List GitHub repositories',
+                                      'options': [],
+                                      'subcommands': {}},
+                            'clone': {'help': 'Clone a GitHub repository',
+                                      'options': ['--path',
+                                                  '--filter',
+                                                  '--depth',
+                                                  '--sparse',
+                                                  '--reference'],
+                                      'subcommands': {}},
+                            'bulk-clone': {'help': 'Clone many repositories in '
+                                                   'parallel',
+                                           'options': ['--org',
+                                                       '--dest',
+                                                       '--jobs',
+                                                       '--filter',
+                                                       '--depth',
+                                                       '--sparse',
+                                                       '--reference'],
+                                           'subcommands': {}},
+                            'search': {'help': 'Search GitHub repositories',
+                                       'options': ['--limit'],
+                                       'subcommands': {}},
+                            'issues': {'help': 'Manage GitHub issues',
+                                       'options': [],
+                                       'subcommands': {'list': {'help': 'List '
+                                                                        'issues '
+                                                                        'for a '
+                                                                        'repository',
+                                                                'options': ['--repo',
+                                                                            '--state',
+                                                                            '--label',
+                                                                            '--assignee',
+                                                                            '--limit',
+                                                                            '--offline',
+                                                                            '--search',
+                                                                            '--sort'],
+                                                                'subcommands': {}}}},
+                            'prs': {'help': 'Manage GitHub pull requests',
+                                    'options': [],
+                                    'subcommands': {'list': {'help': 'List '
+                                                                     'pull '
+                                                                     'requests '
+                                                                     'for a '
+                                                                     'repository',
+                                                             'options': ['--repo',
+                                                                         '--state',
+                                                                         '--label',
+                                                                         '--assignee',
+                                                                         '--limit',
+                                                                         '--offline',
+                                                                         '--search',
+                                                                         '--sort'],
+                                                             'subcommands': {}},
+                                                    'create': {'help': 'Create '
+                                                                       'a new '
+                                                                       'pull '
+                                                                       'request',
+                                                               'options': ['--repo',
+                                                                           '--title',
+                                                                           '--head',
+                                                                           '--base',
+                                                                           '--body'],
+                                                               'subcommands': {}},
+                                                    'comment': {'help': 'Comment '
+                                                                        'on a '
+                                                                        'pull '
+                                                                        'request',
+                                                                'options': ['--repo',
+                                                                            '--pr',
+                                                                            '--body'],
+                                                                'subcommands': {}},
+                                                    'close': {'help': 'Close a '
+                                                                      'pull '
+                                                                      'request',
+                                                              'options': ['--repo',
+                                                                          '--pr'],
+                                                              'subcommands': {}},
+                                                    'merge': {'help': 'Merge a '
+                                                                      'pull '
+                                                                      'request',
+                                                              'options': ['--repo',
+                                                                          '--pr',
+                                                                          '--method'],
+                                                              'subcommands': {}},
+                                                    'assign': {'help': 'Assign '
+                                                                       'a user '
+                                                                       'to a '
+                                                                       'pull '
+                                                                       'request',
+                                                               'options': ['--repo',
+                                                                           '--pr',
+                                                                           '--user'],
+                                                               'subcommands': {}},
+                                                    'label': {'help': 'Add a '
+                                                                      'label '
+                                                                      'to a '
+                                                                      'pull '
+                                                                      'request',
+                                                              'options': ['--repo',
+                                                                          '--pr',
+                                                                          '--label'],
+                                                              'subcommands': {}}}},
+                            'notifications': {'help': 'Manage GitHub '
+                                                      'notifications',
+                                              'options': [],
+                                              'subcommands': {'list': {'help': 'List '
+                                                                               'notifications',
+                                                                       'options': ['--all'],
+                                                                       'subcommands': {}},
+                                                              'watch': {'help': 'Show '
+                                                                                'new '
+                                                                                'notifications '
+                                                                                'as '
+                                                                                'they '
+                                                                                'arrive',
+                                                                        'options': ['--all',
+                                                                                    '--interval'],
+                                                                        'subcommands': {}},
+                                                              'mark-read': {'help': 'Mark '
+                                                                                    'notifications '
+                                                                                    'as '
+                                                                                    'read',
+                                                                            'options': ['--id',
+                                                                                        '--all'],
+                                                                            'subcommands': {}}}},
+                            'webhooks': {'help': 'Keep mirrored repositories '
+                                                 'current from webhook '
+                                                 'deliveries',
+                                         'options': [],
+                                         'subcommands': {'serve': {'help': 'Receive '
+                                                                           'webhook '
+                                                                           'deliveries '
+                                                                           'on '
+                                                                           'a '
+                                                                           'local '
+                                                                           'port',
+                                                                   'options': ['--host',
+                                                                               '--port',
+                                                                               '--secret',
+                                                                               '--insecure'],
+                                                                   'subcommands': {}},
+                                                         'replay': {'help': 'Apply '
+                                                                            'recorded '
+                                                                            'webhook '
+                                                                            'deliveries',
+                                                                    'options': [],
+                                                                    'subcommands': {}}}},
+                            'releases': {'help': 'Manage GitHub releases',
+                                         'options': [],
+                                         'subcommands': {'list': {'help': 'List '
+                                                                          'releases '
+                                                                          'for '
+                                                                          'a '
+                                                                          'repository',
+                                                                  'options': ['--repo',
+                                                                              '--limit'],
+                                                                  'subcommands': {}},
+                                                         'create': {'help': 'Create '
+                                                                            'a '
+                                                                            'new '
+                                                                            'release',
+                                                                    'options': ['--repo',
+                                                                                '--tag',
+                                                                                '--title',
+                                                                                '--body',
+                                                                                '--draft',
+                                                                                '--prerelease'],
+                                                                    'subcommands': {}}}},
+                            'bulk': {'help': 'Apply one operation to many '
+                                             'issues or pull requests',
+                                     'options': ['--repo',
+                                                 '--value',
+                                                 '--from-mirror',
+                                                 '--kind',
+                                                 '--state',
+                                                 '--label',
+                                                 '--assignee',
+                                                 '--search',
+                                                 '--concurrency',
+                                                 '--resume'],
+                                     'subcommands': {}},
+                            'sync': {'help': 'Mirror issues and pull requests '
+                                             'locally',
+                                     'options': ['--repo'],
+                                     'subcommands': {}},
+                            'stats': {'help': 'Show repository stats',
+                                      'options': ['--repo',
+                                                  '--org',
+                                                  '--sort',
+                                                  '--output',
+                                                  '--jobs'],
+                                      'subcommands': {}},
+                            'branches': {'help': 'Branch operations',
+                                         'options': [],
+                                         'subcommands': {'graph': {'help': 'Show '
+                                                                           'branch '
+                                                                           'graph',
+                                                                   'options': ['--repo'],
+                                                                   'subcommands': {}}}}}},
+ 'tag': {'help': 'Tag operations',
+         'requires_repo': False,
+         'options': [],
+         'subcommands': {'list': {'help': 'List all tags',
+                                  'options': ['--repo'],
+                                  'subcommands': {}},
+                         'create': {'help': 'Create a new tag',
+                                    'options': ['--repo',
+                                                '--message',
+                                                '--annotated',
+                                                '--commit'],
+                                    'subcommands': {}},
+                         'delete': {'help': 'Delete a tag',
+                                    'options': ['--repo'],
+                                    'subcommands': {}},
+                         'show': {'help': 'Show tag details',
+                                  'options': ['--repo'],
+                                  'subcommands': {}}}},
+ 'rebase-interactive': {'help': 'Interactive rebase onto a base branch or '
+                                'commit',
+                        'requires_repo': False,
+                        'options': [],
+                        'subcommands': {}},
+ 'squash': {'help': 'Squash last N commits into one',
+            'requires_repo': False,
+            'options': ['--message'],
+            'subcommands': {}},
+ 'log-file': {'help': 'Show commit log for a specific file',
+              'requires_repo': False,
+              'options': ['--max-count'],
+              'subcommands': {}},
+ 'show-commit': {'help': 'Show full details for a specific commit',
+                 'requires_repo': False,
+                 'options': [],
+                 'subcommands': {}},
+ 'analytics': {'help': 'Repository analytics and statistics',
+               'requires_repo': True,
+               'options': [],
+               'subcommands': {'stats': {'help': 'Show comprehensive '
+                                                 'repository statistics',
+                                         'options': [],
+                                         'subcommands': {}},
+                               'activity': {'help': 'Show commit activity over '
+                                                    'time',
+                                            'options': ['--days'],
+                                            'subcommands': {}},
+                               'files': {'help': 'Show file change statistics',
+                                         'options': ['--days'],
+                                         'subcommands': {}},
+                               'branches': {'help': 'Show branch activity and '
+                                                    'health',
+                                            'options': [],
+                                            'subcommands': {}},
+                               'contributors': {'help': 'Show contributor '
+                                                        'statistics',
+                                                'options': [],
+                                                'subcommands': {}},
+                               'health': {'help': 'Show repository health '
+                                                  'indicators',
+                                          'options': [],
+                                          'subcommands': {}}}},
+ 'export': {'help': 'Export commit history, file changes and analytics',
+            'requires_repo': True,
+            'options': [],
+            'subcommands': {'commits': {'help': 'Export every commit (hash, '
+                                                'parents, author, dates, '
+                                                'subject)',
+                                        'options': ['--format',
+                                                    '--compress',
+                                                    '--rev',
+                                                    '--since',
+                                                    '--output-dir',
+                                                    '--incremental'],
+                                        'subcommands': {}},
+                            'files': {'help': 'Export one row per file changed '
+                                              'by each commit, with line '
+                                              'counts',
+                                      'options': ['--format',
+                                                  '--compress',
+                                                  '--rev',
+                                                  '--since',
+                                                  '--output-dir',
+                                                  '--incremental'],
+                                      'subcommands': {}},
+                            'analytics': {'help': 'Compute and export all '
+                                                  'analytics datasets '
+                                                  'concurrently',
+                                          'options': ['--format',
+                                                      '--archive',
+                                                      '--days',
+                                                      '--datasets',
+                                                      '--output-dir'],
+                                          'subcommands': {}}}},
+ 'daemon': {'help': 'Manage the background daemon (warm repository caches for '
+                    'read-only commands)',
+            'requires_repo': False,
+            'options': [],
+            'subcommands': {'start': {'help': 'Start the daemon in the '
+                                              'background',
+                                      'options': [],
+                                      'subcommands': {}},
+                            'stop': {'help': 'Stop the daemon',
+                                     'options': [],
+                                     'subcommands': {}},
+                            'status': {'help': 'Show daemon uptime and cache '
+                                               'statistics',
+                                       'options': [],
+                                       'subcommands': {}},
+                            'run': {'help': 'Run the daemon in the foreground',
+                                    'options': [],
+                                    'subcommands': {}}}},
+ 'completion': {'help': 'Print a shell completion script (bash or zsh)',
+                'requires_repo': False,
+                'options': [],
+                'subcommands': {}}}
+
+
+if __name__ == "__main__":
+    from studio.commands import write_index
+    write_index()
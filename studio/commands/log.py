@@ -0,0 +1,15 @@
+"""
+`log` command - show the commit log
+"""
+
+HELP = 'Show commit log'
+REQUIRES_REPO = True
+DAEMON_SAFE = True
+
+
+def configure(parser):
+    parser.add_argument('--max-count', type=int, default=20, help='Maximum number of commits')
+
+
+async def run(cli, args, parser):
+    await cli.log(args.max_count)
@@ -0,0 +1,20 @@
+"""
+`log-file` command - commit log of a single file
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Show commit log for a specific file'
+REQUIRES_REPO = False
+DAEMON_SAFE = True
+
+
+def configure(parser):
+    parser.add_argument('file', help='File path')
+    parser.add_argument('--max-count', type=int, default=20, help='Maximum number of commits')
+
+
+async def run(cli, args, parser):
+    git_ops = GitOperations.open(args.repo)
+    result = await git_ops.file_log(args.file, args.max_count)
+    print(result if result else '[No log output]')
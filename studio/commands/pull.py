@@ -0,0 +1,15 @@
+"""
+`pull` command - pull changes from a remote
+"""
+
+HELP = 'Pull changes'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    parser.add_argument('--remote', help='Remote name')
+    parser.add_argument('--branch', help='Branch name')
+
+
+async def run(cli, args, parser):
+    await cli.pull(args.remote, args.branch)
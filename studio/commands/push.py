@@ -0,0 +1,15 @@
+"""
+`push` command - push changes to a remote
+"""
+
+HELP = 'Push changes'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    parser.add_argument('--remote', help='Remote name')
+    parser.add_argument('--branch', help='Branch name')
+
+
+async def run(cli, args, parser):
+    await cli.push(args.remote, args.branch)
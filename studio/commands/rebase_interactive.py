@@ -0,0 +1,14 @@
+"""
+`rebase-interactive` command - interactive rebase
+"""
+
+HELP = 'Interactive rebase onto a base branch or commit'
+REQUIRES_REPO = False
+
+
+def configure(parser):
+    parser.add_argument('base', help='Base branch or commit to rebase onto')
+
+
+async def run(cli, args, parser):
+    await cli.rebase_interactive(args.base)
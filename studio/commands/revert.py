@@ -0,0 +1,33 @@
+"""
+`revert` command - revert an existing commit
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Revert a commit'
+REQUIRES_REPO = True
+
+
+def configure(parser):
+    revert_group = parser.add_mutually_exclusive_group(required=True)
+    revert_group.add_argument('commit', nargs='?', help='Commit hash to revert')
+    revert_group.add_argument('--continue', action='store_true', help='Continue revert after resolving conflicts')
+    revert_group.add_argument('--abort', action='store_true', help='Abort revert operation')
+    parser.add_argument('--no-commit', action='store_true', help='Do not automatically commit')
+
+
+async def run(cli, args, parser):
+    git_ops = GitOperations.open(args.repo)
+    if args.abort:
+        result = await git_ops._run_git_command('revert', '--abort')
+        print(result)
+    elif getattr(args, 'continue', False):
+        result = await git_ops._run_git_command('revert', '--continue')
+        print(result)
+    elif args.commit:
+        cmd = ['revert']
+        if args.no_commit:
+            cmd.append('--no-commit')
+        cmd.append(args.commit)
+        result = await git_ops._run_git_command(*cmd)
+        print(result)
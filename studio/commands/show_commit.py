@@ -0,0 +1,19 @@
+"""
+`show-commit` command - full details of a commit
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Show full details for a specific commit'
+REQUIRES_REPO = False
+DAEMON_SAFE = True
+
+
+def configure(parser):
+    parser.add_argument('hash', help='Commit hash')
+
+
+async def run(cli, args, parser):
+    git_ops = GitOperations.open(args.repo)
+    result = await git_ops.show_commit(args.hash)
+    print(result if result else '[No commit details output]')
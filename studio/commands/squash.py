@@ -0,0 +1,15 @@
+"""
+`squash` command - squash recent commits
+"""
+
+HELP = 'Squash last N commits into one'
+REQUIRES_REPO = False
+
+
+def configure(parser):
+    parser.add_argument('num', type=int, help='Number of commits to squash (from HEAD)')
+    parser.add_argument('--message', help='Commit message for the squashed commit')
+
+
+async def run(cli, args, parser):
+    await cli.squash(args.num, args.message)
@@ -0,0 +1,47 @@
+"""
+`stash` command - stash operations
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Stash operations'
+REQUIRES_REPO = False
+
+
+def configure(parser):
+    stash_subparsers = parser.add_subparsers(dest='stash_command')
+    
+    stash_list_parser = stash_subparsers.add_parser('list', help='List stashes')
+    stash_list_parser.add_argument('--repo', required=True, help='Local repository path')
+
+    stash_create_parser = stash_subparsers.add_parser('create', help='Create a new stash')
+    stash_create_parser.add_argument('--repo', required=True, help='Local repository path')
+    stash_create_parser.add_argument('--message', help='Stash message')
+
+    stash_pop_parser = stash_subparsers.add_parser('pop', help='Pop a stash')
+    stash_pop_parser.add_argument('--repo', required=True, help='Local repository path')
+    stash_pop_parser.add_argument('--stash', help='Stash reference (e.g., stash@{0})')
+
+    stash_drop_parser = stash_subparsers.add_parser('drop', help='Drop a stash')
+    stash_drop_parser.add_argument('--repo', required=True, help='Local repository path')
+    stash_drop_parser.add_argument('--stash', help='Stash reference (e.g., stash@{0})')
+
+
+async def run(cli, args, parser):
+    if not args.stash_command:
+        parser.print_help()
+        return
+    
+    git_ops = GitOperations.open(args.repo)
+    if args.stash_command == 'list':
+        result = await git_ops.stash_list()
+        print(result)
+    elif args.stash_command == 'create':
+        result = await git_ops.stash(args.message)
+        print(result)
+    elif args.stash_command == 'pop':
+        result = await git_ops.stash_pop(args.stash or 'stash@{0}')
+        print(result)
+    elif args.stash_command == 'drop':
+        result = await git_ops.drop_stash(args.stash or 'stash@{0}')
+        print(result)
@@ -0,0 +1,15 @@
+"""
+`status` command - show repository status
+"""
+
+HELP = 'Show repository status'
+REQUIRES_REPO = True
+DAEMON_SAFE = True
+
+
+def configure(parser):
+    pass
+
+
+async def run(cli, args, parser):
+    await cli.status()
@@ -0,0 +1,50 @@
+"""
+`tag` command - tag operations
+"""
+
+from studio.git.git_operations import GitOperations
+
+HELP = 'Tag operations'
+REQUIRES_REPO = False
+
+
+def configure(parser):
+    tag_subparsers = parser.add_subparsers(dest='tag_command')
+
+    tag_list_parser = tag_subparsers.add_parser('list', help='List all tags')
+    tag_list_parser.add_argument('--repo', required=True, help='Local repository path')
+
+    tag_create_parser = tag_subparsers.add_parser('create', help='Create a new tag')
+    tag_create_parser.add_argument('--repo', required=True, help='Local repository path')
+    tag_create_parser.add_argument('name', help='Tag name')
+    tag_create_parser.add_argument('--message', help='Tag message (for annotated tag)')
+    tag_create_parser.add_argument('--annotated', action='store_true', help='Create an annotated tag')
+    tag_create_parser.add_argument('--commit', help='Commit hash to tag (default: HEAD)')
+
+    tag_delete_parser = tag_subparsers.add_parser('delete', help='Delete a tag')
+    tag_delete_parser.add_argument('--repo', required=True, help='Local repository path')
+    tag_delete_parser.add_argument('name', help='Tag name to delete')
+
+    tag_show_parser = tag_subparsers.add_parser('show', help='Show tag details')
+    tag_show_parser.add_argument('--repo', required=True, help='Local repository path')
+    tag_show_parser.add_argument('name', help='Tag name to show')
+
+
+async def run(cli, args, parser):
+    if not args.tag_command:
+        parser.print_help()
+        return
+    
+    git_ops = GitOperations.open(args.repo)
+    if args.tag_command == 'list':
+        result = await git_ops.list_tags()
+        print(result)
+    elif args.tag_command == 'create':
+        result = await git_ops.create_tag(args.name, message=args.message, annotated=args.annotated, commit=args.commit)
+        print(result)
+    elif args.tag_command == 'delete':
+        result = await git_ops.delete_tag(args.name)
+        print(result)
+    elif args.tag_command == 'show':
+        result = await git_ops.show_tag_details(args.name)
+        print(result)
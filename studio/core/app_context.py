@@ -2,21 +2,30 @@ import asyncio
 import threading
 from pathlib import Path
 from studio.core.plugin_loader import PluginLoader
-from studio.db.sqlite_manager import SQLiteManager
 from studio.utils.repo_discovery import discover_git_repos
 
 class AppContext:
     def __init__(self):
         self.plugin_loader = PluginLoader()
-        self.db_manager = SQLiteManager()
+        self._db_manager = None
         self.repositories = []
         self.current_repo = None
         self.event_loop = None
         self.background_tasks = []
         
+    @property
+    def db_manager(self):
+        """Database manager, created (and aiosqlite imported) on first use"""
+        if self._db_manager is None:
+            from studio.db.sqlite_manager import SQLiteManager
+            self._db_manager = SQLiteManager()
+        return self._db_manager
+        
     async def initialize(self):
-        """Initialize the application context"""
-        await self.db_manager.init_db()
+        """Initialize the application context
+        
+        The database schema is created by the database manager on first use.
+        """
         self.plugin_loader.discover_plugins()
         self.plugin_loader.load_plugins(self)
         
@@ -43,9 +52,21 @@ class AppContext:
             thread.start()
             self.background_tasks.append(thread)
             
+    async def close(self):
+        """Close the database connections, if they were opened"""
+        if self._db_manager is not None:
+            await self._db_manager.close()
+            
     def cleanup(self):
         """Clean up resources before shutdown"""
         try:
+            # Close the database unless a running loop owns it (it closes when that loop shuts down)
+            if self._db_manager is not None:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(self.close())
+                    
             # Stop background tasks
             for task in self.background_tasks:
                 if task.is_alive():
@@ -0,0 +1,233 @@
+"""
+Background daemon for GitFlow Studio
+Keeps repositories open with warm caches and runs read-only commands for thin clients over a Unix socket
+"""
+
+import asyncio
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+CONFIG_DIR = Path.home() / ".gitflow-studio"
+
+# Clients give up on a daemon that does not accept within this many seconds
+CONNECT_TIMEOUT = 1.0
+
+# ... or that has not answered within this many seconds, and run the command themselves
+RESPONSE_TIMEOUT = 30.0
+
+# Largest request line the daemon accepts
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+def daemon_socket_path() -> Path:
+    """Socket path, overridable with GITFLOW_STUDIO_SOCKET"""
+    return Path(os.environ.get("GITFLOW_STUDIO_SOCKET") or CONFIG_DIR / "daemon.sock")
+
+
+def send_request(request: Dict[str, Any], socket_path=None,
+                 timeout: Optional[float] = RESPONSE_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Send one request to the daemon; None if no daemon is listening or it hangs or dies mid-request"""
+    path = str(socket_path or daemon_socket_path())
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        # Missing socket, refused or reset connection, or a timeout
+        return None
+    data = b"".join(chunks)
+    try:
+        return json.loads(data) if data else None
+    except ValueError:
+        return None
+
+
+def forward_to_daemon(argv: List[str], socket_path=None) -> Optional[int]:
+    """Run a command in the daemon and print its output
+
+    Returns the command's exit status, or None if no daemon is running so the
+    caller runs the command itself.
+    """
+    path = socket_path or daemon_socket_path()
+    if not os.path.exists(path):
+        return None
+
+    from rich.console import Console
+    terminal = Console()
+    response = send_request({
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "width": terminal.width,
+        "is_terminal": terminal.is_terminal,
+        "color_system": terminal.color_system
+    }, path)
+    if response is None:
+        return None
+
+    sys.stdout.write(response.get("output", ""))
+    sys.stdout.flush()
+    return response.get("status", 0)
+
+
+@contextmanager
+def _request_output(console, buffer: io.StringIO):
+    """Send everything studio modules print during a request to the client's buffer"""
+    from rich.console import Console
+
+    swapped = []
+    for name, module in list(sys.modules.items()):
+        if name.startswith("studio") and isinstance(getattr(module, "console", None), Console):
+            swapped.append((module, module.console))
+            module.console = console
+    try:
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            yield
+    finally:
+        for module, original in swapped:
+            module.console = original
+
+
+class StudioDaemon:
+    """Serves read-only CLI commands from one long-lived process"""
+
+    def __init__(self, socket_path=None):
+        self.socket_path = Path(socket_path or daemon_socket_path())
+        self.pid_path = self.socket_path.with_suffix(".pid")
+        self.started = time.time()
+        self.requests = 0
+        self.cli = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def serve(self):
+        """Listen on the socket until stopped"""
+        from studio.cli import GitFlowStudioCLI
+        from studio.git.git_operations import GitOperations
+
+        if self.socket_path.exists():
+            if send_request({"action": "ping"}, self.socket_path) is not None:
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        GitOperations.share_instances()
+        self.cli = GitFlowStudioCLI()
+        with redirect_stdout(io.StringIO()):
+            await self.cli.initialize()
+
+        self._lock = asyncio.Lock()
+        self._stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._stopping.set)
+
+        # Owner-only from the moment it exists, rather than chmod-ed once it is already accepting
+        umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path), limit=MAX_REQUEST_SIZE)
+        finally:
+            os.umask(umask)
+        self.pid_path.write_text(str(os.getpid()))
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            await self.cli.close()
+            for path in (self.socket_path, self.pid_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = json.loads(await reader.readline())
+            response = await self.dispatch(request)
+        except Exception as e:
+            response = {"status": 1, "output": f"gitflow-studio daemon error: {e}\n"}
+        try:
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a control action or run a command"""
+        action = request.get("action", "run")
+        if action == "ping":
+            return {"status": 0, "output": "", "pid": os.getpid()}
+        if action == "status":
+            return {"status": 0, "output": "", **self.status()}
+        if action == "stop":
+            self._stopping.set()
+            return {"status": 0, "output": ""}
+        # Commands share the CLI, the working directory and the consoles, so run one at a time
+        async with self._lock:
+            return await self.run(request)
+
+    async def run(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a CLI command as the client would have, capturing its output"""
+        from rich.console import Console
+        from rich.panel import Panel
+        from studio.cli import prepare_command, run_command
+
+        argv = list(request.get("argv", []))
+        buffer = io.StringIO()
+        console = Console(file=buffer, width=request.get("width") or 80,
+                          force_terminal=request.get("is_terminal", False),
+                          color_system=request.get("color_system"))
+        status = 0
+        cwd = os.getcwd()
+        try:
+            with _request_output(console, buffer):
+                os.chdir(request.get("cwd") or cwd)
+                try:
+                    parser, command, command_parsers = prepare_command(self.cli, argv)
+                    args = parser.parse_args(argv)
+                    if not getattr(command, "DAEMON_SAFE", False):
+                        console.print(Panel(f"[bold red]❌ '{args.command}' cannot run in the daemon[/]",
+                                            title="[red]Error", border_style="red"))
+                        status = 2
+                    else:
+                        await run_command(self.cli, args, command, command_parsers[args.command])
+                except SystemExit as e:
+                    status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    console.print(Panel(f"[bold red]❌ {e}[/]", title="[red]Error", border_style="red"))
+                    status = 1
+        finally:
+            os.chdir(cwd)
+            self.requests += 1
+        return {"status": status, "output": buffer.getvalue()}
+
+    def status(self) -> Dict[str, Any]:
+        """Uptime, requests served and cache statistics per open repository"""
+        from studio.git.git_operations import GitOperations
+
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "repositories": {path: ops.cache.stats() for path, ops in (GitOperations._shared or {}).items()}
+        }
+
+
+if __name__ == "__main__":
+    asyncio.run(StudioDaemon().serve())
@@ -10,6 +10,7 @@ class PluginLoader:
         self.plugins = []
 
     def discover_plugins(self):
+        self.plugins = []
         sys.path.insert(0, str(self.plugins_path))
         for file in self.plugins_path.glob('*.py'):
             if file.name.startswith('_') or not file.name.endswith('.py'):
@@ -17,7 +18,7 @@ class PluginLoader:
             module_name = file.stem
             try:
                 module = importlib.import_module(module_name)
-                if hasattr(module, 'register'):
+                if hasattr(module, 'register') or hasattr(module, 'register_commands'):
                     self.plugins.append(module)
             except Exception as e:
                 print(f"Failed to load plugin {module_name}: {e}")
@@ -25,6 +26,8 @@ class PluginLoader:
 
     def load_plugins(self, app_context):
         for plugin in self.plugins:
+            if not hasattr(plugin, 'register'):
+                continue
             try:
                 plugin.register(app_context)
             except Exception as e:
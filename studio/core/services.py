@@ -0,0 +1,59 @@
+"""
+Lazy service container for GitFlow Studio
+Builds services (and imports their modules) only on first use
+"""
+
+import importlib
+from typing import Dict, Any, Callable
+
+
+def import_attr(module_name: str, attr: str) -> Any:
+    """Import a module attribute on demand"""
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class ServiceContainer:
+    """Registry of lazily constructed, process-wide services"""
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]):
+        """Register a factory; it is called the first time the service is requested"""
+        self._factories[name] = factory
+        self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Get a service, constructing it on first access"""
+        if name not in self._instances:
+            if name not in self._factories:
+                raise KeyError(f"Unknown service: {name}")
+            self._instances[name] = self._factories[name]()
+        return self._instances[name]
+
+    def set(self, name: str, instance: Any):
+        """Replace a service with an already constructed instance"""
+        self._instances[name] = instance
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a service has been constructed yet"""
+        return name in self._instances
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._factories or name in self._instances
+
+
+class LazyService:
+    """Attribute that resolves to a service of its owner's ``services`` container"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.services.get(self.name)
+
+    def __set__(self, obj, value):
+        obj.services.set(self.name, value)
@@ -1,32 +1,200 @@
+"""
+SQLite Manager
+Long-lived aiosqlite connections in WAL mode: one writer that batches statements into transactions
+and a separate read-only connection, instead of a new connection (and thread) per query
+"""
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence
+
 import aiosqlite
-import os
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repositories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT UNIQUE NOT NULL,
+    name TEXT,
+    last_opened TIMESTAMP
+);
+"""
+
+MMAP_SIZE = 256 * 1024 * 1024
+BUSY_TIMEOUT_MS = 5000
+# Prepared statements kept per connection; sqlite3 reuses them for identical SQL text
+STATEMENT_CACHE_SIZE = 256
+
+# WAL lets the reader query while the writer commits, and with WAL synchronous=NORMAL
+# only syncs at checkpoints without risking corruption
+WRITER_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+)
+CONNECTION_PRAGMAS = (
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    f"PRAGMA mmap_size = {MMAP_SIZE}",
+    "PRAGMA temp_store = MEMORY",
+)
+
 
 class SQLiteManager:
+    """Persistent writer and reader connections to the application database
+
+    Close it with close() or by using it as an async context manager. If
+    neither happens, the connections are closed when the event loop that
+    opened them shuts down (asyncio.run), and their threads never keep the
+    interpreter from exiting.
+    """
+
     def __init__(self, db_path='gitflow_studio.db'):
         self.db_path = db_path
+        self._initialized = False
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._reader: Optional[aiosqlite.Connection] = None
+        # Created on first use so they belong to the running event loop
+        self._open_lock: Optional[asyncio.Lock] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._transaction_task: Optional[asyncio.Task] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+
+    @property
+    def in_memory(self) -> bool:
+        return str(self.db_path) in (':memory:', '')
+
+    async def _ensure_db(self):
+        if not self._initialized:
+            await self.init_db()
 
     async def init_db(self):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute('''
-                CREATE TABLE IF NOT EXISTS repositories (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE NOT NULL,
-                    name TEXT,
-                    last_opened TIMESTAMP
-                )
-            ''')
-            await db.commit()
-
-    async def execute(self, query, params=None):
-        async with aiosqlite.connect(self.db_path) as db:
-            if params is None:
-                params = ()
-            await db.execute(query, params)
-            await db.commit()
-
-    async def fetchall(self, query, params=None):
-        async with aiosqlite.connect(self.db_path) as db:
-            if params is None:
-                params = ()
-            async with db.execute(query, params) as cursor:
-                return await cursor.fetchall() 
\ No newline at end of file
+        """Open the connections and create the schema"""
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._initialized:
+                return
+            writer = await self._connect(self.db_path)
+            try:
+                for pragma in WRITER_PRAGMAS + CONNECTION_PRAGMAS:
+                    await writer.execute(pragma)
+                await writer.executescript(SCHEMA)
+                await writer.commit()
+                # An in-memory database only exists on its own connection, so it is read through the writer
+                self._reader = writer if self.in_memory else await self._open_reader()
+            except Exception:
+                await writer.close()
+                raise
+            self._writer = writer
+            self._initialized = True
+            self._shutdown_task = asyncio.ensure_future(self._close_at_shutdown())
+
+    @staticmethod
+    def _connect(database: str, **kwargs: Any) -> aiosqlite.Connection:
+        connection = aiosqlite.connect(database, cached_statements=STATEMENT_CACHE_SIZE, **kwargs)
+        # The worker thread starts when the connection is awaited; as a daemon it cannot block
+        # interpreter exit (older aiosqlite connections are the thread themselves)
+        thread = getattr(connection, '_thread', connection)
+        if isinstance(thread, threading.Thread):
+            thread.daemon = True
+        return connection
+
+    async def _close_at_shutdown(self):
+        """Wait until the loop cancels its remaining tasks at shutdown, then close the connections"""
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            await self.close()
+            raise
+
+    async def _open_reader(self) -> aiosqlite.Connection:
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        reader = await self._connect(uri, uri=True)
+        try:
+            for pragma in CONNECTION_PRAGMAS + ("PRAGMA query_only = ON",):
+                await reader.execute(pragma)
+        except Exception:
+            await reader.close()
+            raise
+        return reader
+
+    def _in_transaction(self) -> bool:
+        return self._transaction_task is not None and self._transaction_task is asyncio.current_task()
+
+    @asynccontextmanager
+    async def _writing(self):
+        """The writer, held exclusively; commits on exit (rolls back on error) unless inside transaction()"""
+        await self._ensure_db()
+        if self._in_transaction():
+            yield self._writer
+            return
+        async with self._write_lock:
+            try:
+                yield self._writer
+            except BaseException:
+                await self._writer.rollback()
+                raise
+            await self._writer.commit()
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Batch writes: execute() and executemany() calls made by this task inside the block
+        commit together when it exits, or are rolled back if it raises"""
+        if self._in_transaction():
+            yield self
+            return
+        async with self._writing():
+            self._transaction_task = asyncio.current_task()
+            try:
+                yield self
+            finally:
+                self._transaction_task = None
+
+    async def execute(self, query, params=None) -> int:
+        """Run one write statement; returns the number of rows changed"""
+        async with self._writing() as db:
+            async with db.execute(query, params or ()) as cursor:
+                return cursor.rowcount
+
+    async def executemany(self, query, params_seq: Iterable[Sequence[Any]]) -> int:
+        """Run one statement for every parameter set in a single transaction; returns the rows changed"""
+        async with self._writing() as db:
+            async with db.executemany(query, params_seq) as cursor:
+                return cursor.rowcount
+
+    def _read_connection(self) -> aiosqlite.Connection:
+        # Inside a transaction, read through the writer so uncommitted changes are visible
+        return self._writer if self._in_transaction() else self._reader
+
+    async def fetchall(self, query, params=None) -> List[Any]:
+        await self._ensure_db()
+        async with self._read_connection().execute(query, params or ()) as cursor:
+            return await cursor.fetchall()
+
+    async def fetchone(self, query, params=None) -> Optional[Any]:
+        await self._ensure_db()
+        async with self._read_connection().execute(query, params or ()) as cursor:
+            return await cursor.fetchone()
+
+    async def close(self):
+        """Close both connections; the next query opens them again"""
+        reader, writer = self._reader, self._writer
+        self._reader = self._writer = None
+        self._initialized = False
+        shutdown_task, self._shutdown_task = self._shutdown_task, None
+        if shutdown_task is not None and shutdown_task is not asyncio.current_task():
+            shutdown_task.cancel()
+        if reader is not None and reader is not writer:
+            await reader.close()
+        if writer is not None:
+            await writer.close()
+
+    async def __aenter__(self) -> 'SQLiteManager':
+        await self._ensure_db()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
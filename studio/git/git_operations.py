@@ -1,16 +1,59 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
-import git
+from collections import OrderedDict
 from pathlib import Path
 import re
 import os
 import tempfile
 
+from studio.git.repo_cache import RepoStateCache, cached, RELATIVE_TTL
+
+# Record (\x1e) and field (\x1f) separators keep subjects with '|' intact
+HISTORY_FORMAT = '%x1e%H%x1f%P%x1f%an%x1f%ae%x1f%aI%x1f%cI%x1f%s'
+COMMIT_FIELDS = ('hash', 'parents', 'author', 'email', 'date', 'committer_date', 'subject')
+FILE_CHANGE_FIELDS = ('hash', 'date', 'author', 'path', 'additions', 'deletions')
+# Bytes read from `git log` at a time
+HISTORY_CHUNK_SIZE = 64 * 1024
+
 class GitOperations:
-    def __init__(self, repo_path):
+    # Shared, cached instances per repository (see share_instances)
+    _shared = None
+    MAX_SHARED_REPOS = 16
+    
+    def __init__(self, repo_path, cache=None):
+        import git  # GitPython is slow to import; only load it once a repo is opened
         self.repo_path = Path(repo_path)
         self.repo = git.Repo(repo_path)
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self.cache = cache
+    
+    @classmethod
+    def share_instances(cls, enabled=True):
+        """Make open() reuse one cached instance per repository
+        
+        Used by long-lived processes (the daemon, interactive mode) so repositories
+        stay open and read-only results are reused until the repository changes.
+        """
+        cls._shared = OrderedDict() if enabled else None
+    
+    @classmethod
+    def open(cls, repo_path):
+        """Get operations for a repository, shared and cached if sharing is enabled"""
+        if cls._shared is None:
+            return cls(repo_path)
+        
+        key = os.path.realpath(repo_path)
+        ops = cls._shared.get(key)
+        if ops is None:
+            ops = cls(repo_path)
+            ops.cache = RepoStateCache(ops.repo.git_dir, ops.repo.common_dir)
+            cls._shared[key] = ops
+            if len(cls._shared) > cls.MAX_SHARED_REPOS:
+                _, evicted = cls._shared.popitem(last=False)
+                evicted.executor.shutdown(wait=False)
+        else:
+            cls._shared.move_to_end(key)
+        return ops
         
     async def _run_git_command(self, *args, env=None):
         """Run a Git command asynchronously, with optional environment variables"""
@@ -22,10 +65,12 @@ class GitOperations:
         return await loop.run_in_executor(self.executor, run)
     
     # Basic Operations
+    # Not cached: working tree edits do not show in the repository fingerprint
     async def status(self):
         """Get repository status"""
         return await self._run_git_command('status', '--porcelain')
     
+    @cached()
     async def log(self, max_count=50, branch=None):
         """Get commit log"""
         cmd = ['log', f'--max-count={max_count}', '--oneline', '--graph']
@@ -33,6 +78,7 @@ class GitOperations:
             cmd.append(branch)
         return await self._run_git_command(*cmd)
     
+    @cached()
     async def branches(self):
         """Get all branches"""
         return await self._run_git_command('branch', '-a')
@@ -201,10 +247,12 @@ class GitOperations:
         return await self._run_git_command('revert', commit_hash)
     
     # Repository Information
+    @cached()
     async def get_remotes(self):
         """Get remote information"""
         return await self._run_git_command('remote', '-v')
     
+    @cached()
     async def get_tags(self):
         """Get all tags"""
         return await self._run_git_command('tag', '-l')
@@ -289,13 +337,14 @@ class GitOperations:
     # Conflict Resolution
     async def check_merge_conflicts(self, source_branch, target_branch):
         """Check for merge conflicts between branches"""
+        from git import GitCommandError
         try:
             # Try to merge without committing
             await self._run_git_command('merge', '--no-commit', '--no-ff', source_branch)
             # If successful, abort the merge
             await self._run_git_command('merge', '--abort')
             return []
-        except git.GitCommandError:
+        except GitCommandError:
             # Merge failed, check for conflicted files
             status = await self._run_git_command('status', '--porcelain')
             conflicts = []
@@ -307,6 +356,7 @@ class GitOperations:
             return conflicts
             
     # Current branch
+    @cached()
     async def current_branch(self):
         """Get the current branch name"""
         return await self._run_git_command('branch', '--show-current')
@@ -334,6 +384,7 @@ class GitOperations:
         return await self._run_git_command(*cmd)
     
     # Tag Management
+    @cached()
     async def list_tags(self):
         """List all tags"""
         return await self._run_git_command('tag', '-l')
@@ -356,6 +407,7 @@ class GitOperations:
         """Delete a tag by name"""
         return await self._run_git_command('tag', '-d', name)
 
+    @cached()
     async def show_tag_details(self, name):
         """Show details for a tag (annotated or lightweight)"""
         return await self._run_git_command('show', name)
@@ -385,16 +437,104 @@ class GitOperations:
         except Exception as e:
             return f"Error during squash: {e}"
 
+    @cached()
     async def file_log(self, file_path, max_count=50):
         """Show commit log for a specific file"""
         result = await self._run_git_command('log', f'--max-count={max_count}', '--oneline', '--', file_path)
         return f"DEBUG: file_log result type: {type(result)}, value: {result}"
 
+    @cached()
     async def show_commit(self, commit_hash):
         """Show full details for a specific commit"""
         return await self._run_git_command('show', commit_hash)
 
+    # Streaming History (for exports: one row at a time, never the whole log)
+    async def _iter_log(self, rev, since, numstat):
+        """Yield (header fields, numstat records) per commit from a streamed `git log -z`
+
+        NUL-terminated records keep paths verbatim: no C-quoting of non-ASCII
+        names, and tabs or newlines in a path cannot split a record. Raises
+        GitCommandError, with git's stderr, if git fails (e.g. an unknown rev).
+        """
+        cmd = ['git', 'log', '-z', f'--format={HISTORY_FORMAT}']
+        if numstat:
+            cmd += ['--numstat', '--no-renames']
+        if since:
+            cmd.append(f'--since={since}')
+        cmd += [rev, '--']
+        process = await asyncio.create_subprocess_exec(
+            *cmd, cwd=str(self.repo_path), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        # Drained alongside stdout so a chatty git cannot block on a full stderr pipe
+        stderr = asyncio.ensure_future(process.stderr.read())
+        header, stats, pending = None, [], b''
+        try:
+            while True:
+                chunk = await process.stdout.read(HISTORY_CHUNK_SIZE)
+                if not chunk:
+                    if not pending:
+                        break
+                    chunk = b'\0'  # terminate a final unterminated record
+                *records, pending = (pending + chunk).split(b'\0')
+                for raw in records:
+                    # The first numstat record of a commit follows a newline
+                    record = raw.decode('utf-8', errors='replace').lstrip('\n')
+                    if record.startswith('\x1e'):
+                        if header is not None:
+                            yield header, stats
+                        header, stats = record[1:].split('\x1f'), []
+                    elif record:
+                        stats.append(record)
+            returncode = await process.wait()
+            if returncode != 0:
+                from git import GitCommandError
+                raise GitCommandError(cmd, returncode, (await stderr).decode('utf-8', errors='replace').strip())
+            if header is not None:
+                yield header, stats
+        finally:
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+            await process.wait()
+            if not stderr.done():
+                stderr.cancel()
+
+    async def resolve(self, rev='HEAD'):
+        """Full hash of the commit rev points at"""
+        return (await self._run_git_command('rev-parse', '--verify', f'{rev}^{{commit}}')).strip()
+
+    async def is_ancestor(self, ancestor, descendant='HEAD'):
+        """Whether ancestor is reachable from descendant (False if it no longer exists, e.g. after a force push)"""
+        try:
+            await self._run_git_command('merge-base', '--is-ancestor', ancestor, descendant)
+            return True
+        except Exception:
+            return False
+
+    async def iter_commits(self, rev='HEAD', since=None):
+        """Commits reachable from rev (a ref or range such as 'a1b2..HEAD'), newest first, as COMMIT_FIELDS rows"""
+        async for header, _ in self._iter_log(rev, since, numstat=False):
+            yield dict(zip(COMMIT_FIELDS, header))
+
+    async def iter_file_changes(self, rev='HEAD', since=None):
+        """One FILE_CHANGE_FIELDS row per file touched by each commit (binary files count 0 lines)"""
+        async for header, stats in self._iter_log(rev, since, numstat=True):
+            commit_hash, author, date = header[0], header[2], header[4]
+            for line in stats:
+                additions, deletions, path = line.split('\t', 2)
+                yield {
+                    'hash': commit_hash,
+                    'date': date,
+                    'author': author,
+                    'path': path,
+                    'additions': int(additions) if additions != '-' else 0,
+                    'deletions': int(deletions) if deletions != '-' else 0
+                }
+
     # Repository Analytics & Statistics
+    @cached(ttl=RELATIVE_TTL)
     async def get_repository_stats(self):
         """Get comprehensive repository statistics"""
         stats = {}
@@ -449,6 +589,7 @@ class GitOperations:
             
         return stats
 
+    @cached(ttl=RELATIVE_TTL)
     async def get_commit_activity(self, days=30):
         """Get commit activity over a period of time"""
         try:
@@ -464,6 +605,7 @@ class GitOperations:
         except Exception as e:
             return {'error': str(e)}
 
+    @cached(ttl=RELATIVE_TTL)
     async def get_file_changes(self, days=30):
         """Get file change statistics"""
         try:
@@ -490,6 +632,7 @@ class GitOperations:
         except Exception as e:
             return {'error': str(e)}
 
+    @cached()
     async def get_branch_activity(self):
         """Get branch activity and health metrics"""
         try:
@@ -534,19 +677,20 @@ class GitOperations:
         except Exception as e:
             return {'error': str(e)}
 
+    @cached()
     async def get_contributor_stats(self):
         """Get contributor statistics and activity"""
         try:
-            # Get contributor summary
-            contributors = await self._run_git_command('shortlog', '-sn', '--no-merges')
+            # Get contributor summary (with no revision, shortlog reads stdin when it is not a terminal)
+            contributors = await self._run_git_command('shortlog', '-sn', '--no-merges', 'HEAD')
             
-            # Get detailed contributor info
-            detailed_contributors = await self._run_git_command('shortlog', '-sn', '--no-merges', '--format=%H|%an|%ae|%ad|%s')
+            # Get detailed contributor info, one commit per line (shortlog -s drops --format)
+            detailed_contributors = await self._run_git_command('log', '--no-merges', '--format=%H|%an|%ae|%aI|%s')
             
             contributor_details = []
             for line in detailed_contributors.split('\n'):
                 if line.strip():
-                    parts = line.split('|')
+                    parts = line.split('|', 4)
                     if len(parts) >= 5:
                         contributor_details.append({
                             'hash': parts[0][:8],
@@ -563,6 +707,7 @@ class GitOperations:
         except Exception as e:
             return {'error': str(e)}
 
+    @cached()
     async def get_repository_health(self):
         """Get repository health indicators"""
         try:
@@ -0,0 +1,96 @@
+"""
+Repository state cache for GitFlow Studio
+Keeps results of read-only Git calls until HEAD, the index or any ref changes
+"""
+
+import asyncio
+import os
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Callable, Awaitable
+
+# Results relative to "now" (e.g. `--since=30 days ago`) are recomputed after this long
+RELATIVE_TTL = 300.0
+
+
+def _stat(path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class RepoStateCache:
+    """Caches read-only Git results keyed by a fingerprint of the repository state"""
+
+    def __init__(self, git_dir, common_dir=None):
+        self.git_dir = Path(git_dir)
+        self.common_dir = Path(common_dir or git_dir)
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Any, Tuple[Any, float, Any]] = {}
+        self._inflight: Dict[Any, asyncio.Future] = {}
+
+    def fingerprint(self) -> Tuple:
+        """Stat HEAD, the index, packed-refs and every loose ref
+
+        Git updates these files by renaming a lock file into place, so the
+        inode changes even where mtimes are coarse.
+        """
+        parts = [_stat(self.git_dir / "HEAD"), _stat(self.git_dir / "index"),
+                 _stat(self.common_dir / "packed-refs")]
+        for root, dirs, files in os.walk(self.common_dir / "refs"):
+            dirs.sort()
+            parts.append((root, _stat(root)))
+            parts.extend((name, _stat(os.path.join(root, name))) for name in sorted(files))
+        return tuple(parts)
+
+    async def get_or_compute(self, key, compute: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        """Return a cached result, or compute it once even if requested concurrently"""
+        fingerprint = self.fingerprint()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == fingerprint and (ttl is None or time.monotonic() - entry[1] < ttl):
+            self.hits += 1
+            return entry[2]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+            return await asyncio.shield(task)
+
+        self.misses += 1
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        try:
+            value = await asyncio.shield(task)
+        finally:
+            self._inflight.pop(key, None)
+        self._entries[key] = (fingerprint, time.monotonic(), value)
+        return value
+
+    def invalidate(self):
+        """Drop every cached result"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def cached(ttl: Optional[float] = None):
+    """Serve a read-only GitOperations coroutine from the instance's RepoStateCache
+
+    Only for results determined by HEAD, the index and refs: file edits in the
+    working tree change nothing the fingerprint sees. Instances without a
+    cache run uncached.
+    """
+    def decorator(method):
+        @wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if self.cache is None:
+                return await method(self, *args, **kwargs)
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            return await self.cache.get_or_compute(key, lambda: method(self, *args, **kwargs), ttl)
+        return wrapper
+    return decorator
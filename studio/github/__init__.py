@@ -3,7 +3,10 @@ GitHub integration module for GitFlow Studio
 Provides authentication and repository access via GitHub API
 """
 
+from .http_cache import HTTPCache
+from .client import GitHubClient
+from .graphql import GitHubGraphQL
 from .auth import GitHubAuth
 from .repos import GitHubRepos
 
-__all__ = ['GitHubAuth', 'GitHubRepos'] 
\ No newline at end of file
+__all__ = ['HTTPCache', 'GitHubClient', 'GitHubGraphQL', 'GitHubAuth', 'GitHubRepos'] 
\ No newline at end of file
@@ -8,19 +8,26 @@ import json
 import webbrowser
 import keyring
 import asyncio
+import time
 from typing import Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime, timedelta
-import aiohttp
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from cryptography.fernet import Fernet
 import base64
+import aiohttp
+
+from .client import GitHubClient, API_BASE
+from .http_cache import HTTPCache
 
 console = Console()
 
+# How long a token check against /user is trusted
+TOKEN_CHECK_TTL = 3600
+
 class GitHubAuth:
     """GitHub Authentication Handler"""
     
@@ -31,12 +38,20 @@ class GitHubAuth:
         self.redirect_uri = "http://localhost:8080/callback"
         self.auth_url = "https://github.com/login/oauth/authorize"
         self.token_url = "https://github.com/login/oauth/access_token"
-        self.api_base = "https://api.github.com"
+        self.api_base = API_BASE
         self.access_token = None
         self.user_info = None
         self.config_dir = Path.home() / ".gitflow-studio"
         self.config_file = self.config_dir / "github_config.json"
         self._encryption_key = None
+        # Credentials are read and decrypted once; the config file's mtime
+        # tells when another process logged in or out
+        self._config_mtime = None
+        self._token_valid = True
+        self._verified_at = 0.0
+        # Shared by every GitHub API call (see GitHubRepos); GET responses are
+        # cached on disk and revalidated with conditional requests
+        self.client = GitHubClient(self, self.api_base, cache=HTTPCache(self.config_dir / "http_cache.db"))
         
     def _get_encryption_key(self) -> bytes:
         """Get or create encryption key for storing tokens securely"""
@@ -74,6 +89,29 @@ class GitHubAuth:
             
         with open(self.config_file, 'w') as f:
             json.dump(config, f, indent=2)
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Forget the cached credentials; the next access reloads them"""
+        self._config_mtime = None
+        self._token_valid = True
+        self._verified_at = 0.0
+    
+    def _ensure_loaded(self):
+        """Load and decrypt credentials unless the cached copy is current"""
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        if mtime == self._config_mtime:
+            return
+        config = self._load_config()
+        self._config_mtime = mtime
+        self.access_token = config.get('access_token')
+        self.user_info = config.get('user_info')
+        self._token_valid = True
+        verified_at = config.get('token_verified_at', 0.0)
+        self._verified_at = verified_at if isinstance(verified_at, (int, float)) else 0.0
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -95,15 +133,42 @@ class GitHubAuth:
     
     def is_authenticated(self) -> bool:
         """Check if user is authenticated"""
-        config = self._load_config()
-        if 'access_token' not in config:
+        self._ensure_loaded()
+        return self.access_token is not None and self._token_valid
+    
+    async def verify_token(self, force: bool = False) -> bool:
+        """Check the token against /user, at most once per TOKEN_CHECK_TTL"""
+        if not self.is_authenticated():
             return False
-            
-        self.access_token = config['access_token']
-        self.user_info = config.get('user_info')
-        
-        # Check if token is still valid
-        return self.access_token is not None
+        if not force and time.time() - self._verified_at < TOKEN_CHECK_TTL:
+            return True
+        try:
+            async with self.client.get(f"{self.api_base}/user") as response:
+                if response.status == 401:
+                    self._token_valid = False
+                    return False
+                if response.status != 200:
+                    # Can't tell (rate limited, outage): keep the token
+                    return True
+                self.user_info = await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return True
+        self._verified_at = time.time()
+        self._store_verification()
+        return True
+    
+    def _store_verification(self):
+        """Record the check in the config file so other processes skip it too"""
+        try:
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+            config['token_verified_at'] = self._verified_at
+            config['user_info'] = self.user_info
+            with open(self.config_file, 'w') as f:
+                json.dump(config, f, indent=2)
+            self._config_mtime = self.config_file.stat().st_mtime_ns
+        except (OSError, ValueError):
+            pass
     
     async def login(self) -> bool:
         """Perform GitHub OAuth login flow"""
@@ -190,6 +255,8 @@ See studio/github/config_template.py for detailed instructions.
         
         self.access_token = token
         self.user_info = user_info
+        self._verified_at = time.time()
+        self._store_verification()
         
         console.print(Panel(f"[bold green]✅ Successfully authenticated as {user_info['login']}![/]", 
                           title="[green]Success", border_style="green"))
@@ -265,43 +332,37 @@ See studio/github/config_template.py for detailed instructions.
         ) as progress:
             task = progress.add_task("Exchanging code for access token...", total=None)
             
-            async with aiohttp.ClientSession() as session:
-                data = {
-                    'client_id': self.client_id,
-                    'client_secret': self.client_secret,
-                    'code': code,
-                    'redirect_uri': self.redirect_uri
-                }
-                
-                headers = {
-                    'Accept': 'application/json',
-                    'Content-Type': 'application/json'
-                }
-                
-                async with session.post(self.token_url, json=data, headers=headers) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        token = result.get('access_token')
-                        progress.update(task, description="✅ Access token obtained!")
-                        return token
-                    else:
-                        progress.update(task, description="❌ Failed to get access token")
-                        return None
-    
-    async def _get_user_info(self, token: str) -> Optional[Dict[str, Any]]:
-        """Get authenticated user information"""
-        async with aiohttp.ClientSession() as session:
+            data = {
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'code': code,
+                'redirect_uri': self.redirect_uri
+            }
+            
             headers = {
-                'Authorization': f'token {token}',
-                'Accept': 'application/vnd.github.v3+json'
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
             }
             
-            async with session.get(f"{self.api_base}/user", headers=headers) as response:
+            async with self.client.post(self.token_url, json=data, headers=headers) as response:
                 if response.status == 200:
-                    return await response.json()
+                    result = await response.json()
+                    token = result.get('access_token')
+                    progress.update(task, description="✅ Access token obtained!")
+                    return token
                 else:
+                    progress.update(task, description="❌ Failed to get access token")
                     return None
     
+    async def _get_user_info(self, token: str) -> Optional[Dict[str, Any]]:
+        """Get authenticated user information"""
+        headers = {'Authorization': f'token {token}'}
+        async with self.client.get(f"{self.api_base}/user", headers=headers) as response:
+            if response.status == 200:
+                return await response.json()
+            else:
+                return None
+    
     def logout(self):
         """Logout and clear stored credentials"""
         try:
@@ -314,6 +375,7 @@ See studio/github/config_template.py for detailed instructions.
             
             self.access_token = None
             self.user_info = None
+            self._invalidate()
             
             console.print(Panel("[bold green]✅ Successfully logged out from GitHub[/]", 
                               title="[green]Logout", border_style="green"))
@@ -323,8 +385,10 @@ See studio/github/config_template.py for detailed instructions.
     
     def get_user_info(self) -> Optional[Dict[str, Any]]:
         """Get current user information"""
+        self._ensure_loaded()
         return self.user_info
     
     def get_access_token(self) -> Optional[str]:
         """Get current access token"""
+        self._ensure_loaded()
         return self.access_token 
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+GitHub Benchmark Module
+Runs every GitHubRepos method against the fake GitHub server and measures requests, bytes and wall time
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import sys
+import tempfile
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
+
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+from .client import GitHubClient
+from .http_cache import HTTPCache
+from .fake_server import FakeGitHub, FakeAuth
+from .repos import GitHubRepos
+
+console = Console()
+
+# Requests per second the benchmark client may send; high enough that the
+# numbers measure the client rather than the pacing
+UNPACED_RATE = 1e6
+
+Case = Tuple[str, Callable[[GitHubRepos], Awaitable[Any]]]
+
+
+def cases(fake: FakeGitHub) -> List[Case]:
+    """(name, call) for every GitHubRepos method that talks to the API, reads before writes"""
+    big = fake.repo_name(0)
+    small = fake.repo_name(min(1, fake.repo_count - 1))
+    owner, name = big.split('/')
+    return [
+        ('list_repositories', lambda repos: repos.list_repositories()),
+        ('find_repository', lambda repos: repos.find_repository(name)),
+        ('search_repositories', lambda repos: repos.search_repositories('repo-0001')),
+        ('get_repository_info', lambda repos: repos.get_repository_info(owner, name)),
+        ('list_issues', lambda repos: repos.list_issues(big, limit=100)),
+        ('list_pull_requests', lambda repos: repos.list_pull_requests(big, limit=100)),
+        ('list_notifications', lambda repos: repos.list_notifications()),
+        ('list_releases', lambda repos: repos.list_releases(big)),
+        ('list_stats', lambda repos: repos.list_stats(big)),
+        ('list_branches_graph', lambda repos: repos.list_branches_graph(big)),
+        ('stats_report', lambda repos: repos.stats_report([fake.repo_name(i) for i in range(min(fake.repo_count, 100))])),
+        ('sync_issues', lambda repos: repos.sync_issues(big)),
+        ('sync_issues (incremental)', lambda repos: repos.sync_issues(big)),
+        ('create_issue', lambda repos: repos.create_issue(small, 'Benchmark issue', 'Body')),
+        ('comment_issue', lambda repos: repos.comment_issue(small, 1, 'Benchmark comment')),
+        ('assign_issue', lambda repos: repos.assign_issue(small, 1, 'hubot')),
+        ('label_issue', lambda repos: repos.label_issue(small, 1, 'bug')),
+        ('close_issue', lambda repos: repos.close_issue(small, 1)),
+        ('create_pull_request', lambda repos: repos.create_pull_request(small, 'Benchmark PR', 'feature', 'main')),
+        ('merge_pull_request', lambda repos: repos.merge_pull_request(small, 5)),
+        ('create_release', lambda repos: repos.create_release(small, 'v9.9.9', 'Benchmark release')),
+        ('mark_notifications_as_read', lambda repos: repos.mark_notifications_as_read(mark_all=True)),
+        ('bulk_operation', lambda repos: repos.bulk_operation(
+            'label', [(big, number) for number in range(1, 101)], 'stale')),
+    ]
+
+
+@contextmanager
+def _quiet():
+    """Discard what studio modules print while a case runs"""
+    sink = Console(file=io.StringIO())
+    swapped = []
+    for module_name, module in list(sys.modules.items()):
+        if module_name.startswith("studio") and isinstance(getattr(module, "console", None), Console):
+            swapped.append((module, module.console))
+            module.console = sink
+    try:
+        with redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        for module, original in swapped:
+            module.console = original
+
+
+async def run_benchmark(fake: FakeGitHub, use_graphql: bool = False, cached: bool = False, rounds: int = 1,
+                        only: Optional[List[str]] = None, work_dir=None) -> List[Dict[str, Any]]:
+    """Serve fake and time each case; one result per case and round
+
+    With cached=True the client keeps an HTTP cache, so later rounds show how
+    many requests come back 304 Not Modified.
+    """
+    selected = [case for case in cases(fake) if not only or case[0] in only]
+    results = []
+    with tempfile.TemporaryDirectory() as scratch:
+        work = Path(work_dir or scratch)
+        auth = FakeAuth(config_dir=work, login=fake.owner)
+        url = await fake.start()
+        cache = HTTPCache(work / "http_cache.db") if cached else None
+        client = GitHubClient(auth, url, cache=cache, rate=UNPACED_RATE, burst=int(UNPACED_RATE))
+        repos = GitHubRepos(auth, client=client, use_graphql=use_graphql)
+        try:
+            for round_number in range(1, rounds + 1):
+                for name, call in selected:
+                    fake.reset_stats()
+                    started = time.perf_counter()
+                    with _quiet():
+                        await call(repos)
+                    elapsed = time.perf_counter() - started
+                    results.append({'round': round_number, 'method': name, **fake.stats(), 'seconds': elapsed})
+        finally:
+            await client.close()
+            if repos._mirror is not None:
+                repos._mirror.close()
+            await fake.stop()
+    return results
+
+
+def display_results(results: List[Dict[str, Any]], title: str):
+    table = Table(title=f"[bold blue]{title}[/]", box=box.ROUNDED, border_style="blue")
+    table.add_column("Round", style="dim", justify="right")
+    table.add_column("Method", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("304s", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Seconds", style="green", justify="right")
+    for result in results:
+        table.add_row(str(result['round']), result['method'], str(result['requests']),
+                      str(result['not_modified']), f"{result['bytes']:,}", f"{result['seconds']:.3f}")
+    console.print(table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark GitHubRepos against a local fake GitHub API')
+    parser.add_argument('--repos', type=int, default=10000)
+    parser.add_argument('--issues', type=int, default=100000, help='Issues in the benchmarked repository')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--graphql', action='store_true', help='Use the GraphQL backend where available')
+    parser.add_argument('--cache', action='store_true', help='Use the HTTP cache (see 304s from round 2)')
+    parser.add_argument('--rounds', type=int, default=1)
+    parser.add_argument('--only', action='append', help='Run just this method (repeatable)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args(argv)
+
+    fake = FakeGitHub(repos=args.repos, issues=args.issues, latency=args.latency, rate_limit=10 ** 9)
+    results = asyncio.run(run_benchmark(fake, args.graphql, args.cache, args.rounds, args.only))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        display_results(results, f"GitHubRepos against {args.repos} repos / {args.issues} issues, "
+                                 f"{args.latency * 1000:.0f} ms latency")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+GitHub Bulk Operations Module
+Applies one issue/pull request operation to many items concurrently, journaled so a job can resume
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+from .client import GitHubClient
+from .ratelimit import bulk_priority
+
+# Items processed at the same time; the rate limiter still paces requests
+BULK_CONCURRENCY = 8
+
+# operation -> (HTTP method, path under /repos/{repo}/, request body for a value, success statuses)
+OPERATIONS: Dict[str, Tuple[str, str, Callable[[Optional[str]], Dict[str, Any]], Tuple[int, ...]]] = {
+    'comment': ('POST', 'issues/{number}/comments', lambda value: {'body': value}, (201,)),
+    'close': ('PATCH', 'issues/{number}', lambda value: {'state': 'closed'}, (200,)),
+    'assign': ('POST', 'issues/{number}/assignees', lambda value: {'assignees': [value]}, (200, 201)),
+    'label': ('POST', 'issues/{number}/labels', lambda value: {'labels': [value]}, (200,)),
+    'merge': ('PUT', 'pulls/{number}/merge', lambda value: {'merge_method': value or 'merge'}, (200,)),
+}
+
+# Operations that need --value
+VALUE_REQUIRED = ('comment', 'assign', 'label')
+
+Target = Tuple[str, int]
+
+
+def parse_target(text: str, default_repos: Optional[List[str]] = None) -> List[Target]:
+    """'owner/repo#12' or a bare number applied to each default repository"""
+    if '#' in text:
+        repo, _, number = text.rpartition('#')
+        return [(repo, int(number))]
+    if not default_repos:
+        raise ValueError(f"'{text}' needs a repository: use owner/repo#{text} or --repo")
+    return [(repo, int(text)) for repo in default_repos]
+
+
+class BulkJournal:
+    """Append-only JSON lines file: the job description, then one line per finished item"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @property
+    def job_id(self) -> str:
+        return self.path.stem
+
+    def create(self, operation: str, value: Optional[str], targets: List[Target]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w') as f:
+            f.write(json.dumps({'operation': operation, 'value': value,
+                                'targets': [list(target) for target in targets]}) + '\n')
+
+    def load(self) -> Tuple[Dict[str, Any], Dict[Target, Dict[str, Any]]]:
+        """Job description and the latest outcome of each item"""
+        with open(self.path) as f:
+            job = json.loads(f.readline())
+            outcomes = {}
+            for line in f:
+                try:
+                    outcome = json.loads(line)
+                except ValueError:
+                    continue  # torn last line of an interrupted job
+                outcomes[(outcome['repo'], outcome['number'])] = outcome
+        return job, outcomes
+
+    def record(self, outcome: Dict[str, Any]):
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(outcome) + '\n')
+
+
+class BulkRunner:
+    """Runs one operation over many (repo, number) targets with bounded concurrency"""
+
+    def __init__(self, client: GitHubClient, journal: BulkJournal, concurrency: int = BULK_CONCURRENCY):
+        self.client = client
+        self.journal = journal
+        self.concurrency = concurrency
+
+    async def _apply(self, operation: str, value: Optional[str], repo: str, number: int) -> Dict[str, Any]:
+        method, path, body, ok_statuses = OPERATIONS[operation]
+        outcome = {'repo': repo, 'number': number, 'ok': False, 'status': None, 'error': '', 'time': time.time()}
+        try:
+            async with self.client.request(method, f"/repos/{repo}/{path.format(number=number)}",
+                                           json=body(value)) as response:
+                outcome['status'] = response.status
+                if response.status in ok_statuses:
+                    outcome['ok'] = True
+                else:
+                    text = await response.text()
+                    try:
+                        outcome['error'] = json.loads(text).get('message', '')
+                    except (ValueError, AttributeError):
+                        outcome['error'] = text[:200]
+        except Exception as e:
+            outcome['error'] = str(e) or type(e).__name__
+        return outcome
+
+    async def run(self, on_done: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """Process every target without a successful outcome in the journal
+
+        Returns the outcome of every target, including ones that succeeded in
+        an earlier run of the job.
+        """
+        job, previous = self.journal.load()
+        targets = [tuple(target) for target in job['targets']]
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def process(target: Target) -> Dict[str, Any]:
+            if previous.get(target, {}).get('ok'):
+                outcome = {**previous[target], 'skipped': True}
+            else:
+                async with semaphore:
+                    outcome = await self._apply(job['operation'], job['value'], *target)
+                self.journal.record(outcome)
+            if on_done is not None:
+                on_done(outcome)
+            return outcome
+
+        with bulk_priority():
+            return list(await asyncio.gather(*(process(target) for target in targets)))
@@ -0,0 +1,315 @@
+"""
+GitHub HTTP Client Module
+One long-lived, pooled aiohttp session shared by every GitHub API call
+"""
+
+import asyncio
+import hashlib
+import re
+from typing import Optional, Dict, Any, List, Callable
+from urllib.parse import urlsplit, parse_qs
+
+import aiohttp
+
+from .http_cache import HTTPCache, CachedResponse
+from .ratelimit import (RateLimiter, RateLimitPaused, DEFAULT_RATE, DEFAULT_BURST, MAX_RETRIES, INTERACTIVE,
+                        INTERACTIVE_MAX_WAIT, request_priority)
+
+API_BASE = "https://api.github.com"
+
+# Connection pool tuning: GitHub is a handful of hosts, so a per-host limit
+# bounds concurrency while keep-alive and the DNS cache avoid reconnecting
+LIMIT_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 30.0
+DNS_CACHE_TTL = 300
+REQUEST_TIMEOUT = 30.0
+
+# Pages of one listing that are fetched at the same time
+PAGE_CONCURRENCY = 8
+
+LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+DEFAULT_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': 'gitflow-studio'
+}
+
+
+class GitHubAPIError(Exception):
+    """Unexpected status from the GitHub API"""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"GitHub API returned {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class RateLimitedError(GitHubAPIError):
+    """Interactive request not sent because the token's rate limit pause would outlast INTERACTIVE_MAX_WAIT"""
+
+    def __init__(self, url: str, retry_in: float):
+        super().__init__(429, url)
+        self.retry_in = retry_in
+
+
+def parse_link_header(value: Optional[str]) -> Dict[str, str]:
+    """Map rel -> URL from a Link header"""
+    return {rel: url for url, rel in LINK_PATTERN.findall(value or '')}
+
+
+class GitHubClient:
+    """Pooled HTTP client for the GitHub API with built-in auth headers"""
+
+    def __init__(self, auth=None, api_base: str = API_BASE, limit_per_host: int = LIMIT_PER_HOST,
+                 keepalive_timeout: float = KEEPALIVE_TIMEOUT, dns_cache_ttl: int = DNS_CACHE_TTL,
+                 timeout: float = REQUEST_TIMEOUT, cache: Optional[HTTPCache] = None,
+                 rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.auth = auth
+        self.cache = cache
+        self.api_base = api_base.rstrip('/')
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Rate limit state is per token, keyed by a digest of it
+        self.rate = rate
+        self.burst = burst
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session, created on first use in the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            # A session cannot move between event loops; the old loop's
+            # connections are unusable, so drop them without awaiting
+            self._session.detach()
+            self._session = None
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._loop = loop
+        return self._session
+
+    def url(self, path: str) -> str:
+        """Absolute URL for an API path ("/user") or an already absolute URL"""
+        if path.startswith(('http://', 'https://')):
+            return path
+        return f"{self.api_base}/{path.lstrip('/')}"
+
+    def _headers(self, url: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        merged = {}
+        # The token is only ever sent to the API host
+        token = self.auth.get_access_token() if self.auth is not None else None
+        if token and url.startswith(self.api_base + '/'):
+            merged['Authorization'] = f'token {token}'
+        if headers:
+            merged.update(headers)
+        return merged
+
+    def limiter(self, headers: Optional[Dict[str, str]] = None) -> RateLimiter:
+        """Rate limiter for the token a request is sent with"""
+        authorization = (headers or {}).get('Authorization', '')
+        key = hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]
+        if key not in self._limiters:
+            self._limiters[key] = RateLimiter(self.rate, self.burst)
+        return self._limiters[key]
+
+    def rate_limit_status(self) -> Dict[str, Any]:
+        """Rate limit state of the current token"""
+        return self.limiter(self._headers(self.api_base + '/', None)).status()
+
+    async def send(self, method: str, url: str, headers: Dict[str, str], priority: Optional[int] = None,
+                   **kwargs: Any) -> aiohttp.ClientResponse:
+        """Send a prepared request through the rate limiter, retrying rate-limited responses
+
+        Requests run at the priority set with ratelimit.bulk_priority() unless
+        one is given. Interactive requests raise RateLimitedError rather than
+        wait out a long rate limit pause. The caller releases the returned response.
+        """
+        if priority is None:
+            priority = request_priority.get()
+        limiter = self.limiter(headers) if url.startswith(self.api_base + '/') else None
+        attempt = 0
+        while True:
+            if limiter is not None:
+                try:
+                    await limiter.acquire(priority)
+                except RateLimitPaused as e:
+                    raise RateLimitedError(url, e.retry_in) from e
+            response = await self.session.request(method, url, headers=headers, **kwargs)
+            if limiter is None:
+                return response
+            # Read (and keep) the body of a 403/429: a secondary limit may only be named there
+            body = await response.read() if response.status in (403, 429) else None
+            delay = limiter.observe(response.status, response.headers, attempt, body)
+            if delay is None or attempt >= MAX_RETRIES:
+                return response
+            if priority == INTERACTIVE and delay > INTERACTIVE_MAX_WAIT:
+                return response
+            response.release()
+            attempt += 1
+
+    def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None, **kwargs: Any):
+        """Send a request; use as ``async with client.request(...) as response``"""
+        url = self.url(path)
+        return _Request(self.send(method, url, self._headers(url, headers), **kwargs))
+
+    def get(self, path: str, **kwargs: Any):
+        if self.cache is None:
+            return self.request('GET', path, **kwargs)
+        return _ConditionalGet(self, path, kwargs)
+
+    def post(self, path: str, **kwargs: Any):
+        return self.request('POST', path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any):
+        return self.request('PUT', path, **kwargs)
+
+    def patch(self, path: str, **kwargs: Any):
+        return self.request('PATCH', path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any):
+        return self.request('DELETE', path, **kwargs)
+
+    async def get_json(self, path: str, params: Optional[Dict[str, Any]] = None):
+        """GET a JSON document; returns (data, response headers)"""
+        async with self.get(path, params=params) as response:
+            if response.status != 200:
+                raise GitHubAPIError(response.status, self.url(path))
+            return await response.json(), response.headers
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                       concurrency: int = PAGE_CONCURRENCY,
+                       project: Optional[Callable[[List[Any]], List[Any]]] = None) -> List[Any]:
+        """All items of a paginated listing (at most limit), in order
+
+        The first response's Link header tells how many pages there are; the
+        rest are then fetched concurrently. project (e.g. RepoRecord.page) is
+        applied to each page as soon as it is decoded, so the full objects of
+        at most the pages in flight are held at once. Raises GitHubAPIError.
+        """
+        project = project or list
+        params = dict(params or {})
+        params.setdefault('per_page', 100)
+        params['page'] = 1
+        items, headers = await self.get_json(path, params)
+        items = project(items)
+        links = parse_link_header(headers.get('Link'))
+
+        if 'last' in links:
+            last_page = int(parse_qs(urlsplit(links['last']).query)['page'][0])
+            if limit is not None:
+                last_page = min(last_page, -(-limit // params['per_page']))
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(page: int) -> List[Any]:
+                async with semaphore:
+                    data, _ = await self.get_json(path, {**params, 'page': page})
+                    return project(data)
+
+            for page_items in await asyncio.gather(*(fetch(page) for page in range(2, last_page + 1))):
+                items.extend(page_items)
+        else:
+            # Cursor-paginated listings only link to the next page
+            while 'next' in links and (limit is None or len(items) < limit):
+                data, headers = await self.get_json(links['next'])
+                items.extend(project(data))
+                links = parse_link_header(headers.get('Link'))
+
+        return items if limit is None else items[:limit]
+
+    async def close(self):
+        """Close the session, its pooled connections and the cache database"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            if self._loop is asyncio.get_running_loop():
+                await session.close()
+            else:
+                session.detach()
+        self._loop = None
+        if self.cache is not None:
+            self.cache.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class _Request:
+    """``async with`` wrapper releasing the response of a scheduled request"""
+
+    def __init__(self, coro):
+        self._coro = coro
+        self._response: Optional[aiohttp.ClientResponse] = None
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._response.release()
+        return False
+
+
+class _ConditionalGet:
+    """``async with`` GET that revalidates cached responses
+
+    Sends If-None-Match/If-Modified-Since for cached URLs and answers a 304
+    (which does not count against the rate limit) with the cached body.
+    """
+
+    def __init__(self, client: GitHubClient, path: str, kwargs: Dict[str, Any]):
+        self.client = client
+        self.path = path
+        self.kwargs = kwargs
+
+    async def __aenter__(self) -> CachedResponse:
+        client, cache = self.client, self.client.cache
+        url = client.url(self.path)
+        kwargs = dict(self.kwargs)
+        headers = client._headers(url, kwargs.pop('headers', None))
+        key = cache.key(url, kwargs.get('params'), {**DEFAULT_HEADERS, **headers})
+
+        entry = cache.get(key)
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        try:
+            response = await client.send('GET', url, headers, **kwargs)
+        except RateLimitedError:
+            # Rate limited for a while: a stale copy beats no answer
+            if entry is None:
+                raise
+            return CachedResponse(200, entry.headers, entry.body, url, from_cache=True)
+        async with response:
+            body = await response.read()
+            if response.status == 304 and entry is not None:
+                cache.touch(key)
+                return CachedResponse(200, entry.headers, entry.body, url, from_cache=True)
+
+            response_headers = dict(response.headers)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if response.status == 200 and (etag or last_modified):
+                cache.put(key, url, etag, last_modified, response_headers, body)
+            return CachedResponse(response.status, response_headers, body, url)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
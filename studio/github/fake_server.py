@@ -0,0 +1,599 @@
+"""
+Fake GitHub Server Module
+Local stand-in for the GitHub API with deterministic fixtures, for tests and benchmarks
+"""
+
+import argparse
+import asyncio
+import hashlib
+import re
+import time
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Callable
+
+from aiohttp import web
+
+# Repositories other than the first (the large one) have this many issues
+SMALL_REPO_ISSUES = 5
+BRANCHES_PER_REPO = 8
+RELEASES_PER_REPO = 30
+CONTRIBUTORS_PER_REPO = 42
+NOTIFICATIONS = 20
+LABELS = ['bug', 'enhancement', 'documentation', 'question', 'stale']
+USERS = ['octocat', 'hubot', 'monalisa', 'defunkt', 'mojombo']
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _minutes(stamp: str) -> int:
+    """Minutes from the fixture epoch to an ISO 8601 timestamp"""
+    moment = datetime.strptime(stamp[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+    return int((moment - EPOCH).total_seconds() // 60)
+
+
+class FakeAuth:
+    """Stand-in for GitHubAuth: a fixed token and a scratch config directory"""
+
+    def __init__(self, token: str = "fake-token", config_dir=None, login: str = 'octocat'):
+        self.token = token
+        self.config_dir = Path(config_dir) if config_dir else Path.cwd()
+        self.user_info = {'login': login}
+        self.client = None
+
+    def is_authenticated(self) -> bool:
+        return True
+
+    async def verify_token(self, force: bool = False) -> bool:
+        return True
+
+    def get_access_token(self) -> Optional[str]:
+        return self.token
+
+    def get_user_info(self) -> Optional[Dict[str, Any]]:
+        return self.user_info
+
+
+class FakeGitHub:
+    """aiohttp application that answers the REST and GraphQL calls GitHubRepos makes
+
+    Reproduces Link-header pagination, ETags and 304s, primary rate limit
+    headers, secondary rate limits with Retry-After, and injected latency.
+    The first repository holds `issues` issues; fixtures are computed from
+    their index, so 100k issues cost no memory until they are listed.
+    """
+
+    def __init__(self, owner: str = 'octo', repos: int = 100, issues: int = 1000, latency: float = 0.0,
+                 rate_limit: int = 5000, secondary_limit: Optional[int] = None, secondary_window: float = 60.0,
+                 retry_after: int = 1):
+        self.owner = owner
+        self.repo_count = repos
+        self.issue_total = issues
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.secondary_limit = secondary_limit
+        self.secondary_window = secondary_window
+        self.retry_after = retry_after
+        self.reset_at = int(time.time()) + 3600
+        self._remaining: Dict[str, int] = {}
+        self._recent: Dict[str, deque] = {}
+        # Mutations: (repo, number) -> changed fields, and extra comments
+        self._overrides: Dict[tuple, Dict[str, Any]] = {}
+        self._new_comments: Dict[str, List[Dict[str, Any]]] = {}
+        self._extra_issues: Counter = Counter()
+        self._version = 0
+        self._listings: Dict[tuple, List[int]] = {}
+        self.poll_interval = 60
+        self._threads: Optional[List[Dict[str, Any]]] = None
+        self._threads_modified = EPOCH
+        # Repositories whose /stats/* data has been "computed" (the first request gets a 202)
+        self._computed: set = set()
+        self._runner: Optional[web.AppRunner] = None
+        self.reset_stats()
+
+    # Statistics
+
+    def reset_stats(self):
+        self.requests = 0
+        self.bytes_sent = 0
+        self.not_modified = 0
+        self.rate_limited = 0
+        self.paths: Counter = Counter()
+
+    def stats(self) -> Dict[str, Any]:
+        return {'requests': self.requests, 'bytes': self.bytes_sent, 'not_modified': self.not_modified,
+                'rate_limited': self.rate_limited}
+
+    # Fixtures
+
+    def repo_name(self, index: int) -> str:
+        return f"{self.owner}/repo-{index:05d}"
+
+    def _repo_index(self, full_name: str) -> Optional[int]:
+        match = re.fullmatch(rf"{re.escape(self.owner)}/repo-(\d+)", full_name)
+        if match and int(match.group(1)) < self.repo_count:
+            return int(match.group(1))
+        return None
+
+    def repo(self, index: int) -> Dict[str, Any]:
+        full_name = self.repo_name(index)
+        return {
+            'id': index + 1, 'name': full_name.split('/')[1], 'full_name': full_name,
+            'owner': {'login': self.owner}, 'private': index % 4 == 0,
+            'description': f"Fixture repository {index}", 'language': ['Python', 'Go', 'Rust'][index % 3],
+            'stargazers_count': index * 3 % 1000, 'watchers_count': index * 3 % 1000,
+            'subscribers_count': index % 50, 'forks_count': index % 100,
+            'open_issues_count': (self.issue_total if index == 0 else SMALL_REPO_ISSUES) * 2 // 3,
+            'html_url': f"https://github.com/{full_name}",
+            'clone_url': f"https://github.com/{full_name}.git", 'ssh_url': f"git@github.com:{full_name}.git",
+            'updated_at': _iso(EPOCH + timedelta(hours=index))
+        }
+
+    def issue_count(self, repo: str) -> int:
+        base = self.issue_total if self._repo_index(repo) == 0 else SMALL_REPO_ISSUES
+        return base + self._extra_issues[repo]
+
+    def issue(self, repo: str, number: int) -> Dict[str, Any]:
+        created = EPOCH + timedelta(hours=number)
+        item = {
+            'number': number, 'title': f"Issue {number}", 'body': f"Body of issue {number}",
+            'state': 'closed' if number % 3 == 0 else 'open',
+            'user': {'login': USERS[number % len(USERS)]},
+            'labels': [{'name': LABELS[number % len(LABELS)]}],
+            'assignees': [{'login': USERS[(number + 1) % len(USERS)]}] if number % 2 else [],
+            'comments': number % 3,
+            'created_at': _iso(created),
+            'updated_at': _iso(created + timedelta(minutes=number * 7919 % 5000)),
+            'html_url': f"https://github.com/{repo}/issues/{number}"
+        }
+        if number % 5 == 0:
+            item['pull_request'] = {'url': f"https://api.github.com/repos/{repo}/pulls/{number}"}
+            item['html_url'] = f"https://github.com/{repo}/pull/{number}"
+        item.update(self._overrides.get((repo, number), {}))
+        return item
+
+    def _facets(self, repo: str, number: int) -> tuple:
+        """(number, is_pr, state, labels, assignees, created, updated) without building the issue"""
+        if (repo, number) in self._overrides:
+            item = self.issue(repo, number)
+            return (number, 'pull_request' in item, item['state'], tuple(l['name'] for l in item['labels']),
+                    tuple(a['login'] for a in item['assignees']), _minutes(item['created_at']),
+                    _minutes(item['updated_at']))
+        return (number, number % 5 == 0, 'closed' if number % 3 == 0 else 'open', (LABELS[number % len(LABELS)],),
+                (USERS[(number + 1) % len(USERS)],) if number % 2 else (), number * 60,
+                number * 60 + number * 7919 % 5000)
+
+    def comments(self, repo: str) -> List[Dict[str, Any]]:
+        key = ('comments', repo, self._version)
+        if key not in self._listings:
+            comments = []
+            for number in range(1, self.issue_count(repo) + 1):
+                for k in range(number % 3):
+                    stamp = _iso(EPOCH + timedelta(hours=number + k + 1))
+                    comments.append({'id': number * 10 + k, 'body': f"Comment {k} on {number}",
+                                     'user': {'login': USERS[k % len(USERS)]},
+                                     'issue_url': f"https://api.github.com/repos/{repo}/issues/{number}",
+                                     'created_at': stamp, 'updated_at': stamp})
+            comments.extend(self._new_comments.get(repo, []))
+            comments.sort(key=lambda comment: comment['updated_at'])
+            self._listings[key] = comments
+        return self._listings[key]
+
+    def issue_numbers(self, repo: str, kind: Optional[str] = None, state: str = 'open', label: Optional[str] = None,
+                      assignee: Optional[str] = None, since: Optional[str] = None, sort: str = 'created',
+                      direction: str = 'desc') -> List[int]:
+        """Numbers of matching issues in listing order (cached until the next mutation)"""
+        key = (repo, kind, state, label, assignee, since, sort, direction, self._version)
+        if key not in self._listings:
+            rows = [self._facets(repo, number) for number in range(1, self.issue_count(repo) + 1)]
+            if kind is not None:
+                rows = [row for row in rows if row[1] == (kind == 'pr')]
+            if state != 'all':
+                rows = [row for row in rows if row[2] == state]
+            if label:
+                wanted = set(label.split(','))
+                rows = [row for row in rows if wanted <= set(row[3])]
+            if assignee:
+                rows = [row for row in rows if assignee in row[4]]
+            if since:
+                rows = [row for row in rows if row[6] >= _minutes(since)]
+            column = 6 if sort == 'updated' else 5
+            rows.sort(key=lambda row: row[column], reverse=direction == 'desc')
+            self._listings[key] = [row[0] for row in rows]
+        return self._listings[key]
+
+    def _mutated(self):
+        self._version += 1
+        self._listings.clear()
+
+    # HTTP plumbing
+
+    @staticmethod
+    def _page(request: web.Request, count: int, default_per_page: int = 30):
+        per_page = min(int(request.query.get('per_page', default_per_page)), 100)
+        page = max(int(request.query.get('page', 1)), 1)
+        last = max((count + per_page - 1) // per_page, 1)
+        links = []
+        for rel, number in (('prev', page - 1), ('next', page + 1), ('first', 1), ('last', last)):
+            if 1 <= number <= last and (rel not in ('prev', 'first') or page > 1) and (rel != 'next' or page < last):
+                if rel == 'last' and page == last:
+                    continue
+                url = request.url.update_query(page=number, per_page=per_page)
+                links.append(f'<{url}>; rel="{rel}"')
+        start = (page - 1) * per_page
+        return start, min(start + per_page, count), {'Link': ', '.join(links)} if links else {}
+
+    def _paginated(self, request: web.Request, count: int, item: Callable[[int], Any]) -> web.Response:
+        start, stop, headers = self._page(request, count)
+        return web.json_response([item(i) for i in range(start, stop)], headers=headers)
+
+    def _rate_headers(self, token: str) -> Dict[str, str]:
+        remaining = self._remaining.get(token, self.rate_limit)
+        return {'X-RateLimit-Limit': str(self.rate_limit), 'X-RateLimit-Remaining': str(remaining),
+                'X-RateLimit-Used': str(self.rate_limit - remaining), 'X-RateLimit-Reset': str(self.reset_at)}
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests += 1
+        self.paths[f"{request.method} {request.path}"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        token = request.headers.get('Authorization', request.remote or '')
+
+        if self._remaining.get(token, self.rate_limit) <= 0:
+            self.rate_limited += 1
+            return self._sent(web.json_response({'message': 'API rate limit exceeded'}, status=403,
+                                                headers=self._rate_headers(token)))
+        if self.secondary_limit:
+            recent = self._recent.setdefault(token, deque())
+            now = time.monotonic()
+            while recent and now - recent[0] > self.secondary_window:
+                recent.popleft()
+            if len(recent) >= self.secondary_limit:
+                self.rate_limited += 1
+                headers = {**self._rate_headers(token), 'Retry-After': str(self.retry_after)}
+                return self._sent(web.json_response(
+                    {'message': 'You have exceeded a secondary rate limit'}, status=403, headers=headers))
+            recent.append(now)
+
+        try:
+            response = await handler(request)
+        except web.HTTPException as e:
+            response = web.json_response({'message': e.reason}, status=e.status)
+
+        if request.method == 'GET' and response.status == 200 and response.body is not None:
+            etag = '"' + hashlib.sha1(response.body).hexdigest()[:20] + '"'
+            response.headers['ETag'] = etag
+            if request.headers.get('If-None-Match') == etag:
+                # Conditional hits do not count against the rate limit
+                self.not_modified += 1
+                response = web.Response(status=304, headers={'ETag': etag})
+                response.headers.update(self._rate_headers(token))
+                return self._sent(response)
+        if response.status == 304:
+            # Conditional hits do not count against the rate limit
+            self.not_modified += 1
+            response.headers.update(self._rate_headers(token))
+            return self._sent(response)
+        self._remaining[token] = self._remaining.get(token, self.rate_limit) - 1
+        response.headers.update(self._rate_headers(token))
+        return self._sent(response)
+
+    def _sent(self, response: web.Response) -> web.Response:
+        self.bytes_sent += len(response.body or b'')
+        return response
+
+    def _repo_or_404(self, request: web.Request) -> str:
+        repo = f"{request.match_info['owner']}/{request.match_info['name']}"
+        if self._repo_index(repo) is None:
+            raise web.HTTPNotFound(reason='Not Found')
+        return repo
+
+    # Handlers
+
+    async def _user(self, request):
+        return web.json_response({'login': 'octocat', 'name': 'The Octocat', 'id': 1})
+
+    async def _repos(self, request):
+        return self._paginated(request, self.repo_count, self.repo)
+
+    async def _search_repos(self, request):
+        query = request.query.get('q', '').split()[0] if request.query.get('q') else ''
+        matches = [i for i in range(self.repo_count) if query in self.repo_name(i)]
+        start, stop, headers = self._page(request, len(matches))
+        return web.json_response({'total_count': len(matches),
+                                  'items': [self.repo(i) for i in matches[start:stop]]}, headers=headers)
+
+    async def _repo(self, request):
+        return web.json_response(self.repo(self._repo_index(self._repo_or_404(request))))
+
+    async def _issues(self, request):
+        repo = self._repo_or_404(request)
+        q = request.query
+        numbers = self.issue_numbers(repo, None, q.get('state', 'open'), q.get('labels'), q.get('assignee'),
+                                     q.get('since'), q.get('sort', 'created'), q.get('direction', 'desc'))
+        return self._paginated(request, len(numbers), lambda i: self.issue(repo, numbers[i]))
+
+    async def _pulls(self, request):
+        repo = self._repo_or_404(request)
+        numbers = self.issue_numbers(repo, 'pr', request.query.get('state', 'open'))
+
+        def pull(i):
+            item = self.issue(repo, numbers[i])
+            item.pop('pull_request', None)
+            return {**item, 'head': {'ref': f"feature-{item['number']}"}, 'base': {'ref': 'main'}}
+        return self._paginated(request, len(numbers), pull)
+
+    async def _comments(self, request):
+        repo = self._repo_or_404(request)
+        since = request.query.get('since', '')
+        comments = [comment for comment in self.comments(repo) if comment['updated_at'] >= since]
+        if request.query.get('direction') == 'desc':
+            comments = comments[::-1]
+        return self._paginated(request, len(comments), lambda i: comments[i])
+
+    async def _update_issue(self, request):
+        repo = self._repo_or_404(request)
+        number = int(request.match_info['number'])
+        if not 1 <= number <= self.issue_count(repo):
+            raise web.HTTPNotFound(reason='Not Found')
+        changes = await request.json()
+        fields = {key: changes[key] for key in ('state', 'title', 'body') if key in changes}
+        self._overrides.setdefault((repo, number), {}).update(fields)
+        self._overrides[(repo, number)]['updated_at'] = _iso(datetime.now(timezone.utc))
+        self._mutated()
+        return web.json_response(self.issue(repo, number))
+
+    async def _add_comment(self, request):
+        repo = self._repo_or_404(request)
+        number = int(request.match_info['number'])
+        body = (await request.json()).get('body', '')
+        stamp = _iso(datetime.now(timezone.utc))
+        comment = {'id': 10 ** 9 + len(self._new_comments.get(repo, [])), 'body': body, 'user': {'login': 'octocat'},
+                   'issue_url': f"https://api.github.com/repos/{repo}/issues/{number}",
+                   'created_at': stamp, 'updated_at': stamp}
+        self._new_comments.setdefault(repo, []).append(comment)
+        self._mutated()
+        return web.json_response(comment, status=201)
+
+    async def _add_to_list(self, request, field: str, key: str, payload_key: str, status: int):
+        repo = self._repo_or_404(request)
+        number = int(request.match_info['number'])
+        values = (await request.json()).get(payload_key, [])
+        current = self.issue(repo, number)[field]
+        merged = current + [{key: value} for value in values if {key: value} not in current]
+        self._overrides.setdefault((repo, number), {})[field] = merged
+        self._mutated()
+        return web.json_response(self.issue(repo, number) if field == 'assignees' else merged, status=status)
+
+    async def _assign(self, request):
+        return await self._add_to_list(request, 'assignees', 'login', 'assignees', 201)
+
+    async def _label(self, request):
+        return await self._add_to_list(request, 'labels', 'name', 'labels', 200)
+
+    async def _create_issue(self, request):
+        repo = self._repo_or_404(request)
+        data = await request.json()
+        self._extra_issues[repo] += 1
+        number = self.issue_count(repo)
+        self._overrides[(repo, number)] = {'title': data.get('title', ''), 'body': data.get('body', ''),
+                                           'state': 'open'}
+        self._mutated()
+        return web.json_response(self.issue(repo, number), status=201)
+
+    async def _create_pull(self, request):
+        response = await self._create_issue(request)
+        repo = self._repo_or_404(request)
+        number = self.issue_count(repo)
+        self._overrides[(repo, number)]['pull_request'] = {'url': f"https://api.github.com/repos/{repo}/pulls/{number}"}
+        return response
+
+    async def _merge(self, request):
+        repo = self._repo_or_404(request)
+        number = int(request.match_info['number'])
+        item = self.issue(repo, number)
+        if 'pull_request' not in item or item['state'] != 'open':
+            return web.json_response({'message': 'Pull Request is not mergeable'}, status=405)
+        self._overrides.setdefault((repo, number), {})['state'] = 'closed'
+        self._mutated()
+        return web.json_response({'merged': True, 'message': 'Pull Request successfully merged'})
+
+    async def _releases(self, request):
+        repo = self._repo_or_404(request)
+        return self._paginated(request, RELEASES_PER_REPO, lambda i: {
+            'id': i, 'tag_name': f"v1.{RELEASES_PER_REPO - i}.0", 'name': f"Release 1.{RELEASES_PER_REPO - i}",
+            'draft': False, 'prerelease': i % 7 == 0, 'created_at': _iso(EPOCH + timedelta(days=RELEASES_PER_REPO - i)),
+            'html_url': f"https://github.com/{repo}/releases/tag/v1.{RELEASES_PER_REPO - i}.0"})
+
+    async def _create_release(self, request):
+        repo = self._repo_or_404(request)
+        data = await request.json()
+        return web.json_response({**data, 'id': 10 ** 6,
+                                  'html_url': f"https://github.com/{repo}/releases/tag/{data.get('tag_name')}"},
+                                 status=201)
+
+    async def _contributors(self, request):
+        self._repo_or_404(request)
+        return self._paginated(request, CONTRIBUTORS_PER_REPO,
+                               lambda i: {'login': f"contributor-{i}", 'contributions': 100 - i})
+
+    def _branch_names(self) -> List[str]:
+        return ['main', 'develop'] + [f"feature-{i}" for i in range(BRANCHES_PER_REPO - 2)]
+
+    async def _branches(self, request):
+        self._repo_or_404(request)
+        names = self._branch_names()
+        return self._paginated(request, len(names), lambda i: {'name': names[i]})
+
+    def _commit(self, branch: str, i: int) -> Dict[str, Any]:
+        return {'sha': hashlib.sha1(f"{branch}-{i}".encode()).hexdigest(),
+                'commit': {'message': f"Commit {i} on {branch}\n\nDetails"}}
+
+    async def _commits(self, request):
+        self._repo_or_404(request)
+        branch = request.query.get('sha', 'main')
+        return self._paginated(request, 100, lambda i: self._commit(branch, i))
+
+    async def _participation(self, request):
+        repo = self._repo_or_404(request)
+        if repo not in self._computed:
+            self._computed.add(repo)
+            return web.json_response({}, status=202)
+        index = self._repo_index(repo)
+        weekly = [(index + week) % 7 for week in range(52)]
+        return web.json_response({'all': weekly, 'owner': [count // 2 for count in weekly]})
+
+    def notify(self, title: str, repo: Optional[str] = None) -> Dict[str, Any]:
+        """Add an unread notification thread, as when someone mentions the user"""
+        self._notification_threads()
+        stamp = datetime.now(timezone.utc).replace(microsecond=0)
+        thread = {'id': str(1000 + len(self._threads)), 'reason': 'mention', 'unread': True,
+                  'repository': {'full_name': repo or self.repo_name(0)},
+                  'subject': {'title': title, 'type': 'Issue'}, 'updated_at': _iso(stamp)}
+        self._threads.append(thread)
+        self._touch_threads()
+        return thread
+
+    def _touch_threads(self):
+        # Last-Modified has one-second resolution; make every change visible
+        self._threads_modified = max(datetime.now(timezone.utc).replace(microsecond=0),
+                                     self._threads_modified + timedelta(seconds=1))
+
+    def _notification_threads(self) -> List[Dict[str, Any]]:
+        if self._threads is None:
+            self._threads = [{'id': str(1000 + i), 'reason': 'mention', 'unread': True,
+                              'repository': {'full_name': self.repo_name(i % self.repo_count)},
+                              'subject': {'title': f"Issue {i}", 'type': 'Issue'},
+                              'updated_at': _iso(EPOCH + timedelta(hours=i))} for i in range(NOTIFICATIONS)]
+            self._threads_modified = EPOCH + timedelta(hours=NOTIFICATIONS - 1)
+        return self._threads
+
+    async def _notifications(self, request):
+        threads = self._notification_threads()
+        if request.query.get('all') != 'true':
+            threads = [thread for thread in threads if thread['unread']]
+        threads = sorted(threads, key=lambda thread: thread['updated_at'], reverse=True)
+        headers = {'Last-Modified': self._threads_modified.strftime('%a, %d %b %Y %H:%M:%S GMT'),
+                   'X-Poll-Interval': str(self.poll_interval)}
+        if request.headers.get('If-Modified-Since') == headers['Last-Modified']:
+            return web.Response(status=304, headers=headers)
+        start, stop, links = self._page(request, len(threads), default_per_page=50)
+        return web.json_response(threads[start:stop], headers={**headers, **links})
+
+    async def _mark_read(self, request):
+        thread_id = request.match_info.get('id')
+        for thread in self._notification_threads():
+            if thread_id is None or thread['id'] == thread_id:
+                thread['unread'] = False
+        self._touch_threads()
+        return web.Response(status=205)
+
+    async def _graphql(self, request):
+        body = await request.json()
+        query, variables = body.get('query', ''), body.get('variables') or {}
+        if 'search(' in query:
+            terms = dict(term.split(':', 1) for term in re.findall(r'\w+:"[^"]*"|\w+:\S+', variables['query']))
+            kinds = re.findall(r'is:(issue|pr|open|closed)', variables['query'])
+            repo = terms.get('repo', '')
+            kind = 'pr' if 'pr' in kinds else 'issue'
+            state = 'open' if 'open' in kinds else 'closed' if 'closed' in kinds else 'all'
+            numbers = self.issue_numbers(repo, kind, state, terms.get('label', '').strip('"') or None,
+                                         terms.get('assignee'))
+            start = int(variables.get('cursor') or 0)
+            stop = min(start + variables.get('first', 20), len(numbers))
+            nodes = []
+            for number in numbers[start:stop]:
+                item = self.issue(repo, number)
+                nodes.append({'title': item['title'], 'state': item['state'].upper(), 'createdAt': item['created_at'],
+                              'url': item['html_url'], 'author': item['user']})
+            return web.json_response({'data': {'search': {
+                'pageInfo': {'hasNextPage': stop < len(numbers), 'endCursor': str(stop)}, 'nodes': nodes}}})
+
+        repo = f"{variables.get('owner')}/{variables.get('name')}"
+        index = self._repo_index(repo)
+        if index is None:
+            return web.json_response({'data': None, 'errors': [{'message': f"Could not resolve to a Repository '{repo}'"}]})
+        if 'refs(' in query:
+            nodes = [{'name': name, 'target': {'history': {'nodes': [
+                {'oid': self._commit(name, i)['sha'], 'messageHeadline': f"Commit {i} on {name}"}
+                for i in range(variables.get('commits', 10))]}}} for name in self._branch_names()]
+            return web.json_response({'data': {'repository': {'refs': {
+                'pageInfo': {'hasNextPage': False, 'endCursor': None}, 'nodes': nodes}}}})
+        info = self.repo(index)
+        return web.json_response({'data': {'repository': {
+            'stargazerCount': info['stargazers_count'], 'forkCount': info['forks_count'],
+            'watchers': {'totalCount': info['subscribers_count']}}}})
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        repo = '/repos/{owner}/{name}'
+        app.router.add_get('/user', self._user)
+        app.router.add_get('/user/repos', self._repos)
+        app.router.add_get('/orgs/{org}/repos', self._repos)
+        app.router.add_get('/search/repositories', self._search_repos)
+        app.router.add_get(repo, self._repo)
+        app.router.add_get(repo + '/issues', self._issues)
+        app.router.add_post(repo + '/issues', self._create_issue)
+        app.router.add_get(repo + '/issues/comments', self._comments)
+        app.router.add_patch(repo + '/issues/{number}', self._update_issue)
+        app.router.add_post(repo + '/issues/{number}/comments', self._add_comment)
+        app.router.add_post(repo + '/issues/{number}/assignees', self._assign)
+        app.router.add_post(repo + '/issues/{number}/labels', self._label)
+        app.router.add_get(repo + '/pulls', self._pulls)
+        app.router.add_post(repo + '/pulls', self._create_pull)
+        app.router.add_patch(repo + '/pulls/{number}', self._update_issue)
+        app.router.add_put(repo + '/pulls/{number}/merge', self._merge)
+        app.router.add_get(repo + '/releases', self._releases)
+        app.router.add_post(repo + '/releases', self._create_release)
+        app.router.add_get(repo + '/contributors', self._contributors)
+        app.router.add_get(repo + '/branches', self._branches)
+        app.router.add_get(repo + '/commits', self._commits)
+        app.router.add_get(repo + '/stats/participation', self._participation)
+        app.router.add_get('/notifications', self._notifications)
+        app.router.add_put('/notifications', self._mark_read)
+        app.router.add_patch('/notifications/threads/{id}', self._mark_read)
+        app.router.add_post('/graphql', self._graphql)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Serve in the running event loop; returns the API base URL"""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        return f"http://{host}:{self._runner.addresses[0][1]}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeGitHub':
+        self.url = await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve a fake GitHub API for offline testing')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--repos', type=int, default=10000)
+    parser.add_argument('--issues', type=int, default=100000, help='Issues in the first repository')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--rate-limit', type=int, default=5000)
+    parser.add_argument('--secondary-limit', type=int, help='Requests per minute before Retry-After responses')
+    args = parser.parse_args(argv)
+    fake = FakeGitHub(repos=args.repos, issues=args.issues, latency=args.latency, rate_limit=args.rate_limit,
+                      secondary_limit=args.secondary_limit)
+    print(f"Fake GitHub API on http://127.0.0.1:{args.port} ({fake.repo_name(0)} has {args.issues} issues)")
+    web.run_app(fake.app(), host='127.0.0.1', port=args.port, print=None)
+
+
+if __name__ == '__main__':
+    main()
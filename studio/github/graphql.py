@@ -0,0 +1,135 @@
+"""
+GitHub GraphQL Module
+Optional transport that fetches a whole listing or graph in one batched query
+"""
+
+import os
+from typing import Dict, Any, List, Optional
+
+from .client import GitHubClient, GitHubAPIError
+
+# Set to 1/true/yes to use GraphQL where it replaces several REST calls
+GRAPHQL_ENV = "GITFLOW_STUDIO_GRAPHQL"
+
+BRANCH_GRAPH_QUERY = """
+query($owner: String!, $name: String!, $commits: Int!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        target { ... on Commit { history(first: $commits) { nodes { oid messageHeadline } } } }
+      }
+    }
+  }
+}
+"""
+
+REPO_STATS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    stargazerCount
+    forkCount
+    watchers { totalCount }
+  }
+}
+"""
+
+SEARCH_ISSUES_QUERY = """
+query($query: String!, $first: Int!, $cursor: String) {
+  search(query: $query, type: ISSUE, first: $first, after: $cursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on Issue { title state createdAt url author { login } }
+      ... on PullRequest { title state createdAt url author { login } }
+    }
+  }
+}
+"""
+
+
+def graphql_enabled() -> bool:
+    return os.environ.get(GRAPHQL_ENV, "").lower() in ("1", "true", "yes")
+
+
+class GraphQLError(Exception):
+    """Errors reported in a GraphQL response body"""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__("; ".join(error.get('message', str(error)) for error in errors))
+        self.errors = errors
+
+
+def _split(repo_full_name: str):
+    owner, _, name = repo_full_name.partition('/')
+    return {'owner': owner, 'name': name}
+
+
+class GitHubGraphQL:
+    """Batched GitHub queries returning the REST-shaped records the display code expects"""
+
+    def __init__(self, client: GitHubClient):
+        self.client = client
+
+    async def query(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a query; raises GitHubAPIError or GraphQLError"""
+        async with self.client.post('/graphql', json={'query': query, 'variables': variables}) as response:
+            if response.status != 200:
+                raise GitHubAPIError(response.status, self.client.url('/graphql'))
+            result = await response.json()
+        if result.get('errors'):
+            raise GraphQLError(result['errors'])
+        return result['data']
+
+    async def branch_graph(self, repo_full_name: str, commits: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """Recent commits of every branch: one request per 100 branches"""
+        variables = {**_split(repo_full_name), 'commits': commits, 'cursor': None}
+        graph = {}
+        while True:
+            refs = (await self.query(BRANCH_GRAPH_QUERY, variables))['repository']['refs']
+            for ref in refs['nodes']:
+                history = (ref.get('target') or {}).get('history', {}).get('nodes', [])
+                graph[ref['name']] = [
+                    {'sha': commit['oid'], 'commit': {'message': commit['messageHeadline']}}
+                    for commit in history
+                ]
+            if not refs['pageInfo']['hasNextPage']:
+                return graph
+            variables['cursor'] = refs['pageInfo']['endCursor']
+
+    async def repo_stats(self, repo_full_name: str) -> Dict[str, int]:
+        repository = (await self.query(REPO_STATS_QUERY, _split(repo_full_name)))['repository']
+        return {
+            'stargazers_count': repository['stargazerCount'],
+            'forks_count': repository['forkCount'],
+            'subscribers_count': repository['watchers']['totalCount']
+        }
+
+    async def search_issues(self, repo_full_name: str, kind: str, state: str = 'open', limit: int = 20,
+                            label: Optional[str] = None, assignee: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Issues (kind 'issue') or pull requests (kind 'pr'), newest first"""
+        terms = [f'repo:{repo_full_name}', f'is:{kind}', 'sort:created-desc']
+        if state != 'all':
+            terms.append(f'is:{state}')
+        if label:
+            terms.append(f'label:"{label}"')
+        if assignee:
+            terms.append(f'assignee:{assignee}')
+
+        variables = {'query': ' '.join(terms), 'first': min(limit, 100), 'cursor': None}
+        items = []
+        while len(items) < limit:
+            search = (await self.query(SEARCH_ISSUES_QUERY, variables))['search']
+            for node in search['nodes']:
+                items.append({
+                    'title': node['title'],
+                    # REST reports merged pull requests as closed
+                    'state': 'closed' if node['state'] == 'MERGED' else node['state'].lower(),
+                    'user': {'login': (node.get('author') or {}).get('login', '')},
+                    'created_at': node['createdAt'],
+                    'html_url': node['url']
+                })
+            if not search['pageInfo']['hasNextPage']:
+                break
+            variables['cursor'] = search['pageInfo']['endCursor']
+        return items[:limit]
@@ -0,0 +1,157 @@
+"""
+GitHub HTTP Cache Module
+On-disk cache of GitHub API responses, revalidated with ETag/Last-Modified conditional requests
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, NamedTuple
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Upper bound on stored response bodies; least recently used entries go first
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+class CacheEntry(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: bytes
+
+
+class CachedResponse:
+    """Fully read response with the parts of aiohttp's ClientResponse the GitHub modules use"""
+
+    def __init__(self, status: int, headers, body: bytes, url: str, from_cache: bool = False):
+        self.status = status
+        self.headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.url = url
+        self.from_cache = from_cache
+        self._body = body
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = 'utf-8') -> str:
+        return self._body.decode(encoding, errors='replace')
+
+    async def json(self, **kwargs) -> Any:
+        return json.loads(self._body) if self._body else None
+
+
+class HTTPCache:
+    """SQLite-backed store of response bodies and their validators, with LRU eviction"""
+
+    def __init__(self, path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """The cache database, opened on first use"""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path))
+            self._db.executescript(SCHEMA)
+            self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._db
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]], headers: Dict[str, str]) -> str:
+        """Cache key for a GET; responses vary by query, media type and user"""
+        parts = [url, json.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+                 headers.get('Accept', ''), headers.get('Authorization', '')]
+        return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self.db.execute(
+            "SELECT etag, last_modified, headers, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(row[0], row[1], json.loads(row[2]), row[3])
+
+    def touch(self, key: str):
+        """Record a successful revalidation (HTTP 304)"""
+        self.hits += 1
+        with self.db:
+            self.db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key))
+
+    def put(self, key: str, url: str, etag: Optional[str], last_modified: Optional[str],
+            headers: Dict[str, str], body: bytes):
+        self.misses += 1
+        if len(body) > self.max_bytes:
+            return
+        with self.db:
+            old = self.db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, etag, last_modified, json.dumps(headers), body, len(body), time.time())
+            )
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        while self._total_bytes > self.max_bytes:
+            rows = self.db.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def invalidate(self, url: str, children: bool = True) -> int:
+        """Drop cached responses for url and its query variants (and the URLs under it); returns how many"""
+        url = url.rstrip('/')
+        escaped = url.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        with self.db:
+            rows = self.db.execute(
+                "SELECT key, size FROM responses WHERE url = ? OR url LIKE ? ESCAPE '\\' OR url LIKE ? ESCAPE '\\'",
+                (url, escaped + '?%', escaped + '/%' if children else '')
+            ).fetchall()
+            for key, size in rows:
+                self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+        return len(rows)
+
+    def clear(self):
+        with self.db:
+            self.db.execute("DELETE FROM responses")
+        self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        entries = self.db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {"entries": entries, "bytes": self._total_bytes, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
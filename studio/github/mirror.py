@@ -0,0 +1,289 @@
+"""
+GitHub Mirror Module
+Local SQLite copy of issues, pull requests and comments, kept current with incremental syncs
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterable
+
+from .client import GitHubClient
+from .ratelimit import bulk_priority
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    full_name TEXT PRIMARY KEY,
+    issues_since TEXT,
+    comments_since TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT,
+    state TEXT NOT NULL,
+    user TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    html_url TEXT,
+    UNIQUE (repo, number)
+);
+CREATE INDEX IF NOT EXISTS items_listing ON items (repo, kind, state, created_at);
+CREATE TABLE IF NOT EXISTS labels (
+    item_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (item_id, name)
+);
+CREATE INDEX IF NOT EXISTS labels_name ON labels (name);
+CREATE TABLE IF NOT EXISTS assignees (
+    item_id INTEGER NOT NULL,
+    login TEXT NOT NULL,
+    PRIMARY KEY (item_id, login)
+);
+CREATE INDEX IF NOT EXISTS assignees_login ON assignees (login);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    user TEXT,
+    body TEXT,
+    created_at TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_item ON comments (repo, number);
+"""
+
+# Full-text index over titles, bodies and comments; rowid is items.id
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(title, body, comments);
+"""
+
+SORT_COLUMNS = {
+    'created': 'items.created_at',
+    'updated': 'items.updated_at',
+    'number': 'items.number'
+}
+
+
+def _issue_number(comment: Dict[str, Any]) -> int:
+    return int(comment.get('issue_url', '').rstrip('/').rsplit('/', 1)[-1])
+
+
+class IssueMirror:
+    """SQLite mirror of a repository's issues, pull requests, labels, assignees and comments"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._db: Optional[sqlite3.Connection] = None
+        self.fts = True
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """The mirror database, opened on first use"""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path))
+            self._db.row_factory = sqlite3.Row
+            self._db.executescript(SCHEMA)
+            try:
+                self._db.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5: text queries fall back to LIKE
+                self.fts = False
+        return self._db
+
+    def repositories(self) -> List[str]:
+        return [row[0] for row in self.db.execute("SELECT full_name FROM repos ORDER BY full_name")]
+
+    def watermarks(self, repo: str) -> Dict[str, Optional[str]]:
+        row = self.db.execute(
+            "SELECT issues_since, comments_since FROM repos WHERE full_name = ?", (repo,)
+        ).fetchone()
+        return {'issues': row[0], 'comments': row[1]} if row else {'issues': None, 'comments': None}
+
+    def store_items(self, repo: str, items: Iterable[Dict[str, Any]], advance: bool = True) -> int:
+        """Insert or update issues and pull requests as returned by /repos/{repo}/issues
+
+        Items older than the mirrored copy are ignored. advance=False leaves the
+        sync watermark alone, for items that arrive outside a sync (webhooks).
+        """
+        count = 0
+        since = self.watermarks(repo)['issues']
+        with self.db:
+            for item in items:
+                kind = 'pr' if 'pull_request' in item else 'issue'
+                current = self.db.execute("SELECT updated_at FROM items WHERE repo = ? AND number = ?",
+                                          (repo, item['number'])).fetchone()
+                if current is not None and current[0] > item.get('updated_at', ''):
+                    continue
+                self.db.execute(
+                    "INSERT INTO items (repo, number, kind, title, body, state, user, created_at, updated_at, html_url) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (repo, number) DO UPDATE SET kind = excluded.kind, title = excluded.title, "
+                    "body = excluded.body, state = excluded.state, user = excluded.user, "
+                    "updated_at = excluded.updated_at, html_url = excluded.html_url",
+                    (repo, item['number'], kind, item.get('title') or '', item.get('body') or '',
+                     item.get('state', ''), (item.get('user') or {}).get('login', ''),
+                     item.get('created_at', ''), item.get('updated_at', ''), item.get('html_url', ''))
+                )
+                item_id = self.db.execute(
+                    "SELECT id FROM items WHERE repo = ? AND number = ?", (repo, item['number'])
+                ).fetchone()[0]
+                self.db.execute("DELETE FROM labels WHERE item_id = ?", (item_id,))
+                self.db.executemany("INSERT OR IGNORE INTO labels VALUES (?, ?)",
+                                    [(item_id, label['name']) for label in item.get('labels') or []])
+                self.db.execute("DELETE FROM assignees WHERE item_id = ?", (item_id,))
+                self.db.executemany("INSERT OR IGNORE INTO assignees VALUES (?, ?)",
+                                    [(item_id, user['login']) for user in item.get('assignees') or []])
+                self._index(item_id)
+                since = max(since or '', item.get('updated_at', ''))
+                count += 1
+            if advance:
+                self._set_watermark(repo, 'issues_since', since)
+        return count
+
+    def store_comments(self, repo: str, comments: Iterable[Dict[str, Any]], advance: bool = True) -> int:
+        """Insert or update comments as returned by /repos/{repo}/issues/comments"""
+        count = 0
+        touched = set()
+        since = self.watermarks(repo)['comments']
+        with self.db:
+            for comment in comments:
+                number = _issue_number(comment)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (comment['id'], repo, number, (comment.get('user') or {}).get('login', ''),
+                     comment.get('body') or '', comment.get('created_at', ''), comment.get('updated_at', ''))
+                )
+                touched.add(number)
+                since = max(since or '', comment.get('updated_at', ''))
+                count += 1
+            for number in touched:
+                row = self.db.execute("SELECT id FROM items WHERE repo = ? AND number = ?", (repo, number)).fetchone()
+                if row is not None:
+                    self._index(row[0])
+            if advance:
+                self._set_watermark(repo, 'comments_since', since)
+        return count
+
+    def delete_item(self, repo: str, number: int):
+        with self.db:
+            row = self.db.execute("SELECT id FROM items WHERE repo = ? AND number = ?", (repo, number)).fetchone()
+            if row is None:
+                return
+            for table, column in (('labels', 'item_id'), ('assignees', 'item_id'), ('items', 'id')):
+                self.db.execute(f"DELETE FROM {table} WHERE {column} = ?", (row[0],))
+            self.db.execute("DELETE FROM comments WHERE repo = ? AND number = ?", (repo, number))
+            if self.fts:
+                self.db.execute("DELETE FROM items_fts WHERE rowid = ?", (row[0],))
+
+    def delete_comment(self, repo: str, comment_id: int):
+        with self.db:
+            row = self.db.execute("SELECT number FROM comments WHERE id = ?", (comment_id,)).fetchone()
+            self.db.execute("DELETE FROM comments WHERE id = ?", (comment_id,))
+            item = self.db.execute("SELECT id FROM items WHERE repo = ? AND number = ?",
+                                   (repo, row[0])).fetchone() if row else None
+            if item is not None:
+                self._index(item[0])
+
+    def _set_watermark(self, repo: str, column: str, value: Optional[str]):
+        self.db.execute("INSERT OR IGNORE INTO repos (full_name) VALUES (?)", (repo,))
+        self.db.execute(f"UPDATE repos SET {column} = ? WHERE full_name = ?", (value or None, repo))
+
+    def _index(self, item_id: int):
+        if not self.fts:
+            return
+        item = self.db.execute("SELECT repo, number, title, body FROM items WHERE id = ?", (item_id,)).fetchone()
+        comments = "\n".join(row[0] for row in self.db.execute(
+            "SELECT body FROM comments WHERE repo = ? AND number = ? ORDER BY created_at",
+            (item['repo'], item['number'])
+        ))
+        self.db.execute("DELETE FROM items_fts WHERE rowid = ?", (item_id,))
+        self.db.execute("INSERT INTO items_fts (rowid, title, body, comments) VALUES (?, ?, ?, ?)",
+                        (item_id, item['title'], item['body'], comments))
+
+    def query(self, repo: str, kind: str = 'issue', state: str = 'open', label: Optional[str] = None,
+              assignee: Optional[str] = None, text: Optional[str] = None, sort: str = 'created',
+              limit: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """Mirrored issues or pull requests, newest first by sort, as REST-shaped records"""
+        clauses = ["items.repo = ?", "items.kind = ?"]
+        params: List[Any] = [repo, kind]
+        if state != 'all':
+            clauses.append("items.state = ?")
+            params.append(state)
+        if label:
+            clauses.append("items.id IN (SELECT item_id FROM labels WHERE name = ?)")
+            params.append(label)
+        if assignee:
+            clauses.append("items.id IN (SELECT item_id FROM assignees WHERE login = ?)")
+            params.append(assignee)
+        if text:
+            if self.fts:
+                clauses.append("items.id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+                # Quote each word so user input is never parsed as FTS syntax
+                params.append(" ".join('"{}"'.format(word.replace('"', '""')) for word in text.split()))
+            else:
+                clauses.append("(items.title LIKE ? OR items.body LIKE ? OR EXISTS "
+                               "(SELECT 1 FROM comments WHERE comments.repo = items.repo "
+                               "AND comments.number = items.number AND comments.body LIKE ?))")
+                params.extend([f"%{text}%"] * 3)
+        sql = ("SELECT items.*, "
+               "(SELECT GROUP_CONCAT(name, char(31)) FROM labels WHERE item_id = items.id) AS label_names, "
+               "(SELECT GROUP_CONCAT(login, char(31)) FROM assignees WHERE item_id = items.id) AS assignee_logins "
+               f"FROM items WHERE {' AND '.join(clauses)} "
+               f"ORDER BY {SORT_COLUMNS[sort]} DESC")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        results = []
+        for row in self.db.execute(sql, params):
+            labels = sorted(row['label_names'].split('\x1f')) if row['label_names'] else []
+            assignees = sorted(row['assignee_logins'].split('\x1f')) if row['assignee_logins'] else []
+            results.append({
+                'number': row['number'],
+                'title': row['title'],
+                'state': row['state'],
+                'user': {'login': row['user']},
+                'created_at': row['created_at'],
+                'updated_at': row['updated_at'],
+                'html_url': row['html_url'],
+                'labels': [{'name': name} for name in labels],
+                'assignees': [{'login': login} for login in assignees]
+            })
+        return results
+
+    async def sync(self, client: GitHubClient, repo: str) -> Dict[str, int]:
+        """Fetch what changed since the last sync (everything the first time)
+
+        Listings are requested oldest update first with ``since`` set to the
+        newest update already mirrored; results are upserted, so the overlap
+        at the watermark is harmless.
+        """
+        since = self.watermarks(repo)
+        params = {'state': 'all', 'sort': 'updated', 'direction': 'asc', 'per_page': 100}
+        with bulk_priority():
+            items = await client.paginate(f"/repos/{repo}/issues",
+                                          {**params, **({'since': since['issues']} if since['issues'] else {})})
+            stored_items = self.store_items(repo, items)
+            comments = await client.paginate(f"/repos/{repo}/issues/comments",
+                                             {'sort': 'updated', 'direction': 'asc', 'per_page': 100,
+                                              **({'since': since['comments']} if since['comments'] else {})})
+            stored_comments = self.store_comments(repo, comments)
+        return {'items': stored_items, 'comments': stored_comments}
+
+    def stats(self, repo: str) -> Dict[str, Any]:
+        counts = dict(self.db.execute(
+            "SELECT kind, COUNT(*) FROM items WHERE repo = ? GROUP BY kind", (repo,)
+        ).fetchall())
+        comments = self.db.execute("SELECT COUNT(*) FROM comments WHERE repo = ?", (repo,)).fetchone()[0]
+        since = self.watermarks(repo)
+        return {'issues': counts.get('issue', 0), 'pull_requests': counts.get('pr', 0), 'comments': comments,
+                'issues_since': since['issues'], 'comments_since': since['comments']}
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,190 @@
+"""
+GitHub Notifications Module
+Local notification store and a watcher that polls with If-Modified-Since at the server's X-Poll-Interval
+"""
+
+import asyncio
+import random
+import sqlite3
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+import aiohttp
+
+from .client import GitHubClient, GitHubAPIError, RateLimitedError, parse_link_header
+
+# Seconds between polls when the response has no X-Poll-Interval
+DEFAULT_POLL_INTERVAL = 60
+
+# After a failed poll (network error, timeout or 5xx) the watcher retries after
+# this many seconds, doubling with each consecutive failure up to the maximum
+ERROR_RETRY_DELAY = 5.0
+ERROR_RETRY_MAX = 300.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notifications (
+    id TEXT PRIMARY KEY,
+    reason TEXT,
+    repo TEXT,
+    title TEXT,
+    type TEXT,
+    unread INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS poll_state (
+    feed TEXT PRIMARY KEY,
+    last_modified TEXT,
+    poll_interval INTEGER
+);
+"""
+
+
+class NotificationStore:
+    """SQLite copy of notification threads and the Last-Modified of the last poll"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._db: Optional[sqlite3.Connection] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """The store database, opened on first use"""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path))
+            self._db.row_factory = sqlite3.Row
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def poll_state(self, feed: str) -> Tuple[Optional[str], Optional[int]]:
+        """(Last-Modified, X-Poll-Interval) of the last successful poll of a feed"""
+        row = self.db.execute("SELECT last_modified, poll_interval FROM poll_state WHERE feed = ?",
+                              (feed,)).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def set_poll_state(self, feed: str, last_modified: Optional[str], poll_interval: Optional[int]):
+        with self.db:
+            self.db.execute(
+                "INSERT INTO poll_state VALUES (?, ?, ?) ON CONFLICT (feed) DO UPDATE SET "
+                "last_modified = excluded.last_modified, poll_interval = excluded.poll_interval",
+                (feed, last_modified, poll_interval)
+            )
+
+    def apply(self, threads: List[Dict[str, Any]], unread_feed: bool = False) -> List[Dict[str, Any]]:
+        """Store threads; returns those that are new or updated since they were last stored
+
+        unread_feed: threads is the complete unread feed, so stored threads
+        missing from it have been read.
+        """
+        changed = []
+        with self.db:
+            for thread in threads:
+                row = self.db.execute("SELECT updated_at, unread FROM notifications WHERE id = ?",
+                                      (str(thread['id']),)).fetchone()
+                unread = int(bool(thread.get('unread')))
+                if row is not None and row[0] == thread.get('updated_at') and row[1] == unread:
+                    continue
+                self.db.execute(
+                    "INSERT OR REPLACE INTO notifications VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (str(thread['id']), thread.get('reason', ''),
+                     (thread.get('repository') or {}).get('full_name', ''),
+                     (thread.get('subject') or {}).get('title', ''), (thread.get('subject') or {}).get('type', ''),
+                     unread, thread.get('updated_at', ''), (thread.get('subject') or {}).get('url', ''))
+                )
+                if row is None or row[0] != thread.get('updated_at'):
+                    changed.append(thread)
+            if unread_feed:
+                ids = [str(thread['id']) for thread in threads]
+                self.db.execute(f"UPDATE notifications SET unread = 0 WHERE unread = 1 "
+                                f"AND id NOT IN ({', '.join('?' for _ in ids)})", ids)
+        return changed
+
+    def unread(self) -> List[Dict[str, Any]]:
+        rows = self.db.execute("SELECT * FROM notifications WHERE unread = 1 ORDER BY updated_at DESC")
+        return [dict(row) for row in rows]
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class NotificationWatcher:
+    """Polls /notifications conditionally; an unchanged feed costs a 304, which uses no quota"""
+
+    def __init__(self, client: GitHubClient, store: NotificationStore, all: bool = False,
+                 min_interval: float = 0):
+        self.client = client
+        self.store = store
+        self.all = all
+        self.params = {'all': str(all).lower(), 'per_page': 50}
+        self.feed = f"notifications?all={self.params['all']}"
+        self.min_interval = min_interval
+        self.polls = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.failures = 0  # consecutive failed polls
+
+    async def poll(self) -> Tuple[List[Dict[str, Any]], float]:
+        """One conditional poll: (new or updated threads, seconds until the next poll)"""
+        last_modified, interval = self.store.poll_state(self.feed)
+        headers = {'If-Modified-Since': last_modified} if last_modified else {}
+        self.polls += 1
+        # Sent past the HTTP cache: its 304 handling would hide X-Poll-Interval
+        async with self.client.request('GET', '/notifications', headers=headers, params=self.params) as response:
+            interval = int(response.headers.get('X-Poll-Interval', interval or DEFAULT_POLL_INTERVAL))
+            if response.status == 304:
+                self.not_modified += 1
+                self.store.set_poll_state(self.feed, last_modified, interval)
+                return [], max(interval, self.min_interval)
+            if response.status != 200:
+                raise GitHubAPIError(response.status, self.client.url('/notifications'))
+            threads = await response.json()
+            new_last_modified = response.headers.get('Last-Modified', last_modified)
+            next_url = parse_link_header(response.headers.get('Link')).get('next')
+        while next_url:
+            page, page_headers = await self.client.get_json(next_url)
+            threads.extend(page)
+            next_url = parse_link_header(page_headers.get('Link')).get('next')
+        changed = self.store.apply(threads, unread_feed=not self.all)
+        self.store.set_poll_state(self.feed, new_last_modified, interval)
+        return changed, max(interval, self.min_interval)
+
+    def _retry_delay(self) -> float:
+        delay = min(ERROR_RETRY_DELAY * 2 ** (self.failures - 1), ERROR_RETRY_MAX)
+        return max(delay * random.uniform(1.0, 1.25), self.min_interval)
+
+    async def watch(self, on_changes: Callable[[List[Dict[str, Any]]], None],
+                    stop: Optional[asyncio.Event] = None, max_polls: Optional[int] = None,
+                    on_error: Optional[Callable[[Exception, float], None]] = None):
+        """Poll until stop is set (or max_polls polls), calling on_changes with each non-empty delta
+
+        Network errors, timeouts, server errors and rate limit pauses do not
+        end the watch: the poll is retried with backoff (or once the pause is
+        over) and on_error is told the error and delay. Other API errors
+        (e.g. 401) are raised.
+        """
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                changed, interval = await self.poll()
+                self.failures = 0
+            except (aiohttp.ClientError, asyncio.TimeoutError, GitHubAPIError) as e:
+                if isinstance(e, GitHubAPIError) and e.status < 500 and not isinstance(e, RateLimitedError):
+                    raise
+                self.errors += 1
+                self.failures += 1
+                changed, interval = [], self._retry_delay()
+                if isinstance(e, RateLimitedError):
+                    interval = max(interval, e.retry_in)
+                if on_error is not None:
+                    on_error(e, interval)
+            if changed:
+                on_changes(changed)
+            if max_polls is not None and self.polls >= max_polls:
+                break
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,177 @@
+"""
+GitHub Portfolio Stats Module
+Fans out per-repository stats requests for an organization or a list of repositories
+"""
+
+import asyncio
+import statistics
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Callable
+from urllib.parse import urlparse, parse_qs
+
+import aiohttp
+
+from .client import GitHubClient, GitHubAPIError, parse_link_header
+from .ratelimit import bulk_priority
+
+# Stats requests in flight at the same time; waits for /stats/* data do not hold a slot
+STATS_CONCURRENCY = 16
+
+# /stats/* endpoints answer 202 while GitHub computes them in the background
+STATS_RETRIES = 6
+STATS_RETRY_DELAY = 1.0
+STATS_RETRY_MAX = 16.0
+
+# Report columns, in display order; every one but 'repo' sorts largest first
+REPORT_FIELDS = ('repo', 'stars', 'forks', 'watchers', 'contributors', 'open_issues', 'open_prs',
+                 'commits_year', 'releases_year', 'release_interval', 'last_release')
+
+
+async def count_listing(client: GitHubClient, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+    """Length of a listing from a one-item page: the last page number is the total
+
+    Returns None if the listing cannot be read.
+    """
+    async with client.get(path, params={**(params or {}), 'per_page': 1}) as response:
+        if response.status != 200:
+            return None
+        items = await response.json() or []
+        last = parse_link_header(response.headers.get('Link', '')).get('last')
+    if last:
+        return int(parse_qs(urlparse(last).query).get('page', ['1'])[0])
+    return len(items)
+
+
+async def computed_stats(client: GitHubClient, path: str, retries: int = STATS_RETRIES,
+                         delay: float = STATS_RETRY_DELAY, slots: Optional[asyncio.Semaphore] = None) -> Optional[Any]:
+    """JSON of a /stats/* endpoint, waiting while GitHub computes it
+
+    Returns None if it is still computing after the retries or has no data (204).
+    Raises GitHubAPIError for other statuses. Each request, but not the wait
+    between them, holds one of the given slots.
+    """
+    slots = slots or asyncio.Semaphore(1)
+    for attempt in range(retries + 1):
+        async with slots, client.get(path) as response:
+            if response.status == 200:
+                return await response.json()
+            if response.status == 204:
+                return None
+            if response.status != 202:
+                raise GitHubAPIError(response.status, client.url(path))
+        if attempt < retries:
+            await asyncio.sleep(min(delay * 2 ** attempt, STATS_RETRY_MAX))
+    return None
+
+
+def release_cadence(releases: List[Dict[str, Any]], now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Releases in the last year, median days between releases and the latest release date"""
+    now = now or datetime.now(timezone.utc)
+    stamps = [release.get('published_at') or release.get('created_at')
+              for release in releases if not release.get('draft')]
+    dates = sorted(datetime.strptime(stamp, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+                   for stamp in stamps if stamp)
+    intervals = [(later - earlier).total_seconds() / 86400 for earlier, later in zip(dates, dates[1:])]
+    return {
+        'releases_year': sum(1 for date in dates if (now - date).days < 365),
+        'release_interval': round(statistics.median(intervals), 1) if intervals else None,
+        'last_release': dates[-1].strftime('%Y-%m-%d') if dates else None
+    }
+
+
+def sort_report(rows: List[Dict[str, Any]], field: str = 'stars') -> List[Dict[str, Any]]:
+    """Rows ordered by field: repository name A-Z, numbers largest first, missing values last"""
+    if field == 'repo':
+        return sorted(rows, key=lambda row: row['repo'].lower())
+    present = [row for row in rows if row.get(field) is not None]
+    missing = [row for row in rows if row.get(field) is None]
+    return sorted(present, key=lambda row: row[field], reverse=True) + missing
+
+
+def report_totals(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sums of the count columns over repositories without errors"""
+    totals = {'repo': f"{len(rows)} repositories"}
+    for field in ('stars', 'forks', 'watchers', 'contributors', 'open_issues', 'open_prs', 'commits_year',
+                  'releases_year'):
+        totals[field] = sum(row[field] or 0 for row in rows if not row.get('error'))
+    return totals
+
+
+class PortfolioStats:
+    """Collects stats for many repositories through the shared, rate-limited client"""
+
+    def __init__(self, client: GitHubClient, concurrency: int = STATS_CONCURRENCY,
+                 stats_retries: int = STATS_RETRIES, stats_delay: float = STATS_RETRY_DELAY):
+        self.client = client
+        self.concurrency = concurrency
+        self.stats_retries = stats_retries
+        self.stats_delay = stats_delay
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def _limited(self, coro):
+        async with self._slots:
+            return await coro
+
+    async def _commits_year(self, repo_full_name: str) -> Optional[int]:
+        participation = await computed_stats(self.client, f"/repos/{repo_full_name}/stats/participation",
+                                             self.stats_retries, self.stats_delay, self._slots)
+        if not participation:
+            return None
+        return sum(participation.get('all', []))
+
+    async def repo_stats(self, repo_full_name: str) -> Dict[str, Any]:
+        """One report row; failures are recorded in its 'error' field"""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        row = dict.fromkeys(REPORT_FIELDS)
+        row.update(repo=repo_full_name, error='')
+        # Every request finishes before a failure is reported, so none is left running
+        results = await asyncio.gather(
+            self._limited(self.client.get_json(f"/repos/{repo_full_name}")),
+            self._limited(count_listing(self.client, f"/repos/{repo_full_name}/contributors", {'anon': 'true'})),
+            self._limited(count_listing(self.client, f"/repos/{repo_full_name}/pulls", {'state': 'open'})),
+            self._limited(self.client.get_json(f"/repos/{repo_full_name}/releases", {'per_page': 100})),
+            self._commits_year(repo_full_name),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, GitHubAPIError):
+                row['error'] = f"GitHub API returned {result.status}"
+                return row
+            if isinstance(result, asyncio.TimeoutError):
+                row['error'] = "Request timed out"
+                return row
+            if isinstance(result, aiohttp.ClientError):
+                row['error'] = f"Network error: {result}"
+                return row
+            if isinstance(result, BaseException):
+                raise result
+        info, contributors, open_prs, releases, commits = results
+        repo, _ = info
+        row.update(
+            stars=repo.get('stargazers_count', 0),
+            forks=repo.get('forks_count', 0),
+            watchers=repo.get('subscribers_count', 0),
+            contributors=contributors,
+            open_prs=open_prs,
+            commits_year=commits,
+            **release_cadence(releases[0])
+        )
+        # open_issues_count includes pull requests
+        if open_prs is not None:
+            row['open_issues'] = max(repo.get('open_issues_count', 0) - open_prs, 0)
+        return row
+
+    async def run(self, repo_names: List[str],
+                  on_done: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """A row for each repository, in the order given"""
+        self._slots = asyncio.Semaphore(self.concurrency)
+
+        async def collect(name: str) -> Dict[str, Any]:
+            row = await self.repo_stats(name)
+            if on_done is not None:
+                on_done(row)
+            return row
+
+        with bulk_priority():
+            return list(await asyncio.gather(*(collect(name) for name in repo_names)))
@@ -0,0 +1,201 @@
+"""
+GitHub Rate Limit Module
+Paces API requests per token and backs off when GitHub asks us to slow down
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import random
+import time
+from typing import Optional, Dict, Any
+
+# Request priorities: lower is served first
+INTERACTIVE = 0
+BULK = 1
+
+# Token bucket: sustained requests per second and burst size. GitHub's
+# secondary limits allow roughly 900 REST points a minute per token.
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+
+# Retries of rate-limited requests and the exponential backoff between them
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# Secondary limit responses without Retry-After: GitHub asks for at least a minute,
+# growing with each retry. They are told apart from permission errors by their message.
+SECONDARY_LIMIT_WAIT = 60.0
+SECONDARY_LIMIT_MAX = 600.0
+SECONDARY_LIMIT_MESSAGES = (b'secondary rate limit', b'abuse detection')
+
+# Interactive requests give up rather than wait longer than this, whether for a
+# rate-limited response's retry or for a pause already in force; bulk work waits
+INTERACTIVE_MAX_WAIT = 30.0
+
+# Start spreading the remaining quota over the reset window below this
+LOW_REMAINING = 100
+
+request_priority: contextvars.ContextVar = contextvars.ContextVar('request_priority', default=INTERACTIVE)
+
+
+@contextlib.contextmanager
+def bulk_priority():
+    """Mark requests made in this block (and tasks it starts) as background work"""
+    reset = request_priority.set(BULK)
+    try:
+        yield
+    finally:
+        request_priority.reset(reset)
+
+
+class RateLimitPaused(Exception):
+    """An interactive request refused instead of held back for a long rate limit pause"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"GitHub rate limit reached; requests resume in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_MAX) -> float:
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    try:
+        return int(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Token bucket and rate limit state for one access token
+
+    Waiting requests are granted in priority order, so interactive requests
+    overtake queued bulk work. While a pause of more than INTERACTIVE_MAX_WAIT
+    is in force, interactive requests fail with RateLimitPaused instead of waiting.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        # Monotonic time before which nothing is sent (exhausted quota, Retry-After)
+        self.paused_until = 0.0
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[int] = None
+        self._waiting = []
+        self._order = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def current_rate(self) -> float:
+        """Bucket rate, slowed down to make a nearly spent quota last until reset"""
+        if self.remaining is None or self.reset is None or self.remaining >= LOW_REMAINING:
+            return self.rate
+        window = self.reset - time.time()
+        if window <= 0:
+            return self.rate
+        return max(min(self.rate, self.remaining / window), 1.0 / BACKOFF_MAX)
+
+    async def acquire(self, priority: int = INTERACTIVE):
+        """Wait for permission to send one request; raises RateLimitPaused (interactive priority only)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Waiters of another (finished) event loop can never be woken
+            self._waiting.clear()
+            self._timer = None
+            self._loop = loop
+        future = loop.create_future()
+        heapq.heappush(self._waiting, (priority, next(self._order), future))
+        self._dispatch()
+        await future
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = time.monotonic()
+        rate = self.current_rate()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+
+        while self._waiting and self._waiting[0][2].done():
+            heapq.heappop(self._waiting)  # cancelled
+        if self.paused_until - now > INTERACTIVE_MAX_WAIT:
+            self._refuse_interactive(self.paused_until - now)
+        while self._waiting and now >= self.paused_until and self.tokens >= 1:
+            _, _, future = heapq.heappop(self._waiting)
+            if not future.done():
+                self.tokens -= 1
+                future.set_result(None)
+
+        if self._waiting:
+            delay = max(self.paused_until - now, (1 - self.tokens) / rate, 0.001)
+            self._timer = self._loop.call_later(delay, self._dispatch)
+
+    def _refuse_interactive(self, retry_in: float):
+        waiting = []
+        for entry in self._waiting:
+            priority, _, future = entry
+            if future.done():
+                continue
+            if priority == INTERACTIVE:
+                future.set_exception(RateLimitPaused(retry_in))
+            else:
+                waiting.append(entry)
+        heapq.heapify(waiting)
+        self._waiting = waiting
+
+    def pause(self, seconds: float):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        if self._loop is not None and not self._loop.is_closed():
+            # Interactive requests already queued give up now rather than when they would be woken
+            self._dispatch()
+
+    def observe(self, status: int, headers, attempt: int = 0, body: Optional[bytes] = None) -> Optional[float]:
+        """Record a response's rate limit headers
+
+        Returns how long to wait before retrying, or None if the response
+        should be handed to the caller. body is the response body of a 403 or
+        429, which is the only sign of a secondary limit without Retry-After.
+        """
+        limit = _int_header(headers, 'X-RateLimit-Limit')
+        remaining = _int_header(headers, 'X-RateLimit-Remaining')
+        reset = _int_header(headers, 'X-RateLimit-Reset')
+        if remaining is not None:
+            self.limit, self.remaining, self.reset = limit, remaining, reset
+
+        if status not in (403, 429):
+            return None
+        retry_after = _int_header(headers, 'Retry-After')
+        if retry_after is not None:
+            # Secondary rate limit; jitter keeps parallel jobs from retrying in lockstep
+            delay = retry_after * random.uniform(1.0, 1.25)
+        elif remaining == 0 and reset is not None:
+            delay = max(reset - time.time(), 0) + backoff_delay(0)
+        elif body and any(message in body.lower() for message in SECONDARY_LIMIT_MESSAGES):
+            delay = min(SECONDARY_LIMIT_WAIT * 2 ** attempt, SECONDARY_LIMIT_MAX) * random.uniform(1.0, 1.25)
+        elif status == 429:
+            delay = backoff_delay(attempt)
+        else:
+            # A plain 403 is a permission error, not a rate limit
+            return None
+        # The limit applies to the token, so hold back every request using it
+        self.pause(delay)
+        return delay
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'limit': self.limit,
+            'remaining': self.remaining,
+            'reset': self.reset,
+            'paused_for': max(self.paused_until - time.monotonic(), 0.0),
+            'waiting': len(self._waiting)
+        }
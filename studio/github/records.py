@@ -0,0 +1,91 @@
+"""
+GitHub Records Module
+Compact records holding only the fields the listings use, built page by page as responses are decoded
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple, Iterator
+
+# Stored for fields the API object did not have, so lookups behave like the dict did
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _nested(items: Tuple[Tuple[str, Any], ...]):
+    """Read-only nested object, shared by every record with the same values (e.g. one owner)"""
+    return MappingProxyType(dict(items))
+
+
+class Record:
+    """Slotted projection of a GitHub API object that reads like the original dict
+
+    Subclasses list the top-level FIELDS to keep and, in NESTED, the keys kept
+    from nested objects such as 'owner'.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    NESTED: Dict[str, Tuple[str, ...]] = {}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'Record':
+        record = cls.__new__(cls)
+        for field in cls.FIELDS:
+            value = data.get(field, _MISSING)
+            keys = cls.NESTED.get(field)
+            if keys is not None and isinstance(value, dict):
+                value = _nested(tuple((key, value.get(key)) for key in keys))
+            object.__setattr__(record, field, value)
+        return record
+
+    @classmethod
+    def page(cls, items: List[Dict[str, Any]]) -> List['Record']:
+        """Project one decoded page; pass as ``project=`` to GitHubClient.paginate"""
+        return [cls.from_json(item) for item in items]
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, _MISSING) if key in self.FIELDS else _MISSING
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS and getattr(self, key) is not _MISSING
+
+    def keys(self) -> Iterator[str]:
+        return (field for field in self.FIELDS if getattr(self, field) is not _MISSING)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, JSON-serializable dict of the kept fields"""
+        return {key: dict(value) if isinstance(value, MappingProxyType) else value
+                for key, value in ((key, self[key]) for key in self.keys())}
+
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class RepoRecord(Record):
+    """A repository in a listing: what display_repositories and cloning need"""
+
+    FIELDS = ('id', 'name', 'full_name', 'owner', 'private', 'description', 'language', 'stargazers_count',
+              'forks_count', 'html_url', 'clone_url', 'ssh_url', 'updated_at')
+    NESTED = {'owner': ('login',)}
+    __slots__ = FIELDS
+
+
+class IssueRecord(Record):
+    """An issue or pull request in a listing: what display_issues needs"""
+
+    FIELDS = ('number', 'title', 'state', 'user', 'created_at', 'updated_at', 'html_url', 'pull_request')
+    NESTED = {'user': ('login',), 'pull_request': ('url',)}
+    __slots__ = FIELDS
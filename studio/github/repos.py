@@ -4,28 +4,61 @@ Handles repository listing, cloning, and management via GitHub API
 """
 
 import os
+import csv
+import json
 import asyncio
-import subprocess
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-import aiohttp
+from datetime import datetime
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, MofNCompleteColumn
 from rich.prompt import Prompt, Confirm
 from rich import box
 
 from .auth import GitHubAuth
+from .client import GitHubClient, GitHubAPIError
+from .graphql import GitHubGraphQL, GraphQLError, graphql_enabled
+from .mirror import IssueMirror
+from .bulk import BulkJournal, BulkRunner, BULK_CONCURRENCY, Target
+from .clone import CloneOptions, CloneError, CLONE_CONCURRENCY, clone
+from .records import RepoRecord, IssueRecord
+from .notifications import NotificationStore, NotificationWatcher
+from .webhooks import WebhookApplier, WebhookReceiver, DEFAULT_PORT, WEBHOOK_SECRET_ENV, replay
+from .portfolio import PortfolioStats, STATS_CONCURRENCY, REPORT_FIELDS, count_listing, sort_report, report_totals
 
 console = Console()
 
 class GitHubRepos:
     """GitHub Repository Manager"""
     
-    def __init__(self, auth: GitHubAuth):
+    def __init__(self, auth: GitHubAuth, client: Optional[GitHubClient] = None, use_graphql: Optional[bool] = None,
+                 mirror: Optional[IssueMirror] = None):
         self.auth = auth
-        self.api_base = "https://api.github.com"
+        self._mirror = mirror
+        self._notification_store: Optional[NotificationStore] = None
+        # Share the auth module's pooled session unless given a client (e.g. for a test server)
+        self.client = client or auth.client
+        self.api_base = self.client.api_base
+        # Batched GraphQL queries for graphs, listings and stats; REST otherwise
+        if use_graphql is None:
+            use_graphql = graphql_enabled()
+        self.graphql = GitHubGraphQL(self.client) if use_graphql else None
+
+    @property
+    def mirror(self) -> IssueMirror:
+        """Local copy of synced issues and pull requests"""
+        if self._mirror is None:
+            self._mirror = IssueMirror(self.auth.config_dir / "github_mirror.db")
+        return self._mirror
+
+    @property
+    def notification_store(self) -> NotificationStore:
+        """Local copy of notification threads seen by 'notifications watch'"""
+        if self._notification_store is None:
+            self._notification_store = NotificationStore(self.auth.config_dir / "notifications.db")
+        return self._notification_store
         
     async def list_repositories(self, user_type: str = "user") -> List[Dict[str, Any]]:
         """List repositories for the authenticated user"""
@@ -41,38 +74,22 @@ class GitHubRepos:
         ) as progress:
             task = progress.add_task("Fetching repositories...", total=None)
             
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                
-                # Get user repositories
-                url = f"{self.api_base}/user/repos"
-                params = {
-                    'type': user_type,  # 'all', 'owner', 'member'
-                    'sort': 'updated',
-                    'per_page': 100
-                }
-                
-                repos = []
-                page = 1
-                
-                while True:
-                    params['page'] = page
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            page_repos = await response.json()
-                            if not page_repos:
-                                break
-                            repos.extend(page_repos)
-                            page += 1
-                        else:
-                            progress.update(task, description="❌ Failed to fetch repositories")
-                            return []
-                
-                progress.update(task, description=f"✅ Found {len(repos)} repositories!")
-                return repos
+            # Get user repositories
+            url = f"{self.api_base}/user/repos"
+            params = {
+                'type': user_type,  # 'all', 'owner', 'member'
+                'sort': 'updated',
+                'per_page': 100
+            }
+            
+            try:
+                repos = await self.client.paginate(url, params, project=RepoRecord.page)
+            except GitHubAPIError:
+                progress.update(task, description="❌ Failed to fetch repositories")
+                return []
+            
+            progress.update(task, description=f"✅ Found {len(repos)} repositories!")
+            return repos
     
     def display_repositories(self, repos: List[Dict[str, Any]]):
         """Display repositories in a nice table format"""
@@ -117,91 +134,194 @@ class GitHubRepos:
         
         console.print(table)
     
-    async def clone_repository(self, repo_name: str, target_path: Optional[str] = None) -> bool:
-        """Clone a repository by name"""
+    async def find_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Look up 'owner/name' directly, or 'name' among the user's repositories"""
+        repo = await self._get_repository(repo_name)
+        if repo is not None or '/' in repo_name:
+            return repo
+        # Not the user's own: it may belong to an organization they can see
+        for repo in await self.list_repositories():
+            if repo['name'] == repo_name:
+                return repo
+        return None
+
+    async def _get_repository(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        """'owner/name', or 'name' as one of the user's own repositories, without listing them"""
+        if '/' in repo_name:
+            candidates = [repo_name]
+        else:
+            user_info = self.auth.get_user_info()
+            candidates = [f"{user_info['login']}/{repo_name}"] if user_info else []
+        for full_name in candidates:
+            async with self.client.get(f"/repos/{full_name}") as response:
+                if response.status == 200:
+                    return await response.json()
+        return None
+
+    async def _resolve_repositories(self, repo_names: List[str]) -> Dict[str, Any]:
+        """Name -> repository, None if not found, or the exception raised looking it up
+
+        Names that are not the user's own are searched in one listing of their repositories.
+        """
+        async def lookup(name: str):
+            try:
+                return await self._get_repository(name)
+            except Exception as e:
+                return e
+
+        found = dict(zip(repo_names, await asyncio.gather(*(lookup(name) for name in repo_names))))
+        unresolved = [name for name, repo in found.items() if repo is None and '/' not in name]
+        if unresolved:
+            try:
+                listed = {repo['name']: repo for repo in await self.list_repositories()}
+            except Exception as e:
+                listed = {name: e for name in unresolved}
+            for name in unresolved:
+                found[name] = listed.get(name)
+        return found
+
+    def _default_clone_path(self, repo: Dict[str, Any]) -> Path:
+        owner = repo.get('owner', {}).get('login')
+        if owner:
+            return Path.home() / "git" / owner / repo['name']
+        return Path.home() / "git" / repo['name']
+
+    async def clone_repository(self, repo_name: str, target_path: Optional[str] = None,
+                               options: Optional[CloneOptions] = None) -> Optional[Path]:
+        """Clone a repository by name ('owner/name' or one of the user's); returns where it was cloned"""
         if not self.auth.is_authenticated():
             console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
                               title="[red]Error", border_style="red"))
-            return False
-        
-        # Find repository
-        repos = await self.list_repositories()
-        target_repo = None
-        
-        for repo in repos:
-            if repo['name'] == repo_name:
-                target_repo = repo
-                break
+            return None
         
+        target_repo = await self.find_repository(repo_name)
         if not target_repo:
             console.print(Panel(f"[bold red]❌ Repository '{repo_name}' not found.[/]", 
                               title="[red]Error", border_style="red"))
-            return False
+            return None
         
         # Determine clone path
         if not target_path:
-            user_info = self.auth.get_user_info()
-            if user_info:
-                default_path = Path.home() / "git" / user_info['login'] / repo_name
-            else:
-                default_path = Path.home() / "git" / repo_name
-            
             target_path = Prompt.ask(
                 "Clone to path",
-                default=str(default_path)
+                default=str(self._default_clone_path(target_repo))
             )
         
         target_path_obj = Path(target_path)
         
-        # Create directory if it doesn't exist
-        target_path_obj.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Clone repository
+        # Clone repository, streaming git's progress
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.percentage:>3.0f}%"),
             console=console,
         ) as progress:
-            task = progress.add_task(f"Cloning {repo_name}...", total=None)
-            
+            task = progress.add_task(f"Cloning {repo_name}...", total=100)
+
+            def on_progress(phase: str, percent: int):
+                progress.update(task, description=f"Cloning {repo_name}: {phase}", completed=percent)
+
             try:
-                # Use HTTPS URL for authenticated cloning
-                clone_url = target_repo['clone_url']
-                
-                # Replace with authenticated URL if it's a private repo
-                if target_repo['private']:
-                    token = self.auth.get_access_token()
-                    clone_url = clone_url.replace('https://', f'https://{token}@')
-                
-                result = subprocess.run(
-                    ['git', 'clone', clone_url, str(target_path_obj)],
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                
-                if result.returncode == 0:
-                    progress.update(task, description=f"✅ Successfully cloned {repo_name}!")
-                    console.print(Panel(f"[bold green]✅ Repository '{repo_name}' cloned successfully![/]\n[dim]Path: {target_path_obj}[/]", 
-                                      title="[green]Success", border_style="green"))
-                    return True
-                else:
-                    progress.update(task, description=f"❌ Failed to clone {repo_name}")
-                    console.print(Panel(f"[bold red]❌ Failed to clone repository:[/]\n{result.stderr}", 
-                                      title="[red]Error", border_style="red"))
-                    return False
-                    
-            except subprocess.TimeoutExpired:
-                progress.update(task, description="❌ Clone operation timed out")
-                console.print(Panel("[bold red]❌ Clone operation timed out[/]", 
+                token = self.auth.get_access_token() if target_repo.get('private') else None
+                await clone(target_repo['clone_url'], target_path_obj, options, token, on_progress)
+            except CloneError as e:
+                progress.update(task, description=f"❌ Failed to clone {repo_name}")
+                console.print(Panel(f"[bold red]❌ Failed to clone repository:[/]\n{e.stderr}", 
                                   title="[red]Error", border_style="red"))
-                return False
+                return None
             except Exception as e:
                 progress.update(task, description=f"❌ Error: {e}")
                 console.print(Panel(f"[bold red]❌ Error during clone:[/] {e}", 
                                   title="[red]Error", border_style="red"))
-                return False
-    
+                return None
+            progress.update(task, description=f"✅ Successfully cloned {repo_name}!", completed=100)
+        console.print(Panel(f"[bold green]✅ Repository '{repo_name}' cloned successfully![/]\n[dim]Path: {target_path_obj}[/]", 
+                          title="[green]Success", border_style="green"))
+        return target_path_obj
+
+    async def clone_repositories(self, repo_names: List[str], target_dir: Optional[str] = None,
+                                 options: Optional[CloneOptions] = None,
+                                 concurrency: int = CLONE_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Clone many repositories at once into target_dir/<owner>/<name>
+
+        Existing checkouts are skipped, so an interrupted run can simply be repeated.
+        """
+        if not self.auth.is_authenticated():
+            console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return []
+        base = Path(target_dir).expanduser() if target_dir else Path.home() / "git"
+        semaphore = asyncio.Semaphore(concurrency)
+        # Resolved before the progress display opens: listing repositories shows a progress display of its own
+        repositories = await self._resolve_repositories(repo_names)
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("{task.percentage:>3.0f}%"),
+            console=console,
+        ) as progress:
+            overall = progress.add_task(f"Cloning {len(repo_names)} repositories...", total=len(repo_names))
+
+            async def clone_one(name: str) -> Dict[str, Any]:
+                result = {'name': name, 'path': '', 'status': 'failed', 'error': ''}
+                try:
+                    repo = repositories[name]
+                    if isinstance(repo, Exception):
+                        raise repo
+                    if repo is None:
+                        result['error'] = 'not found'
+                        return result
+                    path = base / repo['full_name']
+                    result['path'] = str(path)
+                    if path.exists():
+                        result['status'] = 'exists'
+                        return result
+                    async with semaphore:
+                        task = progress.add_task(f"  {repo['full_name']}", total=100)
+
+                        def on_progress(phase: str, percent: int):
+                            progress.update(task, description=f"  {repo['full_name']}: {phase}", completed=percent)
+
+                        token = self.auth.get_access_token() if repo.get('private') else None
+                        try:
+                            await clone(repo['clone_url'], path, options, token, on_progress)
+                        finally:
+                            progress.remove_task(task)
+                    result['status'] = 'cloned'
+                except GitHubAPIError as e:
+                    result['error'] = f"GitHub API returned {e.status}"
+                except Exception as e:
+                    # One repository failing never stops the others
+                    result['error'] = str(e) or type(e).__name__
+                finally:
+                    progress.advance(overall)
+                return result
+
+            results = await asyncio.gather(*(clone_one(name) for name in repo_names))
+            failed = sum(1 for result in results if result['status'] == 'failed')
+            progress.update(overall, description=f"{'❌' if failed else '✅'} Cloned {len(repo_names) - failed} "
+                                                 f"of {len(repo_names)} repositories")
+
+        table = Table(
+            title=f"[bold blue]Bulk Clone[/]\n[dim]{base}[/]",
+            show_header=True,
+            header_style="bold magenta",
+            box=box.ROUNDED,
+            border_style="blue"
+        )
+        table.add_column("Repository", style="cyan")
+        table.add_column("Result", style="green")
+        table.add_column("Path", style="dim")
+        table.add_column("Error", style="red")
+        labels = {'cloned': "✅ cloned", 'exists': "✅ already there", 'failed': "❌ failed"}
+        for result in results:
+            table.add_row(result['name'], labels[result['status']], result['path'], result['error'])
+        console.print(table)
+        return list(results)
+
     async def search_repositories(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Search repositories on GitHub"""
         if not self.auth.is_authenticated():
@@ -216,29 +336,23 @@ class GitHubRepos:
         ) as progress:
             task = progress.add_task(f"Searching for '{query}'...", total=None)
             
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                
-                url = f"{self.api_base}/search/repositories"
-                params = {
-                    'q': query,
-                    'sort': 'stars',
-                    'order': 'desc',
-                    'per_page': min(limit, 100)
-                }
-                
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        repos = result.get('items', [])
-                        progress.update(task, description=f"✅ Found {len(repos)} repositories!")
-                        return repos
-                    else:
-                        progress.update(task, description="❌ Search failed")
-                        return []
+            url = f"{self.api_base}/search/repositories"
+            params = {
+                'q': query,
+                'sort': 'stars',
+                'order': 'desc',
+                'per_page': min(limit, 100)
+            }
+            
+            async with self.client.get(url, params=params) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    repos = RepoRecord.page(result.get('items', []))
+                    progress.update(task, description=f"✅ Found {len(repos)} repositories!")
+                    return repos
+                else:
+                    progress.update(task, description="❌ Search failed")
+                    return []
     
     async def get_repository_info(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific repository"""
@@ -254,22 +368,16 @@ class GitHubRepos:
         ) as progress:
             task = progress.add_task(f"Fetching info for {owner}/{repo}...", total=None)
             
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                
-                url = f"{self.api_base}/repos/{owner}/{repo}"
-                
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        repo_info = await response.json()
-                        progress.update(task, description=f"✅ Got info for {owner}/{repo}!")
-                        return repo_info
-                    else:
-                        progress.update(task, description="❌ Failed to get repository info")
-                        return None
+            url = f"{self.api_base}/repos/{owner}/{repo}"
+            
+            async with self.client.get(url) as response:
+                if response.status == 200:
+                    repo_info = await response.json()
+                    progress.update(task, description=f"✅ Got info for {owner}/{repo}!")
+                    return repo_info
+                else:
+                    progress.update(task, description="❌ Failed to get repository info")
+                    return None
     
     def display_repository_info(self, repo_info: Dict[str, Any]):
         """Display detailed repository information"""
@@ -303,66 +411,32 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Fetching issues for {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/issues"
-                params = {
-                    'state': state,
-                    'per_page': min(limit, 100),
-                    'page': 1
-                }
-                if label is not None:
-                    params['labels'] = label
-                if assignee is not None:
-                    params['assignee'] = assignee
-                issues = []
-                while len(issues) < limit:
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            page_issues = await response.json()
-                            if not page_issues:
-                                break
-                            issues.extend(page_issues)
-                            if len(page_issues) < params['per_page']:
-                                break
-                            params['page'] += 1
-                        else:
-                            progress.update(task, description="❌ Failed to fetch issues")
-                            console.print(Panel(f"[bold red]❌ Failed to fetch issues: {response.status}[/]", 
-                                              title="[red]Error", border_style="red"))
-                            return
-                progress.update(task, description=f"✅ Found {len(issues)} issues!")
-                # Display issues (unchanged)
-                if not issues:
-                    console.print(Panel("[yellow]No issues found.[/]", 
-                                      title="[blue]Issues", border_style="blue"))
-                    return
-                table = Table(
-                    title=f"[bold blue]GitHub Issues[/]\n[dim]Found {len(issues)} issues[/]",
-                    show_header=True,
-                    header_style="bold magenta",
-                    box=box.ROUNDED,
-                    border_style="blue"
-                )
-                table.add_column("#", style="cyan", no_wrap=True)
-                table.add_column("Title", style="green")
-                table.add_column("State", style="yellow")
-                table.add_column("User", style="white")
-                table.add_column("Created", style="dim")
-                table.add_column("URL", style="blue")
-                for i, issue in enumerate(issues[:limit], 1):
-                    table.add_row(
-                        f"[bold]{i}[/]",
-                        issue.get('title', 'No title'),
-                        issue.get('state', ''),
-                        issue.get('user', {}).get('login', ''),
-                        issue.get('created_at', '')[:10],
-                        issue.get('html_url', '')
-                    )
-                console.print(table)
+            url = f"{self.api_base}/repos/{repo_full_name}/issues"
+            params = {
+                'state': state,
+                'per_page': min(limit, 100)
+            }
+            if label is not None:
+                params['labels'] = label
+            if assignee is not None:
+                params['assignee'] = assignee
+            try:
+                if self.graphql is not None:
+                    issues = await self.graphql.search_issues(repo_full_name, 'issue', state, limit, label, assignee)
+                else:
+                    issues = await self.client.paginate(url, params, limit=limit, project=IssueRecord.page)
+            except GitHubAPIError as e:
+                progress.update(task, description="❌ Failed to fetch issues")
+                console.print(Panel(f"[bold red]❌ Failed to fetch issues: {e.status}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            except GraphQLError as e:
+                progress.update(task, description="❌ Failed to fetch issues")
+                console.print(Panel(f"[bold red]❌ Failed to fetch issues: {e}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            progress.update(task, description=f"✅ Found {len(issues)} issues!")
+        self.display_issues(issues[:limit], 'issue')
 
     async def comment_issue(self, repo_full_name: str, issue_number: int, body: str):
         """Comment on a GitHub issue"""
@@ -376,24 +450,19 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Commenting on issue #{issue_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/comments"
-                data = {'body': body}
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status == 201:
-                        comment = await response.json()
-                        progress.update(task, description="✅ Comment posted!")
-                        console.print(Panel(f"[bold green]✅ Comment posted![/]\n[dim]URL:[/] {comment.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to post comment")
-                        console.print(Panel(f"[bold red]❌ Failed to post comment: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/comments"
+            data = {'body': body}
+            async with self.client.post(url, json=data) as response:
+                if response.status == 201:
+                    comment = await response.json()
+                    progress.update(task, description="✅ Comment posted!")
+                    console.print(Panel(f"[bold green]✅ Comment posted![/]\n[dim]URL:[/] {comment.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to post comment")
+                    console.print(Panel(f"[bold red]❌ Failed to post comment: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def close_issue(self, repo_full_name: str, issue_number: int):
         """Close a GitHub issue"""
@@ -407,24 +476,19 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Closing issue #{issue_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}"
-                data = {'state': 'closed'}
-                async with session.patch(url, json=data, headers=headers) as response:
-                    if response.status == 200:
-                        issue = await response.json()
-                        progress.update(task, description="✅ Issue closed!")
-                        console.print(Panel(f"[bold green]✅ Issue closed![/]\n[dim]URL:[/] {issue.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to close issue")
-                        console.print(Panel(f"[bold red]❌ Failed to close issue: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}"
+            data = {'state': 'closed'}
+            async with self.client.patch(url, json=data) as response:
+                if response.status == 200:
+                    issue = await response.json()
+                    progress.update(task, description="✅ Issue closed!")
+                    console.print(Panel(f"[bold green]✅ Issue closed![/]\n[dim]URL:[/] {issue.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to close issue")
+                    console.print(Panel(f"[bold red]❌ Failed to close issue: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def assign_issue(self, repo_full_name: str, issue_number: int, user: str):
         """Assign a user to a GitHub issue"""
@@ -438,23 +502,18 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Assigning @{user} to issue #{issue_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/assignees"
-                data = {'assignees': [user]}
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status in (200, 201):
-                        progress.update(task, description="✅ User assigned!")
-                        console.print(Panel(f"[bold green]✅ User assigned to issue![/]", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to assign user")
-                        console.print(Panel(f"[bold red]❌ Failed to assign user: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/assignees"
+            data = {'assignees': [user]}
+            async with self.client.post(url, json=data) as response:
+                if response.status in (200, 201):
+                    progress.update(task, description="✅ User assigned!")
+                    console.print(Panel(f"[bold green]✅ User assigned to issue![/]", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to assign user")
+                    console.print(Panel(f"[bold red]❌ Failed to assign user: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def label_issue(self, repo_full_name: str, issue_number: int, label: str):
         """Add a label to a GitHub issue"""
@@ -468,23 +527,18 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Adding label '{label}' to issue #{issue_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/labels"
-                data = {'labels': [label]}
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status in (200, 201):
-                        progress.update(task, description="✅ Label added!")
-                        console.print(Panel(f"[bold green]✅ Label added to issue![/]", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to add label")
-                        console.print(Panel(f"[bold red]❌ Failed to add label: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/issues/{issue_number}/labels"
+            data = {'labels': [label]}
+            async with self.client.post(url, json=data) as response:
+                if response.status in (200, 201):
+                    progress.update(task, description="✅ Label added!")
+                    console.print(Panel(f"[bold green]✅ Label added to issue![/]", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to add label")
+                    console.print(Panel(f"[bold red]❌ Failed to add label: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def create_issue(self, repo_full_name: str, title: str, body: str = ""):
         """Create a new issue for a given repository"""
@@ -500,29 +554,89 @@ class GitHubRepos:
         ) as progress:
             task = progress.add_task(f"Creating issue in {repo_full_name}...", total=None)
             
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                
-                url = f"{self.api_base}/repos/{repo_full_name}/issues"
-                data = {
-                    'title': title,
-                    'body': body or ""
-                }
-                
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status == 201:
-                        issue = await response.json()
-                        progress.update(task, description="✅ Issue created!")
-                        console.print(Panel(f"[bold green]✅ Issue created successfully![/]\n[dim]URL:[/] {issue.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to create issue")
-                        console.print(Panel(f"[bold red]❌ Failed to create issue: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/issues"
+            data = {
+                'title': title,
+                'body': body or ""
+            }
+            
+            async with self.client.post(url, json=data) as response:
+                if response.status == 201:
+                    issue = await response.json()
+                    progress.update(task, description="✅ Issue created!")
+                    console.print(Panel(f"[bold green]✅ Issue created successfully![/]\n[dim]URL:[/] {issue.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to create issue")
+                    console.print(Panel(f"[bold red]❌ Failed to create issue: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
+
+    def bulk_journal(self, job_id: Optional[str] = None) -> BulkJournal:
+        """Journal of a bulk job; a new job id is made from the current time"""
+        if job_id is None:
+            job_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        return BulkJournal(self.auth.config_dir / "bulk" / f"{job_id}.jsonl")
+
+    async def bulk_operation(self, operation: str, targets: List[Target], value: Optional[str] = None,
+                             concurrency: int = BULK_CONCURRENCY, job_id: Optional[str] = None):
+        """Apply comment/close/assign/label/merge to many issues or pull requests
+
+        Pass job_id of an earlier run (and no targets) to resume it: items that
+        already succeeded are skipped.
+        """
+        if not self.auth.is_authenticated():
+            console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return None
+        journal = self.bulk_journal(job_id)
+        if job_id is None:
+            journal.create(operation, value, targets)
+        elif not journal.path.exists():
+            console.print(Panel(f"[bold red]❌ No bulk job '{job_id}'[/]", 
+                              title="[red]Error", border_style="red"))
+            return None
+        job, _ = journal.load()
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Running '{job['operation']}' (job {journal.job_id})...", total=len(job['targets']))
+            outcomes = await BulkRunner(self.client, journal, concurrency).run(
+                lambda outcome: progress.advance(task)
+            )
+            failed = [outcome for outcome in outcomes if not outcome['ok']]
+            progress.update(task, description=f"{'❌' if failed else '✅'} '{job['operation']}' finished: "
+                                              f"{len(outcomes) - len(failed)} succeeded, {len(failed)} failed")
+
+        table = Table(
+            title=f"[bold blue]Bulk {job['operation']}[/]\n[dim]Job {journal.job_id}[/]",
+            show_header=True,
+            header_style="bold magenta",
+            box=box.ROUNDED,
+            border_style="blue"
+        )
+        table.add_column("Repository", style="cyan")
+        table.add_column("#", style="white", no_wrap=True)
+        table.add_column("Result", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Error", style="red")
+        # Failures first
+        for outcome in sorted(outcomes, key=lambda outcome: outcome['ok']):
+            if not outcome['ok']:
+                result = "❌ failed"
+            else:
+                result = "✅ done earlier" if outcome.get('skipped') else "✅ done"
+            table.add_row(outcome['repo'], str(outcome['number']), result,
+                          str(outcome['status'] or ''), outcome['error'])
+        console.print(table)
+        if failed:
+            console.print(f"[yellow]Resume with:[/] gitflow-studio github bulk --resume {journal.job_id}")
+        return outcomes
 
     async def list_pull_requests(self, repo_full_name: str, state: str = 'open', limit: int = 20, label: str = '', assignee: str = ''):
         """List pull requests for a given repository, with optional label and assignee filters"""
@@ -536,66 +650,97 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Fetching pull requests for {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/pulls"
-                params = {
-                    'state': state,
-                    'per_page': min(limit, 100),
-                    'page': 1
-                }
-                if label is not None:
-                    params['labels'] = label
-                if assignee is not None:
-                    params['assignee'] = assignee
-                prs = []
-                while len(prs) < limit:
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            page_prs = await response.json()
-                            if not page_prs:
-                                break
-                            prs.extend(page_prs)
-                            if len(page_prs) < params['per_page']:
-                                break
-                            params['page'] += 1
-                        else:
-                            progress.update(task, description="❌ Failed to fetch pull requests")
-                            console.print(Panel(f"[bold red]❌ Failed to fetch pull requests: {response.status}[/]", 
-                                              title="[red]Error", border_style="red"))
-                            return
-                progress.update(task, description=f"✅ Found {len(prs)} pull requests!")
-                # Display PRs
-                if not prs:
-                    console.print(Panel("[yellow]No pull requests found.[/]", 
-                                      title="[blue]Pull Requests", border_style="blue"))
-                    return
-                table = Table(
-                    title=f"[bold blue]GitHub Pull Requests[/]\n[dim]Found {len(prs)} pull requests[/]",
-                    show_header=True,
-                    header_style="bold magenta",
-                    box=box.ROUNDED,
-                    border_style="blue"
-                )
-                table.add_column("#", style="cyan", no_wrap=True)
-                table.add_column("Title", style="green")
-                table.add_column("State", style="yellow")
-                table.add_column("User", style="white")
-                table.add_column("Created", style="dim")
-                table.add_column("URL", style="blue")
-                for i, pr in enumerate(prs[:limit], 1):
-                    table.add_row(
-                        f"[bold]{i}[/]",
-                        pr.get('title', 'No title'),
-                        pr.get('state', ''),
-                        pr.get('user', {}).get('login', ''),
-                        pr.get('created_at', '')[:10],
-                        pr.get('html_url', '')
-                    )
-                console.print(table)
+            url = f"{self.api_base}/repos/{repo_full_name}/pulls"
+            params = {
+                'state': state,
+                'per_page': min(limit, 100)
+            }
+            if label is not None:
+                params['labels'] = label
+            if assignee is not None:
+                params['assignee'] = assignee
+            try:
+                if self.graphql is not None:
+                    prs = await self.graphql.search_issues(repo_full_name, 'pr', state, limit, label, assignee)
+                else:
+                    prs = await self.client.paginate(url, params, limit=limit, project=IssueRecord.page)
+            except GitHubAPIError as e:
+                progress.update(task, description="❌ Failed to fetch pull requests")
+                console.print(Panel(f"[bold red]❌ Failed to fetch pull requests: {e.status}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            except GraphQLError as e:
+                progress.update(task, description="❌ Failed to fetch pull requests")
+                console.print(Panel(f"[bold red]❌ Failed to fetch pull requests: {e}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            progress.update(task, description=f"✅ Found {len(prs)} pull requests!")
+        self.display_issues(prs[:limit], 'pr')
+
+    def display_issues(self, items: List[Dict[str, Any]], kind: str = 'issue'):
+        """Display issues (kind 'issue') or pull requests (kind 'pr') in a table"""
+        title, noun = ("Pull Requests", "pull requests") if kind == 'pr' else ("Issues", "issues")
+        if not items:
+            console.print(Panel(f"[yellow]No {noun} found.[/]", 
+                              title=f"[blue]{title}", border_style="blue"))
+            return
+        table = Table(
+            title=f"[bold blue]GitHub {title}[/]\n[dim]Found {len(items)} {noun}[/]",
+            show_header=True,
+            header_style="bold magenta",
+            box=box.ROUNDED,
+            border_style="blue"
+        )
+        table.add_column("#", style="cyan", no_wrap=True)
+        table.add_column("Title", style="green")
+        table.add_column("State", style="yellow")
+        table.add_column("User", style="white")
+        table.add_column("Created", style="dim")
+        table.add_column("URL", style="blue")
+        for i, item in enumerate(items, 1):
+            table.add_row(
+                f"[bold]{i}[/]",
+                item.get('title', 'No title'),
+                item.get('state', ''),
+                item.get('user', {}).get('login', ''),
+                item.get('created_at', '')[:10],
+                item.get('html_url', '')
+            )
+        console.print(table)
+
+    async def sync_issues(self, repo_full_name: str) -> Optional[Dict[str, int]]:
+        """Mirror a repository's issues, pull requests and comments locally (incremental after the first run)"""
+        if not self.auth.is_authenticated():
+            console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return None
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Syncing issues and pull requests for {repo_full_name}...", total=None)
+            try:
+                synced = await self.mirror.sync(self.client, repo_full_name)
+            except GitHubAPIError as e:
+                progress.update(task, description="❌ Sync failed")
+                console.print(Panel(f"[bold red]❌ Failed to sync {repo_full_name}: {e.status}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return None
+            progress.update(task, description=f"✅ Synced {synced['items']} issues and pull requests, "
+                                              f"{synced['comments']} comments")
+        return synced
+
+    def list_mirrored(self, repo_full_name: str, kind: str = 'issue', state: str = 'open', limit: int = 20,
+                      label: Optional[str] = None, assignee: Optional[str] = None, text: Optional[str] = None,
+                      sort: str = 'created'):
+        """List issues or pull requests from the local mirror; works offline"""
+        if repo_full_name not in self.mirror.repositories():
+            console.print(Panel(f"[bold red]❌ {repo_full_name} is not mirrored. Run 'github sync --repo {repo_full_name}' first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return
+        items = self.mirror.query(repo_full_name, kind, state, label, assignee, text, sort, limit)
+        self.display_issues(items, kind)
 
     async def create_pull_request(self, repo_full_name: str, title: str, head: str, base: str, body: str = ""):
         """Create a new pull request"""
@@ -609,29 +754,24 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Creating pull request in {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/pulls"
-                data = {
-                    'title': title,
-                    'head': head,
-                    'base': base,
-                    'body': body or ""
-                }
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status == 201:
-                        pr = await response.json()
-                        progress.update(task, description="✅ Pull request created!")
-                        console.print(Panel(f"[bold green]✅ Pull request created successfully![/]\n[dim]URL:[/] {pr.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to create pull request")
-                        console.print(Panel(f"[bold red]❌ Failed to create pull request: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/pulls"
+            data = {
+                'title': title,
+                'head': head,
+                'base': base,
+                'body': body or ""
+            }
+            async with self.client.post(url, json=data) as response:
+                if response.status == 201:
+                    pr = await response.json()
+                    progress.update(task, description="✅ Pull request created!")
+                    console.print(Panel(f"[bold green]✅ Pull request created successfully![/]\n[dim]URL:[/] {pr.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to create pull request")
+                    console.print(Panel(f"[bold red]❌ Failed to create pull request: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def comment_pull_request(self, repo_full_name: str, pr_number: int, body: str):
         """Comment on a pull request (issue comments API)"""
@@ -649,24 +789,19 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Closing pull request #{pr_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/pulls/{pr_number}"
-                data = {'state': 'closed'}
-                async with session.patch(url, json=data, headers=headers) as response:
-                    if response.status == 200:
-                        pr = await response.json()
-                        progress.update(task, description="✅ Pull request closed!")
-                        console.print(Panel(f"[bold green]✅ Pull request closed![/]\n[dim]URL:[/] {pr.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to close pull request")
-                        console.print(Panel(f"[bold red]❌ Failed to close pull request: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/pulls/{pr_number}"
+            data = {'state': 'closed'}
+            async with self.client.patch(url, json=data) as response:
+                if response.status == 200:
+                    pr = await response.json()
+                    progress.update(task, description="✅ Pull request closed!")
+                    console.print(Panel(f"[bold green]✅ Pull request closed![/]\n[dim]URL:[/] {pr.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to close pull request")
+                    console.print(Panel(f"[bold red]❌ Failed to close pull request: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def merge_pull_request(self, repo_full_name: str, pr_number: int, method: str = 'merge'):
         """Merge a pull request"""
@@ -680,24 +815,19 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Merging pull request #{pr_number}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/pulls/{pr_number}/merge"
-                data = {'merge_method': method}
-                async with session.put(url, json=data, headers=headers) as response:
-                    if response.status == 200:
-                        merge_result = await response.json()
-                        progress.update(task, description="✅ Pull request merged!")
-                        console.print(Panel(f"[bold green]✅ Pull request merged![/]\n[dim]Message:[/] {merge_result.get('message', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to merge pull request")
-                        console.print(Panel(f"[bold red]❌ Failed to merge pull request: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/pulls/{pr_number}/merge"
+            data = {'merge_method': method}
+            async with self.client.put(url, json=data) as response:
+                if response.status == 200:
+                    merge_result = await response.json()
+                    progress.update(task, description="✅ Pull request merged!")
+                    console.print(Panel(f"[bold green]✅ Pull request merged![/]\n[dim]Message:[/] {merge_result.get('message', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to merge pull request")
+                    console.print(Panel(f"[bold red]❌ Failed to merge pull request: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def assign_pull_request(self, repo_full_name: str, pr_number: int, user: str):
         """Assign a user to a pull request (issue assignees API)"""
@@ -719,51 +849,142 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task("Fetching notifications...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/notifications"
-                params = {'all': str(all).lower()}
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        notifications = await response.json()
-                        progress.update(task, description=f"✅ Found {len(notifications)} notifications!")
-                        if not notifications:
-                            console.print(Panel("[yellow]No notifications found.[/]", 
-                                              title="[blue]Notifications", border_style="blue"))
-                            return
-                        table = Table(
-                            title=f"[bold blue]GitHub Notifications[/]\n[dim]Found {len(notifications)} notifications[/]",
-                            show_header=True,
-                            header_style="bold magenta",
-                            box=box.ROUNDED,
-                            border_style="blue"
+            url = f"{self.api_base}/notifications"
+            params = {'all': str(all).lower()}
+            async with self.client.get(url, params=params) as response:
+                if response.status == 200:
+                    notifications = await response.json()
+                    progress.update(task, description=f"✅ Found {len(notifications)} notifications!")
+                    if not notifications:
+                        console.print(Panel("[yellow]No notifications found.[/]", 
+                                          title="[blue]Notifications", border_style="blue"))
+                        return
+                    table = Table(
+                        title=f"[bold blue]GitHub Notifications[/]\n[dim]Found {len(notifications)} notifications[/]",
+                        show_header=True,
+                        header_style="bold magenta",
+                        box=box.ROUNDED,
+                        border_style="blue"
+                    )
+                    table.add_column("#", style="cyan", no_wrap=True)
+                    table.add_column("Reason", style="green")
+                    table.add_column("Repository", style="yellow")
+                    table.add_column("Subject", style="white")
+                    table.add_column("Type", style="dim")
+                    table.add_column("Updated", style="blue")
+                    table.add_column("ID", style="magenta")
+                    for i, n in enumerate(notifications, 1):
+                        table.add_row(
+                            f"[bold]{i}[/]",
+                            n.get('reason', ''),
+                            n.get('repository', {}).get('full_name', ''),
+                            n.get('subject', {}).get('title', ''),
+                            n.get('subject', {}).get('type', ''),
+                            n.get('updated_at', '')[:10],
+                            n.get('id', '')
                         )
-                        table.add_column("#", style="cyan", no_wrap=True)
-                        table.add_column("Reason", style="green")
-                        table.add_column("Repository", style="yellow")
-                        table.add_column("Subject", style="white")
-                        table.add_column("Type", style="dim")
-                        table.add_column("Updated", style="blue")
-                        table.add_column("ID", style="magenta")
-                        for i, n in enumerate(notifications, 1):
-                            table.add_row(
-                                f"[bold]{i}[/]",
-                                n.get('reason', ''),
-                                n.get('repository', {}).get('full_name', ''),
-                                n.get('subject', {}).get('title', ''),
-                                n.get('subject', {}).get('type', ''),
-                                n.get('updated_at', '')[:10],
-                                n.get('id', '')
-                            )
-                        console.print(table)
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to fetch notifications")
-                        console.print(Panel(f"[bold red]❌ Failed to fetch notifications: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+                    console.print(table)
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to fetch notifications")
+                    console.print(Panel(f"[bold red]❌ Failed to fetch notifications: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
+
+    def display_notification_changes(self, threads: List[Dict[str, Any]]):
+        """One line per new or updated notification"""
+        for thread in threads:
+            console.print(f"[blue]{thread.get('updated_at', '')[:16].replace('T', ' ')}[/] "
+                          f"[yellow]{(thread.get('repository') or {}).get('full_name', '')}[/] "
+                          f"{(thread.get('subject') or {}).get('title', '')} "
+                          f"[dim]({thread.get('reason', '')}, {(thread.get('subject') or {}).get('type', '')}, "
+                          f"id {thread.get('id', '')})[/]")
+
+    async def watch_notifications(self, all: bool = False, min_interval: float = 0, max_polls: Optional[int] = None,
+                                  stop: Optional[asyncio.Event] = None) -> Optional[NotificationWatcher]:
+        """Show notifications as they arrive until interrupted
+
+        Polls with If-Modified-Since at the X-Poll-Interval GitHub asks for, so
+        an idle feed costs only 304 responses, which do not use rate limit.
+        """
+        if not self.auth.is_authenticated():
+            console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return None
+        watcher = NotificationWatcher(self.client, self.notification_store, all, min_interval)
+        console.print(Panel("[bold blue]Watching GitHub notifications...[/]\n[dim]Press Ctrl+C to stop.[/]", 
+                          title="[blue]Notifications", border_style="blue"))
+        try:
+            await watcher.watch(self.display_notification_changes, stop, max_polls, self._notification_poll_failed)
+        except GitHubAPIError as e:
+            console.print(Panel(f"[bold red]❌ Failed to fetch notifications: {e.status}[/]", 
+                              title="[red]Error", border_style="red"))
+        except asyncio.CancelledError:
+            pass
+        console.print(f"[dim]{watcher.polls} polls, {watcher.not_modified} unchanged (no quota used)[/]")
+        return watcher
+
+    @staticmethod
+    def _notification_poll_failed(error: Exception, retry_in: float):
+        reason = f"GitHub API returned {error.status}" if isinstance(error, GitHubAPIError) else (str(error) or type(error).__name__)
+        console.print(f"[yellow]⚠️  Polling notifications failed ({reason}); retrying in {retry_in:.0f}s[/]")
+
+    def webhook_applier(self) -> WebhookApplier:
+        """Applies webhook events to the mirror and the HTTP cache of this client"""
+        return WebhookApplier(self.mirror, self.client.cache, self.api_base)
+
+    async def serve_webhooks(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, secret: Optional[str] = None,
+                             stop: Optional[asyncio.Event] = None, insecure: bool = False) -> Optional[WebhookReceiver]:
+        """Receive webhook deliveries until interrupted, keeping mirrored repositories current
+
+        Point a repository or organization webhook (or a forwarder such as
+        'gh webhook forward') at http://HOST:PORT/webhook.
+        """
+        receiver = WebhookReceiver(self.webhook_applier(), secret, insecure=insecure)
+        if not receiver.secret:
+            if not insecure:
+                console.print(Panel(f"[bold red]❌ No webhook secret set. Pass --secret or set {WEBHOOK_SECRET_ENV}, "
+                                    f"or --insecure to accept unsigned deliveries.[/]",
+                                  title="[red]Error", border_style="red"))
+                return None
+            console.print("[yellow]⚠️  --insecure: deliveries are not verified.[/]")
+        try:
+            url = await receiver.start(host, port)
+        except OSError as e:
+            console.print(Panel(f"[bold red]❌ Cannot listen on {host}:{port}: {e.strerror}[/]", 
+                              title="[red]Error", border_style="red"))
+            return None
+        console.print(Panel(f"[bold blue]Receiving webhooks on {url}[/]\n"
+                            f"[dim]Mirrored: {', '.join(self.mirror.repositories()) or 'none'}. Press Ctrl+C to stop.[/]", 
+                          title="[blue]Webhooks", border_style="blue"))
+        try:
+            await (stop or asyncio.Event()).wait()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await receiver.stop()
+        console.print(f"[dim]{receiver.applier.applied} events applied, {receiver.rejected} rejected[/]")
+        return receiver
+
+    def replay_webhooks(self, paths: List[str]) -> List[Dict[str, Any]]:
+        """Apply recorded webhook deliveries to the mirror and cache"""
+        try:
+            results = replay(self.webhook_applier(), paths)
+        except (OSError, ValueError, KeyError) as e:
+            console.print(Panel(f"[bold red]❌ Cannot replay webhook deliveries: {e}[/]", 
+                              title="[red]Error", border_style="red"))
+            return []
+        table = Table(title="Replayed Webhook Deliveries")
+        table.add_column("Event", style="cyan")
+        table.add_column("Action", style="yellow")
+        table.add_column("Repository", style="green")
+        table.add_column("Mirrored", style="magenta", justify="right")
+        table.add_column("Cache Dropped", style="blue", justify="right")
+        for result in results:
+            table.add_row(result['event'], result.get('action') or '', result.get('repo') or '',
+                          'duplicate' if result.get('duplicate') else str(result['mirrored']),
+                          str(result.get('invalidated', 0)))
+        console.print(table)
+        return results
 
     async def mark_notifications_as_read(self, thread_id: str = '', mark_all: bool = False):
         """Mark notifications as read (all or by thread ID)"""
@@ -778,40 +999,30 @@ class GitHubRepos:
         ) as progress:
             if mark_all:
                 task = progress.add_task("Marking all notifications as read...", total=None)
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'Authorization': f'token {self.auth.get_access_token()}',
-                        'Accept': 'application/vnd.github.v3+json'
-                    }
-                    url = f"{self.api_base}/notifications"
-                    async with session.put(url, headers=headers) as response:
-                        if response.status == 205:
-                            progress.update(task, description="✅ All notifications marked as read!")
-                            console.print(Panel("[bold green]✅ All notifications marked as read![/]", 
-                                              title="[green]Success", border_style="green"))
-                        else:
-                            error_text = await response.text()
-                            progress.update(task, description="❌ Failed to mark all as read")
-                            console.print(Panel(f"[bold red]❌ Failed to mark all as read: {response.status}[/]\n{error_text}", 
-                                              title="[red]Error", border_style="red"))
+                url = f"{self.api_base}/notifications"
+                async with self.client.put(url) as response:
+                    if response.status == 205:
+                        progress.update(task, description="✅ All notifications marked as read!")
+                        console.print(Panel("[bold green]✅ All notifications marked as read![/]", 
+                                          title="[green]Success", border_style="green"))
+                    else:
+                        error_text = await response.text()
+                        progress.update(task, description="❌ Failed to mark all as read")
+                        console.print(Panel(f"[bold red]❌ Failed to mark all as read: {response.status}[/]\n{error_text}", 
+                                          title="[red]Error", border_style="red"))
             elif thread_id:
                 task = progress.add_task(f"Marking notification {thread_id} as read...", total=None)
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'Authorization': f'token {self.auth.get_access_token()}',
-                        'Accept': 'application/vnd.github.v3+json'
-                    }
-                    url = f"{self.api_base}/notifications/threads/{thread_id}"
-                    async with session.patch(url, headers=headers) as response:
-                        if response.status == 205:
-                            progress.update(task, description="✅ Notification marked as read!")
-                            console.print(Panel(f"[bold green]✅ Notification {thread_id} marked as read![/]", 
-                                              title="[green]Success", border_style="green"))
-                        else:
-                            error_text = await response.text()
-                            progress.update(task, description="❌ Failed to mark as read")
-                            console.print(Panel(f"[bold red]❌ Failed to mark as read: {response.status}[/]\n{error_text}", 
-                                              title="[red]Error", border_style="red"))
+                url = f"{self.api_base}/notifications/threads/{thread_id}"
+                async with self.client.patch(url) as response:
+                    if response.status == 205:
+                        progress.update(task, description="✅ Notification marked as read!")
+                        console.print(Panel(f"[bold green]✅ Notification {thread_id} marked as read![/]", 
+                                          title="[green]Success", border_style="green"))
+                    else:
+                        error_text = await response.text()
+                        progress.update(task, description="❌ Failed to mark as read")
+                        console.print(Panel(f"[bold red]❌ Failed to mark as read: {response.status}[/]\n{error_text}", 
+                                          title="[red]Error", border_style="red"))
             else:
                 console.print(Panel("[bold red]❌ Please specify a thread ID or use --all to mark all as read.[/]", 
                                   title="[red]Error", border_style="red"))
@@ -828,60 +1039,46 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Fetching releases for {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/releases"
-                params = {'per_page': min(limit, 100), 'page': 1}
-                releases = []
-                while len(releases) < limit:
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            page_releases = await response.json()
-                            if not page_releases:
-                                break
-                            releases.extend(page_releases)
-                            if len(page_releases) < params['per_page']:
-                                break
-                            params['page'] += 1
-                        else:
-                            progress.update(task, description="❌ Failed to fetch releases")
-                            console.print(Panel(f"[bold red]❌ Failed to fetch releases: {response.status}[/]", 
-                                              title="[red]Error", border_style="red"))
-                            return
-                progress.update(task, description=f"✅ Found {len(releases)} releases!")
-                # Display releases
-                if not releases:
-                    console.print(Panel("[yellow]No releases found.[/]", 
-                                      title="[blue]Releases", border_style="blue"))
-                    return
-                table = Table(
-                    title=f"[bold blue]GitHub Releases[/]\n[dim]Found {len(releases)} releases[/]",
-                    show_header=True,
-                    header_style="bold magenta",
-                    box=box.ROUNDED,
-                    border_style="blue"
+            url = f"{self.api_base}/repos/{repo_full_name}/releases"
+            params = {'per_page': min(limit, 100)}
+            try:
+                releases = await self.client.paginate(url, params, limit=limit)
+            except GitHubAPIError as e:
+                progress.update(task, description="❌ Failed to fetch releases")
+                console.print(Panel(f"[bold red]❌ Failed to fetch releases: {e.status}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            progress.update(task, description=f"✅ Found {len(releases)} releases!")
+            # Display releases
+            if not releases:
+                console.print(Panel("[yellow]No releases found.[/]", 
+                                  title="[blue]Releases", border_style="blue"))
+                return
+            table = Table(
+                title=f"[bold blue]GitHub Releases[/]\n[dim]Found {len(releases)} releases[/]",
+                show_header=True,
+                header_style="bold magenta",
+                box=box.ROUNDED,
+                border_style="blue"
+            )
+            table.add_column("#", style="cyan", no_wrap=True)
+            table.add_column("Tag", style="green")
+            table.add_column("Title", style="yellow")
+            table.add_column("Draft", style="white")
+            table.add_column("Prerelease", style="dim")
+            table.add_column("Created", style="blue")
+            table.add_column("URL", style="magenta")
+            for i, rel in enumerate(releases[:limit], 1):
+                table.add_row(
+                    f"[bold]{i}[/]",
+                    rel.get('tag_name', ''),
+                    rel.get('name', ''),
+                    str(rel.get('draft', False)),
+                    str(rel.get('prerelease', False)),
+                    rel.get('created_at', '')[:10],
+                    rel.get('html_url', '')
                 )
-                table.add_column("#", style="cyan", no_wrap=True)
-                table.add_column("Tag", style="green")
-                table.add_column("Title", style="yellow")
-                table.add_column("Draft", style="white")
-                table.add_column("Prerelease", style="dim")
-                table.add_column("Created", style="blue")
-                table.add_column("URL", style="magenta")
-                for i, rel in enumerate(releases[:limit], 1):
-                    table.add_row(
-                        f"[bold]{i}[/]",
-                        rel.get('tag_name', ''),
-                        rel.get('name', ''),
-                        str(rel.get('draft', False)),
-                        str(rel.get('prerelease', False)),
-                        rel.get('created_at', '')[:10],
-                        rel.get('html_url', '')
-                    )
-                console.print(table)
+            console.print(table)
 
     async def create_release(self, repo_full_name: str, tag: str, title: str, body: str = '', draft: bool = False, prerelease: bool = False):
         """Create a new release for a given repository"""
@@ -895,30 +1092,25 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Creating release in {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                url = f"{self.api_base}/repos/{repo_full_name}/releases"
-                data = {
-                    'tag_name': tag,
-                    'name': title,
-                    'body': body or '',
-                    'draft': draft,
-                    'prerelease': prerelease
-                }
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status == 201:
-                        release = await response.json()
-                        progress.update(task, description="✅ Release created!")
-                        console.print(Panel(f"[bold green]✅ Release created successfully![/]\n[dim]URL:[/] {release.get('html_url', '')}", 
-                                          title="[green]Success", border_style="green"))
-                    else:
-                        error_text = await response.text()
-                        progress.update(task, description="❌ Failed to create release")
-                        console.print(Panel(f"[bold red]❌ Failed to create release: {response.status}[/]\n{error_text}", 
-                                          title="[red]Error", border_style="red"))
+            url = f"{self.api_base}/repos/{repo_full_name}/releases"
+            data = {
+                'tag_name': tag,
+                'name': title,
+                'body': body or '',
+                'draft': draft,
+                'prerelease': prerelease
+            }
+            async with self.client.post(url, json=data) as response:
+                if response.status == 201:
+                    release = await response.json()
+                    progress.update(task, description="✅ Release created!")
+                    console.print(Panel(f"[bold green]✅ Release created successfully![/]\n[dim]URL:[/] {release.get('html_url', '')}", 
+                                      title="[green]Success", border_style="green"))
+                else:
+                    error_text = await response.text()
+                    progress.update(task, description="❌ Failed to create release")
+                    console.print(Panel(f"[bold red]❌ Failed to create release: {response.status}[/]\n{error_text}", 
+                                      title="[red]Error", border_style="red"))
 
     async def list_stats(self, repo_full_name: str):
         """Show repository stats: stars, forks, watchers, contributors"""
@@ -932,41 +1124,100 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Fetching stats for {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                # Repo info
-                url = f"{self.api_base}/repos/{repo_full_name}"
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        repo = await response.json()
-                        stars = repo.get('stargazers_count', 0)
-                        forks = repo.get('forks_count', 0)
-                        watchers = repo.get('subscribers_count', 0)
-                    else:
-                        progress.update(task, description="❌ Failed to fetch repo info")
-                        console.print(Panel(f"[bold red]❌ Failed to fetch repo info: {response.status}[/]", 
-                                          title="[red]Error", border_style="red"))
-                        return
-                # Contributors
-                url = f"{self.api_base}/repos/{repo_full_name}/contributors"
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        contributors = await response.json()
-                        num_contributors = len(contributors)
-                    else:
-                        num_contributors = 'N/A'
-                progress.update(task, description="✅ Stats fetched!")
-                table = Table(title=f"[bold blue]Repository Stats for {repo_full_name}[/]", box=box.ROUNDED, border_style="blue")
-                table.add_column("Metric", style="cyan", no_wrap=True)
-                table.add_column("Value", style="green")
-                table.add_row("Stars", str(stars))
-                table.add_row("Forks", str(forks))
-                table.add_row("Watchers", str(watchers))
-                table.add_row("Contributors", str(num_contributors))
-                console.print(table)
+            try:
+                # Repo counters and contributors in parallel
+                repo, num_contributors = await asyncio.gather(
+                    self._repo_counters(repo_full_name), self._count_contributors(repo_full_name)
+                )
+            except (GitHubAPIError, GraphQLError) as e:
+                progress.update(task, description="❌ Failed to fetch repo info")
+                console.print(Panel(f"[bold red]❌ Failed to fetch repo info: {getattr(e, 'status', e)}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+            stars = repo.get('stargazers_count', 0)
+            forks = repo.get('forks_count', 0)
+            watchers = repo.get('subscribers_count', 0)
+            progress.update(task, description="✅ Stats fetched!")
+            table = Table(title=f"[bold blue]Repository Stats for {repo_full_name}[/]", box=box.ROUNDED, border_style="blue")
+            table.add_column("Metric", style="cyan", no_wrap=True)
+            table.add_column("Value", style="green")
+            table.add_row("Stars", str(stars))
+            table.add_row("Forks", str(forks))
+            table.add_row("Watchers", str(watchers))
+            table.add_row("Contributors", str(num_contributors))
+            console.print(table)
+
+    async def _repo_counters(self, repo_full_name: str) -> Dict[str, Any]:
+        if self.graphql is not None:
+            return await self.graphql.repo_stats(repo_full_name)
+        repo, _ = await self.client.get_json(f"{self.api_base}/repos/{repo_full_name}")
+        return repo
+
+    async def _count_contributors(self, repo_full_name: str):
+        count = await count_listing(self.client, f"{self.api_base}/repos/{repo_full_name}/contributors", {'anon': 'true'})
+        return 'N/A' if count is None else count
+
+    async def stats_report(self, repo_names: List[str], sort: str = 'stars', output: Optional[str] = None,
+                           concurrency: int = STATS_CONCURRENCY) -> List[Dict[str, Any]]:
+        """Stats of many repositories in one table, sorted by a column; optionally saved as JSON or CSV"""
+        if not self.auth.is_authenticated():
+            console.print(Panel("[bold red]❌ Not authenticated. Please login first.[/]", 
+                              title="[red]Error", border_style="red"))
+            return []
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(f"Fetching stats for {len(repo_names)} repositories...", total=len(repo_names))
+            rows = await PortfolioStats(self.client, concurrency).run(
+                repo_names, on_done=lambda row: progress.advance(task))
+            failed = sum(1 for row in rows if row['error'])
+            progress.update(task, description=f"{'❌' if failed else '✅'} Stats for "
+                                              f"{len(rows) - failed} of {len(rows)} repositories")
+        rows = sort_report(rows, sort)
+
+        table = Table(
+            title=f"[bold blue]Repository Stats[/]\n[dim]{len(rows)} repositories, sorted by {sort}[/]",
+            show_header=True,
+            header_style="bold magenta",
+            box=box.ROUNDED,
+            border_style="blue",
+            show_footer=True
+        )
+        totals = report_totals(rows)
+        headers = {'repo': "Repository", 'stars': "Stars", 'forks': "Forks", 'watchers': "Watch",
+                   'contributors': "Contrib", 'open_issues': "Issues", 'open_prs': "PRs",
+                   'commits_year': "Commits/1y", 'releases_year': "Releases/1y",
+                   'release_interval': "Days/release", 'last_release': "Last release"}
+        for field in REPORT_FIELDS:
+            if field == 'repo':
+                table.add_column(headers[field], footer=totals[field], style="cyan", no_wrap=True)
+            else:
+                table.add_column(headers[field], footer=str(totals.get(field, '')), justify="right")
+        for row in rows:
+            if not row['error']:
+                table.add_row(*('–' if row[field] is None else str(row[field]) for field in REPORT_FIELDS))
+        console.print(table)
+        errors = [f"{row['repo']}: {row['error']}" for row in rows if row['error']]
+        if errors:
+            console.print(Panel("[bold red]❌ " + "\n❌ ".join(errors) + "[/]",
+                              title="[red]Failed repositories", border_style="red"))
+
+        if output:
+            path = Path(output).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', newline='') as f:
+                if path.suffix.lower() == '.csv':
+                    writer = csv.DictWriter(f, fieldnames=[*REPORT_FIELDS, 'error'])
+                    writer.writeheader()
+                    writer.writerows(rows)
+                else:
+                    json.dump(rows, f, indent=2)
+            console.print(f"[green]✅ Report saved to {path}[/]")
+        return rows
 
     async def list_branches_graph(self, repo_full_name: str):
         """Show a simple branch graph for the repository (based on recent commits and branches)"""
@@ -980,41 +1231,53 @@ class GitHubRepos:
             console=console,
         ) as progress:
             task = progress.add_task(f"Fetching branches and commits for {repo_full_name}...", total=None)
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    'Authorization': f'token {self.auth.get_access_token()}',
-                    'Accept': 'application/vnd.github.v3+json'
-                }
-                # Get branches
-                url = f"{self.api_base}/repos/{repo_full_name}/branches"
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        branches = await response.json()
-                    else:
-                        progress.update(task, description="❌ Failed to fetch branches")
-                        console.print(Panel(f"[bold red]❌ Failed to fetch branches: {response.status}[/]", 
-                                          title="[red]Error", border_style="red"))
-                        return
-                # Get recent commits for each branch (limit to 10 per branch)
-                branch_commits = {}
-                for branch in branches:
-                    branch_name = branch['name']
-                    url = f"{self.api_base}/repos/{repo_full_name}/commits"
-                    params = {'sha': branch_name, 'per_page': 10}
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            commits = await response.json()
-                            branch_commits[branch_name] = commits
-                        else:
-                            branch_commits[branch_name] = []
-                progress.update(task, description="✅ Branches and commits fetched!")
-                # Render a simple graph (just show branch names and their latest commit SHAs)
-                from rich.tree import Tree
-                tree = Tree(f"[bold blue]Branches in {repo_full_name}[/]")
-                for branch, commits in branch_commits.items():
-                    branch_node = tree.add(f"[green]{branch}[/]")
-                    for commit in commits:
-                        sha = commit.get('sha', '')[:7]
-                        msg = commit.get('commit', {}).get('message', '').split('\n')[0][:40]
-                        branch_node.add(f"[cyan]{sha}[/] [dim]{msg}[/]")
-                console.print(tree) 
\ No newline at end of file
+            if self.graphql is not None:
+                # One query covers every branch and its recent history
+                try:
+                    branch_commits = await self.graphql.branch_graph(repo_full_name, commits=10)
+                except (GitHubAPIError, GraphQLError) as e:
+                    progress.update(task, description="❌ Failed to fetch branches")
+                    console.print(Panel(f"[bold red]❌ Failed to fetch branches: {getattr(e, 'status', e)}[/]", 
+                                      title="[red]Error", border_style="red"))
+                    return
+            else:
+                branch_commits = await self._rest_branch_commits(repo_full_name, progress, task)
+                if branch_commits is None:
+                    return
+            progress.update(task, description="✅ Branches and commits fetched!")
+            # Render a simple graph (just show branch names and their latest commit SHAs)
+            from rich.tree import Tree
+            tree = Tree(f"[bold blue]Branches in {repo_full_name}[/]")
+            for branch, commits in branch_commits.items():
+                branch_node = tree.add(f"[green]{branch}[/]")
+                for commit in commits:
+                    sha = commit.get('sha', '')[:7]
+                    msg = commit.get('commit', {}).get('message', '').split('\n')[0][:40]
+                    branch_node.add(f"[cyan]{sha}[/] [dim]{msg}[/]")
+            console.print(tree)
+
+    async def _rest_branch_commits(self, repo_full_name: str, progress, task) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Branches, then recent commits per branch: one REST request each"""
+        # Get branches
+        url = f"{self.api_base}/repos/{repo_full_name}/branches"
+        async with self.client.get(url) as response:
+            if response.status == 200:
+                branches = await response.json()
+            else:
+                progress.update(task, description="❌ Failed to fetch branches")
+                console.print(Panel(f"[bold red]❌ Failed to fetch branches: {response.status}[/]", 
+                                  title="[red]Error", border_style="red"))
+                return
+        # Get recent commits for each branch (limit to 10 per branch)
+        branch_commits = {}
+        for branch in branches:
+            branch_name = branch['name']
+            url = f"{self.api_base}/repos/{repo_full_name}/commits"
+            params = {'sha': branch_name, 'per_page': 10}
+            async with self.client.get(url, params=params) as response:
+                if response.status == 200:
+                    commits = await response.json()
+                    branch_commits[branch_name] = commits
+                else:
+                    branch_commits[branch_name] = []
+        return branch_commits 
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+GitHub Webhooks Module
+Local webhook receiver that applies push, pull_request, issues and release events to the mirror and HTTP cache
+"""
+
+import argparse
+import hashlib
+import hmac
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+from aiohttp import web
+
+from .client import API_BASE
+from .http_cache import HTTPCache
+from .mirror import IssueMirror
+
+# Shared secret configured on the webhook (or the forwarder)
+WEBHOOK_SECRET_ENV = "GITFLOW_STUDIO_WEBHOOK_SECRET"
+DEFAULT_PORT = 8787
+
+# Delivery ids remembered to drop redeliveries
+SEEN_DELIVERIES = 1024
+
+# Cached API paths under /repos/{repo} that each event makes stale ('' is the repository itself)
+STALE_PATHS = {
+    'push': ('', 'branches', 'commits', 'git', 'contents', 'compare', 'stats', 'readme'),
+    'release': ('', 'releases', 'tags'),
+    # Pull requests are listed (and mirrored) as issues too
+    'pull_request': ('pulls', 'issues'),
+    'issues': ('issues',),
+    'issue_comment': ('issues',),
+}
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check an X-Hub-Signature-256 header ('sha256=<hex HMAC of the body>')"""
+    if not signature or not signature.startswith('sha256='):
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len('sha256='):])
+
+
+def sign(secret: str, body: bytes) -> str:
+    """X-Hub-Signature-256 value for a body, as GitHub computes it"""
+    return 'sha256=' + hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+
+def _pull_request_as_issue(pull_request: Dict[str, Any]) -> Dict[str, Any]:
+    """A pull_request payload in the shape /issues returns, which the mirror stores"""
+    return {**pull_request, 'pull_request': {'url': pull_request.get('url', '')}}
+
+
+class WebhookApplier:
+    """Applies webhook events to the local issue mirror and HTTP cache"""
+
+    def __init__(self, mirror: Optional[IssueMirror] = None, cache: Optional[HTTPCache] = None,
+                 api_base: str = API_BASE):
+        self.mirror = mirror
+        self.cache = cache
+        self.api_base = api_base.rstrip('/')
+        self.applied = 0
+        self._seen: 'OrderedDict[str, None]' = OrderedDict()
+
+    def apply(self, event: str, payload: Dict[str, Any], delivery: Optional[str] = None) -> Dict[str, Any]:
+        """Apply one event; returns what changed"""
+        if delivery:
+            if delivery in self._seen:
+                return {'event': event, 'duplicate': True}
+            self._seen[delivery] = None
+            if len(self._seen) > SEEN_DELIVERIES:
+                self._seen.popitem(last=False)
+
+        repo = (payload.get('repository') or {}).get('full_name')
+        result = {'event': event, 'action': payload.get('action'), 'repo': repo, 'mirrored': 0, 'invalidated': 0}
+        if repo is None:
+            return result
+        self.applied += 1
+
+        # Only repositories that were synced are kept current; a partial copy of
+        # another one would look like a complete mirror
+        if self.mirror is not None and repo in self.mirror.repositories():
+            result['mirrored'] = self._apply_to_mirror(event, payload, repo)
+        if self.cache is not None:
+            for path in STALE_PATHS.get(event, ()):
+                url = f"{self.api_base}/repos/{repo}/{path}".rstrip('/')
+                result['invalidated'] += self.cache.invalidate(url, children=bool(path))
+        return result
+
+    def _apply_to_mirror(self, event: str, payload: Dict[str, Any], repo: str) -> int:
+        action = payload.get('action')
+        if event == 'issues':
+            if action == 'deleted':
+                self.mirror.delete_item(repo, payload['issue']['number'])
+                return 1
+            return self.mirror.store_items(repo, [payload['issue']], advance=False)
+        if event == 'pull_request':
+            return self.mirror.store_items(repo, [_pull_request_as_issue(payload['pull_request'])], advance=False)
+        if event == 'issue_comment':
+            if action == 'deleted':
+                self.mirror.delete_comment(repo, payload['comment']['id'])
+                return 1
+            stored = self.mirror.store_comments(repo, [payload['comment']], advance=False)
+            # The comment count and updated_at of the issue change with it
+            return stored + self.mirror.store_items(repo, [payload['issue']], advance=False)
+        return 0
+
+
+class WebhookReceiver:
+    """aiohttp endpoint for GitHub webhook deliveries
+
+    Deliveries must be signed with the secret; only insecure=True accepts
+    unsigned ones.
+    """
+
+    def __init__(self, applier: WebhookApplier, secret: Optional[str] = None, path: str = '/webhook',
+                 insecure: bool = False):
+        self.applier = applier
+        self.secret = secret if secret is not None else os.environ.get(WEBHOOK_SECRET_ENV)
+        self.insecure = insecure
+        self.path = path
+        self.rejected = 0
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.read()
+        if self.secret or not self.insecure:
+            verified = bool(self.secret) and verify_signature(self.secret, body, request.headers.get('X-Hub-Signature-256'))
+        else:
+            verified = True
+        if not verified:
+            self.rejected += 1
+            return web.json_response({'message': 'Invalid signature'}, status=401)
+        event = request.headers.get('X-GitHub-Event')
+        if not event:
+            return web.json_response({'message': 'Missing X-GitHub-Event'}, status=400)
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return web.json_response({'message': 'Body is not JSON'}, status=400)
+        if event == 'ping':
+            return web.json_response({'message': 'pong'})
+        result = self.applier.apply(event, payload, request.headers.get('X-GitHub-Delivery'))
+        return web.json_response(result, status=202)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(self.path, self._handle)
+        return app
+
+    async def start(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT) -> str:
+        """Listen on host:port (0 picks a free port); returns the delivery URL
+
+        Raises ValueError without a secret unless the receiver is insecure.
+        """
+        if not self.secret and not self.insecure:
+            raise ValueError(f"A webhook secret is required (set {WEBHOOK_SECRET_ENV} or pass one); "
+                             f"use insecure=True to accept unsigned deliveries")
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        try:
+            await web.TCPSite(self._runner, host, port).start()
+        except OSError:
+            await self.stop()
+            raise
+        self.url = f"http://{host}:{self._runner.addresses[0][1]}{self.path}"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def load_fixtures(paths: List[str]) -> Iterator[Tuple[str, Dict[str, Any], Optional[str]]]:
+    """(event, payload, delivery) from recorded deliveries
+
+    A file holds one JSON object {"event": ..., "payload": ..., "delivery": ...}
+    or a list of them, or one such object per line.
+    """
+    for path in paths:
+        text = Path(path).read_text()
+        try:
+            documents = json.loads(text)
+        except ValueError:
+            documents = [json.loads(line) for line in text.splitlines() if line.strip()]
+        if isinstance(documents, dict):
+            documents = [documents]
+        for document in documents:
+            yield document['event'], document['payload'], document.get('delivery')
+
+
+def replay(applier: WebhookApplier, paths: List[str]) -> List[Dict[str, Any]]:
+    """Apply recorded deliveries in order, as if they had just arrived"""
+    return [applier.apply(event, payload, delivery) for event, payload, delivery in load_fixtures(paths)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Replay recorded GitHub webhook deliveries into a mirror')
+    parser.add_argument('mirror', help='Path of github_mirror.db')
+    parser.add_argument('fixtures', nargs='+', help='Recorded deliveries (JSON or JSON lines)')
+    args = parser.parse_args(argv)
+    mirror = IssueMirror(args.mirror)
+    try:
+        for result in replay(WebhookApplier(mirror), args.fixtures):
+            print(json.dumps(result))
+    finally:
+        mirror.close()
+
+
+if __name__ == '__main__':
+    main()
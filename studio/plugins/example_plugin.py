@@ -1,2 +1,21 @@
 def register(app_context):
-    print("[Plugin] Example CLI plugin loaded!") 
\ No newline at end of file
+    print("[Plugin] Example CLI plugin loaded!")
+
+
+class HelloCommand:
+    """`hello` command contributed by this plugin"""
+
+    HELP = 'Example plugin command'
+    REQUIRES_REPO = False
+
+    @staticmethod
+    def configure(parser):
+        parser.add_argument('--name', default='world', help='Who to greet')
+
+    @staticmethod
+    async def run(cli, args, parser):
+        print(f"[Plugin] Hello, {args.name}!")
+
+
+def register_commands(register):
+    register('hello', HelloCommand)
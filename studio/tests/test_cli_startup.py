@@ -0,0 +1,90 @@
+import unittest
+import tempfile
+import shutil
+import subprocess
+import sys
+import os
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestLazyStartup(unittest.TestCase):
+    def test_import_does_not_load_heavy_dependencies(self):
+        """Test that importing and constructing the CLI defers heavy imports"""
+        code = (
+            "import sys\n"
+            "from studio.cli import GitFlowStudioCLI\n"
+            "GitFlowStudioCLI()\n"
+            "heavy = ('git', 'aiohttp', 'keyring', 'cryptography', 'psutil', 'aiosqlite', 'tracemalloc')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_services_are_built_on_first_access(self):
+        """Test that services are only constructed when used"""
+        from studio.cli import GitFlowStudioCLI
+
+        cli = GitFlowStudioCLI()
+        self.assertFalse(cli.services.is_loaded('theme_manager'))
+        self.assertIs(cli.theme_manager, cli.theme_manager)
+        self.assertTrue(cli.services.is_loaded('theme_manager'))
+        self.assertFalse(cli.services.is_loaded('github_auth'))
+
+
+class TestStartupTime(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_record_startup_time(self):
+        """Test that startup times are aggregated into the metrics"""
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(self.temp_dir)
+        monitor.record_startup_time(0.1, budget=0.25)
+        monitor.record_startup_time(0.3, budget=0.25)
+
+        self.assertEqual(monitor.metrics["startup_time"]["count"], 2)
+        startup = PerformanceMonitor(self.temp_dir).metrics["startup_time"]
+        self.assertEqual(startup["count"], 2)
+        self.assertAlmostEqual(startup["avg"], 0.2)
+        self.assertEqual(startup["min"], 0.1)
+        self.assertEqual(startup["last"], 0.3)
+        self.assertEqual(startup["over_budget"], 1)
+
+    def test_cli_records_startup_time_at_exit(self):
+        """Test that a CLI run logs its startup time without touching the metrics file"""
+        env = dict(os.environ, HOME=self.temp_dir)
+        result = subprocess.run([sys.executable, "-m", "studio.cli", "status"], cwd=PROJECT_ROOT,
+                                env=env, capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+        config_dir = os.path.join(self.temp_dir, ".gitflow-studio")
+        self.assertFalse(os.path.exists(os.path.join(config_dir, "performance_metrics.json")))
+
+        from studio.utils.performance_monitor import PerformanceMonitor
+        self.assertEqual(PerformanceMonitor(config_dir).get_startup_stats()["count"], 1)
+
+    def test_startup_log_is_trimmed(self):
+        """Test that the startup log keeps only the newest runs"""
+        from studio.utils import startup_times
+
+        for i in range(startup_times.MAX_ENTRIES + 1500):
+            startup_times.append_startup_time(i / 1000, 0.25, self.temp_dir)
+
+        entries = startup_times.read_startup_times(self.temp_dir)
+        self.assertLessEqual(len(entries), startup_times.MAX_ENTRIES * 2)
+        self.assertAlmostEqual(entries[-1][1], (startup_times.MAX_ENTRIES + 1499) / 1000)
+        self.assertLess(startup_times.startup_log_path(self.temp_dir).stat().st_size,
+                        startup_times.MAX_LOG_BYTES + 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import tempfile
+import shutil
+import subprocess
+import sys
+import os
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+class TestCommandIndex(unittest.TestCase):
+    def test_index_is_up_to_date(self):
+        """Test that the precomputed index matches the command modules"""
+        from studio.commands import build_index, build_global_options
+        from studio.commands.index import COMMAND_INDEX, GLOBAL_OPTIONS
+
+        self.assertEqual(COMMAND_INDEX, build_index(),
+                         "Regenerate with: python -m studio.commands.index")
+        self.assertEqual(GLOBAL_OPTIONS, build_global_options())
+
+    def test_find_command_skips_global_options(self):
+        """Test locating the command word among global options"""
+        from studio.cli import create_parser, find_command
+
+        parser, _ = create_parser()
+        self.assertEqual(find_command(parser, ['--repo', 'status', 'log']), 'log')
+        self.assertEqual(find_command(parser, ['-v', '--sample-interval', '0', 'analytics', 'stats']), 'analytics')
+        self.assertIsNone(find_command(parser, ['--interactive']))
+
+    def test_only_invoked_command_is_imported(self):
+        """Test that running a command imports only that command's module"""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        code = (
+            "import sys\n"
+            "from studio.cli import main\n"
+            "sys.argv = ['gitflow-studio', 'completion', 'bash']\n"
+            "main()\n"
+            "print(sorted(m for m in sys.modules if m.startswith('studio.commands.')))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True,
+                                text=True, timeout=60, env=dict(os.environ, HOME=temp_dir))
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("complete -F _gitflow_studio gitflow-studio", result.stdout)
+        self.assertEqual(result.stdout.strip().splitlines()[-1],
+                         "['studio.commands.completion', 'studio.commands.index']")
+
+
+class TestPluginCommands(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        from studio import commands
+        commands._plugin_commands.pop('greet', None)
+        shutil.rmtree(self.temp_dir)
+
+    def test_plugin_registers_command(self):
+        """Test that plugins can add commands through register_commands()"""
+        from studio.core.plugin_loader import PluginLoader
+        from studio.commands import load_plugin_commands, command_names, command_help, load_command
+
+        (Path(self.temp_dir) / "greet_plugin.py").write_text(
+            "class Greet:\n"
+            "    HELP = 'Say hello'\n"
+            "def register_commands(register):\n"
+            "    register('greet', Greet)\n"
+        )
+        load_plugin_commands(PluginLoader(self.temp_dir))
+
+        self.assertIn('greet', command_names())
+        self.assertEqual(command_help('greet'), 'Say hello')
+        self.assertEqual(load_command('greet').HELP, 'Say hello')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+import subprocess
+import struct
+import time
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from studio.git.git_operations import GitOperations
+from studio.git.repo_cache import RepoStateCache
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+class TestRepoStateCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        git(self.temp_dir, 'init', '-q')
+        git(self.temp_dir, 'commit', '-q', '--allow-empty', '-m', 'first')
+        GitOperations.share_instances()
+
+    def tearDown(self):
+        GitOperations.share_instances(False)
+        shutil.rmtree(self.temp_dir)
+
+    def test_results_reused_until_repository_changes(self):
+        """Test that cached results are dropped when a new commit is made"""
+        ops = GitOperations.open(self.temp_dir)
+        self.assertIs(GitOperations.open(self.temp_dir), ops)
+
+        first = asyncio.run(ops.log())
+        self.assertIn('first', first)
+        self.assertEqual(asyncio.run(ops.log()), first)
+        self.assertEqual(ops.cache.stats()['hits'], 1)
+
+        git(self.temp_dir, 'commit', '-q', '--allow-empty', '-m', 'second')
+        self.assertIn('second', asyncio.run(ops.log()))
+        self.assertEqual(ops.cache.stats()['misses'], 2)
+
+    def test_status_sees_working_tree_edits(self):
+        """Test that status is never served from the cache, since file edits leave .git untouched"""
+        ops = GitOperations.open(self.temp_dir)
+        self.assertEqual(asyncio.run(ops.status()), '')
+        Path(self.temp_dir, 'new.txt').write_text('edit')
+        self.assertIn('new.txt', asyncio.run(ops.status()))
+        self.assertEqual(ops.cache.stats()['entries'], 0)
+
+    def test_concurrent_requests_computed_once(self):
+        """Test that concurrent requests for the same result share one computation"""
+        cache = RepoStateCache(Path(self.temp_dir) / '.git')
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'result'
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_compute('key', compute) for _ in range(3)))
+
+        self.assertEqual(asyncio.run(run()), ['result'] * 3)
+        self.assertEqual(len(calls), 1)
+
+
+class TestInteractivePrefetch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        git(self.temp_dir, 'init', '-q')
+        git(self.temp_dir, 'commit', '-q', '--allow-empty', '-m', 'prefetched')
+
+    def tearDown(self):
+        GitOperations.share_instances(False)
+        shutil.rmtree(self.temp_dir)
+
+    def test_session_serves_prefetched_results(self):
+        """Test that interactive commands share one loop and reuse prefetched results"""
+        from studio.cli import GitFlowStudioCLI
+
+        cli = GitFlowStudioCLI()
+        with patch('studio.cli.Prompt.ask', side_effect=['log', '10', 'branches', 'exit']):
+            asyncio.run(cli.interactive_mode(self.temp_dir))
+
+        stats = GitOperations.open(self.temp_dir).cache.stats()
+        self.assertEqual(stats['misses'], 3)  # branches, tags and log, once each
+        self.assertEqual(stats['hits'], 2)
+        self.assertFalse(cli._prefetch_tasks)
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo = os.path.join(self.temp_dir, 'repo')
+        os.mkdir(self.repo)
+        git(self.repo, 'init', '-q')
+        git(self.repo, 'commit', '-q', '--allow-empty', '-m', 'daemon commit')
+
+    def tearDown(self):
+        GitOperations.share_instances(False)
+        shutil.rmtree(self.temp_dir)
+
+    def test_round_trip(self):
+        """Test running a command and reading cache statistics through the socket"""
+        from studio.core.daemon import StudioDaemon, send_request
+
+        socket_path = Path(self.temp_dir) / 'daemon.sock'
+
+        async def scenario():
+            daemon = StudioDaemon(socket_path)
+            server = asyncio.ensure_future(daemon.serve())
+            while not socket_path.exists():
+                await asyncio.sleep(0.01)
+            loop = asyncio.get_running_loop()
+            request = {"argv": ['--repo', 'repo', 'log'], "cwd": self.temp_dir, "width": 100}
+            first = await loop.run_in_executor(None, send_request, request, socket_path)
+            second = await loop.run_in_executor(None, send_request, request, socket_path)
+            refused = await loop.run_in_executor(None, send_request, {"argv": ['commit', '-m', 'x']}, socket_path)
+            status = await loop.run_in_executor(None, send_request, {"action": "status"}, socket_path)
+            self.assertEqual(os.stat(socket_path).st_mode & 0o077, 0)
+            await loop.run_in_executor(None, send_request, {"action": "stop"}, socket_path)
+            await server
+            return first, second, refused, status
+
+        first, second, refused, status = asyncio.run(scenario())
+        self.assertEqual(first['status'], 0)
+        self.assertIn('daemon commit', first['output'])
+        self.assertEqual(second['output'], first['output'])
+        self.assertEqual(refused['status'], 2)
+        self.assertEqual(status['requests'], 3)
+        stats = status['repositories'][os.path.realpath(self.repo)]
+        self.assertGreaterEqual(stats['hits'], 1)
+        self.assertFalse(socket_path.exists())
+
+    def test_client_falls_back_without_daemon(self):
+        """Test that the client reports no daemon when nothing is listening"""
+        from studio.core.daemon import forward_to_daemon
+
+        self.assertIsNone(forward_to_daemon(['status'], Path(self.temp_dir) / 'missing.sock'))
+
+    def test_client_gives_up_on_hung_or_dying_daemon(self):
+        """Test that a daemon that never answers or drops the connection reads as no daemon"""
+        import socket
+        import threading
+        from studio.core.daemon import send_request
+
+        for behaviour in ('hang', 'reset', 'garbage'):
+            socket_path = str(Path(self.temp_dir) / f'{behaviour}.sock')
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(socket_path)
+            server.listen(1)
+
+            def serve():
+                conn, _ = server.accept()
+                if behaviour == 'hang':
+                    time.sleep(1)
+                elif behaviour == 'reset':
+                    conn.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                else:
+                    conn.sendall(b'{"status": 0, "outp')
+                conn.close()
+
+            thread = threading.Thread(target=serve)
+            thread.start()
+            try:
+                self.assertIsNone(send_request({"action": "ping"}, socket_path, timeout=0.2), behaviour)
+            finally:
+                thread.join()
+                server.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
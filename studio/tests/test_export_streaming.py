@@ -0,0 +1,315 @@
+import unittest
+import asyncio
+import csv
+import gzip
+import json
+import tempfile
+import shutil
+import subprocess
+import tracemalloc
+import tarfile
+import time
+import zipfile
+from pathlib import Path
+
+from studio.git.git_operations import GitOperations
+from studio.utils.export_manager import ExportManager, CONTRIBUTOR_COLUMNS, FILE_CHANGE_COLUMNS, METRIC_COLUMNS
+from studio.utils.export_writers import write_rows, stream_rows, ColumnarWriter, pyarrow
+
+
+def git(repo, *args):
+    subprocess.run(['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+class TestStreamingExports(unittest.TestCase):
+    """Streams history and generated rows into JSON Lines and CSV exports"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.repo = self.temp_dir / "repo"
+        self.repo.mkdir()
+        git(self.repo, 'init', '-q')
+        (self.repo / "a.txt").write_text("one\ntwo\n")
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-q', '-m', 'Add a | with pipes')
+        (self.repo / "a.txt").write_text("one\n")
+        (self.repo / "b.bin").write_bytes(b"\x00\x01")
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-q', '-m', 'Trim a, add b')
+        self.manager = ExportManager(str(self.temp_dir / "exports"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_history_exports(self):
+        """Test commits as gzip JSON Lines and file changes as CSV"""
+        git_ops = GitOperations(self.repo)
+        commits_path = asyncio.run(self.manager.export_history(git_ops, 'commits', 'jsonl', 'gzip'))
+        files_path = asyncio.run(self.manager.export_history(git_ops, 'file_changes', 'csv'))
+        git_ops.executor.shutdown()
+
+        self.assertTrue(commits_path.endswith(".jsonl.gz"))
+        with gzip.open(commits_path, 'rt', encoding='utf-8') as f:
+            commits = [json.loads(line) for line in f]
+        self.assertEqual([commit['subject'] for commit in commits], ["Trim a, add b", "Add a | with pipes"])
+        self.assertEqual(commits[0]['parents'], commits[1]['hash'])
+        self.assertEqual(commits[1]['author'], "Test")
+
+        with open(files_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([(row['path'], row['additions'], row['deletions']) for row in rows],
+                         [("a.txt", "0", "1"), ("b.bin", "0", "0"), ("a.txt", "2", "0")])
+        self.assertEqual(rows[0]['hash'], commits[0]['hash'])
+        self.assertEqual(list(Path(files_path).parent.glob("*.part")), [])
+
+    def test_history_paths_and_git_errors(self):
+        """Test that unusual paths are exported verbatim and a failing git log leaves no export"""
+        for name in ("é.txt", "tab\there.txt", "new\nline.txt"):
+            (self.repo / name).write_text("x\n")
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-q', '-m', 'Odd names')
+        git_ops = GitOperations(self.repo)
+
+        async def file_changes(rev):
+            return [row async for row in git_ops.iter_file_changes(rev)]
+
+        paths = [row['path'] for row in asyncio.run(file_changes('HEAD~1..HEAD'))]
+        self.assertEqual(sorted(paths), sorted(["é.txt", "tab\there.txt", "new\nline.txt"]))
+
+        result = asyncio.run(self.manager.export_history(git_ops, 'commits', 'jsonl', rev='nosuchref'))
+        git_ops.executor.shutdown()
+        self.assertEqual(result, "")
+        self.assertEqual(list((self.temp_dir / "exports").glob("commits_*")), [])
+
+    def test_fixed_schema_and_constant_memory(self):
+        """Test that CSV keeps the first row's columns and a long stream never accumulates"""
+        path = self.temp_dir / "rows.csv"
+        write_rows(iter([{'a': 1, 'b': {'x': 1}}, {'b': 2, 'c': 3}]), path, 'csv')
+        self.assertEqual(path.read_text().splitlines(), ['a,b', '1,"{""x"": 1}"', ',2'])
+
+        async def rows(count):
+            for index in range(count):
+                yield {'hash': f"{index:040x}", 'subject': "x" * 60, 'additions': index}
+
+        def peak(count):
+            tracemalloc.start()
+            written = asyncio.run(stream_rows(rows(count), self.temp_dir / "rows.jsonl.gz", 'jsonl',
+                                              compression='gzip'))
+            size = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertEqual(written, count)
+            return size
+
+        # Ten times the rows, about the same peak
+        small = peak(10_000)
+        self.assertLess(peak(100_000), small * 2)
+        with gzip.open(self.temp_dir / "rows.jsonl.gz", 'rt') as f:
+            self.assertEqual(sum(1 for _ in f), 100_000)
+
+
+    def test_incremental_exports(self):
+        """Test watermarked partitions: only new commits, nothing when unchanged, a full export after a rewrite"""
+        def export():
+            git_ops = GitOperations(self.repo)
+            manifest = asyncio.run(self.manager.export_incremental(git_ops, 'commits'))
+            git_ops.executor.shutdown()
+            return manifest
+
+        def subjects(manifest, partition):
+            with open(directory / manifest['partitions'][partition]['file'], encoding='utf-8') as f:
+                return [json.loads(line)['subject'] for line in f]
+
+        key = ExportManager._repository_key(str(self.repo.resolve()))
+        directory = self.temp_dir / "exports" / "incremental" / key / "commits"
+        first = export()
+        self.assertEqual(subjects(first, 0), ["Trim a, add b", "Add a | with pipes"])
+        self.assertEqual(export(), first)
+
+        git(self.repo, 'commit', '-q', '--allow-empty', '-m', 'Third')
+        second = export()
+        self.assertEqual([partition['rows'] for partition in second['partitions']], [2, 1])
+        self.assertEqual(subjects(second, 1), ["Third"])
+        self.assertEqual(second['partitions'][1]['from'], first['watermark'])
+        self.assertEqual(json.loads((directory / "manifest.json").read_text()), second)
+
+        git(self.repo, 'commit', '-q', '--amend', '--allow-empty', '-m', 'Third, reworded')
+
+        # A rebuild that fails keeps the old partitions, manifest and watermark
+        async def broken_log(rev='HEAD', since=None):
+            yield {'hash': 'x' * 40}
+            raise RuntimeError("git log failed")
+
+        git_ops = GitOperations(self.repo)
+        git_ops.iter_commits = broken_log
+        self.assertIsNone(asyncio.run(self.manager.export_incremental(git_ops, 'commits')))
+        git_ops.executor.shutdown()
+        self.assertEqual(json.loads((directory / "manifest.json").read_text()), second)
+        self.assertEqual(sorted(path.name for path in directory.iterdir()),
+                         ["manifest.json", "part-00001.jsonl", "part-00002.jsonl"])
+
+        rewritten = export()
+        self.assertEqual([partition['rows'] for partition in rewritten['partitions']], [3])
+        self.assertEqual(sorted(path.name for path in directory.iterdir()), ["manifest.json", "part-00003.jsonl"])
+
+        # Another repository with the same name gets its own directory
+        other = self.temp_dir / "elsewhere" / "repo"
+        other.mkdir(parents=True)
+        git(other, 'init', '-q')
+        git(other, 'commit', '-q', '--allow-empty', '-m', 'Elsewhere')
+        git_ops = GitOperations(other)
+        other_manifest = asyncio.run(self.manager.export_incremental(git_ops, 'commits'))
+        git_ops.executor.shutdown()
+        self.assertEqual(other_manifest['repository'], str(other.resolve()))
+        self.assertEqual(len(list((self.temp_dir / "exports" / "incremental").iterdir())), 2)
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_columnar_exports(self):
+        """Test typed, dictionary-encoded Parquet row groups and an Arrow stream of history"""
+        import pyarrow.parquet
+
+        rows = [{'hash': f"{index:040x}", 'date': "2024-01-01T00:00:00+00:00", 'author': f"dev{index % 3}",
+                 'path': f"src/{index % 5}.py", 'additions': str(index), 'deletions': None} for index in range(25)]
+        path = self.temp_dir / "changes.parquet"
+        with ColumnarWriter(path, row_group_size=10) as writer:
+            for row in rows:
+                writer.write(row)
+        parquet = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        table = parquet.read()
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('author').type))
+        self.assertTrue(pyarrow.types.is_timestamp(table.schema.field('date').type))
+        self.assertEqual(table.column('additions').to_pylist(), list(range(25)))
+        self.assertEqual(table.column('deletions').null_count, 25)
+
+        git_ops = GitOperations(self.repo)
+        arrow_path = asyncio.run(self.manager.export_history(git_ops, 'commits', 'arrow'))
+        git_ops.executor.shutdown()
+        commits = pyarrow.ipc.open_stream(arrow_path).read_all()
+        self.assertEqual(commits.column('subject').to_pylist(), ["Trim a, add b", "Add a | with pipes"])
+
+    def test_analytics_rows_match_columns(self):
+        """Test that real contributor and file change analytics flatten into rows with the columnar columns"""
+        git_ops = GitOperations(self.repo)
+        contributors = asyncio.run(git_ops.get_contributor_stats())
+        changes = asyncio.run(git_ops.get_file_changes())
+        git_ops.executor.shutdown()
+
+        rows = self.manager._contributor_rows(contributors)
+        self.assertEqual([row['message'] for row in rows], ["Trim a, add b", "Add a | with pipes"])
+        self.assertEqual({tuple(row) for row in rows}, {CONTRIBUTOR_COLUMNS})
+        self.assertEqual(contributors['summary'].split(), ["2", "Test"])
+        rows = self.manager._file_change_rows(changes)
+        self.assertEqual(sorted((row['file'], row['changes']) for row in rows), [("a.txt", 2), ("b.bin", 1)])
+        self.assertEqual({tuple(row) for row in rows}, {FILE_CHANGE_COLUMNS})
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_columnar_analytics_exports(self):
+        """Test contributor stats and file changes from GitOperations as Parquet, and every analytics dataset as Arrow"""
+        import pyarrow.parquet
+
+        git_ops = GitOperations(self.repo)
+        contributors_path = self.manager.export_contributor_stats(asyncio.run(git_ops.get_contributor_stats()), 'parquet')
+        changes_path = self.manager.export_file_changes(asyncio.run(git_ops.get_file_changes()), 'parquet')
+        files = asyncio.run(self.manager.export_analytics(git_ops, 'arrow'))
+        git_ops.executor.shutdown()
+
+        contributors = pyarrow.parquet.read_table(contributors_path)
+        self.assertEqual(contributors.schema.names, list(CONTRIBUTOR_COLUMNS))
+        self.assertTrue(pyarrow.types.is_timestamp(contributors.schema.field('date').type))
+        self.assertEqual(contributors.column('author').to_pylist(), ["Test", "Test"])
+        changes = pyarrow.parquet.read_table(changes_path)
+        self.assertEqual(dict(zip(changes.column('file').to_pylist(), changes.column('changes').to_pylist())),
+                         {"a.txt": 2, "b.bin": 1})
+
+        self.assertEqual(len(files), 6)
+        self.assertTrue(all(path.endswith(".arrows") for path in files))
+        stats = pyarrow.ipc.open_stream(next(path for path in files if "_stats." in path)).read_all()
+        self.assertEqual(stats.schema.names, list(METRIC_COLUMNS))
+
+    @unittest.skipIf(pyarrow, "pyarrow is installed")
+    def test_columnar_exports_need_pyarrow(self):
+        """Test that Parquet exports fail clearly and leave no file when pyarrow is missing"""
+        git_ops = GitOperations(self.repo)
+        self.assertEqual(asyncio.run(self.manager.export_history(git_ops, 'commits', 'parquet')), "")
+        git_ops.executor.shutdown()
+        git_ops = GitOperations(self.repo)
+        self.assertEqual(asyncio.run(self.manager.export_analytics(git_ops, 'parquet')), [])
+        git_ops.executor.shutdown()
+        with self.assertRaisesRegex(RuntimeError, "pip install pyarrow"):
+            write_rows([{'a': 1}], self.temp_dir / "rows.parquet", 'parquet')
+        self.assertEqual(list(self.temp_dir.glob("rows.parquet*")), [])
+
+
+class SlowAnalytics:
+    """GitOperations stand-in whose analytics each take the same time to compute"""
+
+    def __init__(self, repo_path, delay):
+        self.repo_path = Path(repo_path)
+        self.delay = delay
+
+    async def _result(self, result):
+        await asyncio.sleep(self.delay)
+        return result
+
+    def get_repository_stats(self):
+        return self._result({'total_commits': 2, 'last_commit': {'hash': 'abc'}})
+
+    def get_commit_activity(self, days=30):
+        return self._result({'2024-01-01': 2})
+
+    def get_file_changes(self, days=30):
+        return self._result({'most_changed_files': {'a.txt': 2}, 'total_files_changed': 1})
+
+    def get_branch_activity(self):
+        return self._result({'branches': [], 'merged_branches': ['main']})
+
+    def get_contributor_stats(self):
+        return self._result({'error': 'shortlog failed'})
+
+    def get_repository_health(self):
+        return self._result({'merge_commits': 0})
+
+
+class TestAnalyticsExport(unittest.TestCase):
+    """Exports every analytics dataset from one concurrent pass"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.manager = ExportManager(str(self.temp_dir / "exports"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_datasets_are_computed_concurrently_into_an_archive(self):
+        """Test that six 0.3s datasets take about 0.3s and land in a zip with a manifest"""
+        start = time.monotonic()
+        files = asyncio.run(self.manager.export_analytics(SlowAnalytics(self.temp_dir, 0.3), archive='zip'))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        self.assertEqual(len(files), 1)
+        with zipfile.ZipFile(files[0]) as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            names = set(archive.namelist())
+            stats = json.loads(archive.read(manifest['datasets']['stats']['file']))
+        self.assertEqual(set(manifest['datasets']), {'stats', 'activity', 'files', 'branches', 'contributors', 'health'})
+        self.assertEqual(names, {entry['file'] for entry in manifest['datasets'].values()} | {"manifest.json"})
+        self.assertEqual(stats['total_commits'], 2)
+        self.assertEqual(manifest['datasets']['contributors']['error'], 'shortlog failed')
+        self.assertEqual(sorted(path.name for path in (self.temp_dir / "exports").iterdir()), [Path(files[0]).name])
+
+    def test_csv_files_and_tar_archive(self):
+        """Test separate CSV files (dict results as Metric/Value rows) and a tar.gz archive"""
+        files = asyncio.run(self.manager.export_analytics(SlowAnalytics(self.temp_dir, 0), 'csv',
+                                                          datasets=['activity', 'health']))
+        self.assertEqual(len(files), 2)
+        activity = next(path for path in files if path.endswith("_activity.csv"))
+        self.assertEqual(Path(activity).read_text().splitlines(), ["Metric,Value", "2024-01-01,2"])
+
+        archive_path = asyncio.run(self.manager.export_analytics(SlowAnalytics(self.temp_dir, 0), archive='tar.gz'))[0]
+        with tarfile.open(archive_path) as archive:
+            self.assertEqual(len(archive.getnames()), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
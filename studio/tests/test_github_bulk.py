@@ -0,0 +1,89 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+
+from aiohttp import web
+
+from studio.github.client import GitHubClient
+from studio.github.bulk import BulkJournal, BulkRunner, parse_target
+
+
+class FakeAuth:
+    def get_access_token(self):
+        return "test-token"
+
+
+class TestBulkOperations(unittest.TestCase):
+    """Runs bulk jobs against a local stand-in for the GitHub API"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.closed = []
+        self.broken = {"octo/demo": {3}}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    async def run_job(self, journal, concurrency):
+        async def close(request):
+            repo = f"{request.match_info['owner']}/{request.match_info['name']}"
+            number = int(request.match_info['number'])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.02)
+            self.in_flight -= 1
+            if number in self.broken.get(repo, ()):
+                return web.json_response({"message": "Server Error"}, status=500)
+            self.closed.append((repo, number, (await request.json())["state"]))
+            return web.json_response({"number": number, "state": "closed"})
+
+        app = web.Application()
+        app.router.add_patch('/repos/{owner}/{name}/issues/{number}', close)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        try:
+            async with GitHubClient(FakeAuth(), f"http://127.0.0.1:{runner.addresses[0][1]}") as client:
+                return await BulkRunner(client, journal, concurrency).run()
+        finally:
+            await runner.cleanup()
+
+    def test_bulk_close_resumes_after_failure(self):
+        """Test bounded concurrency, per-item outcomes and resuming a partial job"""
+        targets = [("octo/demo", number) for number in range(1, 11)] + [("octo/tools", 1)]
+        journal = BulkJournal(Path(self.temp_dir) / "bulk" / "job.jsonl")
+        journal.create('close', None, targets)
+
+        outcomes = asyncio.run(self.run_job(journal, concurrency=4))
+        self.assertEqual([(o['repo'], o['number']) for o in outcomes], targets)
+        self.assertEqual([o['number'] for o in outcomes if not o['ok']], [3])
+        self.assertEqual(outcomes[2]['status'], 500)
+        self.assertEqual(outcomes[2]['error'], "Server Error")
+        self.assertEqual(len(self.closed), 10)
+        self.assertTrue(all(state == "closed" for _, _, state in self.closed))
+        self.assertEqual(self.max_in_flight, 4)
+
+        # The resumed job only retries the failed item
+        self.broken = {}
+        self.closed.clear()
+        outcomes = asyncio.run(self.run_job(BulkJournal(journal.path), concurrency=4))
+        self.assertEqual(self.closed, [("octo/demo", 3, "closed")])
+        self.assertTrue(all(o['ok'] for o in outcomes))
+        self.assertEqual(sum(1 for o in outcomes if o.get('skipped')), 10)
+        self.assertEqual(journal.job_id, "job")
+
+    def test_parse_target(self):
+        """Test item syntax: owner/repo#number or a number for each --repo"""
+        self.assertEqual(parse_target("octo/demo#12"), [("octo/demo", 12)])
+        self.assertEqual(parse_target("7", ["a/b", "c/d"]), [("a/b", 7), ("c/d", 7)])
+        with self.assertRaises(ValueError):
+            parse_target("7")
+
+
+if __name__ == '__main__':
+    unittest.main()
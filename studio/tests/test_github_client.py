@@ -0,0 +1,371 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+from cryptography.fernet import Fernet
+
+from aiohttp import web
+
+from studio.github.client import GitHubClient, RateLimitedError
+from studio.github.http_cache import HTTPCache
+from studio.github.graphql import GitHubGraphQL, GraphQLError
+from studio.github.ratelimit import RateLimiter, RateLimitPaused, INTERACTIVE, BULK
+from studio.github.repos import GitHubRepos
+from studio.github.auth import GitHubAuth
+
+
+class FakeAuth:
+    client = None
+
+    def is_authenticated(self):
+        return True
+
+    def get_access_token(self):
+        return "test-token"
+
+
+class TestGitHubClient(unittest.TestCase):
+    """Runs the client against a local stand-in for the GitHub API"""
+
+    def setUp(self):
+        self.requests = []
+        self.org_pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.user_status = 200
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    async def start_server(self):
+        async def user_repos(request):
+            self.requests.append((request.headers, request.transport.get_extra_info('peername')))
+            page = int(request.query.get('page', 1))
+            links = {"Link": f'<{request.url.with_query(page=2)}>; rel="next", <{request.url.with_query(page=2)}>; rel="last"'}
+            return web.json_response([{"name": f"demo-{page}", "permissions": {"admin": True}}], headers=links if page == 1 else None)
+
+        async def org_repos(request):
+            # 5 pages of 2 repos; slow enough that sequential fetching would show
+            page = int(request.query.get('page', 1))
+            self.org_pages.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+            last = request.url.with_query(per_page=2, page=5)
+            return web.json_response([{"id": page * 10}, {"id": page * 10 + 1}],
+                                     headers={"Link": f'<{last}>; rel="last"'})
+
+        async def user(request):
+            self.requests.append((request.headers, request.transport.get_extra_info('peername')))
+            return web.json_response({"login": "octocat"}, status=self.user_status)
+
+        async def issues(request):
+            self.requests.append((request.headers, request.transport.get_extra_info('peername')))
+            if request.headers.get('If-None-Match') == '"v1"':
+                return web.Response(status=304)
+            return web.json_response([{"number": 1}], headers={"ETag": '"v1"'})
+
+        async def graphql(request):
+            body = await request.json()
+            self.requests.append((request.headers, body))
+            if 'search(' in body['query']:
+                return web.json_response({"data": {"search": {
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                    "nodes": [{"title": "Fix", "state": "MERGED", "createdAt": "2024-05-01T00:00:00Z",
+                               "url": "https://github.com/octo/demo/pull/2", "author": None}]
+                }}})
+            if body['variables'].get('name') == 'missing':
+                return web.json_response({"data": None, "errors": [{"message": "Could not resolve"}]})
+            return web.json_response({"data": {"repository": {"refs": {
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+                "nodes": [{"name": name, "target": {"history": {"nodes": [
+                    {"oid": "abc1234def", "messageHeadline": f"Work on {name}"}]}}}
+                    for name in ("main", "develop", "feature")]
+            }}}})
+
+        async def limited(request):
+            # Secondary rate limit on the first two attempts
+            self.requests.append((request.headers, None))
+            if len(self.requests) <= 2:
+                return web.json_response({"message": "secondary rate limit"}, status=403,
+                                         headers={"Retry-After": "0"})
+            return web.json_response({"ok": True}, headers={
+                "X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "4990", "X-RateLimit-Reset": "0"})
+
+        async def forbidden(request):
+            self.requests.append((request.headers, None))
+            return web.json_response({"message": "Must have admin rights"}, status=403)
+
+        app = web.Application()
+        app.router.add_get('/limited', limited)
+        app.router.add_get('/forbidden', forbidden)
+        app.router.add_post('/graphql', graphql)
+        app.router.add_get('/repos/octo/demo/issues', issues)
+        app.router.add_get('/user/repos', user_repos)
+        app.router.add_get('/orgs/octo/repos', org_repos)
+        app.router.add_get('/user', user)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        return runner, f"http://127.0.0.1:{port}"
+
+    def test_requests_share_one_connection(self):
+        """Test that requests reuse the pooled session and send auth headers"""
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                async with GitHubClient(FakeAuth(), base) as client:
+                    repos = await GitHubRepos(FakeAuth(), client).list_repositories()
+                    async with client.get('/user') as response:
+                        user = await response.json()
+                    session = client.session
+                return repos, user, session
+            finally:
+                await runner.cleanup()
+
+        repos, user, session = asyncio.run(scenario())
+        # Listings keep only the fields the display uses
+        self.assertEqual([repo["name"] for repo in repos], ["demo-1", "demo-2"])
+        self.assertNotIn("permissions", repos[0])
+        self.assertEqual(user["login"], "octocat")
+        self.assertTrue(session.closed)
+
+        # Two pages (no trailing empty page) and /user
+        self.assertEqual(len(self.requests), 3)
+        self.assertTrue(all(headers["Authorization"] == "token test-token" for headers, _ in self.requests))
+        self.assertIn("gzip", self.requests[0][0]["Accept-Encoding"])
+        # Keep-alive: every request arrived over the same connection
+        self.assertEqual(len({peer for _, peer in self.requests}), 1)
+
+    def test_unchanged_responses_served_from_cache(self):
+        """Test that cached GETs are revalidated and 304s answered from disk"""
+        cache_path = Path(self.temp_dir) / "http_cache.db"
+
+        async def fetch(base):
+            async with GitHubClient(FakeAuth(), base, cache=HTTPCache(cache_path)) as client:
+                results = []
+                for _ in range(2):
+                    async with client.get('/repos/octo/demo/issues', params={'state': 'open'}) as response:
+                        results.append((response.status, await response.json(), response.from_cache))
+                return results, client.cache.stats()
+
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                # The second client starts with the cache left on disk by the first
+                return await fetch(base), await fetch(base)
+            finally:
+                await runner.cleanup()
+
+        (results, stats), (reopened, _) = asyncio.run(scenario())
+        self.assertEqual(results, [(200, [{"number": 1}], False), (200, [{"number": 1}], True)])
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertNotIn("If-None-Match", self.requests[0][0])
+        self.assertTrue(reopened[0][2])
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test that the cache stays within its size bound"""
+        cache = HTTPCache(Path(self.temp_dir) / "http_cache.db", max_bytes=25)
+        cache.put("a", "a", '"etag"', None, {}, b"x" * 10)
+        cache.put("b", "b", '"etag"', None, {}, b"x" * 10)
+        cache.touch("a")
+        cache.put("c", "c", '"etag"', None, {}, b"x" * 10)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertLessEqual(cache.stats()["bytes"], 25)
+        cache.close()
+
+    def test_pages_fetched_concurrently_in_order(self):
+        """Test that pages after the first are fetched at once, keeping their order"""
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                async with GitHubClient(FakeAuth(), base) as client:
+                    return (await client.paginate('/orgs/octo/repos', {'per_page': 2}),
+                            await client.paginate('/orgs/octo/repos', {'per_page': 2}, limit=5))
+            finally:
+                await runner.cleanup()
+
+        items, limited = asyncio.run(scenario())
+        self.assertEqual([item["id"] for item in items], [10, 11, 20, 21, 30, 31, 40, 41, 50, 51])
+        self.assertEqual(self.max_in_flight, 4)
+        # Only the pages needed for the limit are requested
+        self.assertEqual([item["id"] for item in limited], [10, 11, 20, 21, 30])
+        self.assertEqual(sorted(self.org_pages[5:]), [1, 2, 3])
+
+    def test_graphql_batches_branch_graph(self):
+        """Test that one query returns every branch's history in REST shape"""
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                async with GitHubClient(FakeAuth(), base) as client:
+                    api = GitHubGraphQL(client)
+                    graph = await api.branch_graph('octo/demo')
+                    prs = await api.search_issues('octo/demo', 'pr', 'all', 5, label='bug', assignee='octocat')
+                    with self.assertRaises(GraphQLError):
+                        await api.branch_graph('octo/missing')
+                return graph, prs
+            finally:
+                await runner.cleanup()
+
+        graph, prs = asyncio.run(scenario())
+        self.assertEqual(list(graph), ["main", "develop", "feature"])
+        self.assertEqual(graph["develop"], [{"sha": "abc1234def", "commit": {"message": "Work on develop"}}])
+        self.assertEqual(prs[0]["state"], "closed")
+        self.assertEqual(prs[0]["user"], {"login": ""})
+
+        # One request per operation, filters folded into the search query
+        self.assertEqual(len(self.requests), 3)
+        search = self.requests[1][1]["variables"]["query"]
+        self.assertIn('is:pr', search)
+        self.assertIn('label:"bug"', search)
+        self.assertIn('assignee:octocat', search)
+        self.assertNotIn('is:all', search)
+
+    def test_rate_limited_requests_retried(self):
+        """Test that Retry-After responses are retried and rate limit headers tracked"""
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                async with GitHubClient(FakeAuth(), base) as client:
+                    async with client.get('/limited') as response:
+                        limited = response.status, await response.json()
+                    async with client.get('/forbidden') as response:
+                        forbidden = response.status
+                    return limited, forbidden, client.rate_limit_status()
+            finally:
+                await runner.cleanup()
+
+        limited, forbidden, status = asyncio.run(scenario())
+        self.assertEqual(limited, (200, {"ok": True}))
+        # Permission errors are not rate limits and are returned straight away
+        self.assertEqual(forbidden, 403)
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual((status["limit"], status["remaining"]), (5000, 4990))
+
+    def test_interactive_requests_overtake_bulk(self):
+        """Test that queued requests are granted by priority, paced by the bucket"""
+        async def scenario():
+            limiter = RateLimiter(rate=50.0, burst=1)
+            granted = []
+
+            async def request(name, priority):
+                await limiter.acquire(priority)
+                granted.append(name)
+
+            bulk = [asyncio.ensure_future(request(f"bulk{i}", BULK)) for i in range(3)]
+            await asyncio.sleep(0)
+            await asyncio.gather(*bulk, request("interactive", INTERACTIVE))
+            return granted
+
+        self.assertEqual(asyncio.run(scenario()), ["bulk0", "interactive", "bulk1", "bulk2"])
+
+        limiter = RateLimiter()
+        self.assertIsNotNone(limiter.observe(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}))
+        self.assertIsNone(limiter.observe(403, {}))
+        self.assertEqual(limiter.status()["remaining"], 0)
+        self.assertIsNone(limiter.observe(403, {}, body=b'{"message": "Resource not accessible by integration"}'))
+        secondary = b'{"message": "You have exceeded a secondary rate limit. Please wait a few minutes."}'
+        delay = limiter.observe(403, {"X-RateLimit-Remaining": "4000"}, body=secondary)
+        self.assertGreaterEqual(delay, 60)
+        self.assertLessEqual(delay, 75)
+        self.assertGreaterEqual(limiter.observe(403, {}, attempt=2, body=secondary), 240)
+
+    def test_interactive_requests_fail_fast_while_paused(self):
+        """Test that interactive requests never sit out a long pause: cached reads are served, others refused"""
+        async def waits():
+            limiter = RateLimiter()
+            queued = asyncio.ensure_future(limiter.acquire(INTERACTIVE))
+            bulk = asyncio.ensure_future(limiter.acquire(BULK))
+            limiter.tokens = 0
+            await asyncio.sleep(0)
+            limiter.pause(120)
+            # Already queued, and new, interactive requests give up; bulk work keeps waiting
+            with self.assertRaises(RateLimitPaused):
+                await asyncio.wait_for(queued, 1)
+            with self.assertRaises(RateLimitPaused) as context:
+                await asyncio.wait_for(limiter.acquire(INTERACTIVE), 1)
+            self.assertGreater(context.exception.retry_in, 100)
+            self.assertFalse(bulk.done())
+            bulk.cancel()
+
+        asyncio.run(waits())
+
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                async with GitHubClient(FakeAuth(), base, cache=HTTPCache(Path(self.temp_dir) / "cache.db")) as client:
+                    async with client.get('/repos/octo/demo/issues') as response:
+                        self.assertFalse(response.from_cache)
+                    client.limiter(client._headers(base + '/', None)).pause(300)
+                    async with client.get('/repos/octo/demo/issues') as response:
+                        cached = response.status, await response.json(), response.from_cache
+                    with self.assertRaises(RateLimitedError):
+                        async with client.get('/user'):
+                            pass
+                    return cached
+            finally:
+                await runner.cleanup()
+
+        self.assertEqual(asyncio.run(scenario()), (200, [{"number": 1}], True))
+        self.assertEqual(len(self.requests), 1)
+
+    def test_credentials_loaded_once(self):
+        """Test that credentials are decrypted once and token checks respect the TTL"""
+        auth = GitHubAuth()
+        auth.config_dir = Path(self.temp_dir)
+        auth.config_file = auth.config_dir / "github_config.json"
+        # Stands in for the key normally kept in the system keyring
+        auth._encryption_key = Fernet.generate_key()
+        auth._save_config({'access_token': 'test-token', 'user_info': {'login': 'octocat'}})
+
+        with patch.object(auth, '_decrypt_token', wraps=auth._decrypt_token) as decrypt:
+            for _ in range(10):
+                self.assertTrue(auth.is_authenticated())
+                self.assertEqual(auth.get_access_token(), 'test-token')
+            self.assertEqual(decrypt.call_count, 1)
+
+        async def scenario():
+            runner, base = await self.start_server()
+            try:
+                auth.api_base = base
+                auth.client = GitHubClient(auth, base)
+                checks = [await auth.verify_token(), await auth.verify_token()]
+                self.user_status = 401
+                checks.append(await auth.verify_token(force=True))
+                await auth.client.close()
+                return checks
+            finally:
+                await runner.cleanup()
+
+        self.assertEqual(asyncio.run(scenario()), [True, True, False])
+        # Within the TTL the second check sends nothing
+        self.assertEqual(len(self.requests), 2)
+        self.assertFalse(auth.is_authenticated())
+
+        # Another process logging out is noticed
+        auth._save_config({'access_token': 'new-token'})
+        self.assertTrue(auth.is_authenticated())
+        auth.config_file.unlink()
+        self.assertFalse(auth.is_authenticated())
+
+    def test_token_not_sent_to_other_hosts(self):
+        """Test that the token is only added to API requests"""
+        client = GitHubClient(FakeAuth(), "https://api.github.com")
+        url = client.url("/user")
+        self.assertEqual(url, "https://api.github.com/user")
+        self.assertIn("Authorization", client._headers(url, None))
+        self.assertNotIn("Authorization", client._headers("https://github.com/login/oauth/access_token", None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+import asyncio
+import os
+import subprocess
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from studio.github.clone import CloneOptions, CloneError, auth_env, clone, clone_command, _run
+from studio.github.client import GitHubClient
+from studio.github.fake_server import FakeGitHub, FakeAuth
+from studio.github.repos import GitHubRepos
+
+
+class TestClone(unittest.TestCase):
+    """Clones a local repository with the options the bulk clone passes through"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        source = self.temp_dir / "source"
+        source.mkdir()
+        for directory in ("docs", "src", "tests"):
+            (source / directory).mkdir()
+            (source / directory / "file.txt").write_text(directory)
+        (source / "README").write_text("readme")
+        git = ['git', '-C', str(source), '-c', 'user.name=Test', '-c', 'user.email=test@example.com']
+        subprocess.run(['git', 'init', '-q', str(source)], check=True)
+        subprocess.run(git + ['add', '.'], check=True)
+        subprocess.run(git + ['commit', '-q', '-m', 'first'], check=True)
+        (source / "README").write_text("readme 2")
+        subprocess.run(git + ['commit', '-q', '-am', 'second'], check=True)
+        # file:// so --depth and --filter behave as over the network
+        self.url = source.resolve().as_uri()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_shallow_sparse_clone(self):
+        """Test depth, sparse cone checkout and progress reporting"""
+        target = self.temp_dir / "clones" / "octo" / "demo"
+        phases = []
+        options = CloneOptions(depth=1, sparse=("src",))
+        asyncio.run(clone(self.url, target, options, on_progress=lambda phase, percent: phases.append((phase, percent))))
+
+        commits = subprocess.run(['git', '-C', str(target), 'rev-list', '--count', 'HEAD'],
+                                 capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(commits, "1")
+        self.assertTrue((target / "src" / "file.txt").exists())
+        self.assertTrue((target / "README").exists())
+        self.assertFalse((target / "docs").exists())
+        self.assertTrue(phases)
+        self.assertTrue(all(0 <= percent <= 100 for _, percent in phases))
+
+    def test_clone_failure_and_command(self):
+        """Test that git errors are raised and options map onto git clone flags"""
+        with self.assertRaises(CloneError) as context:
+            asyncio.run(clone(self.url + "-missing", self.temp_dir / "missing"))
+        self.assertNotEqual(context.exception.returncode, 0)
+
+        command = clone_command("https://github.com/octo/demo.git", Path("demo"),
+                                CloneOptions(filter="blob:none", reference="/cache/demo"))
+        self.assertIn('--filter=blob:none', command)
+        self.assertEqual(command[command.index('--reference') + 1], "/cache/demo")
+
+    def test_token_stays_off_the_command_line(self):
+        """Test that the token reaches git as a one-off header through the environment"""
+        self.assertIsNone(auth_env(None))
+        env = auth_env("secret")
+        header = subprocess.run(['git', 'config', '--get', 'http.https://github.com/.extraheader'],
+                                env=env, capture_output=True, text=True, check=True).stdout.strip()
+        self.assertTrue(header.startswith('AUTHORIZATION: basic '))
+        self.assertNotIn('secret', header)
+
+        # Config already passed through the environment is kept
+        with patch.dict(os.environ, {'GIT_CONFIG_COUNT': '1', 'GIT_CONFIG_KEY_0': 'core.pager',
+                                          'GIT_CONFIG_VALUE_0': 'cat'}):
+            env = auth_env("secret")
+        self.assertEqual((env['GIT_CONFIG_COUNT'], env['GIT_CONFIG_KEY_0']), ('2', 'core.pager'))
+        self.assertEqual(env['GIT_CONFIG_KEY_1'], 'http.https://github.com/.extraheader')
+
+    def test_stalled_git_is_killed(self):
+        """Test that a git that stops printing progress is killed instead of hanging the clone"""
+        async def stalled():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            with self.assertRaises(CloneError) as context:
+                await _run(['sh', '-c', 'echo "Cloning into demo..." >&2; sleep 30'], stall_timeout=0.3)
+            return loop.time() - started, context.exception
+
+        elapsed, error = asyncio.run(stalled())
+        self.assertLess(elapsed, 5)
+        self.assertIn("no progress", str(error))
+        self.assertIn("Cloning into demo", error.stderr)
+
+
+
+class TestBulkClone(unittest.TestCase):
+    """Clones many repositories from the fake GitHub server"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_names_resolve_before_cloning(self):
+        """Test that unknown names share one listing and a failing repository only fails its own row"""
+        fake = FakeGitHub(repos=5, issues=10)
+        base = self.temp_dir / "git"
+        (base / "octo" / "repo-00001").mkdir(parents=True)
+
+        async def scenario():
+            async with fake:
+                auth = FakeAuth(config_dir=self.temp_dir, login='someone-else')
+                async with GitHubClient(auth, fake.url) as client:
+                    repos = GitHubRepos(auth, client=client)
+                    with patch.object(repos, 'list_repositories', wraps=repos.list_repositories) as listing, \
+                         patch('studio.github.repos.clone', AsyncMock(side_effect=RuntimeError("boom"))):
+                        results = await repos.clone_repositories(
+                            ['repo-00001', 'repo-00002', 'nope', 'octo/missing'], str(base))
+                    self.assertEqual(listing.call_count, 1)
+                    return results
+
+        results = asyncio.run(scenario())
+        self.assertEqual([(result['status'], result['error']) for result in results],
+                         [('exists', ''), ('failed', 'boom'), ('failed', 'not found'), ('failed', 'not found')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+
+from studio.github.client import GitHubClient
+from studio.github.http_cache import HTTPCache
+from studio.github.fake_server import FakeGitHub, FakeAuth
+from studio.github.benchmark import run_benchmark, cases
+
+
+class TestFakeGitHub(unittest.TestCase):
+    """Checks the fake GitHub server and runs the benchmark on small fixtures"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_pagination_etags_and_rate_limits(self):
+        """Test Link pagination, 304s that spare the quota, and Retry-After on a secondary limit"""
+        fake = FakeGitHub(repos=250, issues=450, rate_limit=100, secondary_window=0.5, retry_after=1)
+
+        async def scenario():
+            async with fake:
+                cache = HTTPCache(self.temp_dir / "http_cache.db")
+                async with GitHubClient(FakeAuth(), fake.url, cache=cache) as client:
+                    repos = await client.paginate('/user/repos')
+                    self.assertEqual(len(repos), 250)
+                    self.assertEqual(repos[-1]['full_name'], "octo/repo-00249")
+                    issues = await client.paginate('/repos/octo/repo-00000/issues', {'state': 'all'})
+                    self.assertEqual(len(issues), 450)
+                    self.assertEqual(issues[0]['number'], 450)  # newest first
+                    self.assertEqual(fake.stats()['rate_limited'], 0)
+
+                    # A seventh request within the window is refused and retried after Retry-After
+                    fake.secondary_limit = 6
+                    fake.reset_stats()
+                    for _ in range(7):
+                        async with client.get('/repos/octo/repo-00001') as response:
+                            self.assertEqual(response.status, 200)
+                            remaining = int(response.headers['X-RateLimit-Remaining'])
+                    self.assertGreaterEqual(fake.stats()['rate_limited'], 1)
+
+                    fake.secondary_limit = None
+                    async with client.get('/repos/octo/repo-00001') as response:
+                        self.assertEqual(response.status, 200)
+                    self.assertEqual(fake.stats()['not_modified'], 7)
+                    self.assertEqual(int(response.headers['X-RateLimit-Remaining']), remaining)
+
+        asyncio.run(scenario())
+
+    def test_benchmark_covers_repo_methods(self):
+        """Test that every benchmark case runs and reports its requests"""
+        fake = FakeGitHub(repos=20, issues=120)
+        results = asyncio.run(run_benchmark(fake, work_dir=self.temp_dir))
+        self.assertEqual([r['method'] for r in results], [name for name, _ in cases(fake)])
+        self.assertTrue(all(r['requests'] >= 1 and r['seconds'] >= 0 for r in results))
+        by_method = {r['method']: r for r in results}
+        self.assertEqual(by_method['bulk_operation']['requests'], 100)
+        # The incremental sync only asks for what changed
+        self.assertLess(by_method['sync_issues (incremental)']['bytes'], by_method['sync_issues']['bytes'])
+
+        graphql = asyncio.run(run_benchmark(FakeGitHub(repos=20, issues=120), use_graphql=True,
+                                            only=['list_branches_graph'], work_dir=self.temp_dir))
+        self.assertEqual(graphql[0]['requests'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
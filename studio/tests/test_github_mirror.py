@@ -0,0 +1,119 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+
+from aiohttp import web
+
+from studio.github.client import GitHubClient
+from studio.github.mirror import IssueMirror
+
+
+class FakeAuth:
+    def get_access_token(self):
+        return "test-token"
+
+
+ISSUES = [
+    {"number": 1, "title": "Crash on startup", "body": "Traceback when opening a repo", "state": "open",
+     "user": {"login": "alice"}, "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-05T00:00:00Z",
+     "html_url": "https://github.com/octo/demo/issues/1", "labels": [{"name": "bug"}],
+     "assignees": [{"login": "bob"}]},
+    {"number": 2, "title": "Add dark theme", "body": "", "state": "closed",
+     "user": {"login": "carol"}, "created_at": "2024-01-02T00:00:00Z", "updated_at": "2024-01-06T00:00:00Z",
+     "html_url": "https://github.com/octo/demo/issues/2", "labels": [{"name": "enhancement"}], "assignees": []},
+    {"number": 3, "title": "Fix startup crash", "body": "Closes #1", "state": "open",
+     "user": {"login": "bob"}, "created_at": "2024-01-03T00:00:00Z", "updated_at": "2024-01-07T00:00:00Z",
+     "html_url": "https://github.com/octo/demo/pull/3", "labels": [], "assignees": [{"login": "alice"}],
+     "pull_request": {"url": "https://api.github.com/repos/octo/demo/pulls/3"}},
+]
+
+COMMENTS = [
+    {"id": 100, "issue_url": "https://api.github.com/repos/octo/demo/issues/1", "user": {"login": "bob"},
+     "body": "Reproduced with a shallow clone", "created_at": "2024-01-04T00:00:00Z",
+     "updated_at": "2024-01-04T00:00:00Z"},
+]
+
+
+class TestIssueMirror(unittest.TestCase):
+    """Syncs a local stand-in for the GitHub API into the mirror and queries it"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.mirror = IssueMirror(Path(self.temp_dir) / "github_mirror.db")
+        self.issues = [dict(issue) for issue in ISSUES]
+        self.queries = []
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.temp_dir)
+
+    async def sync(self):
+        def since_filter(items, request):
+            self.queries.append((request.path, request.query.get('since')))
+            since = request.query.get('since', '')
+            return sorted((item for item in items if item['updated_at'] >= since),
+                          key=lambda item: item['updated_at'])
+
+        async def issues(request):
+            return web.json_response(since_filter(self.issues, request))
+
+        async def comments(request):
+            return web.json_response(since_filter(COMMENTS, request))
+
+        app = web.Application()
+        app.router.add_get('/repos/octo/demo/issues', issues)
+        app.router.add_get('/repos/octo/demo/issues/comments', comments)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        try:
+            async with GitHubClient(FakeAuth(), f"http://127.0.0.1:{runner.addresses[0][1]}") as client:
+                return await self.mirror.sync(client, 'octo/demo')
+        finally:
+            await runner.cleanup()
+
+    def test_incremental_sync(self):
+        """Test that later syncs only ask for what changed since the watermark"""
+        self.assertEqual(asyncio.run(self.sync()), {'items': 3, 'comments': 1})
+        self.assertEqual(self.queries, [('/repos/octo/demo/issues', None),
+                                        ('/repos/octo/demo/issues/comments', None)])
+
+        self.issues[1] = {**self.issues[1], "state": "open", "updated_at": "2024-02-01T00:00:00Z"}
+        self.queries.clear()
+        synced = asyncio.run(self.sync())
+        # Items at the watermark come back again and are simply upserted
+        self.assertEqual(synced, {'items': 2, 'comments': 1})
+        self.assertEqual(self.queries, [('/repos/octo/demo/issues', '2024-01-07T00:00:00Z'),
+                                        ('/repos/octo/demo/issues/comments', '2024-01-04T00:00:00Z')])
+        self.assertEqual([item['number'] for item in self.mirror.query('octo/demo')], [2, 1])
+        self.assertEqual(self.mirror.stats('octo/demo')['issues'], 2)
+        self.assertEqual(self.mirror.repositories(), ['octo/demo'])
+
+    def test_offline_queries(self):
+        """Test filtering, sorting and full-text search against the mirror"""
+        asyncio.run(self.sync())
+        query = self.mirror.query
+
+        self.assertEqual([item['number'] for item in query('octo/demo', 'issue', 'all')], [2, 1])
+        self.assertEqual([item['number'] for item in query('octo/demo', 'pr')], [3])
+        self.assertEqual([item['number'] for item in query('octo/demo', 'issue', 'all', sort='number', limit=1)], [2])
+        self.assertEqual([item['number'] for item in query('octo/demo', 'issue', 'all', label='bug')], [1])
+        self.assertEqual([item['number'] for item in query('octo/demo', 'pr', assignee='alice')], [3])
+        self.assertEqual(query('octo/demo', 'issue', assignee='alice'), [])
+
+        # Titles, bodies and comments are all searchable
+        self.assertEqual([item['number'] for item in query('octo/demo', 'issue', 'all', text='shallow')], [1])
+        self.assertEqual([item['number'] for item in query('octo/demo', 'pr', text='startup crash')], [3])
+        self.assertEqual(query('octo/demo', 'issue', text='"unbalanced'), [])
+
+        issue = query('octo/demo', 'issue', label='bug')[0]
+        self.assertEqual(issue['labels'], [{'name': 'bug'}])
+        self.assertEqual(issue['assignees'], [{'login': 'bob'}])
+        self.assertEqual(issue['user'], {'login': 'alice'})
+
+
+if __name__ == '__main__':
+    unittest.main()
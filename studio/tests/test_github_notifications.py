@@ -0,0 +1,101 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import aiohttp
+
+from studio.github.client import GitHubClient, GitHubAPIError
+from studio.github.fake_server import FakeGitHub, FakeAuth, NOTIFICATIONS
+from studio.github.notifications import NotificationStore, NotificationWatcher
+
+
+class TestNotificationWatcher(unittest.TestCase):
+    """Polls the fake GitHub server's notification feed"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_conditional_polling_reports_deltas(self):
+        """Test If-Modified-Since 304s, X-Poll-Interval and only new threads being reported"""
+        fake = FakeGitHub(repos=5, issues=5)
+        fake.poll_interval = 0
+        store = NotificationStore(self.temp_dir / "notifications.db")
+
+        async def scenario():
+            async with fake:
+                async with GitHubClient(FakeAuth(), fake.url, rate=1000, burst=1000) as client:
+                    watcher = NotificationWatcher(client, store)
+                    first, interval = await watcher.poll()
+                    fake.reset_stats()
+                    quota = client.rate_limit_status()['remaining']
+                    idle = [await watcher.poll() for _ in range(3)]
+                    idle_stats = fake.stats()
+                    used = quota - client.rate_limit_status()['remaining']
+
+                    fake.notify("You were mentioned")
+                    batches = []
+                    await watcher.watch(batches.append, max_polls=watcher.polls + 2)
+
+                    async with client.patch('/notifications/threads/1000') as response:
+                        self.assertEqual(response.status, 205)
+                    read, _ = await watcher.poll()
+                    return first, interval, idle, idle_stats, used, batches, read, watcher
+
+        first, interval, idle, idle_stats, used, batches, read, watcher = asyncio.run(scenario())
+        self.assertEqual(len(first), NOTIFICATIONS)
+        self.assertEqual(interval, 0)
+        self.assertEqual(idle, [([], 0)] * 3)
+        # An idle feed costs nothing: every poll was a 304 that used no quota
+        self.assertEqual(idle_stats['not_modified'], 3)
+        self.assertEqual(used, 0)
+        self.assertEqual([[thread['subject']['title'] for thread in batch] for batch in batches],
+                         [["You were mentioned"]])
+        self.assertEqual(read, [])
+        self.assertNotIn("1000", [thread['id'] for thread in store.unread()])
+        self.assertEqual(len(store.unread()), NOTIFICATIONS)
+        self.assertEqual(watcher.not_modified, 4)
+
+        # The Last-Modified survives a restart: a new watcher starts with a 304
+        reopened = NotificationStore(self.temp_dir / "notifications.db")
+        self.assertIsNotNone(reopened.poll_state("notifications?all=false")[0])
+        store.close()
+        reopened.close()
+
+    def test_watch_survives_network_errors(self):
+        """Test that failed polls back off and the watch keeps going until an API error that is not transient"""
+        store = NotificationStore(self.temp_dir / "notifications.db")
+        watcher = NotificationWatcher(None, store)
+        outcomes = [aiohttp.ClientConnectionError("Connection reset"), asyncio.TimeoutError(),
+                    GitHubAPIError(502, "/notifications"), [{"id": "1"}], GitHubAPIError(401, "/notifications")]
+
+        async def poll():
+            watcher.polls += 1
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome, 0
+
+        watcher.poll = poll
+        batches, errors = [], []
+        with patch('studio.github.notifications.ERROR_RETRY_DELAY', 0.001):
+            with self.assertRaises(GitHubAPIError):
+                asyncio.run(watcher.watch(batches.append, on_error=lambda error, delay: errors.append((error, delay))))
+        store.close()
+
+        self.assertEqual(batches, [[{"id": "1"}]])
+        self.assertEqual(watcher.errors, 3)
+        self.assertEqual(watcher.failures, 0)
+        self.assertEqual([type(error) for error, _ in errors],
+                         [aiohttp.ClientConnectionError, asyncio.TimeoutError, GitHubAPIError])
+        # Consecutive failures double the delay
+        self.assertLess(errors[0][1], errors[2][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import asyncio
+import aiohttp
+from datetime import datetime, timezone
+
+from studio.github.client import GitHubClient
+from studio.github.fake_server import FakeGitHub, FakeAuth
+from studio.github.portfolio import PortfolioStats, release_cadence, sort_report, report_totals
+
+
+class TestPortfolioStats(unittest.TestCase):
+    """Collects org-wide stats from the fake GitHub server"""
+
+    def test_fan_out_with_computing_stats(self):
+        """Test concurrent rows, 202 retries on /stats/*, errors and sorting"""
+        fake = FakeGitHub(repos=30, issues=60)
+        names = [fake.repo_name(i) for i in range(30)] + ["octo/missing"]
+
+        async def scenario():
+            async with fake:
+                async with GitHubClient(FakeAuth(), fake.url, rate=1000, burst=1000) as client:
+                    done = []
+                    rows = await PortfolioStats(client, concurrency=4, stats_delay=0.01).run(names, done.append)
+                    return rows, done
+
+        rows, done = asyncio.run(scenario())
+        self.assertEqual([row['repo'] for row in rows], names)
+        self.assertEqual(len(done), len(names))
+        self.assertEqual(rows[-1]['error'], "GitHub API returned 404")
+
+        first = rows[0]
+        self.assertEqual(first['contributors'], 42)
+        self.assertEqual(first['open_prs'], len(fake.issue_numbers(fake.repo_name(0), 'pr', 'open')))
+        self.assertEqual(first['open_issues'], 40 - first['open_prs'])
+        # Every participation request was answered 202 once, then retried
+        self.assertTrue(all(row['commits_year'] is not None for row in rows[:-1]))
+        self.assertEqual(fake.paths['GET /repos/octo/repo-00003/stats/participation'], 2)
+        self.assertEqual(first['last_release'], "2024-01-31")
+
+        by_stars = sort_report(rows, 'stars')
+        self.assertEqual(by_stars[-1]['repo'], "octo/missing")
+        self.assertEqual([row['stars'] for row in by_stars[:-1]], sorted((row['stars'] for row in rows[:-1]), reverse=True))
+        self.assertEqual(report_totals(rows)['contributors'], 42 * 30)
+
+    def test_network_errors_stay_in_their_row(self):
+        """Test that a connection error or timeout on one repository does not abort the report"""
+        fake = FakeGitHub(repos=3, issues=6)
+        names = [fake.repo_name(i) for i in range(3)]
+        failures = {f"/repos/{names[0]}": aiohttp.ClientConnectionError("Connection reset by peer"),
+                    f"/repos/{names[1]}/releases": asyncio.TimeoutError()}
+
+        async def scenario():
+            async with fake:
+                async with GitHubClient(FakeAuth(), fake.url, rate=1000, burst=1000) as client:
+                    get_json = client.get_json
+
+                    async def flaky_get_json(path, params=None):
+                        if path in failures:
+                            raise failures[path]
+                        return await get_json(path, params)
+
+                    client.get_json = flaky_get_json
+                    return await PortfolioStats(client, stats_delay=0.01).run(names)
+
+        rows = asyncio.run(scenario())
+        self.assertEqual(rows[0]['error'], "Network error: Connection reset by peer")
+        self.assertEqual(rows[1]['error'], "Request timed out")
+        self.assertEqual(rows[2]['error'], "")
+        self.assertIsNotNone(rows[2]['stars'])
+
+    def test_release_cadence(self):
+        """Test releases in the last year and the median interval, ignoring drafts"""
+        releases = [{'published_at': stamp} for stamp in
+                    ("2026-01-01T00:00:00Z", "2026-01-11T00:00:00Z", "2026-02-10T00:00:00Z", "2024-01-01T00:00:00Z")]
+        releases.append({'draft': True, 'created_at': "2026-03-01T00:00:00Z"})
+        cadence = release_cadence(releases, now=datetime(2026, 6, 1, tzinfo=timezone.utc))
+        self.assertEqual(cadence, {'releases_year': 3, 'release_interval': 30.0, 'last_release': "2026-02-10"})
+        self.assertEqual(release_cadence([])['release_interval'], None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import asyncio
+import json
+import tracemalloc
+
+from studio.github.client import GitHubClient
+from studio.github.fake_server import FakeGitHub, FakeAuth
+from studio.github.records import RepoRecord, IssueRecord
+
+
+def full_repo(index):
+    """A repository as the API returns it, with the nested objects listings carry"""
+    return {
+        'id': index, 'node_id': f"R_{index:08d}", 'name': f"repo-{index}", 'full_name': f"octo/repo-{index}",
+        'private': False, 'description': f"Repository number {index}", 'language': 'Python',
+        'owner': {'login': 'octo', 'id': 1, 'avatar_url': "https://avatars.githubusercontent.com/u/1",
+                  'type': 'Organization', 'url': "https://api.github.com/users/octo"},
+        'permissions': {'admin': True, 'maintain': True, 'push': True, 'triage': True, 'pull': True},
+        'license': {'key': 'mit', 'name': 'MIT License', 'spdx_id': 'MIT'},
+        'topics': ['cli', 'git'], 'stargazers_count': index, 'forks_count': 0,
+        'updated_at': "2024-01-01T00:00:00Z", 'html_url': f"https://github.com/octo/repo-{index}",
+        **{f"{name}_url": f"https://api.github.com/repos/octo/repo-{index}/{name}"
+           for name in ('hooks', 'issues', 'pulls', 'commits', 'branches', 'tags', 'releases', 'clone', 'ssh')}
+    }
+
+
+class TestRecords(unittest.TestCase):
+    """Checks the field-projected listing records"""
+
+    def test_record_reads_like_the_dict(self):
+        """Test lookups, missing fields, shared nested objects and JSON conversion"""
+        data = full_repo(7)
+        del data['language']
+        record = RepoRecord.from_json(data)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record['name'], "repo-7")
+        self.assertEqual(record['owner']['login'], "octo")
+        self.assertEqual(record.get('language', 'N/A'), 'N/A')
+        self.assertNotIn('language', record)
+        self.assertNotIn('permissions', record)
+        with self.assertRaises(KeyError):
+            record['permissions']
+        self.assertIs(RepoRecord.from_json(full_repo(8))['owner'], record['owner'])
+        self.assertEqual(json.loads(json.dumps(record.to_dict()))['owner'], {'login': 'octo'})
+
+        pull = IssueRecord.from_json({'number': 5, 'user': None, 'pull_request': {'url': 'u', 'diff_url': 'd'}})
+        self.assertEqual(dict(pull['pull_request']), {'url': 'u'})
+        self.assertIsNone(pull['user'])
+
+    def test_records_use_less_memory(self):
+        """Test that 5,000 records take a fraction of the decoded dicts"""
+        payload = json.dumps([full_repo(i) for i in range(5000)])
+
+        def measure(decode):
+            tracemalloc.start()
+            kept = decode(json.loads(payload))
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            self.assertEqual(len(kept), 5000)
+            return size
+
+        self.assertLess(measure(RepoRecord.page) * 4, measure(list))
+
+    def test_paginate_projects_each_page(self):
+        """Test that paginate hands each decoded page to the projection"""
+        fake = FakeGitHub(repos=250, issues=10)
+        pages = []
+
+        def project(items):
+            pages.append(len(items))
+            return RepoRecord.page(items)
+
+        async def scenario():
+            async with fake:
+                async with GitHubClient(FakeAuth(), fake.url) as client:
+                    return await client.paginate('/user/repos', project=project)
+
+        repos = asyncio.run(scenario())
+        self.assertEqual(pages, [100, 100, 50])
+        self.assertEqual([repo['full_name'] for repo in repos[:2]], ["octo/repo-00000", "octo/repo-00001"])
+        self.assertTrue(all(isinstance(repo, RepoRecord) for repo in repos))
+
+
+if __name__ == '__main__':
+    unittest.main()
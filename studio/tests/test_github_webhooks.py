@@ -0,0 +1,145 @@
+import unittest
+import asyncio
+import json
+import tempfile
+import shutil
+from pathlib import Path
+
+import aiohttp
+
+from studio.github.http_cache import HTTPCache
+from studio.github.mirror import IssueMirror
+from studio.github.webhooks import WebhookApplier, WebhookReceiver, sign, replay
+
+REPO = {"full_name": "octo/demo"}
+
+ISSUE = {"number": 1, "title": "Crash on startup", "body": "Traceback when opening a repo", "state": "open",
+         "user": {"login": "alice"}, "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-05T00:00:00Z",
+         "html_url": "https://github.com/octo/demo/issues/1", "labels": [{"name": "bug"}], "assignees": []}
+
+
+class TestWebhooks(unittest.TestCase):
+    """Applies webhook deliveries to a mirror and an HTTP cache"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.mirror = IssueMirror(self.temp_dir / "github_mirror.db")
+        self.mirror.store_items('octo/demo', [ISSUE])
+        self.cache = HTTPCache(self.temp_dir / "http_cache.db")
+        self.applier = WebhookApplier(self.mirror, self.cache, "https://api.github.com")
+
+    def tearDown(self):
+        self.mirror.close()
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_signed_deliveries(self):
+        """Test that signed events update the mirror and unsigned or forged ones are rejected"""
+        receiver = WebhookReceiver(self.applier, secret="s3cret")
+        edited = {"action": "edited", "repository": REPO,
+                  "issue": {**ISSUE, "title": "Crash when opening a repo", "updated_at": "2024-03-01T00:00:00Z"}}
+
+        async def scenario():
+            url = await receiver.start(port=0)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    statuses = []
+                    for signature in (None, "sha256=" + "0" * 64, sign("s3cret", json.dumps(edited).encode())):
+                        headers = {'X-GitHub-Event': 'issues', 'X-GitHub-Delivery': 'd-1',
+                                   'Content-Type': 'application/json'}
+                        if signature:
+                            headers['X-Hub-Signature-256'] = signature
+                        async with session.post(url, data=json.dumps(edited), headers=headers) as response:
+                            statuses.append(response.status)
+                    return statuses
+            finally:
+                await receiver.stop()
+
+        self.assertEqual(asyncio.run(scenario()), [401, 401, 202])
+        self.assertEqual(receiver.rejected, 2)
+        self.assertEqual(self.mirror.query('octo/demo', text='opening')[0]['title'], "Crash when opening a repo")
+        # The sync watermark stays where the last sync left it
+        self.assertEqual(self.mirror.watermarks('octo/demo')['issues'], "2024-01-05T00:00:00Z")
+
+    def test_secret_required(self):
+        """Test that the receiver refuses to start without a secret unless explicitly insecure"""
+        receiver = WebhookReceiver(self.applier, secret="")
+        with self.assertRaises(ValueError):
+            asyncio.run(receiver.start(port=0))
+
+        insecure = WebhookReceiver(self.applier, secret="", insecure=True)
+
+        async def scenario():
+            url = await insecure.start(port=0)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(url, data=json.dumps({"zen": "hi"}),
+                                            headers={'X-GitHub-Event': 'ping'}) as response:
+                        return response.status
+            finally:
+                await insecure.stop()
+
+        self.assertEqual(asyncio.run(scenario()), 200)
+
+    def test_pull_request_invalidates_issue_listings(self):
+        """Test that a pull_request event drops cached issue listings, which include pull requests"""
+        for path in ("/repos/octo/demo/issues", "/repos/octo/demo/pulls", "/repos/octo/demo/branches"):
+            url = "https://api.github.com" + path
+            self.cache.put(self.cache.key(url, {'state': 'all'}, {}), url, '"etag"', None, {}, b"[]")
+
+        pull = {"number": 3, "title": "Add docs", "state": "open", "user": {"login": "bob"},
+                "created_at": "2024-02-01T00:00:00Z", "updated_at": "2024-02-02T00:00:00Z",
+                "html_url": "https://github.com/octo/demo/pull/3", "labels": [], "assignees": []}
+        result = self.applier.apply('pull_request', {"action": "opened", "repository": REPO, "pull_request": pull})
+        self.assertEqual(result['invalidated'], 2)
+        self.assertEqual(self.cache.db.execute("SELECT url FROM responses").fetchall(),
+                         [("https://api.github.com/repos/octo/demo/branches",)])
+
+    def test_replay_fixtures(self):
+        """Test replaying recorded deliveries: stale, duplicate and unmirrored events change nothing"""
+        for path in ("/repos/octo/demo/branches", "/repos/octo/demo/branches/main", "/repos/octo/demo",
+                     "/repos/octo/demo/issues", "/repos/octo/demo-docs/branches"):
+            url = "https://api.github.com" + path
+            self.cache.put(self.cache.key(url, None, {}), url, '"etag"', None, {}, b"[]")
+
+        pull = {"number": 2, "title": "Fix startup crash", "body": "Closes #1", "state": "closed", "merged": True,
+                "user": {"login": "bob"}, "created_at": "2024-02-01T00:00:00Z", "updated_at": "2024-02-02T00:00:00Z",
+                "html_url": "https://github.com/octo/demo/pull/2", "url": "https://api.github.com/repos/octo/demo/pulls/2",
+                "labels": [], "assignees": []}
+        deliveries = [
+            {"event": "pull_request", "delivery": "a", "payload": {"action": "closed", "repository": REPO, "pull_request": pull}},
+            {"event": "pull_request", "delivery": "a", "payload": {"action": "closed", "repository": REPO, "pull_request": pull}},
+            {"event": "issues", "payload": {"action": "edited", "repository": REPO,
+                                            "issue": {**ISSUE, "title": "Old title", "updated_at": "2023-12-01T00:00:00Z"}}},
+            {"event": "issue_comment", "payload": {"action": "created", "repository": REPO, "issue": ISSUE, "comment": {
+                "id": 100, "issue_url": "https://api.github.com/repos/octo/demo/issues/1", "user": {"login": "bob"},
+                "body": "Reproduced with a shallow clone", "created_at": "2024-01-04T00:00:00Z",
+                "updated_at": "2024-01-04T00:00:00Z"}}},
+            {"event": "issues", "payload": {"action": "opened", "repository": {"full_name": "octo/other"}, "issue": ISSUE}},
+            {"event": "push", "payload": {"ref": "refs/heads/main", "repository": REPO}},
+        ]
+        fixtures = self.temp_dir / "deliveries.jsonl"
+        fixtures.write_text("\n".join(json.dumps(delivery) for delivery in deliveries))
+
+        results = replay(self.applier, [str(fixtures)])
+        self.assertEqual([result.get('mirrored') for result in results], [1, None, 0, 2, 0, 0])
+        self.assertTrue(results[1]['duplicate'])
+        self.assertEqual(results[-1]['invalidated'], 3)
+        # The issue events dropped the cached issue listing; the other repository is untouched
+        self.assertEqual(self.cache.db.execute("SELECT url FROM responses").fetchall(),
+                         [("https://api.github.com/repos/octo/demo-docs/branches",)])
+
+        self.assertEqual([item['number'] for item in self.mirror.query('octo/demo', 'pr', 'closed')], [2])
+        self.assertEqual(self.mirror.query('octo/demo')[0]['title'], "Crash on startup")
+        self.assertEqual([item['number'] for item in self.mirror.query('octo/demo', text='shallow')], [1])
+        self.assertEqual(self.mirror.repositories(), ['octo/demo'])
+
+        self.applier.apply('issue_comment', {"action": "deleted", "repository": REPO, "issue": ISSUE,
+                                             "comment": {"id": 100}})
+        self.applier.apply('issues', {"action": "deleted", "repository": REPO, "issue": ISSUE})
+        self.assertEqual(self.mirror.query('octo/demo', text='shallow'), [])
+        self.assertEqual(self.mirror.query('octo/demo', 'issue', 'all'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import tempfile
+import shutil
+import json
+import time
+import threading
+from pathlib import Path
+
+
+class TestMemoryProfile(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_memory_profile_records_peak(self):
+        """Test that a memory profile stores the peak next to latency data"""
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(self.temp_dir)
+
+        with monitor.memory_profile("allocate", top=5) as profile:
+            blob = [bytearray(1024) for _ in range(2000)]
+
+        self.assertFalse(monitor.memory_profile_active)
+        self.assertGreater(profile["peak_traced_memory"], 2000 * 1024)
+        self.assertTrue(profile["top_by_size"])
+        self.assertLessEqual(len(profile["top_by_count"]), 5)
+
+        op_metrics = monitor.get_operation_stats("allocate")
+        self.assertEqual(op_metrics["count"], 1)
+        self.assertEqual(op_metrics["peak_traced_memory"], profile["peak_traced_memory"])
+        del blob
+
+    def test_stop_without_start(self):
+        """Test stopping a profile that was never started"""
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(self.temp_dir)
+        self.assertEqual(monitor.stop_memory_profile("noop"), {})
+
+    def test_outer_tracing_left_running(self):
+        """Test that a profile does not stop tracing it did not start"""
+        import tracemalloc
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(self.temp_dir)
+        tracemalloc.start()
+        try:
+            monitor.start_memory_profile()
+            monitor.stop_memory_profile("nested")
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+        monitor.start_memory_profile()
+        monitor.stop_memory_profile("own")
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+class TestSampleRing(unittest.TestCase):
+    def test_wraps_and_windows(self):
+        """Test that the ring keeps the newest samples and windows by time"""
+        from studio.utils.resource_sampler import SampleRing
+
+        ring = SampleRing(("value",), capacity=4)
+        for i in range(6):
+            ring.append(100.0 + i, {"value": i})
+
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.column("value"), [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(ring.column("value", since=104.0), [4.0, 5.0])
+
+        stats = ring.window_stats(since=103.0)
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["value"]["min"], 3.0)
+        self.assertEqual(stats["value"]["avg"], 4.0)
+        self.assertEqual(ring.window_stats(since=200.0), {})
+
+        self.assertEqual(ring.discard_before(104.0), 2)
+        self.assertEqual(ring.to_records()[0], {"timestamp": 104.0, "value": 4.0})
+
+
+class TestResourceSampler(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_sampling_persists_on_stop(self):
+        """Test that background samples are persisted once sampling stops"""
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        monitor = PerformanceMonitor(self.temp_dir)
+        with monitor.sampling(interval=0.01):
+            time.sleep(0.1)
+
+        self.assertFalse(monitor.sampler.running)
+        self.assertGreaterEqual(monitor.get_memory_stats()["count"], 3)
+        self.assertGreaterEqual(monitor.get_cpu_stats()["count"], 3)
+
+        with open(Path(self.temp_dir) / "performance_metrics.json") as f:
+            saved = json.load(f)
+        self.assertEqual(len(saved["memory_usage"]), len(monitor.memory_samples))
+
+    def test_sampling_survives_errors(self):
+        """Test that a failing sample is logged and sampling carries on"""
+        from studio.utils.resource_sampler import ResourceSampler, SampleRing
+
+        sampler = ResourceSampler(SampleRing(["rss"]), SampleRing(["cpu"]), interval=0.01)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) <= 2:
+                raise OSError("process table unavailable")
+
+        sampler.sample_once = flaky
+        with self.assertLogs("studio.utils.resource_sampler", "ERROR"):
+            sampler._thread = threading.Thread(target=sampler._run, daemon=True)
+            sampler._thread.start()
+            time.sleep(0.1)
+            self.assertTrue(sampler.running)
+            sampler._stop_event.set()
+            sampler._thread.join()
+        self.assertEqual(sampler.errors, 2)
+        self.assertGreater(len(calls), 2)
+
+    def test_loads_iso_timestamps(self):
+        """Test that metrics saved with ISO timestamps are still windowed"""
+        from datetime import datetime, timedelta
+        from studio.utils.performance_monitor import PerformanceMonitor
+
+        old = (datetime.now() - timedelta(hours=48)).isoformat()
+        recent = datetime.now().isoformat()
+        sample = {"rss": 1, "vms": 2, "percent": 0.5, "available": 3}
+        with open(Path(self.temp_dir) / "performance_metrics.json", "w") as f:
+            json.dump({
+                "operations": {}, "git_operations": {}, "startup_time": None, "total_operations": 0,
+                "memory_usage": [dict(sample, timestamp=old), dict(sample, timestamp=recent)],
+                "cpu_usage": []
+            }, f)
+
+        monitor = PerformanceMonitor(self.temp_dir)
+        self.assertEqual(monitor.get_memory_stats(hours=24)["count"], 1)
+        self.assertEqual(monitor.get_memory_stats(hours=72)["count"], 2)
+        self.assertEqual(monitor.get_cpu_stats(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import asyncio
+import tempfile
+import shutil
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from studio.db.sqlite_manager import SQLiteManager
+
+INSERT = "INSERT INTO repositories (path, name) VALUES (?, ?)"
+
+
+class TestSQLiteManager(unittest.TestCase):
+    """Persistent WAL connections, batched writes and the read connection"""
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.db_path = self.temp_dir / "studio.db"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def run_with_manager(self, test, db_path=None):
+        async def main():
+            async with SQLiteManager(str(db_path or self.db_path)) as manager:
+                await test(manager)
+        asyncio.run(main())
+
+    def test_persistent_wal_connections(self):
+        """Test that queries reuse one writer and a separate read-only reader in WAL mode"""
+        async def test(manager):
+            writer, reader = manager._writer, manager._reader
+            self.assertIsNot(writer, reader)
+            await manager.execute(INSERT, ("/src/a", "a"))
+            self.assertEqual(await manager.fetchall("SELECT name FROM repositories"), [("a",)])
+            self.assertIs(manager._writer, writer)
+            self.assertIs(manager._reader, reader)
+            self.assertEqual((await manager.fetchone("PRAGMA journal_mode"))[0], "wal")
+            async with writer.execute("PRAGMA synchronous") as cursor:
+                self.assertEqual((await cursor.fetchone())[0], 1)  # NORMAL
+            with self.assertRaises(sqlite3.OperationalError):
+                async with reader.execute("DELETE FROM repositories"):
+                    pass
+        self.run_with_manager(test)
+
+    def test_executemany_and_transactions(self):
+        """Test bulk inserts, batched commits and rollback of a failed batch"""
+        async def test(manager):
+            rows = [(f"/src/{i}", f"repo{i}") for i in range(500)]
+            self.assertEqual(await manager.executemany(INSERT, rows), 500)
+
+            async with manager.transaction():
+                await manager.execute(INSERT, ("/src/x", "x"))
+                await manager.executemany(INSERT, [("/src/y", "y"), ("/src/z", "z")])
+                # Visible inside the transaction, not yet to the reader connection
+                self.assertEqual((await manager.fetchone("SELECT COUNT(*) FROM repositories"))[0], 503)
+                async with manager._reader.execute("SELECT COUNT(*) FROM repositories") as cursor:
+                    self.assertEqual((await cursor.fetchone())[0], 500)
+            self.assertEqual((await manager.fetchone("SELECT COUNT(*) FROM repositories"))[0], 503)
+
+            with self.assertRaises(sqlite3.IntegrityError):
+                async with manager.transaction():
+                    await manager.execute(INSERT, ("/src/new", "new"))
+                    await manager.execute(INSERT, ("/src/x", "duplicate"))
+            self.assertEqual((await manager.fetchone("SELECT COUNT(*) FROM repositories"))[0], 503)
+            self.assertIsNone(await manager.fetchone("SELECT 1 FROM repositories WHERE path = '/src/new'"))
+        self.run_with_manager(test)
+
+    def test_concurrent_writers(self):
+        """Test that writes from concurrent tasks are serialised around a transaction"""
+        async def test(manager):
+            async def batch(n):
+                async with manager.transaction():
+                    for i in range(20):
+                        await manager.execute(INSERT, (f"/src/{n}/{i}", str(n)))
+                        await asyncio.sleep(0)
+
+            await asyncio.gather(*(batch(n) for n in range(5)),
+                                 *(manager.execute(INSERT, (f"/single/{n}", "s")) for n in range(5)))
+            self.assertEqual((await manager.fetchone("SELECT COUNT(*) FROM repositories"))[0], 105)
+        self.run_with_manager(test)
+
+    def test_in_memory_database(self):
+        """Test that an in-memory database is read through its single connection"""
+        async def test(manager):
+            self.assertIs(manager._reader, manager._writer)
+            await manager.execute(INSERT, ("/src/a", "a"))
+            self.assertEqual(await manager.fetchall("SELECT path FROM repositories"), [("/src/a",)])
+        self.run_with_manager(test, ":memory:")
+
+    def test_unclosed_manager_does_not_block_exit(self):
+        """Test that connections left open close with their loop and never keep the process alive"""
+        code = (
+            "import asyncio, sys\n"
+            "from studio.db.sqlite_manager import SQLiteManager\n"
+            "manager = SQLiteManager(sys.argv[1])\n"
+            "async def main():\n"
+            "    await manager.execute('INSERT INTO repositories (path) VALUES (?)', ('/src/a',))\n"
+            "    await manager.execute('INSERT INTO repositories (path) VALUES (?)', ('/src/b',))\n"
+            "asyncio.run(main())\n"
+            "print(manager._writer is None)\n"
+            "loop = asyncio.new_event_loop()\n"
+            "loop.run_until_complete(manager.execute('INSERT INTO repositories (path) VALUES (?)', ('/src/c',)))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code, str(self.db_path)], cwd=Path(__file__).resolve().parents[2],
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        # asyncio.run closed the connections as its loop shut down
+        self.assertEqual(result.stdout.strip(), "True")
+        with sqlite3.connect(self.db_path) as db:
+            self.assertEqual(db.execute("SELECT COUNT(*) FROM repositories").fetchone()[0], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable
 from datetime import datetime, timedelta
 from rich.console import Console
 from rich.table import Table
@@ -17,6 +17,8 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from rich.text import Text
 
+from studio.utils.export_writers import EXPORT_FORMATS, export_filename, write_rows
+
 console = Console()
 
 class AdvancedSearch:
@@ -489,38 +491,30 @@ class AdvancedSearch:
             size_bytes /= 1024.0
         return f"{size_bytes:.1f} TB"
     
-    def export_search_results(self, results: List[Dict[str, Any]], format: str = "json",
-                            filename: Optional[str] = None) -> str:
-        """Export search results to file"""
+    def export_search_results(self, results: Iterable[Dict[str, Any]], format: str = "json",
+                            filename: Optional[str] = None, compression: Optional[str] = None) -> str:
+        """Export search results to file
+        
+        jsonl, csv, parquet and arrow are written as results arrive (columns are
+        the keys of the first result), so results may be any iterable, including
+        a generator.
+        """
+        format = format.lower()
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"search_results_{timestamp}.{format}"
+            filename = export_filename(f"search_results_{timestamp}", format, compression)
         
         file_path = Path.cwd() / filename
         
         try:
-            if format.lower() == "json":
+            if format == "json" and compression is None:
                 import json
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False, default=str)
-            elif format.lower() == "csv":
-                import csv
-                with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                    if results:
-                        writer = csv.writer(f)
-                        # Get all possible keys
-                        all_keys = set()
-                        for result in results:
-                            all_keys.update(result.keys())
-                        
-                        headers = sorted(all_keys)
-                        writer.writerow(headers)
-                        
-                        for result in results:
-                            row = [result.get(key, "") for key in headers]
-                            writer.writerow(row)
+                    json.dump(list(results), f, indent=2, ensure_ascii=False, default=str)
+            elif format in EXPORT_FORMATS:
+                write_rows(results, file_path, format, compression=compression)
             else:
-                raise ValueError(f"Unsupported format: {format}")
+                raise ValueError(f"Unsupported format: {format}" + (" (compression needs jsonl, csv, parquet or arrow)" if compression else ""))
             
             console.print(f"[green]✅ Search results exported to {file_path}[/]")
             return str(file_path)
@@ -1,11 +1,19 @@
 """
 Export functionality for GitFlow Studio
-Allows users to export analytics data in JSON/CSV formats
+Allows users to export analytics data in JSON/CSV (or Parquet/Arrow) formats, and commit history as streamed
+JSON Lines/CSV/Parquet/Arrow
 """
 
 import json
 import csv
 import os
+import time
+import asyncio
+import hashlib
+import tarfile
+import zipfile
+import tempfile
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
@@ -15,19 +23,43 @@ from rich.panel import Panel
 from rich import box
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from studio.git.git_operations import COMMIT_FIELDS, FILE_CHANGE_FIELDS
+from studio.utils.export_writers import (Rows, EXPORT_FORMATS, COLUMNAR_FORMATS, export_filename, require_pyarrow,
+                                         stream_rows, write_rows)
+
 console = Console()
 
+# Fixed columns of the streamed history datasets
+HISTORY_DATASETS = {'commits': COMMIT_FIELDS, 'file_changes': FILE_CHANGE_FIELDS}
+# Incremental exports: <output_dir>/incremental/<repository>/<dataset>/{manifest.json, part-NNNNN.*}
+INCREMENTAL_DIR = "incremental"
+MANIFEST_NAME = "manifest.json"
+# Analytics datasets computed by export_analytics, in manifest order
+ANALYTICS_DATASETS = ('stats', 'activity', 'files', 'branches', 'contributors', 'health')
+# Archive format -> (file suffix, tarfile mode or None for zip)
+ARCHIVE_FORMATS = {'zip': ('.zip', None), 'tar': ('.tar', 'w'), 'tar.gz': ('.tar.gz', 'w:gz')}
+# Columns of the analytics tables when written as Parquet/Arrow: one row per entry of
+# get_file_changes()['most_changed_files'] and of get_contributor_stats()['details'];
+# the other datasets become metric/value rows
+FILE_CHANGE_COLUMNS = ('file', 'changes')
+CONTRIBUTOR_COLUMNS = ('hash', 'author', 'email', 'date', 'message')
+METRIC_COLUMNS = ('metric', 'value')
+
 class ExportManager:
     """Manages data export functionality for GitFlow Studio"""
     
     def __init__(self, output_dir: Optional[str] = None):
         self.output_dir = output_dir or Path.cwd() / "exports"
-        self._ensure_output_dir()
     
     def _ensure_output_dir(self):
         """Ensure output directory exists"""
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
     
+    def _output_path(self, filename: str) -> Path:
+        """Path for a new export file; the output directory is created on first export"""
+        self._ensure_output_dir()
+        return Path(self.output_dir) / filename
+    
     def export_repository_stats(self, stats: Dict[str, Any], format: str = "json", 
                                filename: Optional[str] = None) -> str:
         """Export repository statistics"""
@@ -35,7 +67,7 @@ class ExportManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"repo_stats_{timestamp}.{format}"
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
@@ -58,7 +90,7 @@ class ExportManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"commit_activity_{timestamp}.{format}"
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
@@ -79,15 +111,17 @@ class ExportManager:
         """Export file change statistics"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"file_changes_{timestamp}.{format}"
+            filename = export_filename(f"file_changes_{timestamp}", format)
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
                 self._export_json(changes, file_path)
             elif format.lower() == "csv":
                 self._export_csv_file_changes(changes, file_path)
+            elif format.lower() in COLUMNAR_FORMATS:
+                write_rows(self._file_change_rows(changes), file_path, format.lower(), FILE_CHANGE_COLUMNS)
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
@@ -104,7 +138,7 @@ class ExportManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"branch_activity_{timestamp}.{format}"
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
@@ -125,15 +159,17 @@ class ExportManager:
         """Export contributor statistics"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"contributor_stats_{timestamp}.{format}"
+            filename = export_filename(f"contributor_stats_{timestamp}", format)
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
                 self._export_json(stats, file_path)
             elif format.lower() == "csv":
                 self._export_csv_contributor_stats(stats, file_path)
+            elif format.lower() in COLUMNAR_FORMATS:
+                write_rows(self._contributor_rows(stats), file_path, format.lower(), CONTRIBUTOR_COLUMNS)
             else:
                 raise ValueError(f"Unsupported format: {format}")
             
@@ -150,7 +186,7 @@ class ExportManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"repo_health_{timestamp}.{format}"
         
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
@@ -209,6 +245,322 @@ class ExportManager:
         console.print(f"[green]✅ Exported {len(exported_files)} analytics files[/]")
         return exported_files
     
+    def _analytics_jobs(self, git_ops, days: int) -> Dict[str, Any]:
+        return {
+            'stats': git_ops.get_repository_stats,
+            'activity': lambda: git_ops.get_commit_activity(days),
+            'files': lambda: git_ops.get_file_changes(days),
+            'branches': git_ops.get_branch_activity,
+            'contributors': git_ops.get_contributor_stats,
+            'health': git_ops.get_repository_health,
+        }
+    
+    async def export_analytics(self, git_ops, format: str = "json", datasets: Optional[List[str]] = None,
+                               days: int = 30, archive: Optional[str] = None) -> List[str]:
+        """Compute analytics datasets concurrently and export each one as soon as it is ready
+        
+        With archive ('zip', 'tar' or 'tar.gz') the datasets and a manifest.json
+        go into one archive instead of separate files. The whole export takes
+        about as long as the slowest dataset.
+        """
+        format = format.lower()
+        jobs = self._analytics_jobs(git_ops, days)
+        datasets = [name for name in ANALYTICS_DATASETS if name in (datasets or ANALYTICS_DATASETS)]
+        if format not in ("json", "csv") + COLUMNAR_FORMATS:
+            console.print(f"[red]Error exporting analytics: unsupported format: {format}[/]")
+            return []
+        if format in COLUMNAR_FORMATS:
+            try:
+                require_pyarrow(format)
+            except RuntimeError as e:
+                console.print(f"[red]Error exporting analytics: {e}[/]")
+                return []
+        if archive is not None and archive not in ARCHIVE_FORMATS:
+            console.print(f"[red]Error exporting analytics: unsupported archive: {archive}[/]")
+            return []
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        prefix = f"analytics_{timestamp}"
+        started = time.monotonic()
+        
+        async def compute(name):
+            start = time.monotonic()
+            try:
+                return name, await jobs[name](), time.monotonic() - start
+            except Exception as e:
+                return name, {'error': str(e)}, time.monotonic() - start
+        
+        manifest = {
+            "repository": str(git_ops.repo_path.resolve()),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "format": format,
+            "days": days,
+            "datasets": {},
+        }
+        exported_files = []
+        staging = tempfile.TemporaryDirectory(dir=self._output_path("")) if archive else None
+        archive_path = self._output_path(prefix + ARCHIVE_FORMATS[archive][0]) if archive else None
+        bundle = self._open_archive(archive_path.with_name(archive_path.name + ".part"), archive) if archive else None
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Computing analytics...", total=len(datasets))
+                for finished in asyncio.as_completed([compute(name) for name in datasets]):
+                    name, data, seconds = await finished
+                    progress.update(task, description=f"Exporting {name}...")
+                    filename = export_filename(f"{prefix}_{name}", format)
+                    file_path = Path(staging.name) / filename if staging else self._output_path(filename)
+                    try:
+                        self._write_dataset(name, data, format, file_path)
+                    except Exception as e:
+                        console.print(f"[red]Error exporting {name}: {e}[/]")
+                        manifest["datasets"][name] = {"error": str(e), "seconds": round(seconds, 3)}
+                        progress.advance(task)
+                        continue
+                    manifest["datasets"][name] = {
+                        "file": filename,
+                        "bytes": file_path.stat().st_size,
+                        "sha256": hashlib.sha256(file_path.read_bytes()).hexdigest(),
+                        "seconds": round(seconds, 3),
+                        **({"error": data["error"]} if isinstance(data, dict) and "error" in data else {}),
+                    }
+                    if bundle is not None:
+                        self._add_to_archive(bundle, file_path, filename)
+                        file_path.unlink()
+                    else:
+                        exported_files.append(str(file_path))
+                    progress.advance(task)
+            
+            manifest["seconds"] = round(time.monotonic() - started, 3)
+            if bundle is not None:
+                manifest_path = Path(staging.name) / MANIFEST_NAME
+                manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+                self._add_to_archive(bundle, manifest_path, MANIFEST_NAME)
+                bundle.close()
+                bundle = None
+                os.replace(archive_path.with_name(archive_path.name + ".part"), archive_path)
+                exported_files.append(str(archive_path))
+        finally:
+            if bundle is not None:
+                bundle.close()
+                archive_path.with_name(archive_path.name + ".part").unlink(missing_ok=True)
+            if staging is not None:
+                staging.cleanup()
+        
+        slowest = max((entry["seconds"] for entry in manifest["datasets"].values()), default=0)
+        where = f"into {archive_path}" if archive else f"to {self.output_dir}"
+        console.print(f"[green]✅ Exported {len(manifest['datasets'])} analytics datasets {where} in "
+                      f"{manifest['seconds']:.1f}s (slowest dataset {slowest:.1f}s)[/]")
+        return exported_files
+    
+    def _open_archive(self, path: Path, archive: str):
+        mode = ARCHIVE_FORMATS[archive][1]
+        return zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) if mode is None else tarfile.open(path, mode)
+    
+    def _add_to_archive(self, bundle, file_path: Path, name: str):
+        if isinstance(bundle, zipfile.ZipFile):
+            bundle.write(file_path, name)
+        else:
+            bundle.add(str(file_path), arcname=name)
+    
+    def _write_dataset(self, data_type: str, data: Any, format: str, file_path: Path):
+        """Write one analytics dataset as JSON, CSV, Parquet or Arrow
+        
+        Dict-shaped results (everything GitOperations computes except health)
+        become Metric/Value rows in CSV; lists use the dataset's CSV layout.
+        In Parquet/Arrow, files and contributors are tables of their own and
+        everything else is metric/value rows.
+        """
+        if format == "json":
+            self._export_json(data, file_path)
+        elif format in COLUMNAR_FORMATS:
+            if isinstance(data, dict) and "error" in data:
+                write_rows(self._metric_rows(data), file_path, format, METRIC_COLUMNS)
+            elif data_type == "files":
+                write_rows(self._file_change_rows(data), file_path, format, FILE_CHANGE_COLUMNS)
+            elif data_type == "contributors":
+                write_rows(self._contributor_rows(data), file_path, format, CONTRIBUTOR_COLUMNS)
+            elif isinstance(data, dict):
+                write_rows(self._metric_rows(data), file_path, format, METRIC_COLUMNS)
+            else:
+                write_rows(data, file_path, format)
+        elif data_type == "health":
+            self._export_csv_health(data, file_path)
+        elif isinstance(data, dict):
+            self._export_csv_stats(data, file_path)
+        elif data_type == "files":
+            self._export_csv_file_changes(data, file_path)
+        elif data_type == "branches":
+            self._export_csv_branch_activity(data, file_path)
+        elif data_type == "contributors":
+            self._export_csv_contributor_stats(data, file_path)
+        elif isinstance(data, list) and data:
+            self._export_csv_generic(data, file_path)
+        else:
+            self._export_json(data, file_path)
+        # The CSV writers skip empty lists; the manifest still lists the dataset
+        file_path.touch()
+    
+    @staticmethod
+    def _file_change_rows(changes: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Rows of get_file_changes() output: one per most changed file"""
+        if isinstance(changes, dict):
+            return [{'file': path, 'changes': count} for path, count in changes.get('most_changed_files', {}).items()]
+        return changes
+    
+    @staticmethod
+    def _contributor_rows(stats: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Rows of get_contributor_stats() output: one per commit in its details"""
+        if isinstance(stats, dict):
+            return stats.get('details', [])
+        return stats
+    
+    @staticmethod
+    def _metric_rows(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [{'metric': key, 'value': value} for key, value in data.items()]
+    
+    async def export_stream(self, rows: Rows, dataset: str, format: str = "jsonl",
+                            fields: Optional[List[str]] = None, compression: Optional[str] = None,
+                            filename: Optional[str] = None) -> str:
+        """Export rows from an iterator or async iterator as JSON Lines, CSV, Parquet or Arrow, one row at a time"""
+        format = format.lower()
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = export_filename(f"{dataset}_{timestamp}", format, compression)
+        
+        file_path = self._output_path(filename)
+        
+        try:
+            if format not in EXPORT_FORMATS:
+                raise ValueError(f"Unsupported format: {format}")
+            count = await stream_rows(rows, file_path, format, fields or HISTORY_DATASETS.get(dataset), compression)
+            console.print(f"[green]✅ Exported {count:,} {dataset.replace('_', ' ')} to {file_path}[/]")
+            return str(file_path)
+        except Exception as e:
+            console.print(f"[red]Error exporting {dataset.replace('_', ' ')}: {e}[/]")
+            return ""
+    
+    async def export_history(self, git_ops, dataset: str = "commits", format: str = "jsonl",
+                             compression: Optional[str] = None, rev: str = "HEAD", since: Optional[str] = None,
+                             filename: Optional[str] = None) -> str:
+        """Stream the commit history (or per-file changes) of a repository straight into an export file"""
+        rows = self._history_rows(git_ops, dataset, rev, since)
+        if rows is None:
+            return ""
+        return await self.export_stream(rows, dataset, format, compression=compression, filename=filename)
+    
+    def _history_rows(self, git_ops, dataset: str, rev: str, since: Optional[str]):
+        if dataset == "commits":
+            return git_ops.iter_commits(rev, since)
+        if dataset == "file_changes":
+            return git_ops.iter_file_changes(rev, since)
+        console.print(f"[red]Unknown history dataset: {dataset}[/]")
+        return None
+    
+    async def export_incremental(self, git_ops, dataset: str = "commits", format: str = "jsonl",
+                                 compression: Optional[str] = None, rev: str = "HEAD",
+                                 since: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Export only the history added since the last incremental export of this repository and dataset
+        
+        Each run appends a partition file and records it in manifest.json with
+        the new watermark, the commit that was exported up to. If that commit is
+        no longer in the history (a force push), the partitions are replaced by
+        a full export. Returns the manifest.
+        """
+        repository = str(git_ops.repo_path.resolve())
+        directory = Path(self.output_dir) / INCREMENTAL_DIR / self._repository_key(repository) / dataset
+        manifest_path = directory / MANIFEST_NAME
+        manifest = self._load_manifest(manifest_path)
+        if manifest.get("repository", repository) != repository:
+            console.print(f"[red]{directory} holds exports of {manifest['repository']}; "
+                          f"use a different --output-dir for {repository}[/]")
+            return None
+        
+        try:
+            head = await git_ops.resolve(rev)
+        except Exception as e:
+            console.print(f"[red]Error exporting {dataset.replace('_', ' ')}: cannot resolve {rev}: {e}[/]")
+            return None
+        watermark = manifest.get("watermark")
+        if watermark == head:
+            console.print(f"[yellow]{dataset.replace('_', ' ').capitalize()} are up to date at {head[:8]}[/]")
+            return manifest
+        
+        partitions = manifest.get("partitions", [])
+        # Partitions are numbered on from the newest, so a rebuild never overwrites one the manifest still lists
+        number = max((self._partition_number(partition["file"]) for partition in partitions), default=0) + 1
+        stale = []
+        if watermark and not await git_ops.is_ancestor(watermark, head):
+            console.print(f"[yellow]{watermark[:8]} is no longer in the history of {rev}; "
+                          f"exporting {dataset.replace('_', ' ')} from scratch[/]")
+            # Removed only once the new export and manifest are written
+            watermark, stale, partitions = None, partitions, []
+        
+        directory.mkdir(parents=True, exist_ok=True)
+        filename = export_filename(f"part-{number:05d}", format.lower(), compression)
+        rows = self._history_rows(git_ops, dataset, f"{watermark}..{head}" if watermark else head,
+                                  None if watermark else since)
+        if rows is None:
+            return None
+        try:
+            count = await stream_rows(rows, directory / filename, format.lower(), HISTORY_DATASETS[dataset],
+                                      compression)
+        except Exception as e:
+            console.print(f"[red]Error exporting {dataset.replace('_', ' ')}: {e}[/]")
+            return None
+        
+        now = datetime.now().isoformat(timespec="seconds")
+        if count:
+            partitions.append({"file": filename, "from": watermark, "to": head, "rows": count, "created_at": now})
+        else:
+            # Nothing to add (e.g. only merge commits for file changes); just move the watermark
+            (directory / filename).unlink(missing_ok=True)
+        manifest = {
+            "repository": repository,
+            "dataset": dataset,
+            "fields": list(HISTORY_DATASETS[dataset]),
+            "watermark": head,
+            "updated_at": now,
+            "partitions": partitions,
+        }
+        self._write_manifest(manifest_path, manifest)
+        for partition in stale:
+            (directory / partition["file"]).unlink(missing_ok=True)
+        range_text = f"{watermark[:8]}..{head[:8]}" if watermark else f"up to {head[:8]}"
+        if count:
+            console.print(f"[green]✅ Exported {count:,} new {dataset.replace('_', ' ')} ({range_text}) "
+                          f"to {directory / filename}[/]")
+        else:
+            console.print(f"[yellow]No new {dataset.replace('_', ' ')} ({range_text})[/]")
+        return manifest
+    
+    @staticmethod
+    def _repository_key(repository: str) -> str:
+        """Directory name for a repository: its name plus a short hash of its path, so same-named clones don't collide"""
+        return f"{Path(repository).name}-{hashlib.sha256(repository.encode('utf-8')).hexdigest()[:8]}"
+    
+    @staticmethod
+    def _partition_number(filename: str) -> int:
+        match = re.match(r'part-(\d+)', filename)
+        return int(match.group(1)) if match else 0
+    
+    def _load_manifest(self, path: Path) -> Dict[str, Any]:
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+    
+    def _write_manifest(self, path: Path, manifest: Dict[str, Any]):
+        """Replace the manifest atomically, so readers never see a partial one"""
+        temp_path = path.with_name(path.name + ".part")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, path)
+    
     def _export_json(self, data: Any, file_path: Path):
         """Export data to JSON format"""
         with open(file_path, 'w', encoding='utf-8') as f:
@@ -318,7 +670,7 @@ class ExportManager:
     
     def _export_generic(self, data: Any, data_type: str, format: str, filename: str) -> str:
         """Generic export for unknown data types"""
-        file_path = Path(self.output_dir) / filename
+        file_path = self._output_path(filename)
         
         try:
             if format.lower() == "json":
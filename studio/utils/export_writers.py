@@ -0,0 +1,292 @@
+"""
+Streaming export writers for GitFlow Studio
+Write JSON Lines or CSV one row at a time, optionally gzip or zstd compressed, or Parquet/Arrow in row groups,
+so exports use constant memory
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, AsyncIterable, Union, Sequence
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install gitflow-studio[zstd]
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional: pip install gitflow-studio[parquet]
+    pyarrow = None
+
+STREAM_FORMATS = ('jsonl', 'csv')
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+EXPORT_FORMATS = STREAM_FORMATS + COLUMNAR_FORMATS
+# Compression name -> file suffix (text formats; Parquet and Arrow compress internally)
+COMPRESSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+# Columnar format -> file suffix; Arrow is written as an IPC stream
+COLUMNAR_SUFFIXES = {'parquet': '.parquet', 'arrow': '.arrows'}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+# Rows per Parquet row group / Arrow record batch
+ROW_GROUP_SIZE = 64 * 1024
+
+# Column types of the columnar formats by field name; other fields are strings.
+# Low-cardinality text (authors, paths) is dictionary encoded.
+COLUMN_TYPES = {
+    'date': 'timestamp', 'committer_date': 'timestamp',
+    'additions': 'int64', 'deletions': 'int64', 'changes': 'int64', 'commits': 'int64',
+    'line': 'int64', 'size': 'int64',
+    'author': 'dictionary', 'email': 'dictionary', 'path': 'dictionary', 'file': 'dictionary',
+    'relative_path': 'dictionary', 'repository': 'dictionary',
+}
+
+Rows = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+
+def export_filename(stem: str, format: str, compression: Optional[str] = None) -> str:
+    """File name for an export, e.g. commits.jsonl.gz"""
+    if format in COLUMNAR_SUFFIXES:
+        return stem + COLUMNAR_SUFFIXES[format]
+    return f"{stem}.{format}{COMPRESSIONS.get(compression, '') if compression else ''}"
+
+
+def open_export(path: Path, compression: Optional[str] = None):
+    """Text stream writing to path, compressed as it is written"""
+    if compression is None:
+        return open(path, 'w', newline='', encoding='utf-8')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', compresslevel=GZIP_LEVEL, newline='', encoding='utf-8')
+    if compression == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd compression needs the zstandard package (pip install zstandard)")
+        stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, 'wb'))
+        return io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def require_pyarrow(format: str):
+    """Raise RuntimeError when a Parquet/Arrow export cannot be written because pyarrow is missing"""
+    if pyarrow is None:
+        raise RuntimeError(f"{format.title()} exports need pyarrow (pip install pyarrow); "
+                           f"use the jsonl or csv format instead")
+
+
+def _cell(value: Any) -> Any:
+    """CSV cell for a value; nested values are written as JSON"""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+class RowWriter:
+    """Writes rows to an export file one at a time
+
+    The file is written under a .part name and renamed when closed without
+    an error, so an interrupted export never looks complete.
+    """
+
+    def __init__(self, path: Path, fields: Optional[Sequence[str]] = None, compression: Optional[str] = None):
+        self.path = Path(path)
+        self.fields: Optional[List[str]] = list(fields) if fields else None
+        self.rows = 0
+        self._part = self.path.with_name(self.path.name + '.part')
+        self._file = self._open(self._part, compression)
+
+    def _open(self, path: Path, compression: Optional[str]):
+        return open_export(path, compression)
+
+    def write(self, row: Dict[str, Any]):
+        raise NotImplementedError
+
+    def _finish(self, failed: bool):
+        self._file.close()
+
+    def close(self, failed: bool = False):
+        try:
+            self._finish(failed)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._replace(failed)
+
+    def _replace(self, failed: bool):
+        if failed:
+            self._part.unlink(missing_ok=True)
+        else:
+            os.replace(self._part, self.path)
+
+    def __enter__(self) -> 'RowWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(failed=exc_type is not None)
+        return False
+
+
+class JSONLinesWriter(RowWriter):
+    """One JSON object per line"""
+
+    def write(self, row: Dict[str, Any]):
+        if self.fields:
+            row = {field: row.get(field) for field in self.fields}
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._file.write('\n')
+        self.rows += 1
+
+
+class CSVWriter(RowWriter):
+    """CSV with a fixed header: the given fields, or the keys of the first row"""
+
+    def __init__(self, path: Path, fields: Optional[Sequence[str]] = None, compression: Optional[str] = None):
+        super().__init__(path, fields, compression)
+        self._writer = csv.writer(self._file)
+        if self.fields:
+            self._writer.writerow(self.fields)
+
+    def write(self, row: Dict[str, Any]):
+        if self.fields is None:
+            self.fields = list(row.keys())
+            self._writer.writerow(self.fields)
+        self._writer.writerow([_cell(row.get(field)) for field in self.fields])
+        self.rows += 1
+
+
+def _timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+
+
+def _column(field: str, values: List[Any]):
+    """Arrow array for one column of a row group"""
+    kind = COLUMN_TYPES.get(field, 'string')
+    if kind == 'int64':
+        return pyarrow.array([None if value in (None, '') else int(value) for value in values], pyarrow.int64())
+    if kind == 'timestamp':
+        return pyarrow.array([_timestamp(value) for value in values], pyarrow.timestamp('s', tz='UTC'))
+    strings = pyarrow.array([None if value is None else _cell(value) if isinstance(value, (dict, list, tuple))
+                             else str(value) for value in values], pyarrow.string())
+    return strings.dictionary_encode() if kind == 'dictionary' else strings
+
+
+class ColumnarWriter(RowWriter):
+    """Parquet or Arrow IPC stream with typed columns, written a row group at a time
+
+    Rows are buffered only until ROW_GROUP_SIZE of them have arrived.
+    """
+
+    format = 'parquet'
+
+    def __init__(self, path: Path, fields: Optional[Sequence[str]] = None, compression: Optional[str] = None,
+                 row_group_size: int = ROW_GROUP_SIZE):
+        require_pyarrow(self.format)
+        self.row_group_size = row_group_size
+        self._columns: Optional[Dict[str, List[Any]]] = None
+        self._writer = None
+        super().__init__(path, fields, compression)
+
+    def _open(self, path: Path, compression: Optional[str]):
+        self.compression = compression
+        return None
+
+    def write(self, row: Dict[str, Any]):
+        if self._columns is None:
+            self.fields = self.fields or list(row.keys())
+            self._columns = {field: [] for field in self.fields}
+        for field, values in self._columns.items():
+            values.append(row.get(field))
+        self.rows += 1
+        if self.rows % self.row_group_size == 0:
+            self._flush()
+
+    def _flush(self):
+        batch = pyarrow.RecordBatch.from_arrays(
+            [_column(field, values) for field, values in self._columns.items()], names=list(self._columns)
+        )
+        if self._writer is None:
+            self._writer = self._new_writer(batch.schema)
+        self._write_batch(batch)
+        for values in self._columns.values():
+            values.clear()
+
+    def _new_writer(self, schema):
+        dictionary_columns = [field for field in schema.names if COLUMN_TYPES.get(field) == 'dictionary']
+        return pyarrow.parquet.ParquetWriter(str(self._part), schema, compression=self.compression or 'snappy',
+                                             use_dictionary=dictionary_columns or False)
+
+    def _write_batch(self, batch):
+        self._writer.write_table(pyarrow.Table.from_batches([batch]))
+
+    def _finish(self, failed: bool):
+        if not failed:
+            if self._columns is None:
+                self._columns = {field: [] for field in self.fields or []}
+            if self._writer is None or any(self._columns.values()):
+                self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ArrowWriter(ColumnarWriter):
+    """Arrow IPC stream; each row group is a record batch with its own dictionaries"""
+
+    format = 'arrow'
+
+    def _new_writer(self, schema):
+        if self.compression not in (None, 'zstd'):
+            raise ValueError(f"Arrow exports support zstd compression only, not {self.compression}")
+        self._sink = pyarrow.OSFile(str(self._part), 'wb')
+        return pyarrow.ipc.new_stream(self._sink, schema,
+                                      options=pyarrow.ipc.IpcWriteOptions(compression=self.compression))
+
+    def _write_batch(self, batch):
+        self._writer.write_batch(batch)
+
+    def _finish(self, failed: bool):
+        try:
+            super()._finish(failed)
+        finally:
+            if self._writer is not None:
+                self._sink.close()
+
+
+WRITERS = {'jsonl': JSONLinesWriter, 'csv': CSVWriter, 'parquet': ColumnarWriter, 'arrow': ArrowWriter}
+
+
+def row_writer(path: Path, format: str, fields: Optional[Sequence[str]] = None,
+               compression: Optional[str] = None) -> RowWriter:
+    if format not in WRITERS:
+        raise ValueError(f"Unsupported format: {format}")
+    return WRITERS[format](path, fields, compression)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], path: Path, format: str, fields: Optional[Sequence[str]] = None,
+               compression: Optional[str] = None) -> int:
+    """Write rows from an iterable; returns how many were written"""
+    with row_writer(path, format, fields, compression) as writer:
+        for row in rows:
+            writer.write(row)
+    return writer.rows
+
+
+async def stream_rows(rows: Rows, path: Path, format: str, fields: Optional[Sequence[str]] = None,
+                      compression: Optional[str] = None) -> int:
+    """Write rows from an async iterator (or an iterable) as they arrive; returns how many were written"""
+    if not hasattr(rows, '__aiter__'):
+        return write_rows(rows, path, format, fields, compression)
+    with row_writer(path, format, fields, compression) as writer:
+        async for row in rows:
+            writer.write(row)
+    return writer.rows
@@ -4,7 +4,6 @@ Tracks tool performance metrics and provides insights
 """
 
 import time
-import psutil
 import os
 import json
 from pathlib import Path
@@ -14,15 +13,21 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from functools import wraps
+from contextlib import contextmanager
+
+from .resource_sampler import SampleRing, ResourceSampler
+from .startup_times import append_startup_time, read_startup_times, startup_log_path, startup_summary
 
 console = Console()
 
+MEMORY_FIELDS = ("rss", "vms", "percent", "available")
+CPU_FIELDS = ("cpu_percent", "process_cpu_percent")
+
 class PerformanceMonitor:
     """Monitors and tracks performance metrics for GitFlow Studio"""
     
-    def __init__(self, config_dir: Optional[str] = None):
+    def __init__(self, config_dir: Optional[str] = None, sample_capacity: int = 1000):
         self.config_dir = config_dir or os.path.expanduser("~/.gitflow-studio")
         self.metrics_file = Path(self.config_dir) / "performance_metrics.json"
         self.metrics: Dict[str, Any] = {
@@ -33,9 +38,14 @@ class PerformanceMonitor:
             "startup_time": None,
             "total_operations": 0
         }
+        self.memory_samples = SampleRing(MEMORY_FIELDS, sample_capacity)
+        self.cpu_samples = SampleRing(CPU_FIELDS, sample_capacity)
+        self._sampler: Optional[ResourceSampler] = None
         self._ensure_config_dir()
         self._load_metrics()
         self.start_time = time.time()
+        self._memprofile_snapshot = None
+        self._memprofile_started_tracing = False
     
     def _ensure_config_dir(self):
         """Ensure configuration directory exists"""
@@ -47,22 +57,50 @@ class PerformanceMonitor:
             if self.metrics_file.exists():
                 with open(self.metrics_file, 'r') as f:
                     self.metrics = json.load(f)
+            self._load_samples(self.memory_samples, self.metrics.get("memory_usage", []))
+            self._load_samples(self.cpu_samples, self.metrics.get("cpu_usage", []))
+            # Startup times live in their own log; the metrics carry its summary
+            self.metrics["startup_time"] = self.get_startup_stats()
         except Exception as e:
             console.print(f"[red]Error loading performance metrics: {e}[/]")
     
+    @staticmethod
+    def _load_samples(ring: SampleRing, records: List[Dict[str, Any]]):
+        """Fill a sample ring from persisted records (epoch or ISO timestamps)"""
+        samples = []
+        for record in records:
+            timestamp = record["timestamp"]
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp).timestamp()
+            samples.append((timestamp, record))
+        
+        samples.sort(key=lambda sample: sample[0])
+        for timestamp, record in samples:
+            ring.append(timestamp, record)
+    
     def _save_metrics(self):
         """Save performance metrics to file"""
+        self.metrics["memory_usage"] = self.memory_samples.to_records()
+        self.metrics["cpu_usage"] = self.cpu_samples.to_records()
         try:
             with open(self.metrics_file, 'w') as f:
                 json.dump(self.metrics, f, indent=2, default=str)
         except Exception as e:
             console.print(f"[red]Error saving performance metrics: {e}[/]")
     
+    @property
+    def sampler(self) -> ResourceSampler:
+        """Resource sampler feeding the memory and CPU rings (created on first use)"""
+        if self._sampler is None:
+            self._sampler = ResourceSampler(self.memory_samples, self.cpu_samples, on_stop=self.flush)
+        return self._sampler
+    
     def monitor_operation(self, operation_name: str):
         """Decorator to monitor operation performance"""
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
+                import psutil
                 start_time = time.time()
                 start_memory = psutil.Process().memory_info().rss
                 start_cpu = psutil.cpu_percent()
@@ -91,23 +129,7 @@ class PerformanceMonitor:
     def _record_operation(self, operation_name: str, duration: float, memory_delta: int, 
                          cpu_usage: float, success: bool):
         """Record operation performance metrics"""
-        if operation_name not in self.metrics["operations"]:
-            self.metrics["operations"][operation_name] = {
-                "count": 0,
-                "total_duration": 0,
-                "avg_duration": 0,
-                "min_duration": float('inf'),
-                "max_duration": 0,
-                "total_memory": 0,
-                "avg_memory": 0,
-                "total_cpu": 0,
-                "avg_cpu": 0,
-                "success_count": 0,
-                "error_count": 0,
-                "last_execution": None
-            }
-        
-        op_metrics = self.metrics["operations"][operation_name]
+        op_metrics = self._get_operation_entry(operation_name)
         op_metrics["count"] += 1
         op_metrics["total_duration"] += duration
         op_metrics["avg_duration"] = op_metrics["total_duration"] / op_metrics["count"]
@@ -127,6 +149,35 @@ class PerformanceMonitor:
         self.metrics["total_operations"] += 1
         self._save_metrics()
     
+    def _get_operation_entry(self, operation_name: str) -> Dict[str, Any]:
+        """Get (or create) the metrics entry for an operation"""
+        if operation_name not in self.metrics["operations"]:
+            self.metrics["operations"][operation_name] = {
+                "count": 0,
+                "total_duration": 0,
+                "avg_duration": 0,
+                "min_duration": float('inf'),
+                "max_duration": 0,
+                "total_memory": 0,
+                "avg_memory": 0,
+                "total_cpu": 0,
+                "avg_cpu": 0,
+                "success_count": 0,
+                "error_count": 0,
+                "last_execution": None
+            }
+        
+        return self.metrics["operations"][operation_name]
+    
+    def record_startup_time(self, startup_time: float, budget: Optional[float] = None):
+        """Record CLI startup time (module import to command dispatch) in the startup log"""
+        append_startup_time(startup_time, budget, self.config_dir)
+        self.metrics["startup_time"] = self.get_startup_stats()
+    
+    def get_startup_stats(self) -> Optional[Dict[str, Any]]:
+        """Startup time aggregates over the logged runs"""
+        return startup_summary(read_startup_times(self.config_dir))
+    
     def record_git_operation(self, operation: str, repo_path: str, duration: float, 
                            success: bool, additional_data: Dict[str, Any] = None):
         """Record Git operation performance"""
@@ -168,47 +219,172 @@ class PerformanceMonitor:
         self._save_metrics()
     
     def record_memory_usage(self):
-        """Record current memory usage"""
+        """Record current memory usage (kept in memory until flush())"""
         try:
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            
-            memory_data = {
-                "timestamp": datetime.now().isoformat(),
-                "rss": memory_info.rss,
-                "vms": memory_info.vms,
-                "percent": process.memory_percent(),
-                "available": psutil.virtual_memory().available
-            }
-            
-            self.metrics["memory_usage"].append(memory_data)
-            
-            # Keep only last 1000 records
-            if len(self.metrics["memory_usage"]) > 1000:
-                self.metrics["memory_usage"] = self.metrics["memory_usage"][-1000:]
-            
-            self._save_metrics()
+            self.sampler.sample_memory()
         except Exception as e:
             console.print(f"[red]Error recording memory usage: {e}[/]")
     
     def record_cpu_usage(self):
-        """Record current CPU usage"""
+        """Record current CPU usage (kept in memory until flush())"""
+        try:
+            self.sampler.sample_cpu()
+        except Exception as e:
+            console.print(f"[red]Error recording CPU usage: {e}[/]")
+    
+    def flush(self):
+        """Persist buffered samples and metrics"""
+        self._save_metrics()
+    
+    def start_sampler(self, interval: float = 1.0):
+        """Start sampling memory and CPU in the background"""
+        self.sampler.interval = interval
+        self.sampler.start()
+    
+    def stop_sampler(self):
+        """Stop background sampling and persist the collected samples"""
+        self.sampler.stop()
+    
+    @contextmanager
+    def sampling(self, interval: float = 1.0):
+        """Sample memory and CPU in the background while a block runs"""
+        if self.sampler.running:
+            yield self.sampler
+            return
+        
+        self.start_sampler(interval)
         try:
-            cpu_data = {
-                "timestamp": datetime.now().isoformat(),
-                "cpu_percent": psutil.cpu_percent(),
-                "process_cpu_percent": psutil.Process().cpu_percent()
+            yield self.sampler
+        finally:
+            self.stop_sampler()
+    
+    @property
+    def memory_profile_active(self) -> bool:
+        """Whether a tracemalloc memory profile is currently running"""
+        return self._memprofile_snapshot is not None
+    
+    def start_memory_profile(self, frames: int = 1):
+        """Start tracing allocations and take the baseline snapshot"""
+        import tracemalloc
+        # Leave tracing running afterwards if someone else started it
+        self._memprofile_started_tracing = not tracemalloc.is_tracing()
+        if self._memprofile_started_tracing:
+            tracemalloc.start(frames)
+        tracemalloc.reset_peak()
+        self._memprofile_snapshot = tracemalloc.take_snapshot()
+    
+    def stop_memory_profile(self, operation_name: str, top: int = 10) -> Dict[str, Any]:
+        """Diff allocations against the baseline snapshot and stop tracing if the profile started it"""
+        if self._memprofile_snapshot is None:
+            return {}
+        
+        import tracemalloc
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if self._memprofile_started_tracing:
+            tracemalloc.stop()
+            self._memprofile_started_tracing = False
+        
+        # Hide allocations made by the profiler itself
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        before = self._memprofile_snapshot.filter_traces(filters)
+        diff = after.filter_traces(filters).compare_to(before, 'lineno')
+        self._memprofile_snapshot = None
+        
+        def site(stat):
+            frame = stat.traceback[0]
+            return {
+                "location": f"{frame.filename}:{frame.lineno}",
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size": stat.size,
+                "count": stat.count
             }
+        
+        by_size = sorted(diff, key=lambda s: abs(s.size_diff), reverse=True)[:top]
+        by_count = sorted(diff, key=lambda s: abs(s.count_diff), reverse=True)[:top]
+        
+        profile = {
+            "operation": operation_name,
+            "peak_traced_memory": peak,
+            "current_traced_memory": current,
+            "top_by_size": [site(s) for s in by_size if s.size_diff],
+            "top_by_count": [site(s) for s in by_count if s.count_diff]
+        }
+        
+        self.record_peak_memory(operation_name, peak)
+        return profile
+    
+    @contextmanager
+    def memory_profile(self, operation_name: str, top: int = 10):
+        """Record latency plus a tracemalloc allocation profile for a block"""
+        import psutil
+        profile: Dict[str, Any] = {}
+        start_time = time.time()
+        start_memory = psutil.Process().memory_info().rss
+        start_cpu = psutil.cpu_percent()
+        self.start_memory_profile()
+        success = False
+        
+        try:
+            yield profile
+            success = True
+        finally:
+            duration = time.time() - start_time
+            memory_delta = psutil.Process().memory_info().rss - start_memory
+            cpu_avg = (start_cpu + psutil.cpu_percent()) / 2
             
-            self.metrics["cpu_usage"].append(cpu_data)
+            self._record_operation(operation_name, duration, memory_delta, cpu_avg, success)
+            profile.update(self.stop_memory_profile(operation_name, top))
+    
+    def record_peak_memory(self, operation_name: str, peak: int):
+        """Store the peak traced memory of an operation next to its latency data"""
+        op_metrics = self._get_operation_entry(operation_name)
+        op_metrics["peak_traced_memory"] = peak
+        op_metrics["max_peak_traced_memory"] = max(op_metrics.get("max_peak_traced_memory", 0), peak)
+        self._save_metrics()
+    
+    def display_memory_profile(self, profile: Dict[str, Any]):
+        """Display the top allocation sites of a memory profile"""
+        if not profile:
+            return
+        
+        console.print(Panel(
+            f"[cyan]Peak traced memory:[/] {profile['peak_traced_memory']/1024/1024:.2f} MB\n"
+            f"[cyan]Still allocated at exit:[/] {profile['current_traced_memory']/1024/1024:.2f} MB",
+            title=f"[blue]Memory Profile: {profile['operation']}", border_style="blue"))
+        
+        for key, title in (("top_by_size", "Top Allocation Sites by Size"),
+                           ("top_by_count", "Top Allocation Sites by Count")):
+            if not profile[key]:
+                continue
+            
+            table = Table(
+                title=f"[bold blue]{title}[/]",
+                show_header=True,
+                header_style="bold magenta",
+                box=box.ROUNDED,
+                border_style="blue"
+            )
             
-            # Keep only last 1000 records
-            if len(self.metrics["cpu_usage"]) > 1000:
-                self.metrics["cpu_usage"] = self.metrics["cpu_usage"][-1000:]
+            table.add_column("Location", style="cyan", overflow="fold")
+            table.add_column("Size Δ", style="white", justify="right")
+            table.add_column("Count Δ", style="white", justify="right")
+            table.add_column("Total Size", style="green", justify="right")
             
-            self._save_metrics()
-        except Exception as e:
-            console.print(f"[red]Error recording CPU usage: {e}[/]")
+            for entry in profile[key]:
+                table.add_row(
+                    entry["location"],
+                    f"{entry['size_diff']/1024:+.1f} KB",
+                    f"{entry['count_diff']:+d}",
+                    f"{entry['size']/1024:.1f} KB"
+                )
+            
+            console.print(table)
     
     def get_operation_stats(self, operation_name: Optional[str] = None) -> Dict[str, Any]:
         """Get operation performance statistics"""
@@ -226,56 +402,39 @@ class PerformanceMonitor:
     
     def get_memory_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get memory usage statistics for the last N hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        recent_memory = [
-            m for m in self.metrics["memory_usage"]
-            if datetime.fromisoformat(m["timestamp"]) > cutoff_time
-        ]
+        stats = self.memory_samples.window_stats(time.time() - hours * 3600)
         
-        if not recent_memory:
+        if not stats:
             return {}
         
-        rss_values = [m["rss"] for m in recent_memory]
-        vms_values = [m["vms"] for m in recent_memory]
-        percent_values = [m["percent"] for m in recent_memory]
-        
         return {
-            "count": len(recent_memory),
-            "avg_rss": sum(rss_values) / len(rss_values),
-            "max_rss": max(rss_values),
-            "min_rss": min(rss_values),
-            "avg_vms": sum(vms_values) / len(vms_values),
-            "max_vms": max(vms_values),
-            "min_vms": min(vms_values),
-            "avg_percent": sum(percent_values) / len(percent_values),
-            "max_percent": max(percent_values),
-            "min_percent": min(percent_values)
+            "count": stats["count"],
+            "avg_rss": stats["rss"]["avg"],
+            "max_rss": stats["rss"]["max"],
+            "min_rss": stats["rss"]["min"],
+            "avg_vms": stats["vms"]["avg"],
+            "max_vms": stats["vms"]["max"],
+            "min_vms": stats["vms"]["min"],
+            "avg_percent": stats["percent"]["avg"],
+            "max_percent": stats["percent"]["max"],
+            "min_percent": stats["percent"]["min"]
         }
     
     def get_cpu_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get CPU usage statistics for the last N hours"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        recent_cpu = [
-            c for c in self.metrics["cpu_usage"]
-            if datetime.fromisoformat(c["timestamp"]) > cutoff_time
-        ]
+        stats = self.cpu_samples.window_stats(time.time() - hours * 3600)
         
-        if not recent_cpu:
+        if not stats:
             return {}
         
-        cpu_percent_values = [c["cpu_percent"] for c in recent_cpu]
-        process_cpu_values = [c["process_cpu_percent"] for c in recent_cpu]
-        
         return {
-            "count": len(recent_cpu),
-            "avg_cpu_percent": sum(cpu_percent_values) / len(cpu_percent_values),
-            "max_cpu_percent": max(cpu_percent_values),
-            "min_cpu_percent": min(cpu_percent_values),
-            "avg_process_cpu": sum(process_cpu_values) / len(process_cpu_values),
-            "max_process_cpu": max(process_cpu_values),
-            "min_process_cpu": min(process_cpu_values)
+            "count": stats["count"],
+            "avg_cpu_percent": stats["cpu_percent"]["avg"],
+            "max_cpu_percent": stats["cpu_percent"]["max"],
+            "min_cpu_percent": stats["cpu_percent"]["min"],
+            "avg_process_cpu": stats["process_cpu_percent"]["avg"],
+            "max_process_cpu": stats["process_cpu_percent"]["max"],
+            "min_process_cpu": stats["process_cpu_percent"]["min"]
         }
     
     def display_performance_summary(self):
@@ -317,6 +476,12 @@ class PerformanceMonitor:
         table.add_row("Success Rate", f"{(total_success/total_ops*100):.1f}%" if total_ops > 0 else "0%")
         table.add_row("Error Rate", f"{(total_errors/total_ops*100):.1f}%" if total_ops > 0 else "0%")
         
+        startup = self.metrics.get("startup_time")
+        if startup:
+            table.add_row("Startup Time (last / avg)", f"{startup['last']*1000:.0f} ms / {startup['avg']*1000:.0f} ms")
+            if startup.get("budget"):
+                table.add_row("Startups Over Budget", f"{startup['over_budget']} of {startup['count']}")
+        
         console.print(table)
         
         # Most used operations
@@ -360,12 +525,16 @@ class PerformanceMonitor:
         table.add_row("Max Duration", f"{op_data['max_duration']:.3f}s")
         table.add_row("Average Memory", f"{op_data['avg_memory']/1024/1024:.1f} MB")
         table.add_row("Average CPU", f"{op_data['avg_cpu']:.1f}%")
+        if "peak_traced_memory" in op_data:
+            table.add_row("Peak Traced Memory", f"{op_data['peak_traced_memory']/1024/1024:.1f} MB")
+            table.add_row("Max Peak Traced Memory", f"{op_data['max_peak_traced_memory']/1024/1024:.1f} MB")
         table.add_row("Last Execution", op_data.get("last_execution", "Never"))
         
         console.print(table)
     
     def display_system_stats(self):
         """Display current system performance statistics"""
+        import psutil
         try:
             # Current memory usage
             memory = psutil.virtual_memory()
@@ -413,6 +582,8 @@ class PerformanceMonitor:
         
         try:
             if format.lower() == "json":
+                self.metrics["memory_usage"] = self.memory_samples.to_records()
+                self.metrics["cpu_usage"] = self.cpu_samples.to_records()
                 with open(file_path, 'w', encoding='utf-8') as f:
                     json.dump(self.metrics, f, indent=2, default=str)
             elif format.lower() == "csv":
@@ -442,20 +613,10 @@ class PerformanceMonitor:
     
     def cleanup_old_metrics(self, days: int = 30):
         """Clean up old performance metrics"""
-        cutoff_time = datetime.now() - timedelta(days=days)
-        cutoff_timestamp = cutoff_time.isoformat()
+        cutoff_time = (datetime.now() - timedelta(days=days)).timestamp()
         
-        # Clean up memory usage
-        self.metrics["memory_usage"] = [
-            m for m in self.metrics["memory_usage"]
-            if m["timestamp"] > cutoff_timestamp
-        ]
-        
-        # Clean up CPU usage
-        self.metrics["cpu_usage"] = [
-            c for c in self.metrics["cpu_usage"]
-            if c["timestamp"] > cutoff_timestamp
-        ]
+        self.memory_samples.discard_before(cutoff_time)
+        self.cpu_samples.discard_before(cutoff_time)
         
         self._save_metrics()
         console.print(f"[green]✅ Cleaned up performance metrics older than {days} days[/]")
@@ -470,5 +631,8 @@ class PerformanceMonitor:
             "startup_time": None,
             "total_operations": 0
         }
+        self.memory_samples.clear()
+        self.cpu_samples.clear()
+        startup_log_path(self.config_dir).unlink(missing_ok=True)
         self._save_metrics()
         console.print("[green]✅ Performance metrics reset[/]") 
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""
+Background resource sampling for GitFlow Studio
+Keeps memory and CPU samples in fixed-size, array-backed ring buffers
+"""
+
+import time
+import logging
+import threading
+from array import array
+from typing import Dict, List, Optional, Any, Sequence, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class SampleRing:
+    """Fixed-size ring buffer of timestamped samples stored in typed arrays
+
+    Timestamps are epoch floats and are kept non-decreasing, so windows
+    can be located with a binary search instead of scanning every sample.
+    """
+
+    def __init__(self, fields: Sequence[str], capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self._timestamps = array('d', [0.0]) * capacity
+        self._columns = {field: array('d', [0.0]) * capacity for field in self.fields}
+        self._start = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a physical slot"""
+        return (self._start + index) % self.capacity
+
+    def append(self, timestamp: float, values: Dict[str, float]):
+        """Append a sample, overwriting the oldest one when full"""
+        with self._lock:
+            if self._size:
+                # Keep timestamps sorted even if the wall clock steps back
+                timestamp = max(timestamp, self._timestamps[self._slot(self._size - 1)])
+
+            if self._size < self.capacity:
+                slot = self._slot(self._size)
+                self._size += 1
+            else:
+                slot = self._start
+                self._start = (self._start + 1) % self.capacity
+
+            self._timestamps[slot] = timestamp
+            for field in self.fields:
+                self._columns[field][slot] = float(values.get(field, 0.0))
+
+    def _bisect_left(self, timestamp: float) -> int:
+        """Logical index of the first sample at or after timestamp"""
+        lo, hi = 0, self._size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamps[self._slot(mid)] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def column(self, field: str, since: Optional[float] = None) -> List[float]:
+        """Get the values of a field, optionally only samples since a timestamp"""
+        with self._lock:
+            first = self._bisect_left(since) if since is not None else 0
+            values = self._columns[field]
+            return [values[self._slot(i)] for i in range(first, self._size)]
+
+    def window_stats(self, since: Optional[float] = None) -> Dict[str, Any]:
+        """Count, average, minimum and maximum of every field since a timestamp"""
+        with self._lock:
+            first = self._bisect_left(since) if since is not None else 0
+            count = self._size - first
+            if count <= 0:
+                return {}
+
+            stats: Dict[str, Any] = {"count": count}
+            for field in self.fields:
+                values = self._columns[field]
+                window = [values[self._slot(i)] for i in range(first, self._size)]
+                stats[field] = {
+                    "avg": sum(window) / count,
+                    "min": min(window),
+                    "max": max(window)
+                }
+            return stats
+
+    def discard_before(self, timestamp: float) -> int:
+        """Drop samples older than timestamp, returning how many were dropped"""
+        with self._lock:
+            dropped = self._bisect_left(timestamp)
+            self._start = self._slot(dropped)
+            self._size -= dropped
+            return dropped
+
+    def clear(self):
+        """Drop all samples"""
+        with self._lock:
+            self._start = 0
+            self._size = 0
+
+    def to_records(self) -> List[Dict[str, float]]:
+        """Export samples oldest-first as dicts with epoch timestamps"""
+        with self._lock:
+            records = []
+            for i in range(self._size):
+                slot = self._slot(i)
+                record = {"timestamp": self._timestamps[slot]}
+                for field in self.fields:
+                    record[field] = self._columns[field][slot]
+                records.append(record)
+            return records
+
+
+class ResourceSampler:
+    """Background thread that samples process memory and CPU at a fixed interval"""
+
+    def __init__(self, memory_samples: SampleRing, cpu_samples: SampleRing,
+                 interval: float = 1.0, on_stop: Optional[Callable[[], None]] = None):
+        self.memory_samples = memory_samples
+        self.cpu_samples = cpu_samples
+        self.interval = interval
+        self.on_stop = on_stop
+        import psutil
+        self._process = psutil.Process()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample_memory(self, now: Optional[float] = None):
+        """Append one memory sample"""
+        import psutil
+        memory_info = self._process.memory_info()
+        self.memory_samples.append(now or time.time(), {
+            "rss": memory_info.rss,
+            "vms": memory_info.vms,
+            "percent": self._process.memory_percent(),
+            "available": psutil.virtual_memory().available
+        })
+
+    def sample_cpu(self, now: Optional[float] = None):
+        """Append one CPU sample"""
+        import psutil
+        self.cpu_samples.append(now or time.time(), {
+            "cpu_percent": psutil.cpu_percent(),
+            "process_cpu_percent": self._process.cpu_percent()
+        })
+
+    def sample_once(self):
+        """Take one memory sample and one CPU sample"""
+        now = time.time()
+        self.sample_memory(now)
+        self.sample_cpu(now)
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception:
+                # Keep sampling; only the first failure is logged with its traceback
+                self.errors += 1
+                if self.errors == 1:
+                    logger.exception("Resource sampling failed")
+                else:
+                    logger.debug("Resource sampling failed (%d errors)", self.errors, exc_info=True)
+
+    def start(self):
+        """Start sampling in a daemon thread"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.sample_once()
+        self._thread = threading.Thread(target=self._run, name="gitflow-resource-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling, taking a final sample"""
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.sample_once()
+        if self.on_stop:
+            self.on_stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,73 @@
+"""
+Startup time log for GitFlow Studio
+One line per CLI run in a small append-only file, so recording a startup never loads or rewrites the metrics file
+"""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+STARTUP_LOG = "startup_times.log"
+# The log is trimmed to the newest MAX_ENTRIES runs once it grows past MAX_LOG_BYTES
+MAX_ENTRIES = 1000
+MAX_LOG_BYTES = 64 * 1024
+
+Entry = Tuple[float, float, float]
+
+
+def startup_log_path(config_dir: Optional[str] = None) -> Path:
+    return Path(config_dir or os.path.expanduser("~/.gitflow-studio")) / STARTUP_LOG
+
+
+def append_startup_time(startup_time: float, budget: Optional[float] = None, config_dir: Optional[str] = None):
+    """Append one run: wall-clock time, startup seconds and the budget it was measured against"""
+    path = startup_log_path(config_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(f"{time.time():.3f} {startup_time:.6f} {budget or 0}\n")
+        size = f.tell()
+    if size > MAX_LOG_BYTES:
+        _trim(path)
+
+
+def _trim(path: Path):
+    entries = path.read_text(encoding='utf-8').splitlines(keepends=True)[-MAX_ENTRIES:]
+    part = path.with_name(path.name + '.part')
+    part.write_text(''.join(entries), encoding='utf-8')
+    os.replace(part, path)
+
+
+def read_startup_times(config_dir: Optional[str] = None) -> List[Entry]:
+    """Logged runs, oldest first; malformed lines are skipped"""
+    path = startup_log_path(config_dir)
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding='utf-8').splitlines():
+        try:
+            timestamp, startup_time, budget = (float(value) for value in line.split())
+        except ValueError:
+            continue
+        entries.append((timestamp, startup_time, budget))
+    return entries
+
+
+def startup_summary(entries: List[Entry]) -> Optional[Dict[str, Any]]:
+    """Aggregate logged runs the way the performance summary shows them"""
+    if not entries:
+        return None
+    times = [startup_time for _, startup_time, _ in entries]
+    timestamp, last, budget = entries[-1]
+    return {
+        "last": last,
+        "count": len(times),
+        "total": sum(times),
+        "avg": sum(times) / len(times),
+        "min": min(times),
+        "max": max(times),
+        "budget": budget or None,
+        "over_budget": sum(1 for _, startup_time, limit in entries if limit and startup_time > limit),
+        "last_recorded": datetime.fromtimestamp(timestamp).isoformat()
+    }
@@ -119,7 +119,8 @@ async def test_database():
         
         results = await db_manager.fetchall("SELECT * FROM repositories")
         print(f"  💾 Database test completed: {len(results)} repositories stored")
-        
+        await db_manager.close()
+
     except Exception as e:
         print(f"  ❌ Database test failed: {e}")
 